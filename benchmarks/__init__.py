@@ -0,0 +1 @@
+"""Benchmark suite: seeded synthetic databases and timed service scenarios"""
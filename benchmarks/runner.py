@@ -0,0 +1,297 @@
+"""
+Benchmark Runner
+Times the registered scenarios on a working copy of a synthetic database,
+writes JSON results and compares them against a stored baseline.
+"""
+
+import contextlib
+import io
+import json
+import logging
+import platform
+import sqlite3
+import statistics
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from database.migrations import migrate_database
+from benchmarks.scenarios import SCENARIOS, BenchmarkContext, Scenario
+from benchmarks.synthetic_data import read_dataset_parameters
+
+
+RESULTS_VERSION = 1
+
+
+class _ErrorRecorder(logging.Handler):
+    """Collects ERROR records logged while a scenario runs."""
+
+    def __init__(self):
+        super().__init__(logging.ERROR)
+        self.messages: List[str] = []
+
+    def emit(self, record: logging.LogRecord):
+        self.messages.append(record.getMessage())
+
+
+def _percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered) + 0.5)) - 1))
+    return ordered[index]
+
+
+def _copy_database(source: str, destination: str):
+    """Copy a database with the SQLite backup API so the source stays untouched."""
+    src = sqlite3.connect(source)
+    dst = sqlite3.connect(destination)
+    try:
+        src.backup(dst)
+    finally:
+        dst.close()
+        src.close()
+
+
+def select_scenarios(patterns: Optional[List[str]] = None) -> List[Scenario]:
+    """
+    Select scenarios by name substring.
+
+    Read-only scenarios always run before the ones that write, so the
+    reads see the database exactly as generated.
+
+    Args:
+        patterns: Name substrings; None selects every scenario
+
+    Returns:
+        Scenarios in run order
+    """
+    selected = [
+        item for item in SCENARIOS
+        if not patterns or any(pattern in item.name for pattern in patterns)
+    ]
+    return sorted(selected, key=lambda item: item.mutates)
+
+
+def run_benchmarks(db_path: str,
+                   repeat: int = 5,
+                   warmup: int = 1,
+                   patterns: Optional[List[str]] = None,
+                   seed: int = 42,
+                   progress_callback: Optional[Callable[[str, Dict], None]] = None) -> Dict:
+    """
+    Run the benchmark scenarios against a synthetic database.
+
+    The database is copied first; scenarios run on the copy. Services catch
+    their own exceptions and log them, so a scenario that raises or logs an
+    error is reported as failed (with the first error) instead of timed -
+    otherwise the suite would time the error path.
+
+    Args:
+        db_path: Synthetic database produced by SyntheticDataGenerator
+        repeat: Timed runs per scenario (scenarios may fix their own count)
+        warmup: Untimed runs per scenario before timing
+        patterns: Optional scenario name filters
+        seed: Seed for the scenarios' random choices
+        progress_callback: Called with (scenario name, result) after each scenario
+
+    Returns:
+        Results dictionary (see write_results)
+    """
+    scenarios = select_scenarios(patterns)
+    if not scenarios:
+        raise ValueError("No scenarios match the given filter")
+
+    results = {
+        'version': RESULTS_VERSION,
+        'created_at': datetime.now().isoformat(timespec='seconds'),
+        'dataset': read_dataset_parameters(db_path),
+        'environment': {
+            'python': platform.python_version(),
+            'sqlite': sqlite3.sqlite_version,
+            'platform': platform.platform(),
+            'processor': platform.processor() or platform.machine(),
+        },
+        'settings': {'repeat': repeat, 'warmup': warmup, 'seed': seed},
+        'scenarios': {},
+    }
+
+    with tempfile.TemporaryDirectory(prefix='fiu_bench_db_') as temp_dir:
+        work_db = str(Path(temp_dir) / 'benchmark.db')
+        _copy_database(db_path, work_db)
+        # Time the schema the application runs on, not the one the
+        # synthetic database was generated with
+        success, message = migrate_database(work_db)
+        if not success:
+            raise RuntimeError(f"Could not migrate benchmark database: {message}")
+        context = BenchmarkContext(work_db, seed=seed)
+        recorder = _ErrorRecorder()
+        context.logging_service.logger.addHandler(recorder)
+        try:
+            for item in scenarios:
+                runs = item.repeat or repeat
+                samples = []
+                ops = 0
+                recorder.messages.clear()
+                # Services print progress for some operations; keep the report readable
+                with contextlib.redirect_stdout(io.StringIO()):
+                    try:
+                        for _ in range(warmup):
+                            item.func(context)
+                        for _ in range(runs):
+                            start = time.perf_counter()
+                            ops = item.func(context)
+                            samples.append((time.perf_counter() - start) * 1000)
+                    except Exception as e:
+                        recorder.messages.append(f"{type(e).__name__}: {e}")
+
+                if recorder.messages:
+                    result = {
+                        'description': item.description,
+                        'runs': runs,
+                        'error': recorder.messages[0],
+                        'error_count': len(recorder.messages),
+                    }
+                    results['scenarios'][item.name] = result
+                    if progress_callback:
+                        progress_callback(item.name, result)
+                    continue
+
+                result = {
+                    'description': item.description,
+                    'runs': runs,
+                    'ops': ops,
+                    'median_ms': round(statistics.median(samples), 3),
+                    'p95_ms': round(_percentile(samples, 0.95), 3),
+                    'min_ms': round(min(samples), 3),
+                    'max_ms': round(max(samples), 3),
+                }
+                results['scenarios'][item.name] = result
+                if progress_callback:
+                    progress_callback(item.name, result)
+        finally:
+            context.logging_service.logger.removeHandler(recorder)
+            context.close()
+
+    return results
+
+
+def write_results(results: Dict, file_path: str):
+    """
+    Write benchmark results as JSON.
+
+    Args:
+        results: Results from run_benchmarks
+        file_path: Destination file
+    """
+    path = Path(file_path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2, ensure_ascii=False)
+
+
+def load_results(file_path: str) -> Dict:
+    """
+    Load benchmark results written by write_results.
+
+    Args:
+        file_path: Results file
+
+    Returns:
+        Results dictionary
+    """
+    with open(file_path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_results(results: Dict, baseline: Dict,
+                    tolerance: float = 0.20, min_delta_ms: float = 2.0) -> Dict:
+    """
+    Compare results against a baseline on median time.
+
+    A scenario regresses when its median is slower than the baseline by
+    more than the tolerance and by more than min_delta_ms, which keeps
+    sub-millisecond noise from failing a run.
+
+    Args:
+        results: Current results
+        baseline: Baseline results
+        tolerance: Allowed relative slowdown (0.20 = 20%)
+        min_delta_ms: Allowed absolute slowdown in milliseconds
+
+    Returns:
+        Dictionary with 'rows', 'regressions', 'improvements', 'failures',
+        'missing' and 'warnings'
+    """
+    warnings = []
+    if results.get('dataset') != baseline.get('dataset'):
+        warnings.append("Dataset parameters differ from the baseline; timings are not directly comparable")
+    if results.get('environment', {}).get('platform') != baseline.get('environment', {}).get('platform'):
+        warnings.append("Baseline was recorded on a different platform")
+
+    rows = []
+    regressions = []
+    improvements = []
+    failures = []
+    current = results.get('scenarios', {})
+    previous = baseline.get('scenarios', {})
+
+    for name, result in current.items():
+        base = previous.get(name)
+        if 'error' in result:
+            rows.append({'name': name, 'current_ms': None,
+                         'baseline_ms': base.get('median_ms') if base else None,
+                         'change': None, 'status': 'failed'})
+            failures.append(name)
+            continue
+        if base is None or 'error' in base:
+            rows.append({'name': name, 'current_ms': result['median_ms'], 'baseline_ms': None,
+                         'change': None, 'status': 'new'})
+            continue
+
+        delta = result['median_ms'] - base['median_ms']
+        change = delta / base['median_ms'] if base['median_ms'] else 0.0
+        status = 'ok'
+        if change > tolerance and delta > min_delta_ms:
+            status = 'regression'
+            regressions.append(name)
+        elif change < -tolerance and -delta > min_delta_ms:
+            status = 'improved'
+            improvements.append(name)
+
+        rows.append({'name': name, 'current_ms': result['median_ms'], 'baseline_ms': base['median_ms'],
+                     'change': round(change, 4), 'status': status})
+
+    return {
+        'rows': rows,
+        'regressions': regressions,
+        'improvements': improvements,
+        'failures': failures,
+        'missing': [name for name in previous if name not in current],
+        'warnings': warnings,
+    }
+
+
+def format_comparison(comparison: Dict) -> str:
+    """
+    Format a comparison as a plain-text table.
+
+    Args:
+        comparison: Result of compare_results
+
+    Returns:
+        Multi-line table
+    """
+    lines = [f"{'Scenario':<24} {'Baseline ms':>12} {'Current ms':>12} {'Change':>9}  Status"]
+    lines.append("-" * 70)
+    for row in comparison['rows']:
+        baseline = f"{row['baseline_ms']:.1f}" if row['baseline_ms'] is not None else "-"
+        current = f"{row['current_ms']:.1f}" if row['current_ms'] is not None else "-"
+        change = f"{row['change'] * 100:+.1f}%" if row['change'] is not None else "-"
+        lines.append(f"{row['name']:<24} {baseline:>12} {current:>12} {change:>9}  {row['status']}")
+    for name in comparison['missing']:
+        lines.append(f"{name:<24} {'':>12} {'':>12} {'':>9}  not run")
+    for warning in comparison['warnings']:
+        lines.append(f"⚠️  {warning}")
+    return "\n".join(lines)
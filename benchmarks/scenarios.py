@@ -0,0 +1,324 @@
+"""
+Benchmark Scenarios
+Timed operations run against the real services on a synthetic database.
+
+Each scenario receives the BenchmarkContext and returns the number of
+operations it performed; the runner times whole scenario calls.
+"""
+
+import logging
+import random
+import shutil
+import tempfile
+import threading
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from database.db_manager import DatabaseManager
+from services.logging_service import LoggingService
+from services.auth_service import AuthService
+from services.report_service import ReportService
+from services.version_service import VersionService
+from services.activity_service import ActivityService
+from services.approval_service import ApprovalService
+from services.dashboard_service import DashboardService
+from services.report_number_service import ReportNumberService
+from services.backup_service import BackupService
+from services.archive_service import ArchiveService
+from utils.export import export_reports
+
+
+# Columns read by the reports grid
+GRID_COLUMNS = [
+    'report_number', 'sn', 'report_date', 'reported_entity_name', 'cic',
+    'approval_status', 'current_version', 'created_by', 'created_at',
+]
+
+
+class BenchmarkContext:
+    """
+    Services wired the way main.py wires them, against one database file.
+
+    Logging goes to the database and a temporary log directory as in
+    production, but the console handler is silenced.
+    """
+
+    def __init__(self, db_path: str, seed: int = 42):
+        """
+        Initialize the benchmark context.
+
+        Args:
+            db_path: Working copy of the synthetic database
+            seed: Seed for the scenarios' own random choices
+        """
+        self.db_path = db_path
+        self.rng = random.Random(seed)
+        self.work_dir = Path(tempfile.mkdtemp(prefix='fiu_bench_'))
+
+        self.db_manager = DatabaseManager(db_path)
+        self.logging_service = LoggingService(self.db_manager, self.work_dir / 'logs')
+        for handler in self.logging_service.logger.handlers:
+            if type(handler) is logging.StreamHandler:
+                handler.setLevel(logging.WARNING)
+
+        self.auth_service = AuthService(self.db_manager, self.logging_service)
+        self.report_service = ReportService(self.db_manager, self.logging_service, self.auth_service)
+        self.activity_service = ActivityService(self.db_manager, self.logging_service, self.auth_service)
+        self.report_service.set_activity_service(self.activity_service)
+        self.version_service = VersionService(
+            self.db_manager, self.logging_service, self.auth_service, self.report_service, self.activity_service
+        )
+        self.approval_service = ApprovalService(
+            self.db_manager, self.logging_service, self.auth_service, self.version_service, self.report_service
+        )
+        self.approval_service.set_activity_service(self.activity_service)
+        self.dashboard_service = DashboardService(self.db_manager, self.logging_service)
+        self.report_number_service = ReportNumberService(self.db_manager, self.logging_service)
+        self.backup_service = BackupService(self.db_manager, self.logging_service, str(self.work_dir / 'backups'))
+        self.archive_service = ArchiveService(self.db_manager, self.logging_service, str(self.work_dir / 'archive'))
+        self.logging_service.set_archive_service(self.archive_service)
+        self.activity_service.set_archive_service(self.archive_service)
+
+        users = self.db_manager.execute_with_retry(
+            "SELECT user_id, username, full_name, role FROM users WHERE username LIKE 'bench_%' ORDER BY user_id"
+        )
+        self.users = [dict(row) for row in users]
+        self.admin = next(user for user in self.users if user['role'] == 'admin')
+        self.staff = [user for user in self.users if user['role'] != 'admin'] or [self.admin]
+
+        sample = self.db_manager.execute_with_retry(
+            "SELECT report_id, report_number, reported_entity_name FROM reports WHERE is_deleted = 0"
+        )
+        self.reports = [dict(row) for row in sample]
+
+    def login_as(self, user: Dict):
+        """Make a user the current user without a password round-trip."""
+        self.auth_service.current_user = {
+            'user_id': user['user_id'],
+            'username': user['username'],
+            'full_name': user['full_name'],
+            'role': user['role'],
+        }
+
+    def close(self):
+        """Release resources and delete the temporary directory."""
+        for handler in list(self.logging_service.logger.handlers):
+            handler.close()
+            self.logging_service.logger.removeHandler(handler)
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+
+class Scenario:
+    """A named benchmark operation."""
+
+    def __init__(self, name: str, func: Callable[[BenchmarkContext], int],
+                 description: str, repeat: Optional[int] = None, mutates: bool = False):
+        self.name = name
+        self.func = func
+        self.description = description
+        self.repeat = repeat
+        self.mutates = mutates
+
+
+SCENARIOS: List[Scenario] = []
+
+
+def scenario(name: str, description: str, repeat: Optional[int] = None, mutates: bool = False):
+    """
+    Register a benchmark scenario.
+
+    Args:
+        name: Scenario name used in results and baselines
+        description: One-line description
+        repeat: Fixed repetition count (overrides the runner default)
+        mutates: Whether the scenario writes to the database
+    """
+    def decorator(func):
+        SCENARIOS.append(Scenario(name, func, description, repeat, mutates))
+        return func
+    return decorator
+
+
+# ==================== READ SCENARIOS ====================
+
+@scenario('list_first_page', "Reports grid: first 500 rows with total count")
+def list_first_page(ctx: BenchmarkContext) -> int:
+    rows, _ = ctx.report_service.get_report_rows(GRID_COLUMNS, limit=500, with_count=True)
+    return len(rows)
+
+
+@scenario('list_deep_page', "Reports grid: 500 rows from the middle of the table")
+def list_deep_page(ctx: BenchmarkContext) -> int:
+    offset = max(len(ctx.reports) // 2 - 250, 0)
+    rows, _ = ctx.report_service.get_report_rows(GRID_COLUMNS, limit=500, offset=offset, with_count=False)
+    return len(rows)
+
+
+@scenario('list_sorted_by_entity', "Reports grid: first page sorted by entity name")
+def list_sorted_by_entity(ctx: BenchmarkContext) -> int:
+    rows, _ = ctx.report_service.get_report_rows(
+        GRID_COLUMNS, sort_column='reported_entity_name', sort_descending=False, limit=500, with_count=False
+    )
+    return len(rows)
+
+
+@scenario('legacy_report_page', "get_reports: 50 full rows with total count")
+def legacy_report_page(ctx: BenchmarkContext) -> int:
+    reports, _ = ctx.report_service.get_reports(limit=50)
+    return len(reports)
+
+
+@scenario('search_entity', "Search by a fragment of an entity name")
+def search_entity(ctx: BenchmarkContext) -> int:
+    name = ctx.rng.choice(ctx.reports)['reported_entity_name']
+    term = name.split()[-1]
+    rows, _ = ctx.report_service.get_report_rows(GRID_COLUMNS, search_term=term, limit=500, with_count=True)
+    return len(rows)
+
+
+@scenario('search_report_number', "Search by exact report number")
+def search_report_number(ctx: BenchmarkContext) -> int:
+    number = ctx.rng.choice(ctx.reports)['report_number']
+    rows, _ = ctx.report_service.get_report_rows(GRID_COLUMNS, search_term=number, limit=50, with_count=True)
+    return len(rows)
+
+
+@scenario('dashboard_load', "Dashboard: summary, status, monthly, top reporters, recent activity")
+def dashboard_load(ctx: BenchmarkContext) -> int:
+    ctx.dashboard_service.get_summary_statistics()
+    ctx.dashboard_service.get_reports_by_status()
+    ctx.dashboard_service.get_reports_by_month(12)
+    ctx.dashboard_service.get_top_reporters(5)
+    ctx.dashboard_service.get_recent_activity(10)
+    return 5
+
+
+@scenario('approval_queue', "Approval panel: first page of pending approvals with count")
+def approval_queue(ctx: BenchmarkContext) -> int:
+    ctx.login_as(ctx.admin)
+    filters = {'status': 'pending'}
+    pending, _ = ctx.approval_service.query_approvals(filters, limit=100)
+    ctx.approval_service.count_approvals(filters)
+    return len(pending)
+
+
+@scenario('approval_history', "Approval history: third page of all approvals")
+def approval_history(ctx: BenchmarkContext) -> int:
+    ctx.login_as(ctx.admin)
+    history, cursor = ctx.approval_service.query_approvals(limit=50)
+    for _ in range(2):
+        if cursor is None:
+            break
+        history, cursor = ctx.approval_service.query_approvals(cursor=cursor, limit=50)
+    return len(history)
+
+
+@scenario('activity_timeline', "Activity timeline: first page of recent activity with count")
+def activity_timeline(ctx: BenchmarkContext) -> int:
+    activities, _ = ctx.activity_service.query_activities(limit=50)
+    ctx.activity_service.count_activities()
+    return len(activities)
+
+
+@scenario('activity_timeline_deep', "Activity timeline: fifth page via cursor")
+def activity_timeline_deep(ctx: BenchmarkContext) -> int:
+    activities, cursor = ctx.activity_service.query_activities(limit=50)
+    for _ in range(4):
+        if cursor is None:
+            break
+        activities, cursor = ctx.activity_service.query_activities(cursor=cursor, limit=50)
+    return len(activities)
+
+
+@scenario('report_detail', "Open a report with its history and versions")
+def report_detail(ctx: BenchmarkContext) -> int:
+    report_id = ctx.rng.choice(ctx.reports)['report_id']
+    ctx.report_service.get_report(report_id)
+    ctx.report_service.get_report_history(report_id)
+    ctx.version_service.get_report_versions(report_id)
+    return 3
+
+
+@scenario('log_viewer', "Log management: 500 most recent logs")
+def log_viewer(ctx: BenchmarkContext) -> int:
+    return len(ctx.logging_service.get_logs(limit=500))
+
+
+@scenario('log_analytics', "Log management: statistics, hourly error rate, top exceptions, spikes")
+def log_analytics(ctx: BenchmarkContext) -> int:
+    analytics = ctx.logging_service.get_log_analytics()
+    return len(analytics['hourly'])
+
+
+@scenario('export_csv', "Export all reports to CSV", repeat=3)
+def export_csv(ctx: BenchmarkContext) -> int:
+    path = export_reports(ctx.db_manager, output_dir=str(ctx.work_dir))
+    path.unlink()
+    return len(ctx.reports)
+
+
+# ==================== WRITE SCENARIOS ====================
+
+@scenario('create_reports', "Create 20 reports through ReportService", mutates=True)
+def create_reports(ctx: BenchmarkContext) -> int:
+    user = ctx.rng.choice(ctx.staff)
+    ctx.login_as(user)
+    created = 0
+    for _ in range(20):
+        success, reservation, _ = ctx.report_number_service.reserve_next_numbers(user['username'])
+        if not success:
+            continue
+        success, report_id, _ = ctx.report_service.create_report({
+            'sn': reservation['serial_number'],
+            'report_number': reservation['report_number'],
+            'report_date': '01/01/2025',
+            'reported_entity_name': 'Benchmark Entity',
+            'cic': str(ctx.rng.randrange(10 ** 7, 10 ** 8)),
+        })
+        ctx.report_number_service.mark_reservation_used(reservation['report_number'], user['username'])
+        if success:
+            created += 1
+    return created
+
+
+@scenario('update_reports', "Update 20 existing reports through ReportService", mutates=True)
+def update_reports(ctx: BenchmarkContext) -> int:
+    updated = 0
+    for report in ctx.rng.sample(ctx.reports, min(20, len(ctx.reports))):
+        ctx.login_as(ctx.admin)
+        success, _ = ctx.report_service.update_report(report['report_id'], {
+            'total_transaction': f"{ctx.rng.randrange(5000, 5000000)} SAR",
+        })
+        if success:
+            updated += 1
+    return updated
+
+
+@scenario('reservation_storm', "8 threads reserving and cancelling report numbers", mutates=True)
+def reservation_storm(ctx: BenchmarkContext) -> int:
+    users = ctx.staff[:8]
+    completed = []
+    lock = threading.Lock()
+
+    def storm(username):
+        for _ in range(5):
+            success, reservation, _ = ctx.report_number_service.reserve_next_numbers(username)
+            if success:
+                ctx.report_number_service.cancel_reservation(reservation['report_number'], username)
+                with lock:
+                    completed.append(username)
+
+    threads = [threading.Thread(target=storm, args=(user['username'],)) for user in users]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return len(completed)
+
+
+@scenario('backup', "Deduplicated backup of the database", repeat=3, mutates=True)
+def backup(ctx: BenchmarkContext) -> int:
+    success, message, _ = ctx.backup_service.create_backup(created_by=ctx.admin['username'])
+    if not success:
+        raise RuntimeError(message)
+    return 1
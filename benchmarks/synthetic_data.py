@@ -0,0 +1,516 @@
+"""
+Synthetic Data Generator
+Builds a seeded, reproducible FIU database at a configurable scale.
+
+The same seed, scale and end date always produce the same rows, so
+benchmark results from different runs and machines compare like for like.
+"""
+
+import json
+import random
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from database.init_db import initialize_database
+from database.migrations import migrate_database
+from utils.log_fingerprint import error_fingerprint
+
+
+ARABIC_FIRST_NAMES = [
+    'محمد', 'أحمد', 'عبدالله', 'خالد', 'فهد', 'سعود', 'عبدالرحمن', 'فيصل', 'تركي', 'سلطان',
+    'ناصر', 'بندر', 'ماجد', 'عمر', 'يوسف', 'نورة', 'سارة', 'ريم', 'هند', 'لطيفة',
+    'منيرة', 'عبير', 'أمل', 'مها', 'دانة',
+]
+
+ARABIC_FAMILY_NAMES = [
+    'العتيبي', 'القحطاني', 'الغامدي', 'الزهراني', 'الشهري', 'الدوسري', 'الحربي', 'المطيري',
+    'السبيعي', 'الشمري', 'العنزي', 'الرشيدي', 'البقمي', 'الأحمدي', 'السديري', 'الخالدي',
+]
+
+ENGLISH_FIRST_NAMES = [
+    'John', 'Ahmed', 'Maria', 'Rajesh', 'Fatima', 'David', 'Chen', 'Priya', 'Omar', 'Elena',
+    'James', 'Aisha', 'Carlos', 'Mei', 'Hassan', 'Sophia',
+]
+
+ENGLISH_LAST_NAMES = [
+    'Smith', 'Khan', 'Garcia', 'Patel', 'Ali', 'Johnson', 'Wang', 'Sharma', 'Hussain',
+    'Petrov', 'Brown', 'Rahman', 'Lopez', 'Li', 'Qureshi', 'Miller',
+]
+
+COMPANY_WORDS = [
+    'Gulf', 'Al Noor', 'Horizon', 'Desert', 'Falcon', 'Crescent', 'Pearl', 'Oasis',
+    'Summit', 'Royal', 'Eastern', 'Capital', 'Golden', 'Najd', 'Red Sea', 'Atlas',
+]
+
+COMPANY_TYPES = [
+    'Trading Est.', 'Contracting Co.', 'General Trading LLC', 'Investment Group',
+    'Logistics Co.', 'Real Estate Co.', 'Exchange Est.', 'Holding Co.',
+]
+
+ARABIC_COMPANY_TYPES = ['للتجارة', 'للمقاولات', 'للاستثمار', 'للخدمات اللوجستية', 'العقارية']
+
+LOG_MODULES = [
+    ('report_service', ['create_report', 'update_report', 'get_reports', 'get_report_rows']),
+    ('approval_service', ['request_approval', 'approve_report', 'reject_report']),
+    ('auth_service', ['authenticate', 'logout']),
+    ('dashboard_service', ['get_summary_statistics', 'get_reports_by_month']),
+    ('backup_service', ['create_backup', 'apply_retention']),
+    ('report_number_service', ['reserve_next_numbers', 'cancel_reservation']),
+]
+
+# Approval status of generated reports and their relative weights
+APPROVAL_WEIGHTS = [
+    ('approved', 70),
+    ('pending_approval', 10),
+    ('draft', 10),
+    ('rejected', 5),
+    ('rework', 5),
+]
+
+# Fallback values for dropdown categories missing from the seeded database
+DEFAULT_DROPDOWNS = {
+    'gender': ['ذكر', 'أنثى'],
+    'arb_staff': ['نعم', 'لا'],
+    'nationality': ['Saudi', 'Egyptian', 'Indian', 'Pakistani', 'Yemeni'],
+    'second_reason_for_suspicion': ['Unusual cash deposits', 'Structuring', 'Rapid movement of funds'],
+    'type_of_suspected_transaction': ['Cash deposit', 'Wire transfer', 'Cheque'],
+    'report_classification': ['Money Laundering', 'Fraud'],
+    'report_source': ['Transaction monitoring', 'Internal monitoring'],
+    'reporting_entity': ['Branch', 'Compliance'],
+    'fiu_feedback': ['Under review', 'Closed'],
+}
+
+METADATA_KEY = 'synthetic_dataset'
+
+
+class SyntheticDataGenerator:
+    """
+    Generates a complete FIU database from a seed.
+
+    Rows are produced by one random.Random(seed) in a fixed order and
+    written with executemany in large transactions, so a 100k-report
+    database takes seconds rather than minutes.
+    """
+
+    BATCH_SIZE = 5000
+
+    def __init__(self, seed: int = 42, reports: int = 10000, users: int = 20,
+                 logs_per_report: float = 5.0, years: int = 3,
+                 end_date: Optional[str] = None):
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Random seed
+            reports: Number of reports
+            users: Number of agent/reporter users (an admin is always added)
+            logs_per_report: System log rows per report
+            years: Span of report dates, ending at end_date
+            end_date: Last report date (YYYY-MM-DD, default: today)
+        """
+        self.seed = seed
+        self.report_count = reports
+        self.user_count = users
+        self.logs_per_report = logs_per_report
+        self.years = years
+        self.end_date = end_date or datetime.now().strftime('%Y-%m-%d')
+        self.rng = random.Random(seed)
+
+    def parameters(self) -> Dict:
+        """Parameters identifying the generated dataset."""
+        return {
+            'seed': self.seed,
+            'reports': self.report_count,
+            'users': self.user_count,
+            'logs_per_report': self.logs_per_report,
+            'years': self.years,
+            'end_date': self.end_date,
+        }
+
+    # ==================== GENERATION ====================
+
+    def generate(self, db_path: str,
+                 progress_callback: Optional[Callable[[int, str], None]] = None) -> Dict:
+        """
+        Create a new database at db_path and fill it with synthetic data.
+
+        Args:
+            db_path: Path of the database to create (must not exist)
+            progress_callback: Optional callback(percent, message)
+
+        Returns:
+            Dictionary of row counts per table plus elapsed_seconds
+        """
+        def report(percent: int, message: str):
+            if progress_callback:
+                progress_callback(percent, message)
+
+        if Path(db_path).exists():
+            raise FileExistsError(f"Database already exists: {db_path}")
+
+        started = time.perf_counter()
+        report(0, "Creating schema...")
+        success, message = initialize_database(db_path)
+        if not success:
+            raise RuntimeError(message)
+        success, message = migrate_database(db_path)
+        if not success:
+            raise RuntimeError(message)
+
+        counts = {}
+        conn = sqlite3.connect(db_path)
+        try:
+            conn.execute("PRAGMA synchronous=OFF")
+            dropdowns = self._load_dropdowns(conn)
+
+            # Drop the example reports shipped with the schema
+            conn.execute("DELETE FROM report_approvals")
+            conn.execute("DELETE FROM reports")
+
+            report(5, "Creating users...")
+            users = self._insert_users(conn)
+            counts['users'] = len(users)
+
+            counts.update(self._insert_reports(conn, users, dropdowns, report))
+
+            report(90, "Writing system logs...")
+            counts['system_logs'] = self._insert_logs(conn, users)
+
+            conn.execute(
+                "INSERT OR REPLACE INTO system_metadata (key, value) VALUES (?, ?)",
+                (METADATA_KEY, json.dumps(self.parameters(), sort_keys=True))
+            )
+            conn.commit()
+
+            report(97, "Analyzing...")
+            conn.execute("ANALYZE")
+            conn.commit()
+        finally:
+            conn.close()
+
+        counts['elapsed_seconds'] = round(time.perf_counter() - started, 2)
+        report(100, "Done")
+        return counts
+
+    def _load_dropdowns(self, conn) -> Dict[str, List[str]]:
+        """Read active dropdown values, falling back to built-in lists."""
+        dropdowns = {category: list(values) for category, values in DEFAULT_DROPDOWNS.items()}
+        rows = conn.execute("""
+            SELECT config_category, config_value FROM system_config
+            WHERE config_type = 'dropdown' AND is_active = 1
+            ORDER BY config_category, display_order, config_value
+        """).fetchall()
+        seeded: Dict[str, List[str]] = {}
+        for category, value in rows:
+            seeded.setdefault(category, []).append(value)
+        dropdowns.update(seeded)
+        return dropdowns
+
+    def _insert_users(self, conn) -> List[Dict]:
+        """Create the benchmark admin and agent/reporter users."""
+        rng = self.rng
+        users = [{'username': 'bench_admin', 'full_name': 'Benchmark Administrator', 'role': 'admin'}]
+        for index in range(1, self.user_count + 1):
+            first = rng.choice(ARABIC_FIRST_NAMES)
+            family = rng.choice(ARABIC_FAMILY_NAMES)
+            users.append({
+                'username': f"bench_user{index:03d}",
+                'full_name': f"{first} {family}",
+                'role': 'agent' if index % 3 else 'reporter',
+            })
+
+        conn.executemany("""
+            INSERT INTO users (username, password, full_name, role, is_active, created_by)
+            VALUES (?, 'bench123', ?, ?, 1, 'SYSTEM')
+        """, [(user['username'], user['full_name'], user['role']) for user in users])
+
+        ids = dict(conn.execute("SELECT username, user_id FROM users").fetchall())
+        for user in users:
+            user['user_id'] = ids[user['username']]
+            user['initials'] = ''.join(part[0] for part in user['full_name'].split()[:2])
+        return users
+
+    def _entity_name(self) -> str:
+        """Random person or company name, Arabic or English."""
+        rng = self.rng
+        kind = rng.random()
+        if kind < 0.45:
+            return f"{rng.choice(ARABIC_FIRST_NAMES)} {rng.choice(ARABIC_FIRST_NAMES)} {rng.choice(ARABIC_FAMILY_NAMES)}"
+        if kind < 0.7:
+            return f"{rng.choice(ENGLISH_FIRST_NAMES)} {rng.choice(ENGLISH_LAST_NAMES)}"
+        if kind < 0.85:
+            return f"{rng.choice(COMPANY_WORDS)} {rng.choice(COMPANY_TYPES)}"
+        return f"شركة {rng.choice(ARABIC_FAMILY_NAMES)} {rng.choice(ARABIC_COMPANY_TYPES)}"
+
+    def _insert_reports(self, conn, users: List[Dict], dropdowns: Dict[str, List[str]],
+                        report: Callable[[int, str], None]) -> Dict[str, int]:
+        """Create reports with their versions, approvals, activity and history."""
+        rng = self.rng
+        end = datetime.strptime(self.end_date, '%Y-%m-%d')
+        span_seconds = int(timedelta(days=365 * self.years).total_seconds())
+        admin = users[0]
+        staff = users[1:] or users
+        statuses = [status for status, _ in APPROVAL_WEIGHTS]
+        weights = [weight for _, weight in APPROVAL_WEIGHTS]
+
+        # Report numbers are YYYY/MM/NNN in date order, serial numbers global
+        created = sorted(
+            end - timedelta(seconds=rng.randrange(span_seconds)) for _ in range(self.report_count)
+        )
+        next_sn = (conn.execute("SELECT COALESCE(MAX(sn), 0) FROM reports").fetchone()[0]) + 1
+        month_counters: Dict[str, int] = {}
+        for (report_number,) in conn.execute("SELECT report_number FROM reports"):
+            prefix, _, number = report_number.rpartition('/')
+            if number.isdigit():
+                month_counters[prefix] = max(month_counters.get(prefix, 0), int(number))
+
+        counts = {'reports': 0, 'report_versions': 0, 'report_approvals': 0,
+                  'activity_log': 0, 'change_history': 0, 'notifications': 0}
+
+        for batch_start in range(0, self.report_count, self.BATCH_SIZE):
+            batch = created[batch_start:batch_start + self.BATCH_SIZE]
+            report_rows = []
+            pending = []
+
+            for created_at in batch:
+                user = rng.choice(staff)
+                prefix = created_at.strftime('%Y/%m')
+                month_counters[prefix] = month_counters.get(prefix, 0) + 1
+                report_number = f"{prefix}/{month_counters[prefix]:03d}"
+                approval_status = rng.choices(statuses, weights)[0]
+                versions = 1 if approval_status == 'draft' else rng.choice((1, 1, 2, 2, 3))
+                report_date = (created_at - timedelta(days=rng.randrange(0, 10))).strftime('%d/%m/%Y')
+                sending_date = (created_at + timedelta(days=rng.randrange(1, 15))).strftime('%d/%m/%Y')
+                stamp = created_at.strftime('%Y-%m-%d %H:%M:%S')
+                updated_stamp = (created_at + timedelta(hours=rng.randrange(1, 200))).strftime('%Y-%m-%d %H:%M:%S') \
+                    if versions > 1 else None
+                is_company = rng.random() < 0.3
+
+                data = {
+                    'sn': next_sn,
+                    'report_number': report_number,
+                    'report_date': report_date,
+                    'outgoing_letter_number': f"OUT-{created_at.year}-{rng.randrange(10000, 99999)}",
+                    'reported_entity_name': self._entity_name(),
+                    'legal_entity_owner': self._entity_name() if is_company else None,
+                    'legal_entity_owner_checkbox': 1 if is_company else 0,
+                    'gender': '' if is_company else rng.choice(dropdowns['gender']),
+                    'nationality': rng.choice(dropdowns['nationality']),
+                    'id_type': 'CR' if is_company else rng.choice(('National ID', 'Iqama')),
+                    'id_cr': f"{7 if is_company else rng.choice((1, 2))}{rng.randrange(10 ** 8, 10 ** 9)}",
+                    'account_membership': f"SA{rng.randrange(10 ** 21, 10 ** 22)}",
+                    'acc_membership_checkbox': 0,
+                    'branch_id': f"{rng.randrange(100, 999)}",
+                    'cic': f"{rng.randrange(10 ** 7, 10 ** 8)}",
+                    'relationship': rng.choice(('Customer', 'Beneficiary', 'Counterparty')),
+                    'first_reason_for_suspicion': rng.choice(dropdowns['second_reason_for_suspicion']),
+                    'second_reason_for_suspicion': rng.choice(dropdowns['second_reason_for_suspicion']),
+                    'type_of_suspected_transaction': rng.choice(dropdowns['type_of_suspected_transaction']),
+                    'arb_staff': rng.choice(dropdowns['arb_staff']),
+                    'total_transaction': f"{rng.randrange(5000, 5000000)}.{rng.randrange(100):02d}",
+                    'report_classification': rng.choice(dropdowns['report_classification']),
+                    'report_source': rng.choice(dropdowns['report_source']),
+                    'reporting_entity': rng.choice(dropdowns['reporting_entity']),
+                    'reporter_initials': user['initials'],
+                    'sending_date': sending_date,
+                    'original_copy_confirmation': rng.choice(('Yes', 'No', None)),
+                    'fiu_number': f"FIU-{rng.randrange(100000, 999999)}" if approval_status == 'approved' else None,
+                    'fiu_feedback': rng.choice(dropdowns['fiu_feedback']) if approval_status == 'approved' else None,
+                    'created_at': stamp,
+                    'created_by': user['username'],
+                    'updated_at': updated_stamp,
+                    'updated_by': user['username'] if updated_stamp else None,
+                    'current_version': versions,
+                    'approval_status': approval_status,
+                }
+                report_rows.append(data)
+                pending.append((data, user, versions, created_at))
+                next_sn += 1
+
+            columns = list(report_rows[0].keys())
+            conn.executemany(
+                f"INSERT INTO reports ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                [tuple(row[column] for column in columns) for row in report_rows]
+            )
+            ids = dict(conn.execute(
+                "SELECT report_number, report_id FROM reports WHERE sn >= ?",
+                (report_rows[0]['sn'],)
+            ).fetchall())
+
+            self._insert_report_children(conn, pending, ids, admin, counts)
+            conn.commit()
+
+            counts['reports'] += len(report_rows)
+            done = batch_start + len(batch)
+            report(5 + int(85 * done / max(self.report_count, 1)), f"Generated {done:,} of {self.report_count:,} reports")
+
+        return counts
+
+    def _insert_report_children(self, conn, pending: List[tuple], ids: Dict[str, int],
+                                admin: Dict, counts: Dict[str, int]):
+        """Insert versions, approvals, activity, change history and notifications for a batch."""
+        rng = self.rng
+        version_rows, history_rows = [], []
+        for data, user, versions, created_at in pending:
+            report_id = ids[data['report_number']]
+            data['report_id'] = report_id
+            history_rows.append(('reports', report_id, 'report', None, data['report_number'],
+                                 'INSERT', None, user['username'], data['created_at']))
+            for number in range(1, versions + 1):
+                stamp = (created_at + timedelta(hours=(number - 1) * rng.randrange(1, 72))).strftime('%Y-%m-%d %H:%M:%S')
+                snapshot = {key: value for key, value in data.items() if key != 'report_id'}
+                version_rows.append((report_id, number, json.dumps(snapshot, ensure_ascii=False),
+                                     'Initial version' if number == 1 else f"Revision {number}",
+                                     user['username'], stamp))
+                if number > 1:
+                    history_rows.append(('reports', report_id, 'total_transaction', None,
+                                         data['total_transaction'], 'UPDATE', None, user['username'], stamp))
+
+        conn.executemany("""
+            INSERT INTO report_versions
+            (report_id, version_number, snapshot_data, change_summary, created_by, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+        """, version_rows)
+        conn.executemany("""
+            INSERT INTO change_history
+            (table_name, record_id, field_name, old_value, new_value, change_type,
+             change_reason, changed_by, changed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, history_rows)
+
+        first_report_id = min(ids.values())
+        version_ids = {
+            (report_id, number): version_id
+            for version_id, report_id, number in conn.execute(
+                "SELECT version_id, report_id, version_number FROM report_versions WHERE report_id >= ?",
+                (first_report_id,)
+            )
+        }
+
+        approval_rows, activity_rows, notification_rows = [], [], []
+        review_status = {'approved': 'approved', 'rejected': 'rejected', 'rework': 'rework',
+                         'pending_approval': 'pending'}
+        for data, user, versions, created_at in pending:
+            report_id = data['report_id']
+            activity_rows.append((user['user_id'], user['username'], 'CREATE', report_id,
+                                  data['report_number'], version_ids.get((report_id, 1)), 1,
+                                  f"Created report {data['report_number']}", None, data['created_at']))
+            for number in range(2, versions + 1):
+                activity_rows.append((user['user_id'], user['username'], 'VERSION_CREATE', report_id,
+                                      data['report_number'], version_ids.get((report_id, number)), number,
+                                      f"Created version {number} of report {data['report_number']}",
+                                      None, data['updated_at'] or data['created_at']))
+
+            status = review_status.get(data['approval_status'])
+            if status is None:
+                continue
+            requested_at = created_at + timedelta(hours=rng.randrange(1, 48))
+            reviewed_at = requested_at + timedelta(hours=rng.randrange(1, 96)) if status != 'pending' else None
+            approval_rows.append((
+                report_id, version_ids.get((report_id, versions)), status,
+                admin['user_id'] if reviewed_at else None,
+                'Reviewed' if reviewed_at else 'Please review',
+                user['username'], requested_at.strftime('%Y-%m-%d %H:%M:%S'),
+                reviewed_at.strftime('%Y-%m-%d %H:%M:%S') if reviewed_at else None
+            ))
+            if reviewed_at:
+                action = 'APPROVE' if status == 'approved' else 'REJECT'
+                activity_rows.append((admin['user_id'], admin['username'], action, report_id,
+                                      data['report_number'], version_ids.get((report_id, versions)), versions,
+                                      f"{action.title()}d report {data['report_number']}", None,
+                                      reviewed_at.strftime('%Y-%m-%d %H:%M:%S')))
+                notification_rows.append((user['user_id'], f"Report {status.title()}",
+                                          f"Your report {data['report_number']} was {status}",
+                                          'approval_result', report_id, rng.random() < 0.8,
+                                          reviewed_at.strftime('%Y-%m-%d %H:%M:%S')))
+            else:
+                notification_rows.append((admin['user_id'], 'Approval Request',
+                                          f"{user['username']} requested approval for report {data['report_number']}",
+                                          'approval_request', report_id, 0,
+                                          requested_at.strftime('%Y-%m-%d %H:%M:%S')))
+
+        conn.executemany("""
+            INSERT INTO report_approvals
+            (report_id, version_id, approval_status, approver_id, approval_comment,
+             requested_by, requested_at, reviewed_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, approval_rows)
+        conn.executemany("""
+            INSERT INTO activity_log
+            (user_id, username, action_type, report_id, report_number, version_id,
+             version_number, description, metadata, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, activity_rows)
+        conn.executemany("""
+            INSERT INTO notifications
+            (user_id, title, message, notification_type, related_report_id, is_read, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, notification_rows)
+
+        counts['report_versions'] += len(version_rows)
+        counts['change_history'] += len(history_rows)
+        counts['report_approvals'] += len(approval_rows)
+        counts['activity_log'] += len(activity_rows)
+        counts['notifications'] += len(notification_rows)
+
+    def _insert_logs(self, conn, users: List[Dict]) -> int:
+        """Create system log rows spread over the dataset's time range."""
+        rng = self.rng
+        total = int(self.report_count * self.logs_per_report)
+        end = datetime.strptime(self.end_date, '%Y-%m-%d')
+        span_seconds = int(timedelta(days=365 * self.years).total_seconds())
+        levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
+        level_weights = [5, 80, 10, 4, 1]
+
+        written = 0
+        while written < total:
+            rows = []
+            for _ in range(min(self.BATCH_SIZE, total - written)):
+                module, functions = rng.choice(LOG_MODULES)
+                level = rng.choices(levels, level_weights)[0]
+                user = rng.choice(users) if rng.random() < 0.8 else None
+                timestamp = (end - timedelta(seconds=rng.randrange(span_seconds))).isoformat()
+                exception_type = 'OperationalError' if level in ('ERROR', 'CRITICAL') else None
+                function = rng.choice(functions)
+                message = f"{level.title()} in {module}: operation {rng.randrange(1, 10 ** 6)}"
+                rows.append((
+                    timestamp, level, module, function, message,
+                    user['user_id'] if user else None,
+                    user['username'] if user else None,
+                    exception_type,
+                    'database is locked' if exception_type else None,
+                    error_fingerprint(level, exception_type, None, module, function, message),
+                ))
+            conn.executemany("""
+                INSERT INTO system_logs
+                (timestamp, log_level, module, function_name, message, user_id, username,
+                 exception_type, exception_message, error_fingerprint)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """, rows)
+            written += len(rows)
+        return written
+
+
+def read_dataset_parameters(db_path: str) -> Optional[Dict]:
+    """
+    Read the generation parameters stamped into a synthetic database.
+
+    Args:
+        db_path: Database path
+
+    Returns:
+        Parameters dictionary, or None if the database is not synthetic
+    """
+    conn = sqlite3.connect(db_path)
+    try:
+        row = conn.execute(
+            "SELECT value FROM system_metadata WHERE key = ?", (METADATA_KEY,)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
@@ -3,11 +3,20 @@ Database Manager with WAL Mode and Retry Logic
 Handles all database operations with concurrent access support
 """
 import sqlite3
+import threading
 import time
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Any, List, Tuple, Optional
 
+from utils.tracing import tracer, traced
+
+
+def _statement_attributes(self, query, *args, **kwargs):
+    """Span attributes for a traced statement (normalized, never the parameters)"""
+    from database.query_profiler import normalize_statement
+    return {'statement': normalize_statement(query)[1]}
+
 
 class DatabaseManager:
     """Manages SQLite database connections with WAL mode enabled"""
@@ -21,13 +30,29 @@ class DatabaseManager:
         """
         self.db_path = db_path
         self.connection_timeout = 10.0  # 10 seconds
+
+        # Connection gate - lets a restore wait for in-flight work and
+        # hold back new connections while the database file is swapped
+        self._gate = threading.Condition()
+        self._active_connections = 0
+        self._quiesced = False
+
+        # Optional QueryProfiler; None keeps the query path free of timing
+        self.profiler = None
+
         self._init_connection()
+        self.restore_generation = self.get_restore_generation()
     
     def _init_connection(self):
         """Initialize database with WAL mode (one-time setup)"""
         try:
             conn = sqlite3.connect(self.db_path)
-            
+
+            # Lets archival return freed pages with incremental_vacuum; only
+            # takes effect on a new, empty database (ArchiveService converts
+            # existing ones)
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
             # Enable WAL mode for better concurrency
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA synchronous=NORMAL")
@@ -48,22 +73,127 @@ class DatabaseManager:
         Yields:
             sqlite3.Connection: Database connection
         """
-        conn = sqlite3.connect(
-            self.db_path,
-            timeout=self.connection_timeout,
-            isolation_level='DEFERRED'  # Optimal for WAL mode
-        )
-        conn.row_factory = sqlite3.Row  # Access columns by name
-        
+        span = tracer.start_span("db.connection", 'db')
+        with self._gate:
+            while self._quiesced:
+                self._gate.wait()
+            self._active_connections += 1
+
         try:
-            yield conn
-            conn.commit()
-        except Exception:
-            conn.rollback()
-            raise
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=self.connection_timeout,
+                isolation_level='DEFERRED'  # Optimal for WAL mode
+            )
+            conn.row_factory = sqlite3.Row  # Access columns by name
+
+            try:
+                yield conn
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                conn.close()
         finally:
-            conn.close()
+            with self._gate:
+                self._active_connections -= 1
+                self._gate.notify_all()
+            span.finish()
+
+    @contextmanager
+    def quiesce(self, timeout: float = 10.0):
+        """
+        Hold back new connections and wait for in-flight ones to close
+
+        Used while the database file is replaced. Code running inside the
+        block must not call get_connection() (directly or through logging).
+
+        Args:
+            timeout: Seconds to wait for in-flight connections
+
+        Raises:
+            TimeoutError: If connections are still open after the timeout
+        """
+        deadline = time.monotonic() + timeout
+        with self._gate:
+            if self._quiesced:
+                raise RuntimeError("Database is already quiesced")
+            self._quiesced = True
+            try:
+                while self._active_connections > 0:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(
+                            f"{self._active_connections} connection(s) still in use"
+                        )
+                    self._gate.wait(remaining)
+            except BaseException:
+                self._quiesced = False
+                self._gate.notify_all()
+                raise
+
+        try:
+            yield
+        finally:
+            with self._gate:
+                self._quiesced = False
+                self._gate.notify_all()
+
+    def enable_profiling(self, slow_threshold_ms: float = 200, flush_interval: float = 60):
+        """
+        Start recording per-statement timings for execute_with_retry/execute_many
+
+        Args:
+            slow_threshold_ms: Statements slower than this go to the slow query log
+            flush_interval: Seconds between writes to the profile tables
+
+        Returns:
+            QueryProfiler: The active profiler
+        """
+        from database.query_profiler import QueryProfiler
+
+        if self.profiler is None:
+            profiler = QueryProfiler(self, slow_threshold_ms, flush_interval)
+            profiler.start()
+            self.profiler = profiler
+        else:
+            self.profiler.slow_threshold_ms = slow_threshold_ms
+        return self.profiler
+
+    def disable_profiling(self):
+        """Stop recording timings and flush what was collected"""
+        profiler, self.profiler = self.profiler, None
+        if profiler is not None:
+            profiler.stop()
+
+    def get_restore_generation(self) -> Optional[str]:
+        """Get the restore marker stamped into the database by the last restore"""
+        try:
+            result = self.execute_with_retry(
+                "SELECT value FROM system_metadata WHERE key = 'restore_generation'"
+            )
+            return result[0][0] if result else None
+        except Exception:
+            return None
+
+    def check_restored(self) -> bool:
+        """
+        Check whether another client restored the database since the last check
+
+        Connections are opened per operation, so the next query already
+        reads the restored file; callers only need to reload cached state.
+
+        Returns:
+            True if the database was restored since the last check
+        """
+        generation = self.get_restore_generation()
+        if generation == self.restore_generation:
+            return False
+        self.restore_generation = generation
+        return True
     
+    @traced("db.execute", 'db', attributes=_statement_attributes)
     def execute_with_retry(
         self,
         query: str,
@@ -84,24 +214,39 @@ class DatabaseManager:
         Raises:
             sqlite3.Error: If query fails after all retries
         """
+        profiler = self.profiler
+        lock_retries = 0
+        backoff = 0.0
+
         for attempt in range(max_retries):
             try:
                 with self.get_connection() as conn:
                     cursor = conn.cursor()
+                    if profiler is not None:
+                        started = time.perf_counter()
                     cursor.execute(query, params)
                     
                     # Return results for SELECT queries
                     if query.strip().upper().startswith('SELECT'):
-                        return cursor.fetchall()
-                    
-                    # Return empty list for other queries
-                    return []
+                        rows = cursor.fetchall()
+                    else:
+                        # Return empty list for other queries
+                        rows = []
+
+                    if profiler is not None:
+                        profiler.record(
+                            conn, query, params, time.perf_counter() - started,
+                            len(rows) if rows else cursor.rowcount, lock_retries, backoff
+                        )
+                    return rows
                     
             except sqlite3.OperationalError as e:
                 # Handle database locked errors
                 if "locked" in str(e).lower() and attempt < max_retries - 1:
                     # Exponential backoff: 0.5s, 1s, 1.5s, 2s, 2.5s
                     wait_time = 0.5 * (attempt + 1)
+                    lock_retries += 1
+                    backoff += wait_time
                     time.sleep(wait_time)
                     continue
                 raise
@@ -110,6 +255,7 @@ class DatabaseManager:
         
         return []
     
+    @traced("db.execute_many", 'db', attributes=_statement_attributes)
     def execute_many(
         self,
         query: str,
@@ -127,16 +273,30 @@ class DatabaseManager:
         Returns:
             Number of affected rows
         """
+        profiler = self.profiler
+        lock_retries = 0
+        backoff = 0.0
+
         for attempt in range(max_retries):
             try:
                 with self.get_connection() as conn:
                     cursor = conn.cursor()
+                    if profiler is not None:
+                        started = time.perf_counter()
                     cursor.executemany(query, params_list)
+                    if profiler is not None:
+                        # Explained with the first parameter set if it turns out slow
+                        profiler.record(
+                            conn, query, params_list[0] if params_list else (),
+                            time.perf_counter() - started, cursor.rowcount, lock_retries, backoff
+                        )
                     return cursor.rowcount
                     
             except sqlite3.OperationalError as e:
                 if "locked" in str(e).lower() and attempt < max_retries - 1:
                     wait_time = 0.5 * (attempt + 1)
+                    lock_retries += 1
+                    backoff += wait_time
                     time.sleep(wait_time)
                     continue
                 raise
@@ -171,8 +331,9 @@ class DatabaseManager:
     def get_table_columns(self, table_name: str) -> List[str]:
         """Get list of column names for a table"""
         try:
-            query = f"PRAGMA table_info({table_name})"
-            result = self.execute_with_retry(query)
+            # Table-valued form so execute_with_retry treats it as a SELECT
+            query = "SELECT name FROM pragma_table_info(?)"
+            result = self.execute_with_retry(query, (table_name,))
             return [row['name'] for row in result]
         except Exception:
             return []
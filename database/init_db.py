@@ -30,6 +30,9 @@ def initialize_database(db_path: str) -> tuple[bool, str]:
         conn = sqlite3.connect(db_path)
 
         try:
+            # Must be set before the first table is created
+            conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+
             # Enable WAL mode
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA synchronous=NORMAL")
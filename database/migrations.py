@@ -1,10 +1,20 @@
 """
 Database Migrations
 Handles schema updates for existing databases.
+
+Each migration is a numbered step that runs in its own transaction and is
+recorded in migration_history. A schema fingerprint in system_metadata lets
+startup skip all migration work with a single read once the database is
+current.
 """
 
+import hashlib
+import re
 import sqlite3
-from typing import Tuple
+import time
+from typing import Callable, List, Tuple
+
+from utils.log_fingerprint import error_fingerprint
 
 
 def migrate_database(db_path: str) -> Tuple[bool, str]:
@@ -18,1052 +28,1698 @@ def migrate_database(db_path: str) -> Tuple[bool, str]:
         Tuple of (success, message)
     """
     try:
-        conn = sqlite3.connect(db_path)
-        cursor = conn.cursor()
+        conn = sqlite3.connect(db_path, isolation_level=None)
+        try:
+            cursor = conn.cursor()
+            fingerprint = get_schema_fingerprint()
+
+            # Fast path: one read when the schema is already current
+            if _read_schema_fingerprint(cursor) == fingerprint:
+                return True, "No migrations needed"
+
+            messages = []
+            failures = []
+
+            # migration_history must exist before we can tell what was applied
+            _run_migration(cursor, 16, _migration_16, [])
+            cursor.execute("SELECT migration_number FROM migration_history WHERE success = 1")
+            applied = {row[0] for row in cursor.fetchall()}
+
+            for number, name, migration in MIGRATIONS:
+                if number in applied:
+                    continue
+                step_messages = []
+                error = _run_migration(cursor, number, migration, step_messages, name)
+                if error:
+                    failures.append(number)
+                    messages.append(f"Migration {number} ({name}) failed: {error}")
+                else:
+                    messages.extend(step_messages)
 
-        messages = []
+            if failures:
+                return False, "; ".join(messages)
+
+            _write_schema_fingerprint(cursor, fingerprint)
+
+        finally:
+            conn.close()
+
+        if messages:
+            return True, "; ".join(messages)
+        else:
+            return True, "No migrations needed"
+
+    except Exception as e:
+        return False, f"Migration failed: {str(e)}"
+
+
+def get_schema_fingerprint() -> str:
+    """
+    Fingerprint of the migration list.
+
+    Changes whenever a migration is added or renamed, so a database stamped
+    with the current fingerprint has every migration applied.
+    """
+    signature = "\n".join(f"{number}:{name}" for number, name, _ in MIGRATIONS)
+    return hashlib.sha256(signature.encode('utf-8')).hexdigest()[:16]
+
+
+def _read_schema_fingerprint(cursor) -> str:
+    try:
+        cursor.execute("SELECT value FROM system_metadata WHERE key = 'schema_fingerprint'")
+        row = cursor.fetchone()
+        return row[0] if row else ""
+    except sqlite3.OperationalError:
+        return ""
 
-        # Migration 0: Ensure system_config table exists (critical for all dropdown functionality)
+
+def _write_schema_fingerprint(cursor, fingerprint: str):
+    try:
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='system_config'
-        """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE system_config (
-                    config_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    config_key TEXT UNIQUE NOT NULL,
-                    config_value TEXT NOT NULL,
-                    config_type TEXT CHECK(config_type IN ('dropdown', 'setting', 'column', 'path')),
-                    config_category TEXT,
-                    display_order INTEGER DEFAULT 0,
-                    is_active INTEGER DEFAULT 1,
-                    created_at TEXT DEFAULT (datetime('now')),
-                    updated_at TEXT,
-                    updated_by TEXT
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_system_config_key ON system_config(config_key)
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_system_config_type ON system_config(config_type)
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_system_config_category ON system_config(config_category)
-            """)
-            conn.commit()
-            messages.append("Created system_config table")
+            INSERT OR REPLACE INTO system_metadata (key, value, updated_at, updated_by)
+            VALUES ('schema_fingerprint', ?, datetime('now'), 'SYSTEM')
+        """, (fingerprint,))
+    except sqlite3.OperationalError:
+        pass
 
-        # Migration 1: Add theme_preference column to users table
-        try:
-            cursor.execute("SELECT theme_preference FROM users LIMIT 1")
-        except sqlite3.OperationalError:
-            # Column doesn't exist, add it
-            # CHECK constraints in ALTER TABLE ADD COLUMN require SQLite 3.25.0+
-            # Validation is handled at application level
+
+def _run_migration(cursor, number: int, migration: Callable, messages: List[str],
+                   name: str = None) -> str:
+    """
+    Run one migration in its own transaction and record it in migration_history.
+
+    Returns:
+        Error message, or empty string on success
+    """
+    started = time.perf_counter()
+    try:
+        cursor.execute("BEGIN IMMEDIATE")
+        migration(cursor, messages)
+        if name is not None:
             cursor.execute("""
-                ALTER TABLE users
-                ADD COLUMN theme_preference TEXT DEFAULT 'light'
-            """)
-            conn.commit()
-            messages.append("Added theme_preference column to users table")
+                INSERT OR REPLACE INTO migration_history
+                (migration_number, migration_name, applied_at, execution_time_ms, success, error_message)
+                VALUES (?, ?, datetime('now'), ?, 1, NULL)
+            """, (number, name, int((time.perf_counter() - started) * 1000)))
+        cursor.execute("COMMIT")
+        return ""
+
+    except Exception as e:
+        if cursor.connection.in_transaction:
+            cursor.execute("ROLLBACK")
+        if name is not None:
+            try:
+                cursor.execute("""
+                    INSERT OR REPLACE INTO migration_history
+                    (migration_number, migration_name, applied_at, execution_time_ms, success, error_message)
+                    VALUES (?, ?, datetime('now'), ?, 0, ?)
+                """, (number, name, int((time.perf_counter() - started) * 1000), str(e)))
+            except sqlite3.Error:
+                pass
+        return str(e)
+
+
+def _drop_dependent_objects(cursor, table_name: str) -> List[Tuple[str, str, str]]:
+    """
+    Drop the views and triggers that reference a table about to be rebuilt.
+
+    Returns:
+        List of (type, name, sql) for _recreate_objects
+    """
+    cursor.execute("""
+        SELECT type, name, sql FROM sqlite_master
+        WHERE type IN ('view', 'trigger') AND sql IS NOT NULL
+        AND (tbl_name = ? OR sql LIKE ?)
+        ORDER BY rowid
+    """, (table_name, f"%{table_name}%"))
+    objects = cursor.fetchall()
+    for object_type, name, _ in objects:
+        cursor.execute(f"DROP {object_type.upper()} IF EXISTS {name}")
+    return objects
+
+
+def _drop_stray_rebuild_table(cursor, table_name: str, messages: List[str]):
+    """
+    Drop a <table>_new copy left behind by an interrupted table rebuild.
 
-        # Migration 2: Create report_versions table
+    Only called while the original table exists, so the leftover is never
+    the sole copy of the data.
+    """
+    stray = f"{table_name}_new"
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type='table' AND name=?", (stray,))
+    if cursor.fetchone():
+        cursor.execute(f"DROP TABLE {stray}")
+        messages.append(f"Dropped leftover {stray} table")
+
+
+def _recreate_objects(cursor, objects: List[Tuple[str, str, str]], dropped_columns: Tuple[str, ...] = ()):
+    """Recreate views and triggers, skipping any that use a dropped column."""
+    for object_type, name, sql in objects:
+        if any(re.search(rf"\b{column}\b", sql) for column in dropped_columns):
+            continue
+        cursor.execute(sql)
+
+
+# ==================== Migrations ====================
+
+def _migration_0(cursor, messages):
+    """Ensure system_config table exists (critical for all dropdown functionality)"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='system_config'
+    """)
+    if not cursor.fetchone():
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='report_versions'
+            CREATE TABLE system_config (
+                config_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                config_key TEXT UNIQUE NOT NULL,
+                config_value TEXT NOT NULL,
+                config_type TEXT CHECK(config_type IN ('dropdown', 'setting', 'column', 'path')),
+                config_category TEXT,
+                display_order INTEGER DEFAULT 0,
+                is_active INTEGER DEFAULT 1,
+                created_at TEXT DEFAULT (datetime('now')),
+                updated_at TEXT,
+                updated_by TEXT
+            )
         """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE report_versions (
-                    version_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    report_id INTEGER NOT NULL,
-                    version_number INTEGER NOT NULL,
-                    snapshot_data TEXT NOT NULL,
-                    change_summary TEXT,
-                    created_by TEXT NOT NULL,
-                    created_at TEXT DEFAULT (datetime('now')),
-                    FOREIGN KEY (report_id) REFERENCES reports(report_id)
-                )
-            """)
-            conn.commit()
-            messages.append("Created report_versions table")
+        cursor.execute("""
+            CREATE INDEX idx_system_config_key ON system_config(config_key)
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_system_config_type ON system_config(config_type)
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_system_config_category ON system_config(config_category)
+        """)
+        messages.append("Created system_config table")
 
-        # Migration 3: Create report_approvals table
+
+def _migration_1(cursor, messages):
+    """Add theme_preference column to users table"""
+    try:
+        cursor.execute("SELECT theme_preference FROM users LIMIT 1")
+    except sqlite3.OperationalError:
+        # Column doesn't exist, add it
+        # CHECK constraints in ALTER TABLE ADD COLUMN require SQLite 3.25.0+
+        # Validation is handled at application level
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='report_approvals'
+            ALTER TABLE users
+            ADD COLUMN theme_preference TEXT DEFAULT 'light'
         """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE report_approvals (
-                    approval_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    report_id INTEGER NOT NULL,
-                    version_id INTEGER,
-                    approval_status TEXT CHECK(approval_status IN ('pending', 'approved', 'rejected', 'rework')) DEFAULT 'pending',
-                    approver_id INTEGER,
-                    approval_comment TEXT,
-                    requested_by TEXT NOT NULL,
-                    requested_at TEXT DEFAULT (datetime('now')),
-                    reviewed_at TEXT,
-                    FOREIGN KEY (report_id) REFERENCES reports(report_id),
-                    FOREIGN KEY (approver_id) REFERENCES users(user_id),
-                    FOREIGN KEY (version_id) REFERENCES report_versions(version_id)
-                )
-            """)
-            conn.commit()
-            messages.append("Created report_approvals table")
+        messages.append("Added theme_preference column to users table")
+
 
-        # Migration 4: Create notifications table
+def _migration_2(cursor, messages):
+    """Create report_versions table"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='report_versions'
+    """)
+    if not cursor.fetchone():
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='notifications'
+            CREATE TABLE report_versions (
+                version_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                report_id INTEGER NOT NULL,
+                version_number INTEGER NOT NULL,
+                snapshot_data TEXT NOT NULL,
+                change_summary TEXT,
+                created_by TEXT NOT NULL,
+                created_at TEXT DEFAULT (datetime('now')),
+                FOREIGN KEY (report_id) REFERENCES reports(report_id)
+            )
         """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE notifications (
-                    notification_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    title TEXT NOT NULL,
-                    message TEXT NOT NULL,
-                    notification_type TEXT CHECK(notification_type IN ('info', 'warning', 'approval_request', 'approval_result')),
-                    related_report_id INTEGER,
-                    is_read INTEGER DEFAULT 0,
-                    created_at TEXT DEFAULT (datetime('now')),
-                    FOREIGN KEY (user_id) REFERENCES users(user_id),
-                    FOREIGN KEY (related_report_id) REFERENCES reports(report_id)
-                )
-            """)
-            conn.commit()
-            messages.append("Created notifications table")
+        messages.append("Created report_versions table")
 
-        # Migration 5: Add versioning columns to reports table
-        try:
-            cursor.execute("SELECT current_version FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN current_version INTEGER DEFAULT 1
-            """)
-            conn.commit()
-            messages.append("Added current_version column to reports table")
 
-        try:
-            cursor.execute("SELECT approval_status FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
-            # Add approval_status column without CHECK constraint
-            # (CHECK constraints in ALTER TABLE ADD COLUMN require SQLite 3.25.0+)
-            # Validation is handled at application level
-            cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN approval_status TEXT DEFAULT 'draft'
-            """)
-            conn.commit()
-            messages.append("Added approval_status column to reports table")
+def _migration_3(cursor, messages):
+    """Create report_approvals table"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='report_approvals'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE TABLE report_approvals (
+                approval_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                report_id INTEGER NOT NULL,
+                version_id INTEGER,
+                approval_status TEXT CHECK(approval_status IN ('pending', 'approved', 'rejected', 'rework')) DEFAULT 'pending',
+                approver_id INTEGER,
+                approval_comment TEXT,
+                requested_by TEXT NOT NULL,
+                requested_at TEXT DEFAULT (datetime('now')),
+                reviewed_at TEXT,
+                FOREIGN KEY (report_id) REFERENCES reports(report_id),
+                FOREIGN KEY (approver_id) REFERENCES users(user_id),
+                FOREIGN KEY (version_id) REFERENCES report_versions(version_id)
+            )
+        """)
+        messages.append("Created report_approvals table")
+
 
-        # Migration 6: Ensure system_logs table exists
+def _migration_4(cursor, messages):
+    """Create notifications table"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='notifications'
+    """)
+    if not cursor.fetchone():
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='system_logs'
+            CREATE TABLE notifications (
+                notification_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                title TEXT NOT NULL,
+                message TEXT NOT NULL,
+                notification_type TEXT CHECK(notification_type IN ('info', 'warning', 'approval_request', 'approval_result')),
+                related_report_id INTEGER,
+                is_read INTEGER DEFAULT 0,
+                created_at TEXT DEFAULT (datetime('now')),
+                FOREIGN KEY (user_id) REFERENCES users(user_id),
+                FOREIGN KEY (related_report_id) REFERENCES reports(report_id)
+            )
         """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE system_logs (
-                    log_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT DEFAULT (datetime('now')),
-                    log_level TEXT NOT NULL,
-                    module TEXT NOT NULL,
-                    function_name TEXT,
-                    message TEXT NOT NULL,
-                    user_id INTEGER,
-                    username TEXT,
-                    exception_type TEXT,
-                    exception_message TEXT,
-                    stack_trace TEXT,
-                    extra_data TEXT,
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
-                )
-            """)
-            conn.commit()
-            messages.append("Created system_logs table")
+        messages.append("Created notifications table")
+
 
-        # Migration 7: Create report_number_reservations table
+def _migration_5(cursor, messages):
+    """Add versioning columns to reports table"""
+    try:
+        cursor.execute("SELECT current_version FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='report_number_reservations'
+            ALTER TABLE reports
+            ADD COLUMN current_version INTEGER DEFAULT 1
         """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE report_number_reservations (
-                    reservation_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    report_number TEXT NOT NULL,
-                    serial_number INTEGER NOT NULL,
-                    reserved_by TEXT NOT NULL,
-                    reserved_at TEXT DEFAULT (datetime('now')),
-                    expires_at TEXT NOT NULL,
-                    is_used INTEGER DEFAULT 0,
-                    FOREIGN KEY (reserved_by) REFERENCES users(username)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_reservations_expiry
-                ON report_number_reservations(expires_at, is_used)
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_reservations_user
-                ON report_number_reservations(reserved_by)
-            """)
-            conn.commit()
-            messages.append("Created report_number_reservations table")
+        messages.append("Added current_version column to reports table")
 
-        # Migration 8: Create restore_log table
+    try:
+        cursor.execute("SELECT approval_status FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
+        # Add approval_status column without CHECK constraint
+        # (CHECK constraints in ALTER TABLE ADD COLUMN require SQLite 3.25.0+)
+        # Validation is handled at application level
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='restore_log'
+            ALTER TABLE reports
+            ADD COLUMN approval_status TEXT DEFAULT 'draft'
         """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE restore_log (
-                    restore_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    restore_number TEXT UNIQUE NOT NULL,
-                    report_id INTEGER NOT NULL,
-                    report_number TEXT NOT NULL,
-                    serial_number INTEGER NOT NULL,
-                    previous_state TEXT NOT NULL,
-                    restored_by TEXT NOT NULL,
-                    restored_at TEXT DEFAULT (datetime('now')),
-                    restore_reason TEXT,
-                    FOREIGN KEY (report_id) REFERENCES reports(report_id),
-                    FOREIGN KEY (restored_by) REFERENCES users(username)
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_restore_log_report
-                ON restore_log(report_id)
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_restore_log_date
-                ON restore_log(restored_at)
-            """)
-            conn.commit()
-            messages.append("Created restore_log table")
+        messages.append("Added approval_status column to reports table")
 
-        # Migration 9: Add new columns to reports table
-        # Add legal_entity_owner as BOOLEAN (INTEGER in SQLite)
-        try:
-            cursor.execute("SELECT legal_entity_owner_checkbox FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN legal_entity_owner_checkbox INTEGER DEFAULT 0
-            """)
-            conn.commit()
-            messages.append("Added legal_entity_owner_checkbox column to reports table")
 
-        # Add acc_membership_checkbox
-        try:
-            cursor.execute("SELECT acc_membership_checkbox FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN acc_membership_checkbox INTEGER DEFAULT 0
-            """)
-            conn.commit()
-            messages.append("Added acc_membership_checkbox column to reports table")
+def _migration_6(cursor, messages):
+    """Ensure system_logs table exists"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='system_logs'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE TABLE system_logs (
+                log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp TEXT DEFAULT (datetime('now')),
+                log_level TEXT NOT NULL,
+                module TEXT NOT NULL,
+                function_name TEXT,
+                message TEXT NOT NULL,
+                user_id INTEGER,
+                username TEXT,
+                exception_type TEXT,
+                exception_message TEXT,
+                stack_trace TEXT,
+                extra_data TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL
+            )
+        """)
+        messages.append("Created system_logs table")
 
-        # Add relationship field (auto-generated from acc_membership_checkbox)
-        try:
-            cursor.execute("SELECT relationship FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN relationship TEXT
-            """)
-            conn.commit()
-            messages.append("Added relationship column to reports table")
 
-        # Migration 10: Remove CHECK constraint from status column
-        # SQLite doesn't support DROP COLUMN easily, so we mark it for application-level handling
-        # We'll hide it in the UI and stop using it
-        # Note: Actual column removal requires table recreation (handled in migration 11)
+def _migration_7(cursor, messages):
+    """Create report_number_reservations table"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='report_number_reservations'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE TABLE report_number_reservations (
+                reservation_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                report_number TEXT NOT NULL,
+                serial_number INTEGER NOT NULL,
+                reserved_by TEXT NOT NULL,
+                reserved_at TEXT DEFAULT (datetime('now')),
+                expires_at TEXT NOT NULL,
+                is_used INTEGER DEFAULT 0,
+                FOREIGN KEY (reserved_by) REFERENCES users(username)
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_reservations_expiry
+            ON report_number_reservations(expires_at, is_used)
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_reservations_user
+            ON report_number_reservations(reserved_by)
+        """)
+        messages.append("Created report_number_reservations table")
+
 
-        # Migration 11: Add system settings for batch reservation and grace period
+def _migration_8(cursor, messages):
+    """Create restore_log table"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='restore_log'
+    """)
+    if not cursor.fetchone():
         cursor.execute("""
-            INSERT OR IGNORE INTO system_config (config_key, config_value, config_type, config_category, is_active)
-            VALUES
-                ('month_grace_period', '3', 'setting', 'system', 1),
-                ('batch_pool_size', '20', 'setting', 'system', 1),
-                ('reservation_expiry_minutes', '5', 'setting', 'system', 1),
-                ('records_per_page', '50', 'setting', 'system', 1)
+            CREATE TABLE restore_log (
+                restore_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                restore_number TEXT UNIQUE NOT NULL,
+                report_id INTEGER NOT NULL,
+                report_number TEXT NOT NULL,
+                serial_number INTEGER NOT NULL,
+                previous_state TEXT NOT NULL,
+                restored_by TEXT NOT NULL,
+                restored_at TEXT DEFAULT (datetime('now')),
+                restore_reason TEXT,
+                FOREIGN KEY (report_id) REFERENCES reports(report_id),
+                FOREIGN KEY (restored_by) REFERENCES users(username)
+            )
         """)
-        # Check if any rows were inserted
-        if cursor.rowcount > 0:
-            conn.commit()
-            messages.append("Added system settings for batch reservation and grace period")
-
-        # Migration 12: Populate dropdown values in system_config (only if empty)
-        # Check if dropdown values already exist
-        cursor.execute("SELECT COUNT(*) FROM system_config WHERE config_type = 'dropdown'")
-        dropdown_count = cursor.fetchone()[0]
-
-        # Only populate if no dropdown values exist (first run)
-        if dropdown_count == 0:
-            # Populate all dropdown categories with default values
-            dropdown_inserts = []
-
-            # 1. Nationality (Fixed category)
-            nationalities = [
-                'Saudi Arabian', 'Emirati', 'Qatari', 'Bahraini', 'Kuwaiti', 'Omani',
-                'Egyptian', 'Jordanian', 'Lebanese', 'Syrian', 'Iraqi', 'Palestinian',
-                'Yemeni', 'Sudanese', 'Moroccan', 'Algerian', 'Tunisian', 'Libyan',
-                'Pakistani', 'Indian', 'Bangladeshi', 'Filipino', 'Indonesian',
-                'American', 'British', 'French', 'German', 'Other'
-            ]
-            for idx, nat in enumerate(nationalities, 1):
-                dropdown_inserts.append(
-                    f"('nationality_{nat.lower().replace(' ', '_')}', '{nat}', 'dropdown', 'nationality', {idx}, 1)"
-                )
+        cursor.execute("""
+            CREATE INDEX idx_restore_log_report
+            ON restore_log(report_id)
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_restore_log_date
+            ON restore_log(restored_at)
+        """)
+        messages.append("Created restore_log table")
 
-            # 2. Second Reason for Suspicion (Admin-manageable)
-            second_reasons = [
-                'Unusual transaction patterns',
-                'Structuring to avoid reporting limits',
-                'Suspicious cash deposits',
-                'Transactions with high-risk countries',
-                'Lack of economic justification',
-                'Complex ownership structure',
-                'Inconsistent business activity',
-                'Rapid movement of funds',
-                'Use of third parties',
-                'Other suspicious indicators'
-            ]
-            for idx, reason in enumerate(second_reasons, 1):
-                dropdown_inserts.append(
-                    f"('second_reason_{idx}', '{reason}', 'dropdown', 'second_reason_for_suspicion', {idx}, 1)"
-                )
 
-            # 3. Type of Suspected Transaction (Admin-manageable)
-            transaction_types = [
-                'Cash deposit',
-                'Cash withdrawal',
-                'Wire transfer',
-                'Check deposit',
-                'Foreign exchange',
-                'Investment transaction',
-                'Loan transaction',
-                'Trade finance',
-                'Multiple transactions',
-                'Other'
-            ]
-            for idx, ttype in enumerate(transaction_types, 1):
-                dropdown_inserts.append(
-                    f"('transaction_type_{idx}', '{ttype}', 'dropdown', 'type_of_suspected_transaction', {idx}, 1)"
-                )
+def _migration_9(cursor, messages):
+    """Add new columns to reports table"""
+    # Add legal_entity_owner as BOOLEAN (INTEGER in SQLite)
+    try:
+        cursor.execute("SELECT legal_entity_owner_checkbox FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            ALTER TABLE reports
+            ADD COLUMN legal_entity_owner_checkbox INTEGER DEFAULT 0
+        """)
+        messages.append("Added legal_entity_owner_checkbox column to reports table")
 
-            # 4. Report Classification (Admin-manageable)
-            classifications = [
-                'Money Laundering',
-                'Terrorist Financing',
-                'Fraud',
-                'Tax Evasion',
-                'Corruption',
-                'Sanctions Violation',
-                'Other Financial Crime'
-            ]
-            for idx, cls in enumerate(classifications, 1):
-                dropdown_inserts.append(
-                    f"('classification_{idx}', '{cls}', 'dropdown', 'report_classification', {idx}, 1)"
-                )
+    # Add acc_membership_checkbox
+    try:
+        cursor.execute("SELECT acc_membership_checkbox FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            ALTER TABLE reports
+            ADD COLUMN acc_membership_checkbox INTEGER DEFAULT 0
+        """)
+        messages.append("Added acc_membership_checkbox column to reports table")
 
-            # 5. Report Source (Fixed category)
-            sources = [
-                'Internal monitoring',
-                'Customer due diligence',
-                'Transaction monitoring',
-                'External tip',
-                'Law enforcement request',
-                'Media report',
-                'Other'
-            ]
-            for idx, source in enumerate(sources, 1):
-                dropdown_inserts.append(
-                    f"('report_source_{idx}', '{source}', 'dropdown', 'report_source', {idx}, 1)"
-                )
+    # Add relationship field (auto-generated from acc_membership_checkbox)
+    try:
+        cursor.execute("SELECT relationship FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            ALTER TABLE reports
+            ADD COLUMN relationship TEXT
+        """)
+        messages.append("Added relationship column to reports table")
+
+
+def _migration_11(cursor, messages):
+    """Add system settings for batch reservation and grace period"""
+    cursor.execute("""
+        INSERT OR IGNORE INTO system_config (config_key, config_value, config_type, config_category, is_active)
+        VALUES
+            ('month_grace_period', '3', 'setting', 'system', 1),
+            ('batch_pool_size', '20', 'setting', 'system', 1),
+            ('reservation_expiry_minutes', '5', 'setting', 'system', 1),
+            ('records_per_page', '50', 'setting', 'system', 1)
+    """)
+    # Check if any rows were inserted
+    if cursor.rowcount > 0:
+        messages.append("Added system settings for batch reservation and grace period")
+
+
+def _migration_12(cursor, messages):
+    """Populate dropdown values in system_config (only if empty)"""
+    # Check if dropdown values already exist
+    cursor.execute("SELECT COUNT(*) FROM system_config WHERE config_type = 'dropdown'")
+    dropdown_count = cursor.fetchone()[0]
+
+    # Only populate if no dropdown values exist (first run)
+    if dropdown_count == 0:
+        # Populate all dropdown categories with default values
+        dropdown_inserts = []
+
+        # 1. Nationality (Fixed category)
+        nationalities = [
+            'Saudi Arabian', 'Emirati', 'Qatari', 'Bahraini', 'Kuwaiti', 'Omani',
+            'Egyptian', 'Jordanian', 'Lebanese', 'Syrian', 'Iraqi', 'Palestinian',
+            'Yemeni', 'Sudanese', 'Moroccan', 'Algerian', 'Tunisian', 'Libyan',
+            'Pakistani', 'Indian', 'Bangladeshi', 'Filipino', 'Indonesian',
+            'American', 'British', 'French', 'German', 'Other'
+        ]
+        for idx, nat in enumerate(nationalities, 1):
+            dropdown_inserts.append(
+                f"('nationality_{nat.lower().replace(' ', '_')}', '{nat}', 'dropdown', 'nationality', {idx}, 1)"
+            )
+
+        # 2. Second Reason for Suspicion (Admin-manageable)
+        second_reasons = [
+            'Unusual transaction patterns',
+            'Structuring to avoid reporting limits',
+            'Suspicious cash deposits',
+            'Transactions with high-risk countries',
+            'Lack of economic justification',
+            'Complex ownership structure',
+            'Inconsistent business activity',
+            'Rapid movement of funds',
+            'Use of third parties',
+            'Other suspicious indicators'
+        ]
+        for idx, reason in enumerate(second_reasons, 1):
+            dropdown_inserts.append(
+                f"('second_reason_{idx}', '{reason}', 'dropdown', 'second_reason_for_suspicion', {idx}, 1)"
+            )
+
+        # 3. Type of Suspected Transaction (Admin-manageable)
+        transaction_types = [
+            'Cash deposit',
+            'Cash withdrawal',
+            'Wire transfer',
+            'Check deposit',
+            'Foreign exchange',
+            'Investment transaction',
+            'Loan transaction',
+            'Trade finance',
+            'Multiple transactions',
+            'Other'
+        ]
+        for idx, ttype in enumerate(transaction_types, 1):
+            dropdown_inserts.append(
+                f"('transaction_type_{idx}', '{ttype}', 'dropdown', 'type_of_suspected_transaction', {idx}, 1)"
+            )
+
+        # 4. Report Classification (Admin-manageable)
+        classifications = [
+            'Money Laundering',
+            'Terrorist Financing',
+            'Fraud',
+            'Tax Evasion',
+            'Corruption',
+            'Sanctions Violation',
+            'Other Financial Crime'
+        ]
+        for idx, cls in enumerate(classifications, 1):
+            dropdown_inserts.append(
+                f"('classification_{idx}', '{cls}', 'dropdown', 'report_classification', {idx}, 1)"
+            )
+
+        # 5. Report Source (Fixed category)
+        sources = [
+            'Internal monitoring',
+            'Customer due diligence',
+            'Transaction monitoring',
+            'External tip',
+            'Law enforcement request',
+            'Media report',
+            'Other'
+        ]
+        for idx, source in enumerate(sources, 1):
+            dropdown_inserts.append(
+                f"('report_source_{idx}', '{source}', 'dropdown', 'report_source', {idx}, 1)"
+            )
+
+        # 6. Reporting Entity (Fixed category)
+        entities = [
+            'Bank',
+            'Exchange company',
+            'Insurance company',
+            'Securities firm',
+            'Money service business',
+            'Real estate',
+            'Precious metals dealer',
+            'Other financial institution'
+        ]
+        for idx, entity in enumerate(entities, 1):
+            dropdown_inserts.append(
+                f"('reporting_entity_{idx}', '{entity}', 'dropdown', 'reporting_entity', {idx}, 1)"
+            )
+
+        # 7. FIU Feedback (Admin-manageable)
+        feedbacks = [
+            'Under investigation',
+            'No action required',
+            'Referred to law enforcement',
+            'Request for additional information',
+            'Case closed',
+            'Ongoing monitoring',
+            'Other'
+        ]
+        for idx, feedback in enumerate(feedbacks, 1):
+            dropdown_inserts.append(
+                f"('fiu_feedback_{idx}', '{feedback}', 'dropdown', 'fiu_feedback', {idx}, 1)"
+            )
+
+        # 8. Gender (Fixed category - for completeness)
+        genders = ['ذكر', 'أنثى']
+        for idx, gender in enumerate(genders, 1):
+            dropdown_inserts.append(
+                f"('gender_{idx}', '{gender}', 'dropdown', 'gender', {idx}, 1)"
+            )
+
+        # 9. ARB Staff (Fixed category - for completeness)
+        arb_options = ['نعم', 'لا']
+        for idx, arb in enumerate(arb_options, 1):
+            dropdown_inserts.append(
+                f"('arb_staff_{idx}', '{arb}', 'dropdown', 'arb_staff', {idx}, 1)"
+            )
+
+        # Insert all dropdown values
+        insert_query = f"""
+            INSERT OR IGNORE INTO system_config
+            (config_key, config_value, config_type, config_category, display_order, is_active)
+            VALUES {', '.join(dropdown_inserts)}
+        """
+        cursor.execute(insert_query)
+        messages.append(f"Populated {len(dropdown_inserts)} dropdown values across 9 categories")
+
+
+def _migration_13(cursor, messages):
+    """Add id_type column for ID/CR distinction"""
+    try:
+        cursor.execute("SELECT id_type FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            ALTER TABLE reports
+            ADD COLUMN id_type TEXT DEFAULT 'ID'
+        """)
+        messages.append("Added id_type column to reports table")
 
-            # 6. Reporting Entity (Fixed category)
-            entities = [
-                'Bank',
-                'Exchange company',
-                'Insurance company',
-                'Securities firm',
-                'Money service business',
-                'Real estate',
-                'Precious metals dealer',
-                'Other financial institution'
-            ]
-            for idx, entity in enumerate(entities, 1):
-                dropdown_inserts.append(
-                    f"('reporting_entity_{idx}', '{entity}', 'dropdown', 'reporting_entity', {idx}, 1)"
-                )
 
-            # 7. FIU Feedback (Admin-manageable)
-            feedbacks = [
-                'Under investigation',
-                'No action required',
-                'Referred to law enforcement',
-                'Request for additional information',
-                'Case closed',
-                'Ongoing monitoring',
-                'Other'
-            ]
-            for idx, feedback in enumerate(feedbacks, 1):
-                dropdown_inserts.append(
-                    f"('fiu_feedback_{idx}', '{feedback}', 'dropdown', 'fiu_feedback', {idx}, 1)"
-                )
+def _migration_15(cursor, messages):
+    """Populate default validation rules for ID/CR and Account/Membership fields"""
+    import json
 
-            # 8. Gender (Fixed category - for completeness)
-            genders = ['ذكر', 'أنثى']
-            for idx, gender in enumerate(genders, 1):
-                dropdown_inserts.append(
-                    f"('gender_{idx}', '{gender}', 'dropdown', 'gender', {idx}, 1)"
-                )
+    # Check if validation rules are already set for id_cr
+    cursor.execute("""
+        SELECT validation_rules FROM column_settings
+        WHERE column_name = 'id_cr'
+    """)
+    id_cr_rules = cursor.fetchone()
 
-            # 9. ARB Staff (Fixed category - for completeness)
-            arb_options = ['نعم', 'لا']
-            for idx, arb in enumerate(arb_options, 1):
-                dropdown_inserts.append(
-                    f"('arb_staff_{idx}', '{arb}', 'dropdown', 'arb_staff', {idx}, 1)"
-                )
+    if id_cr_rules is None or not id_cr_rules[0]:
+        # Set default validation rules for ID/CR field
+        id_cr_validation = json.dumps({
+            "length": 10,
+            "pattern": "^[0-9]{10}$",
+            "saudi_starts_with": "1",
+            "cr_starts_with": "7"
+        })
+
+        cursor.execute("""
+            UPDATE column_settings
+            SET validation_rules = ?, updated_at = datetime('now')
+            WHERE column_name = 'id_cr'
+        """, (id_cr_validation,))
 
+        if cursor.rowcount > 0:
+            messages.append("Added validation rules for ID/CR field")
+
+    # Check if validation rules are already set for account_membership
+    cursor.execute("""
+        SELECT validation_rules FROM column_settings
+        WHERE column_name = 'account_membership'
+    """)
+    account_rules = cursor.fetchone()
+
+    if account_rules is None or not account_rules[0]:
+        # Set default validation rules for Account/Membership field
+        account_validation = json.dumps({
+            "account_length": 21,
+            "membership_length": 8
+        })
 
-            # Insert all dropdown values
-            insert_query = f"""
-                INSERT OR IGNORE INTO system_config
-                (config_key, config_value, config_type, config_category, display_order, is_active)
-                VALUES {', '.join(dropdown_inserts)}
-            """
-            cursor.execute(insert_query)
-            conn.commit()
-            messages.append(f"Populated {len(dropdown_inserts)} dropdown values across 9 categories")
+        cursor.execute("""
+            UPDATE column_settings
+            SET validation_rules = ?, updated_at = datetime('now')
+            WHERE column_name = 'account_membership'
+        """, (account_validation,))
 
-        # Migration 13: Add id_type column for ID/CR distinction
-        try:
-            cursor.execute("SELECT id_type FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN id_type TEXT DEFAULT 'ID'
-            """)
-            conn.commit()
-            messages.append("Added id_type column to reports table")
+        if cursor.rowcount > 0:
+            messages.append("Added validation rules for Account/Membership field")
 
-        # Migration 15: Populate default validation rules for ID/CR and Account/Membership fields
-        import json
 
-        # Check if validation rules are already set for id_cr
+def _migration_16(cursor, messages):
+    """Create migration_history tracking table"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='migration_history'
+    """)
+    if not cursor.fetchone():
         cursor.execute("""
-            SELECT validation_rules FROM column_settings
-            WHERE column_name = 'id_cr'
+            CREATE TABLE migration_history (
+                migration_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                migration_number INTEGER UNIQUE NOT NULL,
+                migration_name TEXT NOT NULL,
+                applied_at TEXT DEFAULT (datetime('now')),
+                execution_time_ms INTEGER,
+                success INTEGER DEFAULT 1,
+                error_message TEXT
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_migration_history_number ON migration_history(migration_number)
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_migration_history_applied ON migration_history(applied_at)
         """)
-        id_cr_rules = cursor.fetchone()
+        messages.append("Created migration_history tracking table")
+
+
+def _migration_17(cursor, messages):
+    """Add missing performance indexes"""
+    indexes_to_create = [
+        ("idx_reports_approval_status", "reports", "approval_status"),
+        ("idx_report_versions_report_id", "report_versions", "report_id"),
+        ("idx_report_approvals_status", "report_approvals", "approval_status"),
+        ("idx_report_approvals_approver_id", "report_approvals", "approver_id"),
+        ("idx_notifications_user_read", "notifications", "user_id, is_read"),
+        ("idx_change_history_record_id", "change_history", "record_id"),
+        ("idx_status_history_to_status", "status_history", "to_status"),
+        ("idx_report_approvals_report_version", "report_approvals", "report_id, version_id"),
+        ("idx_report_versions_created_at", "report_versions", "created_at"),
+        ("idx_notifications_created_at", "notifications", "created_at"),
+        ("idx_report_number_reservations_number", "report_number_reservations", "report_number"),
+        ("idx_report_approvals_requested_by", "report_approvals", "requested_by")
+    ]
+
+    created_indexes = []
+    for index_name, table_name, columns in indexes_to_create:
+        # Check if index already exists
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='index' AND name=?
+        """, (index_name,))
 
-        if id_cr_rules is None or not id_cr_rules[0]:
-            # Set default validation rules for ID/CR field
-            id_cr_validation = json.dumps({
-                "length": 10,
-                "pattern": "^[0-9]{10}$",
-                "saudi_starts_with": "1",
-                "cr_starts_with": "7"
-            })
+        if not cursor.fetchone():
+            try:
+                cursor.execute(f"CREATE INDEX {index_name} ON {table_name}({columns})")
+                created_indexes.append(index_name)
+            except sqlite3.OperationalError as e:
+                # Table or column might not exist yet - skip
+                pass
 
-            cursor.execute("""
-                UPDATE column_settings
-                SET validation_rules = ?, updated_at = datetime('now')
-                WHERE column_name = 'id_cr'
-            """, (id_cr_validation,))
+    if created_indexes:
+        messages.append(f"Created {len(created_indexes)} performance indexes")
 
-            if cursor.rowcount > 0:
-                conn.commit()
-                messages.append("Added validation rules for ID/CR field")
 
-        # Check if validation rules are already set for account_membership
+def _migration_18(cursor, messages):
+    """Add reservation management settings"""
+    # First, create system_settings table if it doesn't exist
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='system_settings'
+    """)
+    if not cursor.fetchone():
         cursor.execute("""
-            SELECT validation_rules FROM column_settings
-            WHERE column_name = 'account_membership'
+            CREATE TABLE system_settings (
+                setting_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                setting_key TEXT UNIQUE NOT NULL,
+                setting_value TEXT,
+                description TEXT,
+                category TEXT,
+                is_editable INTEGER DEFAULT 1,
+                created_at TEXT DEFAULT (datetime('now')),
+                updated_at TEXT DEFAULT (datetime('now'))
+            )
         """)
-        account_rules = cursor.fetchone()
-
-        if account_rules is None or not account_rules[0]:
-            # Set default validation rules for Account/Membership field
-            account_validation = json.dumps({
-                "account_length": 21,
-                "membership_length": 8
-            })
+        messages.append("Created system_settings table")
+
+    # Insert reservation management settings
+    cursor.execute("""
+        SELECT COUNT(*) FROM system_settings
+        WHERE setting_key IN ('max_concurrent_reservations', 'max_reservations_per_user')
+    """)
+    existing_settings = cursor.fetchone()[0]
+
+    if existing_settings < 2:
+        settings_to_add = [
+            ('max_concurrent_reservations', '10', 'Maximum number of concurrent report number reservations allowed system-wide', 'Reservation Management'),
+            ('max_reservations_per_user', '1', 'Maximum number of active reservations allowed per user', 'Reservation Management')
+        ]
 
+        for key, value, description, category in settings_to_add:
             cursor.execute("""
-                UPDATE column_settings
-                SET validation_rules = ?, updated_at = datetime('now')
-                WHERE column_name = 'account_membership'
-            """, (account_validation,))
+                INSERT OR REPLACE INTO system_settings
+                (setting_key, setting_value, description, category, is_editable)
+                VALUES (?, ?, ?, ?, 1)
+            """, (key, value, description, category))
+
+        messages.append("Added reservation management settings (max: 10 concurrent, 1 per user)")
 
-            if cursor.rowcount > 0:
-                conn.commit()
-                messages.append("Added validation rules for Account/Membership field")
 
-        # Migration 16: Create migration_history tracking table
+def _migration_19(cursor, messages):
+    """Create gap_queue table for managing cancelled reservation gaps"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='gap_queue'
+    """)
+    if not cursor.fetchone():
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='migration_history'
+            CREATE TABLE gap_queue (
+                gap_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                report_number TEXT UNIQUE NOT NULL,
+                serial_number INTEGER NOT NULL,
+                gap_type TEXT NOT NULL,
+                reason TEXT,
+                created_at TEXT DEFAULT (datetime('now')),
+                created_by TEXT,
+                priority INTEGER DEFAULT 0,
+                status TEXT DEFAULT 'available'
+            )
         """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE migration_history (
-                    migration_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    migration_number INTEGER UNIQUE NOT NULL,
-                    migration_name TEXT NOT NULL,
-                    applied_at TEXT DEFAULT (datetime('now')),
-                    execution_time_ms INTEGER,
-                    success INTEGER DEFAULT 1,
-                    error_message TEXT
-                )
-            """)
+
+        cursor.execute("""
+            CREATE INDEX idx_gap_queue_status ON gap_queue(status)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX idx_gap_queue_priority ON gap_queue(priority DESC, created_at ASC)
+        """)
+
+        messages.append("Created gap_queue table for managing reservation gaps")
+
+        # Add gap queue settings
+        gap_settings = [
+            ('enable_gap_reuse', '1', 'Enable automatic reuse of gaps from cancelled reservations', 'Gap Management'),
+            ('gap_merge_threshold', '3', 'Number of consecutive gaps before triggering merge alert', 'Gap Management'),
+            ('auto_cleanup_gaps', '1', 'Automatically clean up expired gaps', 'Gap Management')
+        ]
+
+        for key, value, description, category in gap_settings:
             cursor.execute("""
-                CREATE INDEX idx_migration_history_number ON migration_history(migration_number)
-            """)
+                INSERT OR IGNORE INTO system_settings
+                (setting_key, setting_value, description, category, is_editable)
+                VALUES (?, ?, ?, ?, 1)
+            """, (key, value, description, category))
+
+        messages.append("Added gap management settings")
+
+
+def _migration_20(cursor, messages):
+    """Remove gender CHECK constraint (encoding issues)"""
+    # Check if constraint still exists by trying to insert an invalid value
+    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='reports'")
+    if cursor.fetchone():
+        # SQLite doesn't allow dropping constraints, so we need to recreate the table
+        # First, check if we need this migration by looking at table schema
+        cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='reports'")
+        table_sql = cursor.fetchone()[0]
+
+        if "CHECK(gender IN" in table_sql:
+            # Backup existing data
+            cursor.execute("SELECT COUNT(*) FROM reports")
+            report_count = cursor.fetchone()[0]
+
+            # Views and triggers are dropped with the table; keep them
+            dependent_objects = _drop_dependent_objects(cursor, 'reports')
+
+            # An earlier failed rebuild may have left reports_new behind
+            _drop_stray_rebuild_table(cursor, 'reports', messages)
+
+            # Create temporary table without CHECK constraint
             cursor.execute("""
-                CREATE INDEX idx_migration_history_applied ON migration_history(applied_at)
+                CREATE TABLE reports_new AS SELECT * FROM reports
             """)
-            conn.commit()
-            messages.append("Created migration_history tracking table")
-
-        # Migration 17: Add missing performance indexes
-        indexes_to_create = [
-            ("idx_reports_approval_status", "reports", "approval_status"),
-            ("idx_report_versions_report_id", "report_versions", "report_id"),
-            ("idx_report_approvals_status", "report_approvals", "approval_status"),
-            ("idx_report_approvals_approver_id", "report_approvals", "approver_id"),
-            ("idx_notifications_user_read", "notifications", "user_id, is_read"),
-            ("idx_change_history_record_id", "change_history", "record_id"),
-            ("idx_status_history_to_status", "status_history", "to_status"),
-            ("idx_report_approvals_report_version", "report_approvals", "report_id, version_id"),
-            ("idx_report_versions_created_at", "report_versions", "created_at"),
-            ("idx_notifications_created_at", "notifications", "created_at"),
-            ("idx_report_number_reservations_number", "report_number_reservations", "report_number"),
-            ("idx_report_approvals_requested_by", "report_approvals", "requested_by")
-        ]
 
-        created_indexes = []
-        for index_name, table_name, columns in indexes_to_create:
-            # Check if index already exists
-            cursor.execute("""
-                SELECT name FROM sqlite_master
-                WHERE type='index' AND name=?
-            """, (index_name,))
-
-            if not cursor.fetchone():
-                try:
-                    cursor.execute(f"CREATE INDEX {index_name} ON {table_name}({columns})")
-                    created_indexes.append(index_name)
-                except sqlite3.OperationalError as e:
-                    # Table or column might not exist yet - skip
-                    pass
-
-        if created_indexes:
-            conn.commit()
-            messages.append(f"Created {len(created_indexes)} performance indexes")
-
-        # Migration 18: Add reservation management settings
-        # First, create system_settings table if it doesn't exist
-        cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='system_settings'
-        """)
-        if not cursor.fetchone():
+            # Drop old table
+            cursor.execute("DROP TABLE reports")
+
+            # Recreate table without CHECK constraint (get column list from old table)
             cursor.execute("""
-                CREATE TABLE system_settings (
-                    setting_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    setting_key TEXT UNIQUE NOT NULL,
-                    setting_value TEXT,
-                    description TEXT,
-                    category TEXT,
-                    is_editable INTEGER DEFAULT 1,
+                CREATE TABLE reports (
+                    report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sn INTEGER UNIQUE NOT NULL,
+                    report_number TEXT UNIQUE NOT NULL,
+                    report_date TEXT NOT NULL,
+                    outgoing_letter_number TEXT,
+                    reported_entity_name TEXT NOT NULL,
+                    legal_entity_owner TEXT,
+                    gender TEXT,
+                    nationality TEXT,
+                    id_cr TEXT,
+                    account_membership TEXT,
+                    branch_id TEXT,
+                    cic TEXT,
+                    first_reason_for_suspicion TEXT,
+                    second_reason_for_suspicion TEXT,
+                    type_of_suspected_transaction TEXT,
+                    arb_staff TEXT,
+                    total_transaction TEXT,
+                    report_classification TEXT,
+                    report_source TEXT,
+                    reporting_entity TEXT,
+                    reporter_initials TEXT,
+                    sending_date TEXT,
+                    original_copy_confirmation TEXT,
+                    fiu_number TEXT,
+                    fiu_letter_receive_date TEXT,
+                    fiu_feedback TEXT,
+                    fiu_letter_number TEXT,
+                    fiu_date TEXT,
+                    status TEXT DEFAULT 'pending',
+                    is_deleted INTEGER DEFAULT 0,
                     created_at TEXT DEFAULT (datetime('now')),
-                    updated_at TEXT DEFAULT (datetime('now'))
+                    created_by TEXT NOT NULL,
+                    updated_at TEXT,
+                    updated_by TEXT,
+                    current_version INTEGER DEFAULT 1,
+                    approval_status TEXT DEFAULT 'draft',
+                    legal_entity_owner_checkbox INTEGER DEFAULT 0,
+                    acc_membership_checkbox INTEGER DEFAULT 0,
+                    relationship TEXT,
+                    id_type TEXT
                 )
             """)
-            conn.commit()
-            messages.append("Created system_settings table")
 
-        # Insert reservation management settings
+            # Restore data
+            cursor.execute("INSERT INTO reports SELECT * FROM reports_new")
+
+            # Drop temp table
+            cursor.execute("DROP TABLE reports_new")
+
+            # Recreate indexes
+            cursor.execute("CREATE INDEX idx_reports_number ON reports(report_number)")
+            cursor.execute("CREATE INDEX idx_reports_date ON reports(report_date)")
+            cursor.execute("CREATE INDEX idx_reports_status ON reports(status)")
+            cursor.execute("CREATE INDEX idx_reports_entity ON reports(reported_entity_name)")
+
+            _recreate_objects(cursor, dependent_objects)
+
+            messages.append(f"Removed gender CHECK constraint (migrated {report_count} reports)")
+
+
+def _migration_21(cursor, messages):
+    """Create activity_log table for GitHub-style changelog"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='activity_log'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE TABLE activity_log (
+                activity_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                user_id INTEGER NOT NULL,
+                username TEXT NOT NULL,
+                action_type TEXT NOT NULL CHECK(action_type IN (
+                    'CREATE', 'UPDATE', 'DELETE', 'RESTORE', 'APPROVE',
+                    'REJECT', 'VERSION_CREATE', 'VERSION_DELETE', 'VERSION_RESTORE',
+                    'HARD_DELETE', 'SOFT_DELETE', 'UNDELETE'
+                )),
+                report_id INTEGER,
+                report_number TEXT,
+                version_id INTEGER,
+                version_number INTEGER,
+                description TEXT NOT NULL,
+                metadata TEXT,
+                created_at TEXT DEFAULT (datetime('now')),
+                FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL,
+                FOREIGN KEY (report_id) REFERENCES reports(report_id) ON DELETE SET NULL,
+                FOREIGN KEY (version_id) REFERENCES report_versions(version_id) ON DELETE SET NULL
+            )
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_activity_log_user ON activity_log(user_id)
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_activity_log_report ON activity_log(report_id)
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_activity_log_action ON activity_log(action_type)
+        """)
+        cursor.execute("""
+            CREATE INDEX idx_activity_log_created ON activity_log(created_at DESC)
+        """)
         cursor.execute("""
-            SELECT COUNT(*) FROM system_settings
-            WHERE setting_key IN ('max_concurrent_reservations', 'max_reservations_per_user')
+            CREATE INDEX idx_activity_log_composite ON activity_log(report_id, created_at DESC)
         """)
-        existing_settings = cursor.fetchone()[0]
+        messages.append("Created activity_log table for GitHub-style changelog")
 
-        if existing_settings < 2:
-            settings_to_add = [
-                ('max_concurrent_reservations', '10', 'Maximum number of concurrent report number reservations allowed system-wide', 'Reservation Management'),
-                ('max_reservations_per_user', '1', 'Maximum number of active reservations allowed per user', 'Reservation Management')
-            ]
 
-            for key, value, description, category in settings_to_add:
-                cursor.execute("""
-                    INSERT OR REPLACE INTO system_settings
-                    (setting_key, setting_value, description, category, is_editable)
-                    VALUES (?, ?, ?, ?, 1)
-                """, (key, value, description, category))
+def _migration_22(cursor, messages):
+    """Add soft delete columns to report_versions table"""
+    try:
+        cursor.execute("SELECT is_deleted FROM report_versions LIMIT 1")
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            ALTER TABLE report_versions
+            ADD COLUMN is_deleted INTEGER DEFAULT 0
+        """)
+        messages.append("Added is_deleted column to report_versions table")
 
-            conn.commit()
-            messages.append("Added reservation management settings (max: 10 concurrent, 1 per user)")
+    try:
+        cursor.execute("SELECT deleted_at FROM report_versions LIMIT 1")
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            ALTER TABLE report_versions
+            ADD COLUMN deleted_at TEXT
+        """)
+        messages.append("Added deleted_at column to report_versions table")
 
-        # Migration 19: Create gap_queue table for managing cancelled reservation gaps
+    try:
+        cursor.execute("SELECT deleted_by FROM report_versions LIMIT 1")
+    except sqlite3.OperationalError:
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='gap_queue'
+            ALTER TABLE report_versions
+            ADD COLUMN deleted_by TEXT
         """)
-        if not cursor.fetchone():
+        messages.append("Added deleted_by column to report_versions table")
+
+
+def _migration_23(cursor, messages):
+    """Add delete tracking columns to reports table"""
+    try:
+        cursor.execute("SELECT deleted_at FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            ALTER TABLE reports
+            ADD COLUMN deleted_at TEXT
+        """)
+        messages.append("Added deleted_at column to reports table")
+
+    try:
+        cursor.execute("SELECT deleted_by FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
+        cursor.execute("""
+            ALTER TABLE reports
+            ADD COLUMN deleted_by TEXT
+        """)
+        messages.append("Added deleted_by column to reports table")
+
+    # Add index for version soft delete queries
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND name='idx_report_versions_is_deleted'
+    """)
+    if not cursor.fetchone():
+        try:
+            cursor.execute("""
+                CREATE INDEX idx_report_versions_is_deleted ON report_versions(is_deleted)
+            """)
+            messages.append("Created index for report_versions is_deleted column")
+        except sqlite3.OperationalError:
+            pass
+
+
+def _migration_24(cursor, messages):
+    """Fix approval workflow for existing reports"""
+    # - Admin-created reports should be 'approved'
+    # - Non-admin reports need entries in report_approvals to appear in approval panel
+    # First, auto-approve all admin-created reports that aren't already approved
+    cursor.execute("""
+        UPDATE reports
+        SET approval_status = 'approved', updated_at = datetime('now')
+        WHERE created_by IN (SELECT username FROM users WHERE role = 'admin')
+        AND (approval_status IS NULL OR approval_status != 'approved')
+        AND is_deleted = 0
+    """)
+    admin_reports_fixed = cursor.rowcount
+
+    if admin_reports_fixed > 0:
+        messages.append(f"Auto-approved {admin_reports_fixed} admin-created reports")
+
+    # Now handle non-admin reports that are in draft/pending but have no approval request
+    cursor.execute("""
+        SELECT r.report_id, r.created_by
+        FROM reports r
+        LEFT JOIN report_approvals ra ON r.report_id = ra.report_id
+        WHERE r.created_by NOT IN (SELECT username FROM users WHERE role = 'admin')
+        AND (r.approval_status IS NULL OR r.approval_status IN ('draft', ''))
+        AND ra.approval_id IS NULL
+        AND r.is_deleted = 0
+    """)
+    reports_needing_approval = cursor.fetchall()
+
+    for report_id, created_by in reports_needing_approval:
+        # Update report status to pending_approval
+        cursor.execute("""
+            UPDATE reports
+            SET approval_status = 'pending_approval', updated_at = datetime('now')
+            WHERE report_id = ?
+        """, (report_id,))
+
+        # Create approval request
+        cursor.execute("""
+            INSERT INTO report_approvals (report_id, approval_status, requested_by, approval_comment, requested_at)
+            VALUES (?, 'pending', ?, 'Auto-submitted by migration', datetime('now'))
+        """, (report_id, created_by))
+
+    if reports_needing_approval:
+        messages.append(f"Created approval requests for {len(reports_needing_approval)} non-admin reports")
+
+
+def _migration_25(cursor, messages):
+    """Drop status column from reports table (no longer used)"""
+    cursor.execute("PRAGMA table_info(reports)")
+    columns = [row[1] for row in cursor.fetchall()]
+    if columns:
+        # Check if status column exists (a substring check on the table SQL
+        # also matched approval_status and rebuilt the table every time)
+        if 'status' in columns:
+            # Backup existing data
+            cursor.execute("SELECT COUNT(*) FROM reports")
+            report_count = cursor.fetchone()[0]
+
+            # Drop views and triggers that depend on reports table first
+            dependent_objects = _drop_dependent_objects(cursor, 'reports')
+
+            # An earlier failed rebuild may have left reports_new behind
+            _drop_stray_rebuild_table(cursor, 'reports', messages)
+
+            # Create temporary table without status column
             cursor.execute("""
-                CREATE TABLE gap_queue (
-                    gap_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                CREATE TABLE reports_new (
+                    report_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    sn INTEGER UNIQUE NOT NULL,
                     report_number TEXT UNIQUE NOT NULL,
-                    serial_number INTEGER NOT NULL,
-                    gap_type TEXT NOT NULL,
-                    reason TEXT,
+                    report_date TEXT NOT NULL,
+                    outgoing_letter_number TEXT,
+                    reported_entity_name TEXT NOT NULL,
+                    legal_entity_owner TEXT,
+                    gender TEXT,
+                    nationality TEXT,
+                    id_cr TEXT,
+                    account_membership TEXT,
+                    branch_id TEXT,
+                    cic TEXT,
+                    first_reason_for_suspicion TEXT,
+                    second_reason_for_suspicion TEXT,
+                    type_of_suspected_transaction TEXT,
+                    arb_staff TEXT,
+                    total_transaction TEXT,
+                    report_classification TEXT,
+                    report_source TEXT,
+                    reporting_entity TEXT,
+                    reporter_initials TEXT,
+                    sending_date TEXT,
+                    original_copy_confirmation TEXT,
+                    fiu_number TEXT,
+                    fiu_letter_receive_date TEXT,
+                    fiu_feedback TEXT,
+                    fiu_letter_number TEXT,
+                    fiu_date TEXT,
+                    is_deleted INTEGER DEFAULT 0,
                     created_at TEXT DEFAULT (datetime('now')),
-                    created_by TEXT,
-                    priority INTEGER DEFAULT 0,
-                    status TEXT DEFAULT 'available'
+                    created_by TEXT NOT NULL,
+                    updated_at TEXT,
+                    updated_by TEXT,
+                    current_version INTEGER DEFAULT 1,
+                    approval_status TEXT DEFAULT 'draft',
+                    legal_entity_owner_checkbox INTEGER DEFAULT 0,
+                    acc_membership_checkbox INTEGER DEFAULT 0,
+                    relationship TEXT,
+                    id_type TEXT,
+                    deleted_at TEXT,
+                    deleted_by TEXT
                 )
             """)
 
+            # Copy data from old table (excluding status column)
             cursor.execute("""
-                CREATE INDEX idx_gap_queue_status ON gap_queue(status)
+                INSERT INTO reports_new (
+                    report_id, sn, report_number, report_date, outgoing_letter_number,
+                    reported_entity_name, legal_entity_owner, gender, nationality, id_cr,
+                    account_membership, branch_id, cic, first_reason_for_suspicion,
+                    second_reason_for_suspicion, type_of_suspected_transaction, arb_staff,
+                    total_transaction, report_classification, report_source, reporting_entity,
+                    reporter_initials, sending_date, original_copy_confirmation, fiu_number,
+                    fiu_letter_receive_date, fiu_feedback, fiu_letter_number, fiu_date,
+                    is_deleted, created_at, created_by, updated_at, updated_by,
+                    current_version, approval_status, legal_entity_owner_checkbox,
+                    acc_membership_checkbox, relationship, id_type, deleted_at, deleted_by
+                )
+                SELECT
+                    report_id, sn, report_number, report_date, outgoing_letter_number,
+                    reported_entity_name, legal_entity_owner, gender, nationality, id_cr,
+                    account_membership, branch_id, cic, first_reason_for_suspicion,
+                    second_reason_for_suspicion, type_of_suspected_transaction, arb_staff,
+                    total_transaction, report_classification, report_source, reporting_entity,
+                    reporter_initials, sending_date, original_copy_confirmation, fiu_number,
+                    fiu_letter_receive_date, fiu_feedback, fiu_letter_number, fiu_date,
+                    is_deleted, created_at, created_by, updated_at, updated_by,
+                    current_version, approval_status, legal_entity_owner_checkbox,
+                    acc_membership_checkbox, relationship, id_type, deleted_at, deleted_by
+                FROM reports
             """)
 
-            cursor.execute("""
-                CREATE INDEX idx_gap_queue_priority ON gap_queue(priority DESC, created_at ASC)
-            """)
+            # Drop old table
+            cursor.execute("DROP TABLE reports")
 
-            conn.commit()
-            messages.append("Created gap_queue table for managing reservation gaps")
+            # Rename new table
+            cursor.execute("ALTER TABLE reports_new RENAME TO reports")
 
-            # Add gap queue settings
-            gap_settings = [
-                ('enable_gap_reuse', '1', 'Enable automatic reuse of gaps from cancelled reservations', 'Gap Management'),
-                ('gap_merge_threshold', '3', 'Number of consecutive gaps before triggering merge alert', 'Gap Management'),
-                ('auto_cleanup_gaps', '1', 'Automatically clean up expired gaps', 'Gap Management')
-            ]
+            # Recreate indexes
+            cursor.execute("CREATE INDEX idx_reports_number ON reports(report_number)")
+            cursor.execute("CREATE INDEX idx_reports_date ON reports(report_date)")
+            cursor.execute("CREATE INDEX idx_reports_entity ON reports(reported_entity_name)")
+            cursor.execute("CREATE INDEX idx_reports_approval_status ON reports(approval_status)")
 
-            for key, value, description, category in gap_settings:
-                cursor.execute("""
-                    INSERT OR IGNORE INTO system_settings
-                    (setting_key, setting_value, description, category, is_editable)
-                    VALUES (?, ?, ?, ?, 1)
-                """, (key, value, description, category))
+            # Recreate views and triggers (except those using the status column)
+            _recreate_objects(cursor, dependent_objects, dropped_columns=('status',))
 
-            conn.commit()
-            messages.append("Added gap management settings")
+            messages.append(f"Dropped status column from reports table ({report_count} reports migrated)")
 
-        # Migration 20: Remove gender CHECK constraint (encoding issues)
-        # Check if constraint still exists by trying to insert an invalid value
-        try:
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='reports'")
-            if cursor.fetchone():
-                # SQLite doesn't allow dropping constraints, so we need to recreate the table
-                # First, check if we need this migration by looking at table schema
-                cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='reports'")
-                table_sql = cursor.fetchone()[0]
-
-                if "CHECK(gender IN" in table_sql:
-                    # Backup existing data
-                    cursor.execute("SELECT COUNT(*) FROM reports")
-                    report_count = cursor.fetchone()[0]
-
-                    # Create temporary table without CHECK constraint
-                    cursor.execute("""
-                        CREATE TABLE reports_new AS SELECT * FROM reports
-                    """)
-
-                    # Drop old table
-                    cursor.execute("DROP TABLE reports")
-
-                    # Recreate table without CHECK constraint (get column list from old table)
-                    cursor.execute("""
-                        CREATE TABLE reports (
-                            report_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            sn INTEGER UNIQUE NOT NULL,
-                            report_number TEXT UNIQUE NOT NULL,
-                            report_date TEXT NOT NULL,
-                            outgoing_letter_number TEXT,
-                            reported_entity_name TEXT NOT NULL,
-                            legal_entity_owner TEXT,
-                            gender TEXT,
-                            nationality TEXT,
-                            id_cr TEXT,
-                            account_membership TEXT,
-                            branch_id TEXT,
-                            cic TEXT,
-                            first_reason_for_suspicion TEXT,
-                            second_reason_for_suspicion TEXT,
-                            type_of_suspected_transaction TEXT,
-                            arb_staff TEXT,
-                            total_transaction TEXT,
-                            report_classification TEXT,
-                            report_source TEXT,
-                            reporting_entity TEXT,
-                            reporter_initials TEXT,
-                            sending_date TEXT,
-                            original_copy_confirmation TEXT,
-                            fiu_number TEXT,
-                            fiu_letter_receive_date TEXT,
-                            fiu_feedback TEXT,
-                            fiu_letter_number TEXT,
-                            fiu_date TEXT,
-                            status TEXT DEFAULT 'pending',
-                            is_deleted INTEGER DEFAULT 0,
-                            created_at TEXT DEFAULT (datetime('now')),
-                            created_by TEXT NOT NULL,
-                            updated_at TEXT,
-                            updated_by TEXT,
-                            current_version INTEGER DEFAULT 1,
-                            approval_status TEXT DEFAULT 'draft',
-                            legal_entity_owner_checkbox INTEGER DEFAULT 0,
-                            acc_membership_checkbox INTEGER DEFAULT 0,
-                            relationship TEXT,
-                            id_type TEXT
-                        )
-                    """)
-
-                    # Restore data
-                    cursor.execute("INSERT INTO reports SELECT * FROM reports_new")
-
-                    # Drop temp table
-                    cursor.execute("DROP TABLE reports_new")
-
-                    # Recreate indexes
-                    cursor.execute("CREATE INDEX idx_reports_number ON reports(report_number)")
-                    cursor.execute("CREATE INDEX idx_reports_date ON reports(report_date)")
-                    cursor.execute("CREATE INDEX idx_reports_status ON reports(status)")
-                    cursor.execute("CREATE INDEX idx_reports_entity ON reports(reported_entity_name)")
-
-                    conn.commit()
-                    messages.append(f"Removed gender CHECK constraint (migrated {report_count} reports)")
-        except Exception as e:
-            # If migration fails, just log it and continue
-            messages.append(f"Gender constraint migration skipped: {str(e)}")
-
-        # Migration 21: Create activity_log table for GitHub-style changelog
+
+def _migration_26(cursor, messages):
+    """Add case_id column to reports table"""
+    try:
+        cursor.execute("SELECT case_id FROM reports LIMIT 1")
+    except sqlite3.OperationalError:
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='table' AND name='activity_log'
+            ALTER TABLE reports
+            ADD COLUMN case_id TEXT
         """)
-        if not cursor.fetchone():
-            cursor.execute("""
-                CREATE TABLE activity_log (
-                    activity_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    user_id INTEGER NOT NULL,
-                    username TEXT NOT NULL,
-                    action_type TEXT NOT NULL CHECK(action_type IN (
-                        'CREATE', 'UPDATE', 'DELETE', 'RESTORE', 'APPROVE',
-                        'REJECT', 'VERSION_CREATE', 'VERSION_DELETE', 'VERSION_RESTORE',
-                        'HARD_DELETE', 'SOFT_DELETE', 'UNDELETE'
-                    )),
-                    report_id INTEGER,
-                    report_number TEXT,
-                    version_id INTEGER,
-                    version_number INTEGER,
-                    description TEXT NOT NULL,
-                    metadata TEXT,
-                    created_at TEXT DEFAULT (datetime('now')),
-                    FOREIGN KEY (user_id) REFERENCES users(user_id) ON DELETE SET NULL,
-                    FOREIGN KEY (report_id) REFERENCES reports(report_id) ON DELETE SET NULL,
-                    FOREIGN KEY (version_id) REFERENCES report_versions(version_id) ON DELETE SET NULL
-                )
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_activity_log_user ON activity_log(user_id)
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_activity_log_report ON activity_log(report_id)
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_activity_log_action ON activity_log(action_type)
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_activity_log_created ON activity_log(created_at DESC)
-            """)
-            cursor.execute("""
-                CREATE INDEX idx_activity_log_composite ON activity_log(report_id, created_at DESC)
-            """)
-            conn.commit()
-            messages.append("Created activity_log table for GitHub-style changelog")
+        messages.append("Added case_id column to reports table")
 
-        # Migration 22: Add soft delete columns to report_versions table
-        try:
-            cursor.execute("SELECT is_deleted FROM report_versions LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE report_versions
-                ADD COLUMN is_deleted INTEGER DEFAULT 0
-            """)
-            conn.commit()
-            messages.append("Added is_deleted column to report_versions table")
 
+def _migration_27(cursor, messages):
+    """Add backup store retention settings"""
+    backup_settings = [
+        ('backup_keep_daily', '7', 'Number of daily backups kept in the backup store', 'Backup'),
+        ('backup_keep_weekly', '4', 'Number of weekly backups kept in the backup store', 'Backup')
+    ]
+    added_backup_settings = 0
+    for key, value, description, category in backup_settings:
+        cursor.execute("""
+            INSERT OR IGNORE INTO system_settings
+            (setting_key, setting_value, description, category, is_editable)
+            VALUES (?, ?, ?, ?, 1)
+        """, (key, value, description, category))
+        added_backup_settings += cursor.rowcount
+
+    if added_backup_settings:
+        messages.append("Added backup retention settings")
+
+
+def _migration_28(cursor, messages):
+    """Scheduled backups (backup_log stats, leader lease, schedule settings)"""
+    backup_log_columns = [
+        ('logical_size', 'INTEGER'),
+        ('duration_seconds', 'REAL'),
+        ('throughput_bytes_per_sec', 'REAL'),
+        ('trigger_type', "TEXT DEFAULT 'manual'")
+    ]
+    for column_name, column_type in backup_log_columns:
         try:
-            cursor.execute("SELECT deleted_at FROM report_versions LIMIT 1")
+            cursor.execute(f"SELECT {column_name} FROM backup_log LIMIT 1")
         except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE report_versions
-                ADD COLUMN deleted_at TEXT
-            """)
-            conn.commit()
-            messages.append("Added deleted_at column to report_versions table")
+            cursor.execute(f"ALTER TABLE backup_log ADD COLUMN {column_name} {column_type}")
+            messages.append(f"Added {column_name} column to backup_log table")
+
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='scheduler_leases'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE TABLE scheduler_leases (
+                lease_name TEXT PRIMARY KEY,
+                holder TEXT NOT NULL,
+                acquired_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL
+            )
+        """)
+        messages.append("Created scheduler_leases table")
+
+    schedule_settings = [
+        ('backup_schedule_enabled', '1', 'Run scheduled backups (1 = enabled, 0 = disabled)', 'Backup'),
+        ('backup_schedule_cron', '0 2 * * *', 'Cron expression for scheduled backups (minute hour day month weekday)', 'Backup'),
+        ('backup_max_wal_mb', '64', 'Defer scheduled backups while the WAL file is larger than this (MB)', 'Backup'),
+        ('backup_max_write_kbps', '256', 'Defer scheduled backups while the write rate is above this (KB/s)', 'Backup'),
+        ('backup_max_deferral_minutes', '120', 'Run a deferred backup anyway after this many minutes', 'Backup')
+    ]
+    added_schedule_settings = 0
+    for key, value, description, category in schedule_settings:
+        cursor.execute("""
+            INSERT OR IGNORE INTO system_settings
+            (setting_key, setting_value, description, category, is_editable)
+            VALUES (?, ?, ?, ?, 1)
+        """, (key, value, description, category))
+        added_schedule_settings += cursor.rowcount
+
+    if added_schedule_settings:
+        messages.append("Added backup schedule settings")
+
+
+def _migration_29(cursor, messages):
+    """Reference data change counter (dropdowns, column settings)"""
+    cursor.execute("""
+        INSERT OR IGNORE INTO system_metadata (key, value)
+        VALUES ('reference_data_version', '1')
+    """)
+
+    # Bump the counter on every write so caches in other processes reload
+    counter_triggers = [
+        ('system_config', 'INSERT', "NEW.config_type = 'dropdown'"),
+        ('system_config', 'UPDATE', "NEW.config_type = 'dropdown' OR OLD.config_type = 'dropdown'"),
+        ('system_config', 'DELETE', "OLD.config_type = 'dropdown'"),
+        ('column_settings', 'INSERT', None),
+        ('column_settings', 'UPDATE', None),
+        ('column_settings', 'DELETE', None),
+    ]
+    created_triggers = 0
+    for table_name, event, condition in counter_triggers:
+        trigger_name = f"trg_{table_name}_{event.lower()}_refdata_version"
+        cursor.execute(
+            "SELECT name FROM sqlite_master WHERE type='trigger' AND name=?",
+            (trigger_name,)
+        )
+        if cursor.fetchone():
+            continue
+        when_clause = f"WHEN {condition}" if condition else ""
+        cursor.execute(f"""
+            CREATE TRIGGER {trigger_name}
+            AFTER {event} ON {table_name}
+            {when_clause}
+            BEGIN
+                UPDATE system_metadata
+                SET value = CAST(value AS INTEGER) + 1, updated_at = datetime('now')
+                WHERE key = 'reference_data_version';
+            END
+        """)
+        created_triggers += 1
 
-        try:
-            cursor.execute("SELECT deleted_by FROM report_versions LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE report_versions
-                ADD COLUMN deleted_by TEXT
-            """)
-            conn.commit()
-            messages.append("Added deleted_by column to report_versions table")
+    if created_triggers:
+        messages.append(f"Created {created_triggers} reference data version triggers")
 
-        # Migration 23: Add delete tracking columns to reports table
-        try:
-            cursor.execute("SELECT deleted_at FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN deleted_at TEXT
-            """)
-            conn.commit()
-            messages.append("Added deleted_at column to reports table")
 
-        try:
-            cursor.execute("SELECT deleted_by FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
-            cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN deleted_by TEXT
-            """)
-            conn.commit()
-            messages.append("Added deleted_by column to reports table")
+def _migration_30(cursor, messages):
+    """Query profiler tables and settings"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='query_profile'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE TABLE query_profile (
+                statement_hash TEXT NOT NULL,
+                client_id TEXT NOT NULL,
+                statement TEXT NOT NULL,
+                calls INTEGER NOT NULL DEFAULT 0,
+                total_ms REAL NOT NULL DEFAULT 0,
+                p50_ms REAL,
+                p95_ms REAL,
+                max_ms REAL,
+                rows INTEGER NOT NULL DEFAULT 0,
+                lock_retries INTEGER NOT NULL DEFAULT 0,
+                backoff_ms REAL NOT NULL DEFAULT 0,
+                query_plan TEXT,
+                started_at TEXT NOT NULL,
+                updated_at TEXT NOT NULL,
+                PRIMARY KEY (statement_hash, client_id)
+            )
+        """)
+        messages.append("Created query_profile table")
 
-        # Add index for version soft delete queries
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='slow_query_log'
+    """)
+    if not cursor.fetchone():
         cursor.execute("""
-            SELECT name FROM sqlite_master
-            WHERE type='index' AND name='idx_report_versions_is_deleted'
+            CREATE TABLE slow_query_log (
+                log_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                statement_hash TEXT NOT NULL,
+                statement TEXT NOT NULL,
+                duration_ms REAL NOT NULL,
+                rows INTEGER,
+                lock_retries INTEGER DEFAULT 0,
+                query_plan TEXT,
+                client_id TEXT,
+                created_at TEXT NOT NULL
+            )
         """)
+        cursor.execute("""
+            CREATE INDEX idx_slow_query_log_created
+            ON slow_query_log(created_at)
+        """)
+        messages.append("Created slow_query_log table")
+
+    profiler_settings = [
+        ('query_profiling_enabled', '0', 'Record per-statement query timings (1 = enabled, 0 = disabled)', 'Diagnostics'),
+        ('slow_query_threshold_ms', '200', 'Statements slower than this are written to the slow query log (ms)', 'Diagnostics')
+    ]
+    added_profiler_settings = 0
+    for key, value, description, category in profiler_settings:
+        cursor.execute("""
+            INSERT OR IGNORE INTO system_settings
+            (setting_key, setting_value, description, category, is_editable)
+            VALUES (?, ?, ?, ?, 1)
+        """, (key, value, description, category))
+        added_profiler_settings += cursor.rowcount
+
+    if added_profiler_settings:
+        messages.append("Added query profiler settings")
+
+
+def _migration_31(cursor, messages):
+    """Approval queue indexes on (approval_status, requested_at) and requested_at"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND name='idx_report_approvals_status_requested'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE INDEX idx_report_approvals_status_requested
+            ON report_approvals(approval_status, requested_at)
+        """)
+        messages.append("Created idx_report_approvals_status_requested index")
+
+    # Serves the unfiltered (all statuses) history view in the same order
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND name='idx_report_approvals_requested_at'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE INDEX idx_report_approvals_requested_at
+            ON report_approvals(requested_at)
+        """)
+        messages.append("Created idx_report_approvals_requested_at index")
+
+    # The single-column status index is a prefix of the new one
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND name='idx_report_approvals_status'
+    """)
+    if cursor.fetchone():
+        cursor.execute("DROP INDEX idx_report_approvals_status")
+        messages.append("Dropped redundant idx_report_approvals_status index")
+
+
+def _migration_32(cursor, messages):
+    """Trigger-maintained unread notification counters"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='table' AND name='notification_counters'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("""
+            CREATE TABLE notification_counters (
+                user_id INTEGER PRIMARY KEY,
+                unread_count INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        cursor.execute("""
+            INSERT INTO notification_counters (user_id, unread_count)
+            SELECT user_id, COUNT(*) FROM notifications
+            WHERE is_read = 0
+            GROUP BY user_id
+        """)
+        messages.append("Created notification_counters table")
+
+    triggers = {
+        'trg_notifications_unread_insert': """
+            CREATE TRIGGER trg_notifications_unread_insert
+            AFTER INSERT ON notifications
+            WHEN NEW.is_read = 0
+            BEGIN
+                INSERT INTO notification_counters (user_id, unread_count)
+                VALUES (NEW.user_id, 1)
+                ON CONFLICT(user_id) DO UPDATE SET unread_count = unread_count + 1;
+            END
+        """,
+        'trg_notifications_unread_read': """
+            CREATE TRIGGER trg_notifications_unread_read
+            AFTER UPDATE OF is_read ON notifications
+            WHEN OLD.is_read = 0 AND NEW.is_read != 0
+            BEGIN
+                UPDATE notification_counters
+                SET unread_count = MAX(unread_count - 1, 0)
+                WHERE user_id = OLD.user_id;
+            END
+        """,
+        'trg_notifications_unread_unread': """
+            CREATE TRIGGER trg_notifications_unread_unread
+            AFTER UPDATE OF is_read ON notifications
+            WHEN OLD.is_read != 0 AND NEW.is_read = 0
+            BEGIN
+                INSERT INTO notification_counters (user_id, unread_count)
+                VALUES (NEW.user_id, 1)
+                ON CONFLICT(user_id) DO UPDATE SET unread_count = unread_count + 1;
+            END
+        """,
+        'trg_notifications_unread_delete': """
+            CREATE TRIGGER trg_notifications_unread_delete
+            AFTER DELETE ON notifications
+            WHEN OLD.is_read = 0
+            BEGIN
+                UPDATE notification_counters
+                SET unread_count = MAX(unread_count - 1, 0)
+                WHERE user_id = OLD.user_id;
+            END
+        """,
+    }
+    created_triggers = 0
+    for trigger_name, trigger_sql in triggers.items():
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='trigger' AND name=?
+        """, (trigger_name,))
         if not cursor.fetchone():
-            try:
-                cursor.execute("""
-                    CREATE INDEX idx_report_versions_is_deleted ON report_versions(is_deleted)
-                """)
-                conn.commit()
-                messages.append("Created index for report_versions is_deleted column")
-            except sqlite3.OperationalError:
-                pass
-
-        # Migration 24: Fix approval workflow for existing reports
-        # - Admin-created reports should be 'approved'
-        # - Non-admin reports need entries in report_approvals to appear in approval panel
-        try:
-            # First, auto-approve all admin-created reports that aren't already approved
-            cursor.execute("""
-                UPDATE reports
-                SET approval_status = 'approved', updated_at = datetime('now')
-                WHERE created_by IN (SELECT username FROM users WHERE role = 'admin')
-                AND (approval_status IS NULL OR approval_status != 'approved')
-                AND is_deleted = 0
-            """)
-            admin_reports_fixed = cursor.rowcount
-            conn.commit()
+            cursor.execute(trigger_sql)
+            created_triggers += 1
 
-            if admin_reports_fixed > 0:
-                messages.append(f"Auto-approved {admin_reports_fixed} admin-created reports")
+    if created_triggers:
+        messages.append(f"Created {created_triggers} unread notification counter trigger(s)")
 
-            # Now handle non-admin reports that are in draft/pending but have no approval request
-            cursor.execute("""
-                SELECT r.report_id, r.created_by
-                FROM reports r
-                LEFT JOIN report_approvals ra ON r.report_id = ra.report_id
-                WHERE r.created_by NOT IN (SELECT username FROM users WHERE role = 'admin')
-                AND (r.approval_status IS NULL OR r.approval_status IN ('draft', ''))
-                AND ra.approval_id IS NULL
-                AND r.is_deleted = 0
-            """)
-            reports_needing_approval = cursor.fetchall()
 
-            for report_id, created_by in reports_needing_approval:
-                # Update report status to pending_approval
-                cursor.execute("""
-                    UPDATE reports
-                    SET approval_status = 'pending_approval', updated_at = datetime('now')
-                    WHERE report_id = ?
-                """, (report_id,))
 
-                # Create approval request
-                cursor.execute("""
-                    INSERT INTO report_approvals (report_id, approval_status, requested_by, approval_comment, requested_at)
-                    VALUES (?, 'pending', ?, 'Auto-submitted by migration', datetime('now'))
-                """, (report_id, created_by))
+def _migration_33(cursor, messages):
+    """Activity timeline index on (created_at, activity_id)"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND name='idx_activity_log_created_id'
+    """)
+    if not cursor.fetchone():
+        # Scanned backwards for ORDER BY created_at DESC, activity_id DESC
+        cursor.execute("""
+            CREATE INDEX idx_activity_log_created_id
+            ON activity_log(created_at, activity_id)
+        """)
+        messages.append("Created idx_activity_log_created_id index")
+
+    # The DESC index keeps ties in ascending activity_id order, which still
+    # needs a sort for the timeline's tie-breaker
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND name='idx_activity_log_created'
+    """)
+    if cursor.fetchone():
+        cursor.execute("DROP INDEX idx_activity_log_created")
+        messages.append("Dropped redundant idx_activity_log_created index")
+
+
+def _migration_34(cursor, messages):
+    """Log archival settings and system_logs timestamp index"""
+    cursor.execute("""
+        SELECT name FROM sqlite_master
+        WHERE type='index' AND name='idx_system_logs_timestamp'
+    """)
+    if not cursor.fetchone():
+        cursor.execute("CREATE INDEX idx_system_logs_timestamp ON system_logs(timestamp)")
+        messages.append("Created idx_system_logs_timestamp index")
+
+    archive_settings = [
+        ('log_archive_enabled', '1', 'Move old logs and activity into monthly archive databases (1 = enabled, 0 = disabled)', 'Maintenance'),
+        ('log_archive_after_days', '90', 'Archive logs and activity older than this many days', 'Maintenance'),
+        ('log_archive_batch_size', '1000', 'Rows moved or deleted per transaction during archival', 'Maintenance'),
+        ('log_archive_vacuum_pages', '5000', 'Free pages returned to the filesystem per incremental vacuum', 'Maintenance'),
+    ]
+    added_archive_settings = 0
+    for key, value, description, category in archive_settings:
+        cursor.execute("""
+            INSERT OR IGNORE INTO system_settings
+            (setting_key, setting_value, description, category, is_editable)
+            VALUES (?, ?, ?, ?, 1)
+        """, (key, value, description, category))
+        added_archive_settings += cursor.rowcount
 
-            conn.commit()
+    if added_archive_settings:
+        messages.append("Added log archival settings")
 
-            if reports_needing_approval:
-                messages.append(f"Created approval requests for {len(reports_needing_approval)} non-admin reports")
 
-        except Exception as e:
-            messages.append(f"Approval workflow migration skipped: {str(e)}")
+def _migration_35(cursor, messages):
+    """Hourly log rollups and error fingerprints"""
+    cursor.execute("PRAGMA table_info(system_logs)")
+    if 'error_fingerprint' not in [col[1] for col in cursor.fetchall()]:
+        cursor.execute("ALTER TABLE system_logs ADD COLUMN error_fingerprint TEXT")
+        messages.append("Added error_fingerprint column to system_logs")
 
-        # Migration 25: Drop status column from reports table (no longer used)
-        try:
-            cursor.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='reports'")
-            result = cursor.fetchone()
-            if result:
-                table_sql = result[0]
-
-                # Check if status column exists
-                if "status TEXT" in table_sql:
-                    # Backup existing data
-                    cursor.execute("SELECT COUNT(*) FROM reports")
-                    report_count = cursor.fetchone()[0]
-
-                    # Drop views that depend on reports table first
-                    cursor.execute("DROP VIEW IF EXISTS v_active_reports")
-                    cursor.execute("DROP VIEW IF EXISTS v_reports_with_history")
-
-                    # Create temporary table without status column
-                    cursor.execute("""
-                        CREATE TABLE reports_new (
-                            report_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                            sn INTEGER UNIQUE NOT NULL,
-                            report_number TEXT UNIQUE NOT NULL,
-                            report_date TEXT NOT NULL,
-                            outgoing_letter_number TEXT,
-                            reported_entity_name TEXT NOT NULL,
-                            legal_entity_owner TEXT,
-                            gender TEXT,
-                            nationality TEXT,
-                            id_cr TEXT,
-                            account_membership TEXT,
-                            branch_id TEXT,
-                            cic TEXT,
-                            first_reason_for_suspicion TEXT,
-                            second_reason_for_suspicion TEXT,
-                            type_of_suspected_transaction TEXT,
-                            arb_staff TEXT,
-                            total_transaction TEXT,
-                            report_classification TEXT,
-                            report_source TEXT,
-                            reporting_entity TEXT,
-                            reporter_initials TEXT,
-                            sending_date TEXT,
-                            original_copy_confirmation TEXT,
-                            fiu_number TEXT,
-                            fiu_letter_receive_date TEXT,
-                            fiu_feedback TEXT,
-                            fiu_letter_number TEXT,
-                            fiu_date TEXT,
-                            is_deleted INTEGER DEFAULT 0,
-                            created_at TEXT DEFAULT (datetime('now')),
-                            created_by TEXT NOT NULL,
-                            updated_at TEXT,
-                            updated_by TEXT,
-                            current_version INTEGER DEFAULT 1,
-                            approval_status TEXT DEFAULT 'draft',
-                            legal_entity_owner_checkbox INTEGER DEFAULT 0,
-                            acc_membership_checkbox INTEGER DEFAULT 0,
-                            relationship TEXT,
-                            id_type TEXT,
-                            deleted_at TEXT,
-                            deleted_by TEXT
-                        )
-                    """)
-
-                    # Copy data from old table (excluding status column)
-                    cursor.execute("""
-                        INSERT INTO reports_new (
-                            report_id, sn, report_number, report_date, outgoing_letter_number,
-                            reported_entity_name, legal_entity_owner, gender, nationality, id_cr,
-                            account_membership, branch_id, cic, first_reason_for_suspicion,
-                            second_reason_for_suspicion, type_of_suspected_transaction, arb_staff,
-                            total_transaction, report_classification, report_source, reporting_entity,
-                            reporter_initials, sending_date, original_copy_confirmation, fiu_number,
-                            fiu_letter_receive_date, fiu_feedback, fiu_letter_number, fiu_date,
-                            is_deleted, created_at, created_by, updated_at, updated_by,
-                            current_version, approval_status, legal_entity_owner_checkbox,
-                            acc_membership_checkbox, relationship, id_type, deleted_at, deleted_by
-                        )
-                        SELECT
-                            report_id, sn, report_number, report_date, outgoing_letter_number,
-                            reported_entity_name, legal_entity_owner, gender, nationality, id_cr,
-                            account_membership, branch_id, cic, first_reason_for_suspicion,
-                            second_reason_for_suspicion, type_of_suspected_transaction, arb_staff,
-                            total_transaction, report_classification, report_source, reporting_entity,
-                            reporter_initials, sending_date, original_copy_confirmation, fiu_number,
-                            fiu_letter_receive_date, fiu_feedback, fiu_letter_number, fiu_date,
-                            is_deleted, created_at, created_by, updated_at, updated_by,
-                            current_version, approval_status, legal_entity_owner_checkbox,
-                            acc_membership_checkbox, relationship, id_type, deleted_at, deleted_by
-                        FROM reports
-                    """)
-
-                    # Drop old table
-                    cursor.execute("DROP TABLE reports")
-
-                    # Rename new table
-                    cursor.execute("ALTER TABLE reports_new RENAME TO reports")
-
-                    # Recreate indexes
-                    cursor.execute("CREATE INDEX idx_reports_number ON reports(report_number)")
-                    cursor.execute("CREATE INDEX idx_reports_date ON reports(report_date)")
-                    cursor.execute("CREATE INDEX idx_reports_entity ON reports(reported_entity_name)")
-                    cursor.execute("CREATE INDEX idx_reports_approval_status ON reports(approval_status)")
-
-                    # Recreate views
-                    cursor.execute("""
-                        CREATE VIEW IF NOT EXISTS v_active_reports AS
-                        SELECT * FROM reports WHERE is_deleted = 0
-                    """)
-                    cursor.execute("""
-                        CREATE VIEW IF NOT EXISTS v_reports_with_history AS
-                        SELECT
-                            r.*,
-                            COUNT(DISTINCT ch.change_id) as change_count,
-                            MAX(ch.changed_at) as last_modified
-                        FROM reports r
-                        LEFT JOIN change_history ch ON r.report_id = ch.record_id AND ch.table_name = 'reports'
-                        WHERE r.is_deleted = 0
-                        GROUP BY r.report_id
-                    """)
-
-                    conn.commit()
-                    messages.append(f"Dropped status column from reports table ({report_count} reports migrated)")
-
-        except Exception as e:
-            messages.append(f"Status column migration skipped: {str(e)}")
-
-        # Migration 26: Add case_id column to reports table
-        try:
-            cursor.execute("SELECT case_id FROM reports LIMIT 1")
-        except sqlite3.OperationalError:
+        # Fingerprints are computed in Python, so existing errors are keyed here
+        cursor.execute("""
+            SELECT log_id, log_level, exception_type, stack_trace, module, function_name, message
+            FROM system_logs
+            WHERE log_level IN ('ERROR', 'CRITICAL') OR exception_type IS NOT NULL
+        """)
+        fingerprints = [
+            (error_fingerprint(level, exc_type, stack, module, function, message), log_id)
+            for log_id, level, exc_type, stack, module, function, message in cursor.fetchall()
+        ]
+        cursor.executemany("UPDATE system_logs SET error_fingerprint = ? WHERE log_id = ?", fingerprints)
+
+    # Hour keys are 'YYYY-MM-DD HH:00' in the same local time as the logs
+    tables = {
+        'log_rollups_hourly': """
+            CREATE TABLE log_rollups_hourly (
+                hour TEXT NOT NULL,
+                log_level TEXT NOT NULL,
+                module TEXT NOT NULL,
+                log_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (hour, log_level, module)
+            ) WITHOUT ROWID
+        """,
+        'log_error_fingerprints': """
+            CREATE TABLE log_error_fingerprints (
+                fingerprint TEXT PRIMARY KEY,
+                exception_type TEXT,
+                module TEXT,
+                function_name TEXT,
+                sample_message TEXT,
+                first_seen TEXT NOT NULL,
+                last_seen TEXT NOT NULL
+            )
+        """,
+        'log_error_rollups_hourly': """
+            CREATE TABLE log_error_rollups_hourly (
+                hour TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                error_count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (hour, fingerprint)
+            ) WITHOUT ROWID
+        """,
+    }
+    for table_name, table_sql in tables.items():
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name=?
+        """, (table_name,))
+        if cursor.fetchone():
+            continue
+        cursor.execute(table_sql)
+        messages.append(f"Created {table_name} table")
+
+        if table_name == 'log_rollups_hourly':
             cursor.execute("""
-                ALTER TABLE reports
-                ADD COLUMN case_id TEXT
+                INSERT INTO log_rollups_hourly (hour, log_level, module, log_count)
+                SELECT strftime('%Y-%m-%d %H:00', timestamp), log_level, COALESCE(module, ''), COUNT(*)
+                FROM system_logs
+                WHERE strftime('%Y-%m-%d %H:00', timestamp) IS NOT NULL
+                GROUP BY 1, 2, 3
+            """)
+        elif table_name == 'log_error_fingerprints':
+            cursor.execute("""
+                INSERT INTO log_error_fingerprints
+                (fingerprint, exception_type, module, function_name, sample_message, first_seen, last_seen)
+                SELECT error_fingerprint, exception_type, module, function_name, message,
+                       MIN(timestamp), MAX(timestamp)
+                FROM system_logs
+                WHERE error_fingerprint IS NOT NULL
+                GROUP BY error_fingerprint
             """)
-            conn.commit()
-            messages.append("Added case_id column to reports table")
-
-        conn.close()
-
-        if messages:
-            return True, "; ".join(messages)
         else:
-            return True, "No migrations needed"
+            cursor.execute("""
+                INSERT INTO log_error_rollups_hourly (hour, fingerprint, error_count)
+                SELECT strftime('%Y-%m-%d %H:00', timestamp), error_fingerprint, COUNT(*)
+                FROM system_logs
+                WHERE error_fingerprint IS NOT NULL
+                  AND strftime('%Y-%m-%d %H:00', timestamp) IS NOT NULL
+                GROUP BY 1, 2
+            """)
 
-    except Exception as e:
-        return False, f"Migration failed: {str(e)}"
+    # Counters only grow on insert: archiving moves rows out of system_logs
+    # without changing history, and clearing logs prunes the rollups itself
+    hour_key = "COALESCE(strftime('%Y-%m-%d %H:00', NEW.timestamp), strftime('%Y-%m-%d %H:00', 'now', 'localtime'))"
+    triggers = {
+        'trg_system_logs_rollup': f"""
+            CREATE TRIGGER trg_system_logs_rollup
+            AFTER INSERT ON system_logs
+            BEGIN
+                INSERT INTO log_rollups_hourly (hour, log_level, module, log_count)
+                VALUES ({hour_key}, NEW.log_level, COALESCE(NEW.module, ''), 1)
+                ON CONFLICT(hour, log_level, module) DO UPDATE SET log_count = log_count + 1;
+            END
+        """,
+        'trg_system_logs_error_rollup': f"""
+            CREATE TRIGGER trg_system_logs_error_rollup
+            AFTER INSERT ON system_logs
+            WHEN NEW.error_fingerprint IS NOT NULL
+            BEGIN
+                INSERT INTO log_error_fingerprints
+                (fingerprint, exception_type, module, function_name, sample_message, first_seen, last_seen)
+                VALUES (NEW.error_fingerprint, NEW.exception_type, NEW.module, NEW.function_name,
+                        NEW.message, NEW.timestamp, NEW.timestamp)
+                ON CONFLICT(fingerprint) DO UPDATE SET last_seen = MAX(last_seen, excluded.last_seen);
+
+                INSERT INTO log_error_rollups_hourly (hour, fingerprint, error_count)
+                VALUES ({hour_key}, NEW.error_fingerprint, 1)
+                ON CONFLICT(hour, fingerprint) DO UPDATE SET error_count = error_count + 1;
+            END
+        """,
+    }
+    created_triggers = 0
+    for trigger_name, trigger_sql in triggers.items():
+        cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='trigger' AND name=?
+        """, (trigger_name,))
+        if not cursor.fetchone():
+            cursor.execute(trigger_sql)
+            created_triggers += 1
+
+    if created_triggers:
+        messages.append(f"Created {created_triggers} log rollup trigger(s)")
+
+
+# Numbered migrations, applied in order
+MIGRATIONS: List[Tuple[int, str, Callable]] = [
+    (0, "Ensure system_config table exists (critical for all dropdown functionality)", _migration_0),
+    (1, "Add theme_preference column to users table", _migration_1),
+    (2, "Create report_versions table", _migration_2),
+    (3, "Create report_approvals table", _migration_3),
+    (4, "Create notifications table", _migration_4),
+    (5, "Add versioning columns to reports table", _migration_5),
+    (6, "Ensure system_logs table exists", _migration_6),
+    (7, "Create report_number_reservations table", _migration_7),
+    (8, "Create restore_log table", _migration_8),
+    (9, "Add new columns to reports table", _migration_9),
+    (11, "Add system settings for batch reservation and grace period", _migration_11),
+    (12, "Populate dropdown values in system_config (only if empty)", _migration_12),
+    (13, "Add id_type column for ID/CR distinction", _migration_13),
+    (15, "Populate default validation rules for ID/CR and Account/Membership fields", _migration_15),
+    (16, "Create migration_history tracking table", _migration_16),
+    (17, "Add missing performance indexes", _migration_17),
+    (18, "Add reservation management settings", _migration_18),
+    (19, "Create gap_queue table for managing cancelled reservation gaps", _migration_19),
+    (20, "Remove gender CHECK constraint (encoding issues)", _migration_20),
+    (21, "Create activity_log table for GitHub-style changelog", _migration_21),
+    (22, "Add soft delete columns to report_versions table", _migration_22),
+    (23, "Add delete tracking columns to reports table", _migration_23),
+    (24, "Fix approval workflow for existing reports", _migration_24),
+    (25, "Drop status column from reports table (no longer used)", _migration_25),
+    (26, "Add case_id column to reports table", _migration_26),
+    (27, "Add backup store retention settings", _migration_27),
+    (28, "Scheduled backups (backup_log stats, leader lease, schedule settings)", _migration_28),
+    (29, "Reference data change counter (dropdowns, column settings)", _migration_29),
+    (30, "Query profiler tables and settings", _migration_30),
+    (31, "Approval queue indexes on (approval_status, requested_at) and requested_at", _migration_31),
+    (32, "Trigger-maintained unread notification counters", _migration_32),
+    (33, "Activity timeline index on (created_at, activity_id)", _migration_33),
+    (34, "Log archival settings and system_logs timestamp index", _migration_34),
+    (35, "Hourly log rollups and error fingerprints", _migration_35),
+]
@@ -0,0 +1,474 @@
+"""
+Query Profiler
+Opt-in per-statement timing and slow-query log for DatabaseManager.
+"""
+import atexit
+import hashlib
+import os
+import re
+import socket
+import threading
+import time
+import uuid
+from collections import deque
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+
+# Statements whose query plan can be explained
+EXPLAINABLE = ('SELECT', 'WITH', 'INSERT', 'UPDATE', 'DELETE', 'REPLACE')
+
+_COMMENT_RE = re.compile(r'--[^\n]*|/\*.*?\*/', re.DOTALL)
+_STRING_RE = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_RE = re.compile(r'(?<![\w.])-?\d+(?:\.\d+)?\b')
+_IN_LIST_RE = re.compile(r'\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)', re.IGNORECASE)
+_VALUES_LIST_RE = re.compile(r'\(\s*\?(?:\s*,\s*\?)*\s*\)(?:\s*,\s*\(\s*\?(?:\s*,\s*\?)*\s*\))+')
+_SPACE_RE = re.compile(r'\s+')
+
+
+@lru_cache(maxsize=2048)
+def normalize_statement(query: str) -> Tuple[str, str]:
+    """
+    Reduce a SQL string to its shape so calls with different literals group together.
+
+    Comments are dropped, literals become '?', IN (...) lists of any length
+    collapse to one form and whitespace is squeezed. Parameter values are
+    never part of the result.
+
+    Args:
+        query: SQL statement as passed to the database
+
+    Returns:
+        Tuple of (statement hash, normalized statement)
+    """
+    statement = _COMMENT_RE.sub(' ', query)
+    statement = _STRING_RE.sub('?', statement)
+    statement = _NUMBER_RE.sub('?', statement)
+    statement = _IN_LIST_RE.sub('IN (...)', statement)
+    statement = _VALUES_LIST_RE.sub('(...)', statement)
+    statement = _SPACE_RE.sub(' ', statement).strip()
+    statement_hash = hashlib.sha1(statement.encode('utf-8')).hexdigest()[:16]
+    return statement_hash, statement
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+class _StatementStats:
+    """Running totals for one normalized statement."""
+
+    __slots__ = ('statement', 'calls', 'total_ms', 'max_ms', 'rows',
+                 'lock_retries', 'backoff_ms', 'samples', 'plan', 'plan_at')
+
+    def __init__(self, statement: str, sample_size: int):
+        self.statement = statement
+        self.calls = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.rows = 0
+        self.lock_retries = 0
+        self.backoff_ms = 0.0
+        self.samples = deque(maxlen=sample_size)
+        self.plan: Optional[str] = None
+        self.plan_at = 0.0
+
+
+class QueryProfiler:
+    """
+    Collects per-statement latency, row counts and lock retries.
+
+    DatabaseManager calls record() after every profiled statement. Totals
+    are kept in memory and written to the query_profile table by a
+    background thread, one row per statement per client, so the report can
+    combine every workstation sharing the database. Statements slower than
+    the threshold are explained on the connection that ran them and queued
+    for the slow_query_log table. Parameter values are never stored.
+    """
+
+    # Latency samples kept per statement for p50/p95
+    SAMPLE_SIZE = 512
+
+    # Slow statements are re-explained at most this often (seconds)
+    PLAN_TTL = 600
+
+    # Slow query log rows kept in the database
+    SLOW_LOG_LIMIT = 5000
+
+    # Slow queries kept in memory for the current session
+    RECENT_SLOW_LIMIT = 200
+
+    def __init__(self, db_manager, slow_threshold_ms: float = 200, flush_interval: float = 60):
+        """
+        Initialize the query profiler.
+
+        Args:
+            db_manager: DatabaseManager instance to flush results through
+            slow_threshold_ms: Statements slower than this are logged with their plan
+            flush_interval: Seconds between writes to the profile tables
+        """
+        self.db_manager = db_manager
+        self.slow_threshold_ms = slow_threshold_ms
+        self.flush_interval = flush_interval
+        self.client_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self.started_at = datetime.now().isoformat()
+
+        self._lock = threading.Lock()
+        self._stats: Dict[str, _StatementStats] = {}
+        self._dirty = set()
+        self._pending_slow: List[tuple] = []
+        self._recent_slow = deque(maxlen=self.RECENT_SLOW_LIMIT)
+
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    # ==================== RECORDING ====================
+
+    def record(self, conn, query: str, params, elapsed: float, rows: int,
+               lock_retries: int = 0, backoff: float = 0.0):
+        """
+        Record one executed statement.
+
+        Never raises: a profiling problem must not fail the query it measures.
+
+        Args:
+            conn: Connection the statement ran on (used for EXPLAIN QUERY PLAN)
+            query: SQL statement
+            params: Statement parameters (only used to explain, never stored)
+            elapsed: Execution time in seconds
+            rows: Rows returned or affected
+            lock_retries: Attempts that failed with "database is locked"
+            backoff: Seconds slept between those attempts
+        """
+        try:
+            statement_hash, statement = normalize_statement(query)
+            elapsed_ms = elapsed * 1000.0
+            backoff_ms = backoff * 1000.0
+            rows = max(rows or 0, 0)
+
+            with self._lock:
+                stats = self._stats.get(statement_hash)
+                if stats is None:
+                    stats = _StatementStats(statement, self.SAMPLE_SIZE)
+                    self._stats[statement_hash] = stats
+                stats.calls += 1
+                stats.total_ms += elapsed_ms
+                stats.rows += rows
+                stats.lock_retries += lock_retries
+                stats.backoff_ms += backoff_ms
+                stats.samples.append(elapsed_ms)
+                if elapsed_ms > stats.max_ms:
+                    stats.max_ms = elapsed_ms
+                self._dirty.add(statement_hash)
+
+                if elapsed_ms < self.slow_threshold_ms:
+                    return
+                now = time.monotonic()
+                needs_plan = stats.plan is None or now - stats.plan_at > self.PLAN_TTL
+
+            plan = self._explain(conn, query, params) if needs_plan else None
+
+            with self._lock:
+                if plan is not None:
+                    stats.plan = plan
+                    stats.plan_at = now
+                entry = (
+                    statement_hash, statement, round(elapsed_ms, 3), rows, lock_retries,
+                    stats.plan, self.client_id, datetime.now().isoformat()
+                )
+                self._pending_slow.append(entry)
+                self._recent_slow.append(entry)
+        except Exception:
+            pass
+
+    @staticmethod
+    def _explain(conn, query: str, params) -> Optional[str]:
+        """Run EXPLAIN QUERY PLAN for a statement and format it as an indented tree."""
+        if conn is None or not query.lstrip().upper().startswith(EXPLAINABLE):
+            return None
+        try:
+            plan_rows = conn.execute(f"EXPLAIN QUERY PLAN {query}", params).fetchall()
+        except Exception:
+            return None
+
+        depth = {0: -1}
+        lines = []
+        for node_id, parent_id, _, detail in plan_rows:
+            level = depth.get(parent_id, -1) + 1
+            depth[node_id] = level
+            lines.append(f"{'  ' * level}{detail}")
+        return '\n'.join(lines)
+
+    # ==================== IN-MEMORY VIEWS ====================
+
+    def snapshot(self, sort_by: str = 'total_ms', limit: Optional[int] = None) -> List[Dict]:
+        """
+        Get statistics for this session.
+
+        Args:
+            sort_by: Key to sort descending by (total_ms, p95_ms, max_ms, calls, ...)
+            limit: Maximum number of statements
+
+        Returns:
+            List of per-statement dictionaries
+        """
+        with self._lock:
+            items = [
+                (statement_hash, stats, sorted(stats.samples))
+                for statement_hash, stats in self._stats.items()
+            ]
+
+        result = [self._row(statement_hash, stats, samples) for statement_hash, stats, samples in items]
+        result.sort(key=lambda row: row.get(sort_by) or 0, reverse=True)
+        return result[:limit] if limit else result
+
+    @staticmethod
+    def _row(statement_hash: str, stats: _StatementStats, samples: List[float]) -> Dict:
+        """Build the dictionary form of a statement's statistics."""
+        return {
+            'statement_hash': statement_hash,
+            'statement': stats.statement,
+            'calls': stats.calls,
+            'total_ms': round(stats.total_ms, 3),
+            'avg_ms': round(stats.total_ms / stats.calls, 3) if stats.calls else 0.0,
+            'p50_ms': round(percentile(samples, 0.50), 3),
+            'p95_ms': round(percentile(samples, 0.95), 3),
+            'max_ms': round(stats.max_ms, 3),
+            'rows': stats.rows,
+            'lock_retries': stats.lock_retries,
+            'backoff_ms': round(stats.backoff_ms, 3),
+            'query_plan': stats.plan,
+        }
+
+    def recent_slow_queries(self) -> List[Dict]:
+        """Get slow queries recorded in this session, newest first."""
+        with self._lock:
+            entries = list(self._recent_slow)
+        return [_slow_row(entry) for entry in reversed(entries)]
+
+    def reset(self):
+        """Discard everything recorded in this session."""
+        with self._lock:
+            self._stats.clear()
+            self._dirty.clear()
+            self._pending_slow.clear()
+            self._recent_slow.clear()
+
+    # ==================== PERSISTENCE ====================
+
+    def start(self):
+        """Start the background flush thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="QueryProfilerFlush", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """Stop the flush thread and write what is left."""
+        self._stop_event.set()
+        if self._thread and self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        self._thread = None
+        self.flush()
+        atexit.unregister(self.stop)
+
+    def _run(self):
+        """Flush loop."""
+        while not self._stop_event.wait(self.flush_interval):
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write changed statement totals and pending slow queries to the database.
+
+        Uses get_connection() directly, so the flush itself is not profiled.
+
+        Returns:
+            True if the write succeeded (or there was nothing to write)
+        """
+        with self._lock:
+            dirty = [
+                (statement_hash, self._stats[statement_hash], sorted(self._stats[statement_hash].samples))
+                for statement_hash in self._dirty
+            ]
+            pending_slow = self._pending_slow
+            self._dirty = set()
+            self._pending_slow = []
+
+        if not dirty and not pending_slow:
+            return True
+
+        now = datetime.now().isoformat()
+        profile_rows = []
+        for statement_hash, stats, samples in dirty:
+            row = self._row(statement_hash, stats, samples)
+            profile_rows.append((
+                statement_hash, self.client_id, row['statement'], row['calls'],
+                row['total_ms'], row['p50_ms'], row['p95_ms'], row['max_ms'], row['rows'],
+                row['lock_retries'], row['backoff_ms'], row['query_plan'], self.started_at, now
+            ))
+
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.executemany("""
+                    INSERT OR REPLACE INTO query_profile
+                    (statement_hash, client_id, statement, calls, total_ms, p50_ms, p95_ms,
+                     max_ms, rows, lock_retries, backoff_ms, query_plan, started_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, profile_rows)
+                if pending_slow:
+                    conn.executemany("""
+                        INSERT INTO slow_query_log
+                        (statement_hash, statement, duration_ms, rows, lock_retries,
+                         query_plan, client_id, created_at)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, pending_slow)
+                    conn.execute("""
+                        DELETE FROM slow_query_log
+                        WHERE log_id <= (SELECT MAX(log_id) FROM slow_query_log) - ?
+                    """, (self.SLOW_LOG_LIMIT,))
+            return True
+        except Exception:
+            # Keep the data for the next attempt (e.g. tables not migrated yet
+            # or the database is being restored)
+            with self._lock:
+                self._dirty.update(statement_hash for statement_hash, _, _ in dirty)
+                self._pending_slow[:0] = pending_slow[-self.SLOW_LOG_LIMIT:]
+            return False
+
+
+def _slow_row(entry: tuple) -> Dict:
+    """Build the dictionary form of a slow query log entry."""
+    keys = ('statement_hash', 'statement', 'duration_ms', 'rows', 'lock_retries',
+            'query_plan', 'client_id', 'created_at')
+    return dict(zip(keys, entry))
+
+
+# ==================== REPORTING ====================
+
+PROFILE_SORT_COLUMNS = {
+    'total_ms': 'total_ms',
+    'p95_ms': 'p95_ms',
+    'max_ms': 'max_ms',
+    'calls': 'calls',
+    'avg_ms': 'avg_ms',
+    'rows': 'rows',
+    'lock_retries': 'lock_retries',
+}
+
+
+def load_profile_report(db_manager, sort_by: str = 'total_ms', limit: int = 25) -> List[Dict]:
+    """
+    Load statement statistics combined across every client that recorded them.
+
+    Percentiles cannot be merged exactly, so p50/p95 are the call-weighted
+    average of the per-client values; max is exact.
+
+    Args:
+        db_manager: DatabaseManager instance
+        sort_by: One of PROFILE_SORT_COLUMNS
+        limit: Maximum number of statements
+
+    Returns:
+        List of per-statement dictionaries, hottest first
+    """
+    order = PROFILE_SORT_COLUMNS.get(sort_by, 'total_ms')
+    query = f"""
+        SELECT statement_hash, MAX(statement) AS statement,
+               SUM(calls) AS calls,
+               ROUND(SUM(total_ms), 3) AS total_ms,
+               ROUND(SUM(total_ms) / MAX(SUM(calls), 1), 3) AS avg_ms,
+               ROUND(SUM(p50_ms * calls) / MAX(SUM(calls), 1), 3) AS p50_ms,
+               ROUND(SUM(p95_ms * calls) / MAX(SUM(calls), 1), 3) AS p95_ms,
+               ROUND(MAX(max_ms), 3) AS max_ms,
+               SUM(rows) AS rows,
+               SUM(lock_retries) AS lock_retries,
+               ROUND(SUM(backoff_ms), 3) AS backoff_ms,
+               MAX(query_plan) AS query_plan,
+               COUNT(*) AS clients,
+               MAX(updated_at) AS updated_at
+        FROM query_profile
+        GROUP BY statement_hash
+        ORDER BY {order} DESC
+        LIMIT ?
+    """
+    return [dict(row) for row in db_manager.execute_with_retry(query, (limit,))]
+
+
+def load_slow_queries(db_manager, limit: int = 50) -> List[Dict]:
+    """
+    Load the most recent slow query log entries.
+
+    Args:
+        db_manager: DatabaseManager instance
+        limit: Maximum number of entries
+
+    Returns:
+        List of slow query dictionaries, newest first
+    """
+    query = """
+        SELECT statement_hash, statement, duration_ms, rows, lock_retries,
+               query_plan, client_id, created_at
+        FROM slow_query_log
+        ORDER BY log_id DESC
+        LIMIT ?
+    """
+    return [dict(row) for row in db_manager.execute_with_retry(query, (limit,))]
+
+
+def reset_profile_data(db_manager):
+    """
+    Clear the stored profile and slow query log for every client.
+
+    Args:
+        db_manager: DatabaseManager instance
+    """
+    if db_manager.profiler:
+        db_manager.profiler.reset()
+    with db_manager.get_connection() as conn:
+        conn.execute("DELETE FROM query_profile")
+        conn.execute("DELETE FROM slow_query_log")
+
+
+def configure_profiling(db_manager) -> bool:
+    """
+    Enable or disable profiling from system settings.
+
+    The FIU_QUERY_PROFILE environment variable overrides the
+    query_profiling_enabled setting (1 = on, 0 = off).
+
+    Args:
+        db_manager: DatabaseManager instance
+
+    Returns:
+        True if profiling is enabled
+    """
+    settings = {}
+    try:
+        result = db_manager.execute_with_retry("""
+            SELECT setting_key, setting_value FROM system_settings
+            WHERE setting_key IN ('query_profiling_enabled', 'slow_query_threshold_ms')
+        """)
+        settings = {row[0]: row[1] for row in result}
+    except Exception:
+        pass
+
+    enabled = os.environ.get('FIU_QUERY_PROFILE', settings.get('query_profiling_enabled', '0'))
+    try:
+        threshold = float(settings.get('slow_query_threshold_ms', 200))
+    except (TypeError, ValueError):
+        threshold = 200.0
+
+    if str(enabled).strip().lower() in ('1', 'true', 'yes', 'on'):
+        db_manager.enable_profiling(slow_threshold_ms=threshold)
+        return True
+
+    db_manager.disable_profiling()
+    return False
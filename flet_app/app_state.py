@@ -38,6 +38,10 @@ class AppState:
     settings_service: Any = None
     report_number_service: Any = None
     activity_service: Any = None
+    backup_service: Any = None
+    backup_scheduler_service: Any = None
+    archive_service: Any = None
+    report_import_service: Any = None
 
     # ==================== UI State ====================
     theme: str = "dark"
@@ -62,6 +66,7 @@ class AppState:
             from database.db_manager import DatabaseManager
             from database.init_db import validate_database
             from database.migrations import migrate_database
+            from database.query_profiler import configure_profiling
             from services.logging_service import LoggingService
             from services.auth_service import AuthService
             from services.report_service import ReportService
@@ -73,6 +78,15 @@ class AppState:
             from services.settings_service import SettingsService
             from services.report_number_service import ReportNumberService
             from services.activity_service import ActivityService
+            from services.backup_service import BackupService
+            from services.backup_scheduler_service import BackupSchedulerService
+            from services.archive_service import ArchiveService
+            from services.report_import_service import ReportImportService
+            from config import Config
+
+            # Re-initialization (setup wizard, another session) replaces the
+            # services; stop the old background threads first
+            self.shutdown_services()
 
             # Validate database
             is_valid, message = validate_database(db_path)
@@ -94,6 +108,10 @@ class AppState:
             elif "No migrations needed" not in migration_msg:
                 self.logging_service.info(f"Database migration: {migration_msg}")
 
+            # Opt-in query profiling (system setting or FIU_QUERY_PROFILE)
+            if configure_profiling(self.db_manager):
+                self.logging_service.info("Query profiling enabled")
+
             self.logging_service.info("=" * 60)
             self.logging_service.info("FIU Report Management System Starting (Flet Edition)")
             self.logging_service.info("Version 2.0.0")
@@ -140,6 +158,30 @@ class AppState:
             self.report_service.set_activity_service(self.activity_service)
             self.version_service.set_activity_service(self.activity_service)
 
+            # Activity feed writes are batched off the report save path
+            self.activity_service.start_writer()
+
+            # Old logs and activity move to monthly archive databases
+            self.archive_service = ArchiveService(self.db_manager, self.logging_service)
+            self.logging_service.set_archive_service(self.archive_service)
+            self.activity_service.set_archive_service(self.archive_service)
+
+            # Scheduled backups (only the elected leader client runs them)
+            self.backup_service = BackupService(
+                self.db_manager,
+                self.logging_service,
+                Config.BACKUP_PATH or str(Path.home() / "FIU_System" / "backups"),
+                self.archive_service
+            )
+            self.backup_scheduler_service = BackupSchedulerService(
+                self.db_manager, self.logging_service, self.backup_service, self.archive_service
+            )
+            self.backup_scheduler_service.start()
+
+            self.report_import_service = ReportImportService(
+                self.db_manager, self.logging_service, self.validation_service
+            )
+
             self.logging_service.info("All services initialized successfully")
             return True
 
@@ -152,6 +194,23 @@ class AppState:
                 self.logging_service.error(error_msg, exc_info=True)
             return False
 
+    def shutdown_services(self):
+        """
+        Stop background work started by initialize_services.
+
+        Stops the backup scheduler (releasing its lease), writes queued
+        activity and pending setting changes. Safe to call more than once.
+        """
+        if self.backup_scheduler_service:
+            self.backup_scheduler_service.stop()
+            self.backup_scheduler_service = None
+
+        if self.activity_service:
+            self.activity_service.stop_writer()
+
+        if self.settings_service:
+            self.settings_service.flush()
+
     def login(self, user: Dict[str, Any], session_id: Optional[int] = None):
         """
         Set authenticated state after successful login.
@@ -171,11 +230,23 @@ class AppState:
                 user.get('username')
             )
 
+        # Views read settings from memory from here on
+        if self.settings_service:
+            self.settings_service.load_user_settings(user.get('user_id'))
+
         # Notify listeners
         self._notify_auth_listeners()
 
     def logout(self):
         """Clear authenticated state and perform cleanup."""
+        # Write the session's queued activities before the user goes away
+        if self.activity_service:
+            self.activity_service.flush()
+
+        # Write pending setting changes and drop the user's cached settings
+        if self.settings_service:
+            self.settings_service.unload_user_settings()
+
         if self.auth_service and self.is_authenticated:
             self.auth_service.logout()
 
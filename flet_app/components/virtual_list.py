@@ -0,0 +1,243 @@
+"""
+Virtual List Component for FIU Report Management System.
+Keyed, incrementally rendered list that reuses row controls across refreshes.
+"""
+import flet as ft
+from typing import Any, Callable, Dict, List, Optional
+
+
+class VirtualList:
+    """
+    Keyed list that only builds the rows it has to.
+
+    Row controls are cached by key (e.g. report_id) together with a
+    signature of the data they were built from. On refresh, rows whose
+    signature is unchanged keep their existing control, so page.update()
+    only ships the rows that actually changed. Rows are rendered in
+    windows: the first window on load, the next one when the user scrolls
+    near the end, and the underlying ListView lays out only what is visible.
+
+    Usage:
+        rows = VirtualList(build_row=make_row, key_field='report_id')
+        container.content = rows.control
+        rows.set_items(reports)
+        page.update()
+    """
+
+    def __init__(
+        self,
+        build_row: Callable[[Dict], ft.Control],
+        key_field: str = 'report_id',
+        signature: Optional[Callable[[Dict], Any]] = None,
+        header: Optional[ft.Control] = None,
+        empty_state: Optional[ft.Control] = None,
+        item_extent: Optional[int] = None,
+        width: Optional[int] = None,
+        window_size: int = 100,
+        spacing: int = 0,
+    ):
+        """
+        Initialize the virtual list.
+
+        Args:
+            build_row: Builds the control for one item
+            key_field: Item field that identifies a row across refreshes
+            signature: Returns the value a row is rebuilt on (defaults to the item itself)
+            header: Optional fixed header shown above the rows
+            empty_state: Optional control shown when there are no items
+            item_extent: Fixed row height, lets the client skip measuring rows
+            width: Fixed content width; enables horizontal scrolling for wide rows
+            window_size: Number of rows rendered per scroll window
+            spacing: Spacing between rows
+        """
+        self.build_row = build_row
+        self.key_field = key_field
+        self.signature = signature or (lambda item: item)
+        self.window_size = window_size
+        self.empty_state = empty_state
+
+        self._items: List[Dict] = []
+        self._cache: Dict[Any, tuple] = {}  # key -> (signature, control)
+        self._rendered = 0
+
+        self.list_view = ft.ListView(
+            controls=[],
+            spacing=spacing,
+            item_extent=item_extent,
+            expand=True,
+            on_scroll=self._handle_scroll,
+            on_scroll_interval=100,
+        )
+
+        body = self.list_view
+        if header is not None:
+            body = ft.Column(controls=[header, self.list_view], spacing=0, expand=True)
+        if width is not None:
+            body = ft.Row(
+                controls=[ft.Container(content=body, width=width)],
+                scroll=ft.ScrollMode.AUTO,
+                vertical_alignment=ft.CrossAxisAlignment.STRETCH,
+                expand=True,
+            )
+
+        self.control = ft.Stack(
+            controls=[body] + ([empty_state] if empty_state is not None else []),
+            expand=True,
+        )
+        if empty_state is not None:
+            empty_state.visible = False
+
+    @property
+    def items(self) -> List[Dict]:
+        """Items currently held by the list."""
+        return self._items
+
+    def key_of(self, item: Dict) -> Any:
+        """Return the row key of an item."""
+        return item.get(self.key_field)
+
+    def set_items(self, items: List[Dict]) -> int:
+        """
+        Replace the list contents, reusing controls for unchanged rows.
+
+        The caller is responsible for page.update().
+
+        Args:
+            items: New items in display order
+
+        Returns:
+            Number of row controls that had to be (re)built
+        """
+        self._items = list(items)
+        keys = {self.key_of(item) for item in self._items}
+
+        # Forget rows that left the list
+        for key in list(self._cache):
+            if key not in keys:
+                del self._cache[key]
+
+        # Keep the current scroll depth, but always show at least one window
+        self._rendered = min(len(self._items), max(self._rendered, self.window_size))
+        return self._render()
+
+    def refresh(self) -> int:
+        """
+        Re-evaluate row signatures after external state changed (e.g. selection).
+
+        Returns:
+            Number of row controls rebuilt
+        """
+        return self._render()
+
+    def patch(self, item: Dict) -> bool:
+        """
+        Replace a single item in place by key and rebuild only its row.
+
+        Args:
+            item: Updated item
+
+        Returns:
+            True if the item was found
+        """
+        key = self.key_of(item)
+        for index, existing in enumerate(self._items):
+            if self.key_of(existing) == key:
+                self._items[index] = item
+                if index < self._rendered:
+                    self.list_view.controls[index] = self._row_control(item)
+                    self.list_view.update()
+                return True
+        return False
+
+    def prepend(self, items: List[Dict]) -> int:
+        """
+        Insert new items at the top, skipping keys already in the list.
+
+        Rows already rendered keep their controls, so only the new rows
+        are built and shipped.
+
+        Args:
+            items: New items in display order
+
+        Returns:
+            Number of items inserted
+        """
+        keys = {self.key_of(item) for item in self._items}
+        new_items = [item for item in items if self.key_of(item) not in keys]
+        if not new_items:
+            return 0
+
+        self._items[:0] = new_items
+        self._rendered += len(new_items)
+        self.list_view.controls[:0] = [self._row_control(item) for item in new_items]
+        self._update_empty_state()
+        self.list_view.update()
+        return len(new_items)
+
+    def remove(self, key: Any) -> bool:
+        """
+        Remove a single row by key.
+
+        Args:
+            key: Row key
+
+        Returns:
+            True if the item was found
+        """
+        for index, existing in enumerate(self._items):
+            if self.key_of(existing) == key:
+                del self._items[index]
+                self._cache.pop(key, None)
+                if index < self._rendered:
+                    del self.list_view.controls[index]
+                    self._rendered -= 1
+                self._update_empty_state()
+                self.list_view.update()
+                return True
+        return False
+
+    def _row_control(self, item: Dict) -> ft.Control:
+        """Return the cached control for an item, rebuilding it if its data changed."""
+        key = self.key_of(item)
+        signature = self.signature(item)
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+
+        control = self.build_row(item)
+        self._cache[key] = (signature, control)
+        return control
+
+    def _render(self) -> int:
+        """Sync the ListView with the rendered window of items."""
+        built = 0
+        controls = []
+        for item in self._items[:self._rendered]:
+            cached = self._cache.get(self.key_of(item))
+            control = self._row_control(item)
+            if cached is None or cached[1] is not control:
+                built += 1
+            controls.append(control)
+
+        self.list_view.controls = controls
+        self._update_empty_state()
+        return built
+
+    def _update_empty_state(self):
+        """Toggle the empty state placeholder."""
+        if self.empty_state is not None:
+            self.empty_state.visible = not self._items
+
+    def _handle_scroll(self, e: ft.OnScrollEvent):
+        """Render the next window when the user scrolls near the end."""
+        if self._rendered >= len(self._items):
+            return
+        if e.max_scroll_extent is None or e.pixels < e.max_scroll_extent - 400:
+            return
+
+        start = self._rendered
+        self._rendered = min(len(self._items), self._rendered + self.window_size)
+        self.list_view.controls.extend(
+            self._row_control(item) for item in self._items[start:self._rendered]
+        )
+        self.list_view.update()
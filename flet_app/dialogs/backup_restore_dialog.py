@@ -5,7 +5,6 @@ Comprehensive backup and restore functionality for database.
 import flet as ft
 import asyncio
 import shutil
-import sqlite3
 import threading
 from typing import Any, Callable, Optional
 from pathlib import Path
@@ -14,6 +13,7 @@ from datetime import datetime
 from theme.theme_manager import theme_manager
 from components.toast import show_success, show_error, show_warning
 from config import Config
+from services.backup_service import BackupService
 from utils.file_dialog import choose_file, choose_save_file
 
 
@@ -84,6 +84,10 @@ def show_backup_restore_dialog(
         """Get database path."""
         return Config.DATABASE_PATH or ""
 
+    def get_backup_service() -> BackupService:
+        """Get the deduplicated backup store service."""
+        return BackupService(app_state.db_manager, app_state.logging_service, str(get_backup_dir()))
+
     async def refresh_backup_list():
         """Refresh the list of available backups."""
         nonlocal backup_list_data, selected_backup_path
@@ -104,6 +108,15 @@ def show_backup_restore_dialog(
 
             def scan_backups():
                 files = []
+                # Deduplicated store backups
+                for backup in get_backup_service().list_backups():
+                    files.append({
+                        'path': backup['manifest_path'],
+                        'name': f"{backup['name']} (store)",
+                        'size': backup['total_size'] / (1024 * 1024),  # MB
+                        'modified': datetime.fromisoformat(backup['created_at']),
+                    })
+                # Legacy full-copy backup files
                 for backup_file in backup_dir.glob("*.db"):
                     file_stat = backup_file.stat()
                     files.append({
@@ -237,26 +250,15 @@ def show_backup_restore_dialog(
 
         try:
             def perform_backup():
-                db_path = get_db_path()
-                backup_dir = get_backup_dir()
-
-                # Create backup directory
-                backup_dir.mkdir(parents=True, exist_ok=True)
+                backup_service = get_backup_service()
+                username = (app_state.current_user or {}).get('username', 'SYSTEM')
 
-                # Generate backup filename
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_filename = f"fiu_backup_{timestamp}.db"
-                backup_file_path = backup_dir / backup_filename
+                success, message, manifest = backup_service.create_backup(username)
+                if not success:
+                    raise Exception(message)
 
-                # Copy database
-                shutil.copy2(db_path, str(backup_file_path))
-
-                # Verify backup
-                conn = sqlite3.connect(str(backup_file_path))
-                conn.execute("PRAGMA integrity_check")
-                conn.close()
-
-                return str(backup_file_path)
+                backup_service.apply_retention()
+                return str(backup_service.manifests_dir / f"{manifest['name']}.json")
 
             loop = asyncio.get_event_loop()
 
@@ -347,46 +349,37 @@ def show_backup_restore_dialog(
         page.update()
 
         try:
-            def perform_restore():
-                target_db_path = get_db_path()
-
-                # Verify backup
-                conn = sqlite3.connect(selected_backup_path)
-                conn.execute("PRAGMA integrity_check")
-                conn.close()
-
-                # Create backup of current database
-                current_db = Path(target_db_path)
-                if current_db.exists():
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    pre_restore_backup = current_db.parent / f"pre_restore_backup_{timestamp}.db"
-                    shutil.copy2(str(current_db), str(pre_restore_backup))
+            def on_progress(percent: int, message: str):
+                progress_bar.value = percent / 100
+                progress_label.value = message
+                page.update()
 
-                # Restore
-                shutil.copy2(selected_backup_path, target_db_path)
+            def perform_restore():
+                username = (app_state.current_user or {}).get('username') or 'SYSTEM'
+                success, message, stats = get_backup_service().restore_database(
+                    selected_backup_path, username, progress_callback=on_progress
+                )
+                if not success:
+                    raise Exception(message)
+                return stats
 
             loop = asyncio.get_event_loop()
-
-            progress_bar.value = 0.4
-            progress_label.value = "Backing up current database..."
-            page.update()
-
-            await loop.run_in_executor(None, perform_restore)
-
-            progress_bar.value = 1.0
-            progress_label.value = "Restore completed!"
-            page.update()
+            stats = await loop.run_in_executor(None, perform_restore)
 
             if app_state.logging_service:
                 app_state.logging_service.log_user_action("DATABASE_RESTORED", {})
 
-            show_success(page, "Database restored! Please restart the application.")
+            show_success(
+                page,
+                f"Database restored (unavailable for {stats['downtime_seconds']:.2f}s). "
+                f"Previous state saved as {stats['pre_restore_backup']}."
+            )
 
             if on_restore_complete:
                 on_restore_complete()
 
         except Exception as ex:
-            show_error(page, f"Restore failed: {str(ex)}")
+            show_error(page, str(ex))
         finally:
             is_processing = False
             progress_bar.visible = False
@@ -400,7 +393,10 @@ def show_backup_restore_dialog(
 
         def run_dialog():
             default_dir = str(Path.home() / "Downloads")
-            default_name = Path(selected_backup_path).name
+            backup_service = get_backup_service()
+            is_store_backup = backup_service.is_manifest_path(selected_backup_path)
+            default_name = (f"{Path(selected_backup_path).stem}.db" if is_store_backup
+                            else Path(selected_backup_path).name)
             result = choose_save_file(
                 prompt="Export Backup",
                 default_path=default_dir,
@@ -409,7 +405,13 @@ def show_backup_restore_dialog(
             )
             if result:
                 try:
-                    shutil.copy2(selected_backup_path, result)
+                    if is_store_backup:
+                        # Export store backups as standalone database files
+                        success, message = backup_service.restore_to_file(Path(selected_backup_path).stem, result)
+                        if not success:
+                            raise Exception(message)
+                    else:
+                        shutil.copy2(selected_backup_path, result)
                     show_success(page, f"Backup exported to: {Path(result).name}")
                     if app_state.logging_service:
                         app_state.logging_service.log_user_action("BACKUP_EXPORTED", {'file_path': result})
@@ -485,8 +487,17 @@ def show_backup_restore_dialog(
     async def do_delete():
         nonlocal selected_backup_path
         try:
+            def perform_delete():
+                backup_service = get_backup_service()
+                if backup_service.is_manifest_path(selected_backup_path):
+                    success, message = backup_service.delete_backup(Path(selected_backup_path).stem)
+                    if not success:
+                        raise Exception(message)
+                else:
+                    Path(selected_backup_path).unlink()
+
             loop = asyncio.get_event_loop()
-            await loop.run_in_executor(None, lambda: Path(selected_backup_path).unlink())
+            await loop.run_in_executor(None, perform_delete)
 
             if app_state.logging_service:
                 app_state.logging_service.log_user_action("BACKUP_DELETED", {'file_path': selected_backup_path})
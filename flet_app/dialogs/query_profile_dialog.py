@@ -0,0 +1,262 @@
+"""
+Query Profiler Dialog for FIU Report Management System.
+Shows the hottest SQL statements and the slow query log recorded by the query profiler.
+"""
+import flet as ft
+import asyncio
+from typing import Any, Dict, List
+
+from theme.theme_manager import theme_manager
+from components.toast import show_success, show_error
+from database.query_profiler import load_profile_report, load_slow_queries, reset_profile_data
+
+
+SORT_OPTIONS = [
+    ('total_ms', 'Total time'),
+    ('p95_ms', 'p95 latency'),
+    ('max_ms', 'Max latency'),
+    ('calls', 'Calls'),
+    ('lock_retries', 'Lock retries'),
+]
+
+
+def show_query_profile_dialog(page: ft.Page, app_state: Any):
+    """
+    Show the query profiler dialog.
+
+    Args:
+        page: Flet page object
+        app_state: Application state
+    """
+    colors = theme_manager.get_colors()
+    db_manager = app_state.db_manager
+
+    # State
+    profile_rows: List[Dict] = []
+    slow_rows: List[Dict] = []
+
+    # Controls
+    sort_dropdown = ft.Dropdown(
+        value='total_ms',
+        options=[ft.dropdown.Option(key=key, text=text) for key, text in SORT_OPTIONS],
+        width=160,
+        text_size=13,
+    )
+    profiling_switch = ft.Switch(
+        label="Profile queries in this session",
+        value=db_manager.profiler is not None,
+    )
+    profile_list = ft.ListView(spacing=2, expand=True)
+    slow_list = ft.ListView(spacing=2, expand=True)
+    detail_text = ft.Text(
+        "Select a statement to see its full text and query plan",
+        size=12,
+        color=colors["text_secondary"],
+        font_family="Consolas",
+        selectable=True,
+    )
+
+    def show_detail(row: Dict):
+        detail_text.value = f"{row['statement']}\n\nQuery plan:\n{row.get('query_plan') or '(not captured)'}"
+        detail_text.color = colors["text_primary"]
+        page.update()
+
+    def metric(value, width=70) -> ft.Control:
+        return ft.Text(str(value), size=11, width=width, text_align=ft.TextAlign.RIGHT,
+                       color=colors["text_secondary"])
+
+    def statement_text(statement: str) -> ft.Control:
+        return ft.Text(statement, size=11, color=colors["text_primary"], expand=True,
+                       max_lines=1, overflow=ft.TextOverflow.ELLIPSIS, tooltip=statement)
+
+    def header(labels: List[str]) -> ft.Control:
+        return ft.Container(
+            content=ft.Row(
+                controls=[
+                    ft.Text(label, size=11, width=70, text_align=ft.TextAlign.RIGHT,
+                            weight=ft.FontWeight.BOLD, color=colors["text_primary"])
+                    for label in labels
+                ] + [ft.Text("Statement", size=11, weight=ft.FontWeight.BOLD, color=colors["text_primary"])],
+                spacing=8,
+            ),
+            padding=ft.padding.symmetric(horizontal=8, vertical=6),
+            bgcolor=colors["bg_tertiary"],
+            border_radius=4,
+        )
+
+    def row_control(cells: List[ft.Control], row: Dict) -> ft.Control:
+        return ft.Container(
+            content=ft.Row(controls=cells, spacing=8),
+            padding=ft.padding.symmetric(horizontal=8, vertical=4),
+            border_radius=4,
+            ink=True,
+            on_click=lambda e, r=row: show_detail(r),
+        )
+
+    def render():
+        profile_list.controls = [
+            row_control([
+                metric(row['calls']), metric(row['total_ms']), metric(row['avg_ms']),
+                metric(row['p50_ms']), metric(row['p95_ms']), metric(row['max_ms']),
+                metric(row['rows']), metric(row['lock_retries']),
+                statement_text(row['statement']),
+            ], row)
+            for row in profile_rows
+        ] or [ft.Text("No statements recorded yet.", color=colors["text_muted"])]
+
+        slow_list.controls = [
+            row_control([
+                ft.Text(str(row['created_at'])[:19].replace('T', ' '), size=11, width=140,
+                        color=colors["text_secondary"]),
+                metric(row['duration_ms']), metric(row['rows']), metric(row['lock_retries']),
+                statement_text(row['statement']),
+            ], row)
+            for row in slow_rows
+        ] or [ft.Text("No slow queries logged.", color=colors["text_muted"])]
+        page.update()
+
+    async def load_data():
+        nonlocal profile_rows, slow_rows
+        try:
+            loop = asyncio.get_event_loop()
+
+            def fetch():
+                if db_manager.profiler:
+                    db_manager.profiler.flush()
+                return (
+                    load_profile_report(db_manager, sort_by=sort_dropdown.value, limit=100),
+                    load_slow_queries(db_manager, limit=200),
+                )
+
+            profile_rows, slow_rows = await loop.run_in_executor(None, fetch)
+            render()
+        except Exception as e:
+            show_error(page, f"Error loading query profile: {str(e)}")
+
+    def handle_sort(e):
+        page.run_task(load_data)
+
+    def handle_toggle(e):
+        try:
+            if profiling_switch.value:
+                db_manager.enable_profiling()
+                app_state.logging_service.info("Query profiling enabled for this session")
+            else:
+                db_manager.disable_profiling()
+                app_state.logging_service.info("Query profiling disabled for this session")
+        except Exception as ex:
+            show_error(page, f"Failed to toggle query profiling: {str(ex)}")
+
+    def handle_reset(e):
+        try:
+            reset_profile_data(db_manager)
+            app_state.logging_service.info("Query profile data cleared")
+            show_success(page, "Query profile cleared")
+            page.run_task(load_data)
+        except Exception as ex:
+            show_error(page, f"Failed to clear query profile: {str(ex)}")
+
+    def close_dialog(e):
+        dialog.open = False
+        page.update()
+
+    sort_dropdown.on_change = handle_sort
+    profiling_switch.on_change = handle_toggle
+
+    tabs = ft.Tabs(
+        selected_index=0,
+        animation_duration=150,
+        tabs=[
+            ft.Tab(
+                text="Top Statements",
+                content=ft.Column(
+                    controls=[
+                        header(["Calls", "Total ms", "Avg ms", "p50 ms", "p95 ms", "Max ms", "Rows", "Locks"]),
+                        profile_list,
+                    ],
+                    spacing=4,
+                    expand=True,
+                ),
+            ),
+            ft.Tab(
+                text="Slow Query Log",
+                content=ft.Column(
+                    controls=[
+                        ft.Container(
+                            content=ft.Row(
+                                controls=[
+                                    ft.Text("Time", size=11, width=140, weight=ft.FontWeight.BOLD,
+                                            color=colors["text_primary"]),
+                                    ft.Text("Duration ms", size=11, width=70, text_align=ft.TextAlign.RIGHT,
+                                            weight=ft.FontWeight.BOLD, color=colors["text_primary"]),
+                                    ft.Text("Rows", size=11, width=70, text_align=ft.TextAlign.RIGHT,
+                                            weight=ft.FontWeight.BOLD, color=colors["text_primary"]),
+                                    ft.Text("Locks", size=11, width=70, text_align=ft.TextAlign.RIGHT,
+                                            weight=ft.FontWeight.BOLD, color=colors["text_primary"]),
+                                    ft.Text("Statement", size=11, weight=ft.FontWeight.BOLD,
+                                            color=colors["text_primary"]),
+                                ],
+                                spacing=8,
+                            ),
+                            padding=ft.padding.symmetric(horizontal=8, vertical=6),
+                            bgcolor=colors["bg_tertiary"],
+                            border_radius=4,
+                        ),
+                        slow_list,
+                    ],
+                    spacing=4,
+                    expand=True,
+                ),
+            ),
+        ],
+        expand=True,
+    )
+
+    dialog = ft.AlertDialog(
+        modal=True,
+        title=ft.Row(
+            controls=[
+                ft.Icon(ft.Icons.SPEED, color=colors["primary"]),
+                ft.Text("Query Profiler", weight=ft.FontWeight.BOLD),
+            ],
+            spacing=8,
+        ),
+        content=ft.Container(
+            content=ft.Column(
+                controls=[
+                    ft.Row(
+                        controls=[
+                            profiling_switch,
+                            ft.Container(expand=True),
+                            ft.Text("Sort by:", color=colors["text_secondary"]),
+                            sort_dropdown,
+                        ],
+                        vertical_alignment=ft.CrossAxisAlignment.CENTER,
+                    ),
+                    ft.Container(content=tabs, expand=True),
+                    ft.Container(
+                        content=ft.Column(controls=[detail_text], scroll=ft.ScrollMode.AUTO),
+                        height=140,
+                        padding=ft.padding.all(8),
+                        bgcolor=colors["bg_tertiary"],
+                        border_radius=8,
+                    ),
+                ],
+                spacing=8,
+                expand=True,
+            ),
+            width=1000,
+            height=620,
+        ),
+        actions=[
+            ft.TextButton("Clear Recorded Data", on_click=handle_reset),
+            ft.TextButton("Refresh", on_click=handle_sort),
+            ft.ElevatedButton("Close", on_click=close_dialog),
+        ],
+        actions_alignment=ft.MainAxisAlignment.END,
+    )
+
+    page.overlay.append(dialog)
+    dialog.open = True
+    page.update()
+    page.run_task(load_data)
@@ -6,7 +6,7 @@ import flet as ft
 from typing import Optional, Any, Callable
 
 from theme.theme_manager import theme_manager
-from services.security_service import SecurityService
+from services.security_service import get_password_hasher
 
 
 def show_user_dialog(
@@ -65,7 +65,7 @@ def show_user_dialog(
 
         return True, ""
 
-    def save_user(e):
+    async def save_user(e):
         """Save user data."""
         is_valid, error = validate_form()
         if not is_valid:
@@ -84,8 +84,8 @@ def show_user_dialog(
                 user_id = user_data['user_id']
 
                 if password:
-                    # Hash the new password using SecurityService
-                    hashed_password = SecurityService.hash_password(password)
+                    # Hash the new password in the hasher pool (keeps the UI responsive)
+                    hashed_password = await get_password_hasher().hash_password_async(password)
                     query = """
                         UPDATE users
                         SET password = ?, full_name = ?, role = ?, is_active = ?,
@@ -107,8 +107,8 @@ def show_user_dialog(
                 logging_service.log_user_action("USER_UPDATED", {"user_id": user_id})
 
             else:
-                # Create new user - hash password using SecurityService
-                hashed_password = SecurityService.hash_password(password)
+                # Create new user - hash password in the hasher pool
+                hashed_password = await get_password_hasher().hash_password_async(password)
                 query = """
                     INSERT INTO users (username, password, full_name, role, is_active,
                                      created_at, created_by)
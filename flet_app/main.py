@@ -5,6 +5,7 @@ Modern Flet-based application with light/dark theming.
 Version: 2.0.0
 Technology: Python 3.9+ | Flet | SQLite3 | Plotly
 """
+import asyncio
 import sys
 from pathlib import Path
 
@@ -71,6 +72,7 @@ class FletApp:
         self.sidebar = None
         self.header = None
         self.content_area = None
+        self._restore_watch_started = False
 
         # Configure page
         self._configure_page()
@@ -98,6 +100,18 @@ class FletApp:
         # Setup keyboard shortcuts
         self.page.on_keyboard_event = self._handle_keyboard_event
 
+        # Stop background services when the window or session closes
+        # (the desktop equivalent of aboutToQuit in the PyQt client)
+        self.page.window.prevent_close = True
+        self.page.window.on_event = self._handle_window_event
+        self.page.on_close = lambda e: app_state.shutdown_services()
+
+    def _handle_window_event(self, e):
+        """Shut services down before the window closes."""
+        if e.data == "close":
+            app_state.shutdown_services()
+            self.page.window.destroy()
+
     def _handle_keyboard_event(self, e: ft.KeyboardEvent):
         """Handle keyboard shortcuts."""
         # Only process when logged in (main app showing)
@@ -234,6 +248,28 @@ class FletApp:
         self._build_main_layout()
         self.page.update()
 
+        # Reload content when another client restores the database
+        if not self._restore_watch_started:
+            self._restore_watch_started = True
+            self.page.run_task(self._watch_for_restore)
+
+    async def _watch_for_restore(self):
+        """Poll the restore generation and reload the current view after a restore."""
+        loop = asyncio.get_event_loop()
+        while True:
+            await asyncio.sleep(30)
+            if not app_state.is_authenticated or not app_state.db_manager:
+                continue
+            try:
+                restored = await loop.run_in_executor(None, app_state.db_manager.check_restored)
+            except Exception as e:
+                print(f"Error checking restore generation: {e}")
+                continue
+            if restored:
+                app_state.logging_service.info("Database was restored by another client - reloading view")
+                self._update_content(self.current_route)
+                self.toast.info("Database was restored - data reloaded")
+
     def _handle_navigate(self, route: str):
         """Handle navigation to a route."""
         self.current_route = route
@@ -267,7 +303,10 @@ class FletApp:
 
         # Backup handler (Admin only)
         def handle_backup():
-            show_backup_restore_dialog(self.page, app_state)
+            show_backup_restore_dialog(
+                self.page, app_state,
+                on_restore_complete=lambda: self._update_content(self.current_route)
+            )
 
         # Reservations handler (Admin only)
         def handle_reservations():
@@ -187,7 +187,7 @@ class ThemeManager:
         try:
             current_user = self._auth_service.get_current_user()
             if current_user:
-                settings = self._settings_service.get_user_settings(current_user['user_id'])
+                settings = self._settings_service.get_all_settings(current_user['user_id'])
                 if settings and 'theme' in settings:
                     self._current_theme = settings['theme']
         except Exception as e:
@@ -1,6 +1,7 @@
 """
 Activity View for FIU Report Management System.
-Displays GitHub-style activity feed with filtering and pagination.
+Displays GitHub-style activity feed with filtering, cursor paging and
+incremental refresh of new activities.
 """
 import flet as ft
 import asyncio
@@ -9,6 +10,7 @@ from datetime import datetime, timedelta
 
 from theme.theme_manager import theme_manager
 from components.activity_timeline import create_activity_timeline, ACTION_ICONS, ACTION_COLORS
+from components.virtual_list import VirtualList
 
 
 # Action type options for filtering
@@ -42,8 +44,9 @@ def build_activity_view(
     # State
     activities = []
     total_count = 0
-    current_page = 1
+    next_cursor = None
     page_size = 50
+    poll_interval = 30  # Seconds between checks for new activities
     is_loading = True
 
     # Filters
@@ -57,13 +60,20 @@ def build_activity_view(
     loading_ref = ft.Ref[ft.Container]()
     content_ref = ft.Ref[ft.Container]()
     stats_ref = ft.Ref[ft.Text]()
-    page_ref = ft.Ref[ft.Text]()
-    prev_btn_ref = ft.Ref[ft.IconButton]()
-    next_btn_ref = ft.Ref[ft.IconButton]()
+    load_more_ref = ft.Ref[ft.TextButton]()
+
+    def current_filters() -> dict:
+        """Filters for the activity service."""
+        return {
+            'user_id': user_filter,
+            'action_types': action_type_filter,
+            'date_from': date_from.strftime('%Y-%m-%d') if date_filter_enabled else None,
+            'date_to': date_to.strftime('%Y-%m-%d') if date_filter_enabled else None,
+        }
 
     async def load_activities():
-        """Load activities asynchronously."""
-        nonlocal activities, total_count, is_loading
+        """Load the first page of activities and the total count."""
+        nonlocal activities, total_count, next_cursor, is_loading
 
         is_loading = True
         if loading_ref.current:
@@ -74,24 +84,18 @@ def build_activity_view(
 
         try:
             loop = asyncio.get_event_loop()
+            filters = current_filters()
+            service = app_state.activity_service
 
-            # Build filters
-            df = date_from.strftime('%Y-%m-%d') if date_filter_enabled else None
-            dt = date_to.strftime('%Y-%m-%d') if date_filter_enabled else None
-            offset = (current_page - 1) * page_size
-
-            # Load activities
-            activities, total_count = await loop.run_in_executor(
-                None,
-                lambda: app_state.activity_service.get_recent_activities(
-                    limit=page_size,
-                    offset=offset,
-                    user_id=user_filter,
-                    action_types=action_type_filter,
-                    date_from=df,
-                    date_to=dt,
-                ) if app_state.activity_service else ([], 0)
-            )
+            if service:
+                activities, next_cursor = await loop.run_in_executor(
+                    None, lambda: service.query_activities(limit=page_size, **filters)
+                )
+                total_count = await loop.run_in_executor(
+                    None, lambda: service.count_activities(**filters)
+                )
+            else:
+                activities, next_cursor, total_count = [], None, 0
 
             is_loading = False
             update_ui()
@@ -99,10 +103,84 @@ def build_activity_view(
         except Exception as e:
             is_loading = False
             activities = []
+            next_cursor = None
             total_count = 0
             show_error(f"Failed to load activities: {str(e)}")
             update_ui()
 
+    async def load_more_activities():
+        """Append the next page of older activities."""
+        nonlocal activities, next_cursor
+
+        if next_cursor is None or not app_state.activity_service:
+            return
+
+        try:
+            loop = asyncio.get_event_loop()
+            filters = current_filters()
+            cursor = next_cursor
+            more, next_cursor = await loop.run_in_executor(
+                None,
+                lambda: app_state.activity_service.query_activities(
+                    cursor=cursor, limit=page_size, **filters
+                )
+            )
+            activities = activities + more
+            update_ui()
+
+        except Exception as e:
+            show_error(f"Failed to load more activities: {str(e)}")
+
+    async def load_new_activities():
+        """Prepend activities recorded since the newest one shown."""
+        nonlocal activities, total_count
+
+        if is_loading or not app_state.activity_service:
+            return
+
+        try:
+            loop = asyncio.get_event_loop()
+            filters = current_filters()
+            last_seen_id = max((a['activity_id'] for a in activities), default=0)
+            new_activities = await loop.run_in_executor(
+                None,
+                lambda: app_state.activity_service.get_activities_since(last_seen_id, **filters)
+            )
+
+            # Relabel relative times in one pass; only rows whose label changed rebuild
+            labels = app_state.activity_service.format_relative_times(
+                [a['created_at'] for a in activities]
+            )
+            for activity, label in zip(activities, labels):
+                activity['relative_time'] = label
+            activity_list.refresh()
+
+            if new_activities:
+                added = activity_list.prepend(new_activities)
+                activities = activity_list.items
+                total_count += added
+                update_stats()
+
+            page.update()
+
+        except Exception as e:
+            show_error(f"Failed to check for new activities: {str(e)}")
+
+    async def watch_for_new_activities():
+        """Poll for new activities while the view is shown."""
+        while True:
+            await asyncio.sleep(poll_interval)
+            if view.page is None or not app_state.is_authenticated:
+                break
+            await load_new_activities()
+
+    def update_stats():
+        """Update the activity count and the Load More button."""
+        if stats_ref.current:
+            stats_ref.current.value = f"Showing {len(activities)} of {total_count} activities"
+        if load_more_ref.current:
+            load_more_ref.current.visible = next_cursor is not None
+
     def update_ui():
         """Update the UI with loaded data."""
         if loading_ref.current:
@@ -110,49 +188,10 @@ def build_activity_view(
         if content_ref.current:
             content_ref.current.visible = True
 
-        # Update stats
-        if stats_ref.current:
-            stats_ref.current.value = f"Showing {len(activities)} of {total_count} activities"
+        update_stats()
 
-        # Update pagination
-        total_pages = max(1, (total_count + page_size - 1) // page_size)
-        if page_ref.current:
-            page_ref.current.value = f"Page {current_page} of {total_pages}"
-        if prev_btn_ref.current:
-            prev_btn_ref.current.disabled = current_page <= 1
-        if next_btn_ref.current:
-            next_btn_ref.current.disabled = current_page >= total_pages
-
-        # Update activity list
-        activity_list.controls.clear()
-
-        if not activities:
-            activity_list.controls.append(
-                ft.Container(
-                    content=ft.Column(
-                        controls=[
-                            ft.Icon(ft.Icons.HISTORY, color=colors["text_muted"], size=48),
-                            ft.Text(
-                                "No activity found",
-                                size=16,
-                                color=colors["text_secondary"],
-                            ),
-                            ft.Text(
-                                "Activities will appear here when users perform actions",
-                                size=13,
-                                color=colors["text_muted"],
-                            ),
-                        ],
-                        spacing=8,
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    ),
-                    alignment=ft.alignment.center,
-                    padding=40,
-                )
-            )
-        else:
-            for activity in activities:
-                activity_list.controls.append(create_activity_row(activity))
+        # Patch the activity list; unchanged rows keep their controls
+        activity_list.set_items(activities)
 
         page.update()
 
@@ -268,41 +307,27 @@ def build_activity_view(
         )
 
     def handle_action_filter_change(e):
-        nonlocal action_type_filter, current_page
+        nonlocal action_type_filter
         selected = e.control.value
         for label, types in ACTION_TYPE_OPTIONS:
             if label == selected:
                 action_type_filter = types
                 break
-        current_page = 1
         page.run_task(load_activities)
 
     def handle_date_filter_toggle(e):
-        nonlocal date_filter_enabled, current_page
+        nonlocal date_filter_enabled
         date_filter_enabled = e.control.value
         date_from_picker.visible = date_filter_enabled
         date_to_picker.visible = date_filter_enabled
-        current_page = 1
         page.update()
         page.run_task(load_activities)
 
-    def handle_prev_page(e):
-        nonlocal current_page
-        if current_page > 1:
-            current_page -= 1
-            page.run_task(load_activities)
-
-    def handle_next_page(e):
-        nonlocal current_page
-        total_pages = max(1, (total_count + page_size - 1) // page_size)
-        if current_page < total_pages:
-            current_page += 1
-            page.run_task(load_activities)
+    def handle_load_more(e):
+        page.run_task(load_more_activities)
 
     def handle_refresh(e):
-        nonlocal current_page
-        current_page = 1
-        page.run_task(load_activities)
+        page.run_task(load_new_activities)
 
     def show_error(message: str):
         page.snack_bar = ft.SnackBar(
@@ -317,11 +342,31 @@ def build_activity_view(
     date_to_picker = ft.Container(visible=False)
 
     # Activity list
-    activity_list = ft.Column(
-        controls=[],
-        spacing=0,
-        scroll=ft.ScrollMode.AUTO,
-        expand=True,
+    activity_list = VirtualList(
+        build_row=create_activity_row,
+        key_field='activity_id',
+        signature=lambda activity: (activity['activity_id'], activity['relative_time']),
+        empty_state=ft.Container(
+            content=ft.Column(
+                controls=[
+                    ft.Icon(ft.Icons.HISTORY, color=colors["text_muted"], size=48),
+                    ft.Text(
+                        "No activity found",
+                        size=16,
+                        color=colors["text_secondary"],
+                    ),
+                    ft.Text(
+                        "Activities will appear here when users perform actions",
+                        size=13,
+                        color=colors["text_muted"],
+                    ),
+                ],
+                spacing=8,
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+            ),
+            alignment=ft.alignment.center,
+            padding=40,
+        ),
     )
 
     # Build the view
@@ -342,7 +387,7 @@ def build_activity_view(
                         ft.IconButton(
                             icon=ft.Icons.REFRESH,
                             icon_color=colors["primary"],
-                            tooltip="Refresh",
+                            tooltip="Check for new activity",
                             on_click=handle_refresh,
                         ),
                     ],
@@ -409,38 +454,24 @@ def build_activity_view(
                     controls=[
                         # Activity list container
                         ft.Container(
-                            content=activity_list,
+                            content=activity_list.control,
                             border=ft.border.all(1, colors["border"]),
                             border_radius=8,
                             expand=True,
                         ),
-                        # Pagination
+                        # Older activities
                         ft.Container(
                             content=ft.Row(
                                 controls=[
-                                    ft.IconButton(
-                                        ref=prev_btn_ref,
-                                        icon=ft.Icons.CHEVRON_LEFT,
-                                        icon_color=colors["text_primary"],
-                                        on_click=handle_prev_page,
-                                        disabled=True,
-                                    ),
-                                    ft.Text(
-                                        ref=page_ref,
-                                        value="Page 1 of 1",
-                                        size=13,
-                                        color=colors["text_secondary"],
-                                    ),
-                                    ft.IconButton(
-                                        ref=next_btn_ref,
-                                        icon=ft.Icons.CHEVRON_RIGHT,
-                                        icon_color=colors["text_primary"],
-                                        on_click=handle_next_page,
-                                        disabled=True,
+                                    ft.TextButton(
+                                        "Load More",
+                                        ref=load_more_ref,
+                                        icon=ft.Icons.EXPAND_MORE,
+                                        on_click=handle_load_more,
+                                        visible=False,
                                     ),
                                 ],
                                 alignment=ft.MainAxisAlignment.CENTER,
-                                spacing=8,
                             ),
                             padding=ft.padding.only(top=16),
                         ),
@@ -455,7 +486,8 @@ def build_activity_view(
         spacing=0,
     )
 
-    # Trigger initial load
+    # Trigger initial load and start watching for new activity
     page.run_task(load_activities)
+    page.run_task(watch_for_new_activities)
 
     return view
@@ -40,6 +40,50 @@ def build_admin_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
     stats_ref = ft.Ref[ft.Text]()
     role_filter_ref = ft.Ref[ft.Dropdown]()
     status_filter_ref = ft.Ref[ft.Dropdown]()
+    backup_next_ref = ft.Ref[ft.Text]()
+    backup_last_ref = ft.Ref[ft.Text]()
+    import_status_ref = ft.Ref[ft.Container]()
+    import_progress_ref = ft.Ref[ft.ProgressBar]()
+    import_text_ref = ft.Ref[ft.Text]()
+
+    async def load_backup_status():
+        """Load scheduled backup status (next run, last run stats)."""
+        scheduler = getattr(app_state, 'backup_scheduler_service', None)
+        if scheduler is None:
+            return
+
+        try:
+            loop = asyncio.get_event_loop()
+            status = await loop.run_in_executor(None, scheduler.get_status)
+
+            if not status['enabled']:
+                next_text = "Scheduled backups: disabled"
+            elif status['next_run']:
+                leader = "this client" if status['is_leader'] else (status['leader'] or "no active client")
+                next_text = (f"Next scheduled backup: {status['next_run'].strftime('%Y-%m-%d %H:%M')} "
+                             f"({status['cron']}, run by {leader})")
+            else:
+                next_text = f"Next scheduled backup: unavailable ({status['cron']})"
+
+            last_run = status['last_run']
+            if last_run:
+                logical_mb = (last_run['logical_size'] or 0) / (1024 * 1024)
+                stored_mb = (last_run['backup_size'] or 0) / (1024 * 1024)
+                throughput_mb = (last_run['throughput_bytes_per_sec'] or 0) / (1024 * 1024)
+                last_text = (f"Last run: {last_run['created_at']} • {logical_mb:.1f} MB "
+                             f"({stored_mb:.1f} MB stored) in {last_run['duration_seconds'] or 0:.1f}s "
+                             f"• {throughput_mb:.1f} MB/s")
+            else:
+                last_text = "Last run: never"
+
+            if backup_next_ref.current:
+                backup_next_ref.current.value = next_text
+            if backup_last_ref.current:
+                backup_last_ref.current.value = last_text
+            page.update()
+
+        except Exception as e:
+            print(f"Error loading backup status: {e}")
 
     async def load_users():
         """Load users asynchronously."""
@@ -288,6 +332,54 @@ def build_admin_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
     def handle_refresh(e):
         """Refresh users."""
         page.run_task(load_users)
+        page.run_task(load_backup_status)
+
+    def set_import_progress(percent: int, message: str):
+        """Show report import progress (called from the import thread)."""
+        if import_progress_ref.current:
+            import_progress_ref.current.value = percent / 100 if percent else None
+        if import_text_ref.current:
+            import_text_ref.current.value = message
+        page.update()
+
+    async def run_import(file_path: str):
+        """Import reports from a file without blocking the UI."""
+        if import_status_ref.current:
+            import_status_ref.current.visible = True
+        set_import_progress(0, "Starting import...")
+
+        try:
+            loop = asyncio.get_event_loop()
+            success, message, stats = await loop.run_in_executor(
+                None,
+                lambda: app_state.report_import_service.import_file(
+                    file_path, app_state.current_user, progress_callback=set_import_progress
+                )
+            )
+            set_import_progress(100, message)
+            if success and not stats['rejected']:
+                show_success(page, message)
+            else:
+                show_error(page, message)
+        except Exception as ex:
+            set_import_progress(100, f"Import failed: {ex}")
+            show_error(page, f"Import failed: {ex}")
+
+    def handle_import_result(e: ft.FilePickerResultEvent):
+        """Start an import for the picked file."""
+        if e.files:
+            page.run_task(run_import, e.files[0].path)
+
+    import_picker = ft.FilePicker(on_result=handle_import_result)
+    page.overlay.append(import_picker)
+
+    def handle_import(e):
+        """Pick a CSV/XLSX file to import reports from."""
+        import_picker.pick_files(
+            dialog_title="Import Reports",
+            allowed_extensions=["csv", "xlsx"],
+            allow_multiple=False,
+        )
 
     # Header row
     header_row = ft.Row(
@@ -299,6 +391,12 @@ def build_admin_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
                 color=colors["text_primary"],
             ),
             ft.Container(expand=True),
+            ft.OutlinedButton(
+                "Import Reports",
+                icon=ft.Icons.UPLOAD_FILE,
+                on_click=handle_import,
+                visible=getattr(app_state, 'report_import_service', None) is not None,
+            ),
             ft.ElevatedButton(
                 "Add New User",
                 icon=ft.Icons.PERSON_ADD,
@@ -354,6 +452,42 @@ def build_admin_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
         ],
     )
 
+    # Scheduled backup status row
+    backup_status_row = ft.Container(
+        content=ft.Row(
+            controls=[
+                ft.Icon(ft.Icons.SCHEDULE, size=18, color=colors["primary"]),
+                ft.Text(ref=backup_next_ref, value="Next scheduled backup: -", size=13, color=colors["text_primary"]),
+                ft.Container(expand=True),
+                ft.Text(ref=backup_last_ref, value="Last run: -", size=12, color=colors["text_secondary"]),
+            ],
+            spacing=8,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+        ),
+        padding=ft.padding.symmetric(horizontal=12, vertical=8),
+        border=ft.border.all(1, colors["border"]),
+        border_radius=8,
+        bgcolor=colors["card_bg"],
+        visible=getattr(app_state, 'backup_scheduler_service', None) is not None,
+    )
+
+    # Report import progress row
+    import_status_row = ft.Container(
+        ref=import_status_ref,
+        content=ft.Column(
+            controls=[
+                ft.Text(ref=import_text_ref, value="", size=13, color=colors["text_primary"]),
+                ft.ProgressBar(ref=import_progress_ref, value=0, color=colors["primary"]),
+            ],
+            spacing=6,
+        ),
+        padding=ft.padding.symmetric(horizontal=12, vertical=8),
+        border=ft.border.all(1, colors["border"]),
+        border_radius=8,
+        bgcolor=colors["card_bg"],
+        visible=False,
+    )
+
     # Loading indicator
     loading_container = ft.Container(
         ref=loading_ref,
@@ -381,6 +515,7 @@ def build_admin_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
 
     # Trigger initial load
     page.run_task(load_users)
+    page.run_task(load_backup_status)
 
     return ft.Column(
         controls=[
@@ -388,6 +523,9 @@ def build_admin_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
             ft.Container(height=16),
             filter_row,
             ft.Container(height=8),
+            backup_status_row,
+            ft.Container(height=8),
+            import_status_row,
             stats_row,
             ft.Container(height=8),
             ft.Container(
@@ -4,11 +4,25 @@ Admin-only view for managing report approval requests.
 """
 import flet as ft
 import asyncio
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 from theme.theme_manager import theme_manager
 from components.toast import show_success, show_error
+from components.virtual_list import VirtualList
+
+# Approval list columns (header, width) and fixed row height
+APPROVAL_COLUMNS = [
+    ("Report #", 110),
+    ("Entity Name", 200),
+    ("Requested By", 120),
+    ("Requested At", 130),
+    ("Status", 80),
+    ("Comment", 260),
+    ("Actions", 120),
+]
+APPROVAL_ROW_HEIGHT = 52
+APPROVAL_PAGE_SIZE = 100
 
 # Field definitions for the report form
 REPORT_FIELDS = [
@@ -61,6 +75,8 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
 
     # State
     pending_approvals = []
+    next_cursor = None
+    total_pending = 0
     is_loading = True
 
     # Refs
@@ -69,9 +85,17 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
     stats_ref = ft.Ref[ft.Text]()
     empty_ref = ft.Ref[ft.Container]()
 
+    def current_filters() -> Dict:
+        """Server-side filters for the pending queue."""
+        return {
+            'status': 'pending',
+            'search': (search_field.value or '').strip() or None,
+            'requested_by': (requester_field.value or '').strip() or None,
+        }
+
     async def load_approvals():
-        """Load pending approvals asynchronously."""
-        nonlocal pending_approvals, is_loading
+        """Load the first page of pending approvals asynchronously."""
+        nonlocal pending_approvals, next_cursor, total_pending, is_loading
 
         is_loading = True
         if loading_ref.current:
@@ -85,12 +109,17 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
         try:
             loop = asyncio.get_event_loop()
 
+            filters = current_filters()
+
             def fetch_approvals():
                 if app_state.approval_service:
-                    return app_state.approval_service.get_pending_approvals()
-                return []
+                    page_rows, cursor = app_state.approval_service.query_approvals(
+                        filters, limit=APPROVAL_PAGE_SIZE
+                    )
+                    return page_rows, cursor, app_state.approval_service.count_approvals(filters)
+                return [], None, 0
 
-            pending_approvals = await loop.run_in_executor(None, fetch_approvals)
+            pending_approvals, next_cursor, total_pending = await loop.run_in_executor(None, fetch_approvals)
             update_table_ui()
 
         except Exception as e:
@@ -103,14 +132,43 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
                 loading_ref.current.visible = False
             page.update()
 
+    async def load_more_approvals():
+        """Append the next page of pending approvals."""
+        nonlocal pending_approvals, next_cursor
+        if next_cursor is None or not app_state.approval_service:
+            return
+
+        try:
+            loop = asyncio.get_event_loop()
+            filters = current_filters()
+            cursor = next_cursor
+            page_rows, next_cursor = await loop.run_in_executor(
+                None, lambda: app_state.approval_service.query_approvals(
+                    filters, cursor=cursor, limit=APPROVAL_PAGE_SIZE
+                )
+            )
+            pending_approvals = pending_approvals + page_rows
+            update_table_ui()
+
+        except Exception as e:
+            show_error(page, f"Error loading approvals: {str(e)}")
+
     def update_table_ui():
         """Update table with current data."""
         # Update stats
         if stats_ref.current:
             if pending_approvals:
-                stats_ref.current.value = f"Showing {len(pending_approvals)} pending approval request(s)"
+                stats_ref.current.value = (
+                    f"Showing {len(pending_approvals)} of {total_pending} pending approval request(s)"
+                )
+            elif current_filters()['search'] or current_filters()['requested_by']:
+                stats_ref.current.value = "No pending approval requests match the filters."
             else:
                 stats_ref.current.value = "No pending approval requests at this time."
+        load_more_button.visible = next_cursor is not None
+
+        # Patch the list; unchanged requests keep their controls
+        approvals_list.set_items(pending_approvals)
 
         # Show empty state or table
         if not pending_approvals:
@@ -121,95 +179,98 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
         else:
             if table_ref.current:
                 table_ref.current.visible = True
-                table_ref.current.content = build_table()
             if empty_ref.current:
                 empty_ref.current.visible = False
 
         page.update()
 
-    def build_table() -> ft.Control:
-        """Build the approvals data table."""
-        if not pending_approvals:
-            return ft.Container()
-
-        # Build data rows
-        rows = []
-        for idx, approval in enumerate(pending_approvals):
-            # Format requested_at
-            requested_at = approval.get('requested_at', '')
-            try:
-                dt = datetime.fromisoformat(requested_at.replace('Z', '+00:00'))
-                formatted_date = dt.strftime('%Y-%m-%d %H:%M')
-            except:
-                formatted_date = str(requested_at)[:16] if requested_at else ''
-
-            # Truncate comment
-            comment = approval.get('comment', '')
-            comment_display = (comment[:50] + '...') if len(comment) > 50 else comment
-
-            rows.append(
-                ft.DataRow(
-                    cells=[
-                        ft.DataCell(ft.Text(str(approval.get('report_number', '')), size=12, color=colors["text_primary"])),
-                        ft.DataCell(ft.Text(approval.get('reported_entity_name', ''), size=12, color=colors["text_primary"])),
-                        ft.DataCell(ft.Text(approval.get('requested_by', ''), size=12, color=colors["text_primary"])),
-                        ft.DataCell(ft.Text(formatted_date, size=12, color=colors["text_secondary"])),
-                        ft.DataCell(
-                            ft.Container(
-                                content=ft.Text(
-                                    "Pending",
-                                    size=11,
-                                    color=ft.Colors.WHITE,
-                                ),
-                                bgcolor=colors["warning"],
-                                border_radius=10,
-                                padding=ft.padding.symmetric(horizontal=8, vertical=2),
-                            )
-                        ),
-                        ft.DataCell(
-                            ft.Text(
-                                comment_display or "-",
-                                size=12,
-                                color=colors["text_secondary"],
-                                tooltip=comment if comment else "No comment",
-                            )
-                        ),
-                        ft.DataCell(
-                            ft.ElevatedButton(
-                                "Review",
-                                icon=ft.Icons.RATE_REVIEW,
-                                bgcolor=colors["primary"],
-                                color=ft.Colors.WHITE,
-                                on_click=lambda e, a=approval, i=idx: handle_review(a, i),
-                            )
-                        ),
-                    ],
-                )
-            )
-
-        columns = [
-            ft.DataColumn(ft.Text("Report #", weight=ft.FontWeight.BOLD, size=12, color=colors["text_primary"])),
-            ft.DataColumn(ft.Text("Entity Name", weight=ft.FontWeight.BOLD, size=12, color=colors["text_primary"])),
-            ft.DataColumn(ft.Text("Requested By", weight=ft.FontWeight.BOLD, size=12, color=colors["text_primary"])),
-            ft.DataColumn(ft.Text("Requested At", weight=ft.FontWeight.BOLD, size=12, color=colors["text_primary"])),
-            ft.DataColumn(ft.Text("Status", weight=ft.FontWeight.BOLD, size=12, color=colors["text_primary"])),
-            ft.DataColumn(ft.Text("Comment", weight=ft.FontWeight.BOLD, size=12, color=colors["text_primary"])),
-            ft.DataColumn(ft.Text("Actions", weight=ft.FontWeight.BOLD, size=12, color=colors["text_primary"])),
+    def build_approval_row(approval: Dict) -> ft.Control:
+        """Build a single approval request row."""
+        # Format requested_at
+        requested_at = approval.get('requested_at', '')
+        try:
+            dt = datetime.fromisoformat(requested_at.replace('Z', '+00:00'))
+            formatted_date = dt.strftime('%Y-%m-%d %H:%M')
+        except:
+            formatted_date = str(requested_at)[:16] if requested_at else ''
+
+        # Truncate comment
+        comment = approval.get('comment', '')
+        comment_display = (comment[:50] + '...') if len(comment) > 50 else comment
+
+        cells = [
+            ft.Text(str(approval.get('report_number', '')), size=12, color=colors["text_primary"]),
+            ft.Text(approval.get('reported_entity_name', ''), size=12, color=colors["text_primary"],
+                    overflow=ft.TextOverflow.ELLIPSIS, max_lines=1),
+            ft.Text(approval.get('requested_by', ''), size=12, color=colors["text_primary"]),
+            ft.Text(formatted_date, size=12, color=colors["text_secondary"]),
+            ft.Container(
+                content=ft.Text(
+                    "Pending",
+                    size=11,
+                    color=ft.Colors.WHITE,
+                ),
+                bgcolor=colors["warning"],
+                border_radius=10,
+                padding=ft.padding.symmetric(horizontal=8, vertical=2),
+            ),
+            ft.Text(
+                comment_display or "-",
+                size=12,
+                color=colors["text_secondary"],
+                tooltip=comment if comment else "No comment",
+                overflow=ft.TextOverflow.ELLIPSIS,
+                max_lines=1,
+            ),
+            ft.ElevatedButton(
+                "Review",
+                icon=ft.Icons.RATE_REVIEW,
+                bgcolor=colors["primary"],
+                color=ft.Colors.WHITE,
+                on_click=lambda e, a=approval: handle_review(a),
+            ),
         ]
 
-        return ft.DataTable(
-            columns=columns,
-            rows=rows,
-            column_spacing=16,
-            horizontal_lines=ft.BorderSide(1, colors["border"]),
-            heading_row_color=colors["bg_tertiary"],
-            data_row_color={
-                ft.ControlState.HOVERED: colors["hover"],
-            },
-            border_radius=8,
+        return ft.Container(
+            content=ft.Row(
+                controls=[
+                    ft.Container(content=cell, width=width, alignment=ft.alignment.center_left)
+                    for cell, (_, width) in zip(cells, APPROVAL_COLUMNS)
+                ],
+                spacing=16,
+            ),
+            height=APPROVAL_ROW_HEIGHT,
+            padding=ft.padding.symmetric(horizontal=12),
+            border=ft.border.only(bottom=ft.BorderSide(1, colors["border"])),
         )
 
-    def handle_review(approval: Dict, idx: int):
+    approvals_header = ft.Container(
+        content=ft.Row(
+            controls=[
+                ft.Container(
+                    content=ft.Text(header, weight=ft.FontWeight.BOLD, size=12, color=colors["text_primary"]),
+                    width=width,
+                )
+                for header, width in APPROVAL_COLUMNS
+            ],
+            spacing=16,
+        ),
+        height=APPROVAL_ROW_HEIGHT,
+        bgcolor=colors["bg_tertiary"],
+        padding=ft.padding.symmetric(horizontal=12),
+        border=ft.border.only(bottom=ft.BorderSide(1, colors["border"])),
+    )
+
+    # Rows are keyed by approval_id; a refresh only rebuilds new or changed requests
+    approvals_list = VirtualList(
+        build_row=build_approval_row,
+        key_field='approval_id',
+        header=approvals_header,
+        item_extent=APPROVAL_ROW_HEIGHT,
+        width=sum(width for _, width in APPROVAL_COLUMNS) + 16 * (len(APPROVAL_COLUMNS) - 1) + 24,
+    )
+
+    def handle_review(approval: Dict):
         """Handle review button click."""
         show_full_report_review_dialog(approval)
 
@@ -623,10 +684,173 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
         except Exception as ex:
             show_error(page, f"Failed to process approval: {str(ex)}")
 
+    async def process_bulk_decision(approval_ids: Optional[List[int]], decision: str, comment: str,
+                                    filters: Optional[Dict] = None):
+        """Apply one decision to the given requests (or all matching filters) in a single transaction."""
+        approval_service = app_state.approval_service
+        if not approval_service:
+            show_error(page, "Approval service not available")
+            return
+
+        try:
+            loop = asyncio.get_event_loop()
+            if decision == 'approve':
+                success, message, results = await loop.run_in_executor(
+                    None, lambda: approval_service.bulk_approve(approval_ids, filters=filters, comment=comment)
+                )
+            else:
+                success, message, results = await loop.run_in_executor(
+                    None, lambda: approval_service.bulk_reject(
+                        approval_ids, filters=filters, comment=comment, request_rework=(decision == 'rework')
+                    )
+                )
+
+            failed = sum(1 for result in results if not result['success'])
+            if success and not failed:
+                show_success(page, message)
+            elif success:
+                show_error(page, f"{message}; {failed} request(s) were no longer pending")
+            else:
+                show_error(page, message)
+
+            page.run_task(load_approvals)
+
+        except Exception as ex:
+            show_error(page, f"Failed to process approvals: {str(ex)}")
+
+    def handle_review_all(e):
+        """Review every pending request matching the filters with one decision."""
+        if not pending_approvals:
+            return
+
+        # Only part of the queue is loaded; let the service select the rest by filter
+        if next_cursor is None:
+            approval_ids = [approval['approval_id'] for approval in pending_approvals]
+            bulk_filters = None
+            request_count = len(approval_ids)
+        else:
+            approval_ids = None
+            bulk_filters = current_filters()
+            request_count = total_pending
+        decision_ref = {"value": "approve"}
+        comment_field = ft.TextField(
+            label="Decision Comment (required for Rework/Reject)",
+            hint_text="Enter feedback or reasons for this decision...",
+            multiline=True,
+            min_lines=2,
+            max_lines=3,
+            text_size=12,
+        )
+
+        def on_decision_change(ev):
+            decision_ref["value"] = ev.control.value
+
+        def submit(ev):
+            comment = comment_field.value.strip() if comment_field.value else ""
+            if decision_ref["value"] in ["reject", "rework"] and not comment:
+                show_error(page, "Please provide feedback for rejection or rework request.")
+                return
+            bulk_dialog.open = False
+            page.update()
+            page.run_task(process_bulk_decision, approval_ids, decision_ref["value"], comment, bulk_filters)
+
+        def cancel(ev):
+            bulk_dialog.open = False
+            page.update()
+
+        bulk_dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Row(
+                controls=[
+                    ft.Icon(ft.Icons.RATE_REVIEW, color=colors["primary"]),
+                    ft.Text(f"Review {request_count} Pending Request(s)", weight=ft.FontWeight.BOLD),
+                ],
+                spacing=8,
+            ),
+            content=ft.Container(
+                content=ft.Column(
+                    controls=[
+                        ft.Text(
+                            "The decision is applied to every pending request matching the current filters.",
+                            size=12,
+                            color=colors["text_secondary"],
+                        ),
+                        ft.RadioGroup(
+                            value="approve",
+                            on_change=on_decision_change,
+                            content=ft.Column(
+                                controls=[
+                                    ft.Radio(value="approve", label="Approve all"),
+                                    ft.Radio(value="rework", label="Request rework for all"),
+                                    ft.Radio(value="reject", label="Reject all"),
+                                ],
+                                spacing=4,
+                            ),
+                        ),
+                        comment_field,
+                    ],
+                    spacing=10,
+                    tight=True,
+                ),
+                width=450,
+            ),
+            actions=[
+                ft.TextButton("Cancel", on_click=cancel),
+                ft.ElevatedButton(
+                    "Submit Decision",
+                    icon=ft.Icons.GAVEL,
+                    bgcolor=colors["success"],
+                    color=ft.Colors.WHITE,
+                    on_click=submit,
+                ),
+            ],
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
+
+        page.overlay.append(bulk_dialog)
+        bulk_dialog.open = True
+        page.update()
+
     def handle_refresh(e):
         """Refresh approvals."""
         page.run_task(load_approvals)
 
+    def handle_load_more(e):
+        """Load the next page of approvals."""
+        page.run_task(load_more_approvals)
+
+    def handle_clear_filters(e):
+        """Clear the filters and reload."""
+        search_field.value = ""
+        requester_field.value = ""
+        page.run_task(load_approvals)
+
+    # Server-side filters
+    search_field = ft.TextField(
+        hint_text="Search by report number, entity or CIC...",
+        prefix_icon=ft.Icons.SEARCH,
+        width=320,
+        height=40,
+        text_size=13,
+        content_padding=ft.padding.symmetric(horizontal=12, vertical=8),
+        on_submit=handle_refresh,
+    )
+    requester_field = ft.TextField(
+        hint_text="Requested by (username)",
+        prefix_icon=ft.Icons.PERSON_SEARCH,
+        width=220,
+        height=40,
+        text_size=13,
+        content_padding=ft.padding.symmetric(horizontal=12, vertical=8),
+        on_submit=handle_refresh,
+    )
+    load_more_button = ft.OutlinedButton(
+        "Load More",
+        icon=ft.Icons.EXPAND_MORE,
+        on_click=handle_load_more,
+        visible=False,
+    )
+
     # Header row
     header_row = ft.Row(
         controls=[
@@ -637,6 +861,11 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
                 color=colors["text_primary"],
             ),
             ft.Container(expand=True),
+            ft.OutlinedButton(
+                "Review All",
+                icon=ft.Icons.DONE_ALL,
+                on_click=handle_review_all,
+            ),
             ft.ElevatedButton(
                 "Refresh",
                 icon=ft.Icons.REFRESH,
@@ -648,6 +877,16 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
         spacing=12,
     )
 
+    # Filter row
+    filter_row = ft.Row(
+        controls=[
+            search_field,
+            requester_field,
+            ft.TextButton("Clear", on_click=handle_clear_filters),
+        ],
+        spacing=12,
+    )
+
     # Stats row
     stats_row = ft.Row(
         controls=[
@@ -657,6 +896,8 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
                 size=13,
                 color=colors["text_secondary"],
             ),
+            ft.Container(expand=True),
+            load_more_button,
         ],
     )
 
@@ -698,7 +939,7 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
     # Table container
     table_container = ft.Container(
         ref=table_ref,
-        content=ft.Text("Loading...", color=colors["text_muted"]),
+        content=approvals_list.control,
         expand=True,
         visible=False,
     )
@@ -710,6 +951,8 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
         controls=[
             header_row,
             ft.Container(height=16),
+            filter_row,
+            ft.Container(height=8),
             stats_row,
             ft.Container(height=8),
             ft.Container(
@@ -717,14 +960,7 @@ def build_approval_panel_view(page: ft.Page, app_state: Any) -> ft.Column:
                     controls=[
                         loading_container,
                         empty_container,
-                        ft.Container(
-                            content=ft.Column(
-                                controls=[table_container],
-                                scroll=ft.ScrollMode.ALWAYS,
-                                expand=True,
-                            ),
-                            expand=True,
-                        ),
+                        table_container,
                     ],
                 ),
                 expand=True,
@@ -94,7 +94,7 @@ def build_dashboard_content(
             if app_state.activity_service:
                 activities_result = await loop.run_in_executor(
                     None,
-                    lambda: app_state.activity_service.get_recent_activities(limit=10)
+                    lambda: app_state.activity_service.query_activities(limit=10)
                 )
                 state["recent_activities"] = activities_result[0] if activities_result else []
             else:
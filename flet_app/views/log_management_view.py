@@ -9,10 +9,17 @@ from datetime import datetime, timedelta
 
 from theme.theme_manager import theme_manager
 from components.toast import show_success, show_error
+from components.charts import create_bar_chart, create_line_chart, create_stat_display
+from dialogs.query_profile_dialog import show_query_profile_dialog
+from utils.tracing import tracer
+from utils.file_dialog import choose_save_file
 
 
 LOG_LEVELS = ['All', 'DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
 
+# Hours shown in the error-rate chart and checked for spikes
+ANALYTICS_HOURS = 24
+
 
 def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
     """
@@ -43,6 +50,18 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
     module_ref = ft.Ref[ft.TextField]()
     start_date_ref = ft.Ref[ft.TextField]()
     end_date_ref = ft.Ref[ft.TextField]()
+    analytics_ref = ft.Ref[ft.Container]()
+
+    def current_filters() -> Dict[str, Any]:
+        """Filters from the filter bar; the end date includes the whole day."""
+        level = level_ref.current.value if level_ref.current and level_ref.current.value != 'All' else None
+        module = module_ref.current.value.strip() if module_ref.current and module_ref.current.value else None
+        return {
+            'level': level,
+            'module': module,
+            'start_date': start_date_ref.current.value if start_date_ref.current else default_start,
+            'end_date': end_date_ref.current.value if end_date_ref.current else default_end,
+        }
 
     async def load_logs():
         """Load logs asynchronously."""
@@ -59,26 +78,8 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
             loop = asyncio.get_event_loop()
 
             def fetch_logs():
-                level = level_ref.current.value if level_ref.current and level_ref.current.value != 'All' else None
-                module = module_ref.current.value.strip() if module_ref.current and module_ref.current.value else None
-                start_date = start_date_ref.current.value if start_date_ref.current else default_start
-                end_date_raw = end_date_ref.current.value if end_date_ref.current else default_end
-
-                # Add 1 day to end_date to make it inclusive (include logs from the entire end date)
-                try:
-                    end_date_dt = datetime.strptime(end_date_raw, '%Y-%m-%d') + timedelta(days=1)
-                    end_date = end_date_dt.strftime('%Y-%m-%d')
-                except:
-                    end_date = end_date_raw
-
                 if app_state.logging_service:
-                    return app_state.logging_service.get_logs(
-                        level=level,
-                        module=module,
-                        start_date=start_date,
-                        end_date=end_date,
-                        limit=500
-                    )
+                    return app_state.logging_service.get_logs(limit=500, **current_filters())
                 return []
 
             logs_data = await loop.run_in_executor(None, fetch_logs)
@@ -96,6 +97,79 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
                 table_ref.current.visible = True
             page.update()
 
+    async def load_analytics():
+        """Load the rollup-backed charts; cheap regardless of log volume."""
+        if not app_state.logging_service:
+            return
+        try:
+            loop = asyncio.get_event_loop()
+            analytics = await loop.run_in_executor(
+                None, lambda: app_state.logging_service.get_log_analytics(hours=ANALYTICS_HOURS, top_limit=8)
+            )
+            if analytics_ref.current:
+                analytics_ref.current.content = build_analytics(analytics)
+                page.update()
+        except Exception as e:
+            print(f"Error loading log analytics: {e}")
+
+    def build_analytics(analytics: Dict[str, Any]) -> ft.Control:
+        """Build the error-rate chart, recurring exceptions and spike summary."""
+        statistics = analytics['statistics']
+        spikes = analytics['spikes']
+
+        error_chart = create_line_chart(
+            [{'x': point['hour'][-5:], 'y': point['errors']} for point in analytics['hourly']],
+            title=f"Errors per hour (last {ANALYTICS_HOURS}h)",
+            height=220,
+        )
+        top_chart = create_bar_chart(
+            [
+                {
+                    'label': f"{item['exception_type'] or 'Error'} · {item['module'] or '-'}",
+                    'value': item['count'],
+                }
+                for item in analytics['top_exceptions']
+            ],
+            title="Top recurring exceptions",
+            height=220,
+        )
+
+        spike_lines = [
+            ft.Text(
+                f"{spike['hour']}  {spike['errors']} errors (usual {spike['baseline']:g})",
+                size=11,
+                color=colors["danger"],
+            )
+            for spike in spikes[-4:]
+        ] or [ft.Text("No error spikes", size=11, color=colors["text_muted"])]
+
+        summary = ft.Column(
+            controls=[
+                ft.Row(
+                    controls=[
+                        create_stat_display("Total logs", f"{statistics['total_logs']:,}"),
+                        create_stat_display(
+                            "Errors (24h)", statistics['errors_last_24h'], color=colors["danger"],
+                        ),
+                    ],
+                    spacing=8,
+                ),
+                ft.Text("Spikes", size=12, weight=ft.FontWeight.W_500, color=colors["text_primary"]),
+                *spike_lines,
+            ],
+            spacing=6,
+        )
+
+        return ft.Row(
+            controls=[
+                ft.Container(content=error_chart, expand=3),
+                ft.Container(content=top_chart, expand=2),
+                ft.Container(content=summary, expand=1),
+            ],
+            spacing=12,
+            vertical_alignment=ft.CrossAxisAlignment.START,
+        )
+
     def update_table_ui():
         """Update table with current data."""
         # Update stats
@@ -194,15 +268,45 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
     def handle_refresh(e):
         """Refresh logs."""
         page.run_task(load_logs)
+        page.run_task(load_analytics)
 
-    def handle_export(e):
-        """Export logs to file."""
-        if not logs_data:
-            show_error(page, "No logs to export")
+    async def handle_export(e):
+        """Stream every log matching the filters to a JSON Lines, CSV or text file."""
+        if not app_state.logging_service:
+            show_error(page, "Logging service not available")
             return
 
-        # TODO: Implement file export with FilePicker
-        show_success(page, f"Export functionality - {len(logs_data)} logs ready for export")
+        loop = asyncio.get_event_loop()
+        file_path = await loop.run_in_executor(
+            None,
+            lambda: choose_save_file(
+                prompt="Export Logs",
+                default_name=f"system_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz",
+                file_types=['jsonl', 'csv', 'txt', 'gz'],
+            ),
+        )
+        if not file_path:
+            return
+
+        filters = current_filters()
+
+        def show_progress(percent: int, message: str):
+            if stats_ref.current:
+                stats_ref.current.value = message
+                page.update()
+
+        try:
+            count = await loop.run_in_executor(
+                None,
+                lambda: app_state.logging_service.export_logs(
+                    file_path, progress_callback=show_progress, **filters
+                ),
+            )
+            show_success(page, f"Exported {count} logs to {file_path}")
+        except Exception as ex:
+            show_error(page, f"Error exporting logs: {str(ex)}")
+        finally:
+            update_table_ui()
 
     def handle_clear_logs(e):
         """Clear all logs."""
@@ -216,15 +320,13 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
                     start = start_date_ref.current.value if start_date_ref.current else None
                     end = end_date_ref.current.value if end_date_ref.current else None
 
-                    success = app_state.logging_service.clear_logs(
+                    deleted = app_state.logging_service.clear_logs(
                         before_date=end
                     )
 
-                    if success:
-                        show_success(page, "Logs cleared successfully")
-                        page.run_task(load_logs)
-                    else:
-                        show_error(page, "Failed to clear logs")
+                    show_success(page, f"Cleared {deleted} logs")
+                    page.run_task(load_logs)
+                    page.run_task(load_analytics)
                 else:
                     show_error(page, "Logging service not available")
 
@@ -256,6 +358,80 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
         confirm_dialog.open = True
         page.update()
 
+    def tracing_status() -> str:
+        state = "recording" if tracer.enabled else "off"
+        return f"{tracer.span_count} spans recorded ({state})"
+
+    def handle_toggle_tracing(e):
+        """Turn tracing on or off at runtime."""
+        if e.control.value:
+            tracer.enable()
+            app_state.logging_service.info("Tracing enabled")
+        else:
+            app_state.logging_service.info("Tracing disabled")
+            tracer.disable()
+        tracing_status_text.value = tracing_status()
+        page.update()
+
+    def handle_slowest_requests(e):
+        """Show the slowest traced requests with their timing breakdown."""
+        tracing_status_text.value = tracing_status()
+
+        def close_summary(e):
+            summary_dialog.open = False
+            page.update()
+
+        summary_dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Text("Slowest Requests"),
+            content=ft.Container(
+                content=ft.Column(
+                    controls=[
+                        ft.Text(tracer.format_requests(), size=12, font_family="Consolas", selectable=True),
+                    ],
+                    scroll=ft.ScrollMode.AUTO,
+                ),
+                width=720,
+                height=460,
+            ),
+            actions=[ft.TextButton("Close", on_click=close_summary)],
+        )
+        page.overlay.append(summary_dialog)
+        summary_dialog.open = True
+        page.update()
+
+    async def handle_export_trace(e):
+        """Export recorded spans as Chrome trace-event JSON."""
+        if not tracer.span_count:
+            show_error(page, "No spans recorded. Enable tracing first.")
+            return
+
+        loop = asyncio.get_event_loop()
+        file_path = await loop.run_in_executor(
+            None,
+            lambda: choose_save_file(
+                prompt="Export Trace",
+                default_name=f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                file_types=['json'],
+            ),
+        )
+        if not file_path:
+            return
+
+        try:
+            count = await loop.run_in_executor(None, tracer.export_chrome_trace, file_path)
+            show_success(page, f"Exported {count} spans to {file_path}")
+        except Exception as ex:
+            show_error(page, f"Error exporting trace: {str(ex)}")
+
+    def handle_clear_trace(e):
+        """Drop recorded spans."""
+        tracer.clear()
+        tracing_status_text.value = tracing_status()
+        page.update()
+
+    tracing_status_text = ft.Text(tracing_status(), size=12, color=colors["text_secondary"])
+
     # Header row
     header_row = ft.Row(
         controls=[
@@ -265,6 +441,12 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
                 weight=ft.FontWeight.BOLD,
                 color=colors["text_primary"],
             ),
+            ft.Container(expand=True),
+            ft.OutlinedButton(
+                "Query Profiler",
+                icon=ft.Icons.SPEED,
+                on_click=lambda e: show_query_profile_dialog(page, app_state),
+            ),
         ],
         spacing=12,
     )
@@ -323,6 +505,30 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
         border_radius=8,
     )
 
+    # Tracing row
+    tracing_row = ft.Container(
+        content=ft.Row(
+            controls=[
+                ft.Switch(
+                    label="Trace service and database calls",
+                    value=tracer.enabled,
+                    on_change=handle_toggle_tracing,
+                ),
+                tracing_status_text,
+                ft.Container(expand=True),
+                ft.TextButton("Slowest Requests", icon=ft.Icons.TIMER, on_click=handle_slowest_requests),
+                ft.TextButton("Export Trace", icon=ft.Icons.DOWNLOAD, on_click=handle_export_trace),
+                ft.TextButton("Clear Trace", icon=ft.Icons.CLEAR_ALL, on_click=handle_clear_trace),
+            ],
+            spacing=8,
+            vertical_alignment=ft.CrossAxisAlignment.CENTER,
+            wrap=True,
+        ),
+        padding=ft.padding.symmetric(horizontal=12, vertical=4),
+        bgcolor=colors["bg_tertiary"],
+        border_radius=8,
+    )
+
     # Actions row
     actions_row = ft.Row(
         controls=[
@@ -376,8 +582,19 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
         visible=False,
     )
 
+    # Analytics panel
+    analytics_container = ft.Container(
+        ref=analytics_ref,
+        content=ft.Text("Loading analytics...", color=colors["text_muted"]),
+        padding=ft.padding.all(12),
+        bgcolor=colors["card_bg"],
+        border=ft.border.all(1, colors["border"]),
+        border_radius=8,
+    )
+
     # Trigger initial load
     page.run_task(load_logs)
+    page.run_task(load_analytics)
 
     return ft.Column(
         controls=[
@@ -385,6 +602,10 @@ def build_log_management_view(page: ft.Page, app_state: Any) -> ft.Column:
             ft.Container(height=16),
             filter_row,
             ft.Container(height=8),
+            tracing_row,
+            ft.Container(height=8),
+            analytics_container,
+            ft.Container(height=8),
             actions_row,
             ft.Container(height=8),
             ft.Container(
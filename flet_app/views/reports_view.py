@@ -9,7 +9,7 @@ from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 
 from theme.theme_manager import theme_manager
-from components.data_table import create_data_table
+from components.virtual_list import VirtualList
 from components.toast import show_success, show_error
 from dialogs.report_dialog import show_report_dialog
 
@@ -55,6 +55,12 @@ REPORT_COLUMNS = [
     {'key': 'updated_at', 'header': 'Updated At', 'width': 130},
 ]
 
+# Fixed row geometry for the virtualized list
+ROW_HEIGHT = 44
+SELECT_COLUMN_WIDTH = 40
+ACTION_COLUMN_WIDTH = 40
+CELL_SPACING = 16
+
 # All columns for export (same as display, no status)
 ALL_COLUMNS = [
     {'key': 'sn', 'header': 'SN'},
@@ -239,9 +245,10 @@ def build_reports_view(
         if next_btn_ref.current:
             next_btn_ref.current.disabled = state["current_page"] >= total_pages
 
-        # Rebuild table
-        if table_ref.current:
-            table_ref.current.content = build_table()
+        # Patch the list; unchanged rows keep their controls
+        reports_list.set_items(state["reports_data"])
+        if select_all_ref.current:
+            select_all_ref.current.value = False
 
         page.update()
 
@@ -292,9 +299,10 @@ def build_reports_view(
         if selection_count_ref.current:
             selection_count_ref.current.value = f"{selected_count} selected"
 
-        # Rebuild table to update checkboxes
-        if table_ref.current:
-            table_ref.current.content = build_table()
+        # Rebuild only the rows whose checkbox changed
+        reports_list.refresh()
+        if select_all_ref.current:
+            select_all_ref.current.value = not all_currently_selected and bool(all_ids)
         page.update()
 
     def toggle_select_report(report_id: int, selected: bool):
@@ -308,226 +316,221 @@ def build_reports_view(
     def clear_selection():
         """Clear all selections."""
         state["selected_ids"].clear()
+        reports_list.refresh()
         update_bulk_actions_ui()
-        if table_ref.current:
-            table_ref.current.content = build_table()
-        page.update()
 
-    def build_table() -> ft.Control:
-        """Build the data table with checkbox selection and action popup menu."""
-        if not state["reports_data"]:
-            return ft.Container(
-                content=ft.Column(
-                    controls=[
-                        ft.Icon(ft.Icons.DESCRIPTION, size=48, color=colors["text_muted"]),
-                        ft.Text("No reports found", color=colors["text_muted"]),
-                    ],
-                    horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                    alignment=ft.MainAxisAlignment.CENTER,
-                ),
-                expand=True,
-                alignment=ft.alignment.center,
-            )
+    def build_report_row(report: Dict) -> ft.Control:
+        """Build a single report row with checkbox selection and action popup menu."""
+        is_deleted = report.get('is_deleted', 0) == 1
+        report_id = report.get('report_id', report.get('id'))
+        is_selected = report_id in state["selected_ids"]
 
-        # Build data rows
-        rows = []
-        for report in state["reports_data"]:
-            is_deleted = report.get('is_deleted', 0) == 1
-            report_id = report.get('report_id', report.get('id'))
-            is_selected = report_id in state["selected_ids"]
+        cells = []
 
-            cells = []
+        # Checkbox cell FIRST (for selection) - admin only
+        if is_admin:
+            cells.append(
+                ft.Container(
+                    content=ft.Checkbox(
+                        value=is_selected,
+                        on_change=lambda e, rid=report_id: toggle_select_report(rid, e.control.value),
+                    ),
+                    width=SELECT_COLUMN_WIDTH,
+                )
+            )
 
-            # Checkbox cell FIRST (for selection) - admin only
+        # Action cell (popup menu)
+        if is_deleted:
+            # For deleted reports: Restore and Permanent Delete options (admin only)
             if is_admin:
-                cells.append(
-                    ft.DataCell(
-                        ft.Checkbox(
-                            value=is_selected,
-                            on_change=lambda e, rid=report_id: toggle_select_report(rid, e.control.value),
-                        )
-                    )
+                action_control = ft.PopupMenuButton(
+                    icon=ft.Icons.MORE_VERT,
+                    icon_color=colors["text_muted"],
+                    icon_size=20,
+                    tooltip="Actions",
+                    items=[
+                        ft.PopupMenuItem(
+                            icon=ft.Icons.RESTORE,
+                            text="Restore",
+                            on_click=lambda e, r=report: handle_restore_report(r),
+                        ),
+                        ft.PopupMenuItem(
+                            icon=ft.Icons.DELETE_FOREVER,
+                            text="Delete Permanently",
+                            on_click=lambda e, r=report: handle_hard_delete_report(r),
+                        ),
+                    ],
                 )
-
-            # Action cell (popup menu)
-            if is_deleted:
-                # For deleted reports: Restore and Permanent Delete options (admin only)
-                if is_admin:
-                    action_cell = ft.DataCell(
-                        ft.PopupMenuButton(
-                            icon=ft.Icons.MORE_VERT,
-                            icon_color=colors["text_muted"],
-                            icon_size=20,
-                            tooltip="Actions",
-                            items=[
-                                ft.PopupMenuItem(
-                                    icon=ft.Icons.RESTORE,
-                                    text="Restore",
-                                    on_click=lambda e, r=report: handle_restore_report(r),
-                                ),
-                                ft.PopupMenuItem(
-                                    icon=ft.Icons.DELETE_FOREVER,
-                                    text="Delete Permanently",
-                                    on_click=lambda e, r=report: handle_hard_delete_report(r),
-                                ),
-                            ],
-                        )
-                    )
-                else:
-                    action_cell = ft.DataCell(ft.Container(width=40))
             else:
-                # For active reports: Edit, History, Delete options
-                # Check if current user can edit this report
-                current_username = app_state.current_user.get('username', '')
-                report_creator = report.get('created_by', '')
-                can_edit = is_admin or (current_username == report_creator)
-
-                menu_items = []
+                action_control = None
+        else:
+            # For active reports: Edit, History, Delete options
+            # Check if current user can edit this report
+            current_username = app_state.current_user.get('username', '')
+            report_creator = report.get('created_by', '')
+            can_edit = is_admin or (current_username == report_creator)
 
-                # Only show Edit if user can edit (admin or own report)
-                if can_edit:
-                    menu_items.append(
-                        ft.PopupMenuItem(
-                            icon=ft.Icons.EDIT,
-                            text="Edit",
-                            on_click=lambda e, r=report: handle_row_click(r),
-                        )
-                    )
+            menu_items = []
 
-                # History is always visible
+            # Only show Edit if user can edit (admin or own report)
+            if can_edit:
                 menu_items.append(
                     ft.PopupMenuItem(
-                        icon=ft.Icons.HISTORY,
-                        text="History",
-                        on_click=lambda e, r=report: handle_version_history(r),
+                        icon=ft.Icons.EDIT,
+                        text="Edit",
+                        on_click=lambda e, r=report: handle_row_click(r),
                     )
                 )
 
-                # Delete is admin only
-                if is_admin:
-                    menu_items.append(
-                        ft.PopupMenuItem(
-                            icon=ft.Icons.DELETE_OUTLINE,
-                            text="Delete",
-                            on_click=lambda e, r=report: handle_delete_report(r),
-                        )
-                    )
-
-                action_cell = ft.DataCell(
-                    ft.PopupMenuButton(
-                        icon=ft.Icons.MORE_VERT,
-                        icon_color=colors["primary"] if can_edit else colors["text_secondary"],
-                        icon_size=20,
-                        tooltip="Actions",
-                        items=menu_items,
-                    )
+            # History is always visible
+            menu_items.append(
+                ft.PopupMenuItem(
+                    icon=ft.Icons.HISTORY,
+                    text="History",
+                    on_click=lambda e, r=report: handle_version_history(r),
                 )
+            )
 
-            cells.append(action_cell)
-
-            # Data cells
-            for col in REPORT_COLUMNS:
-                value = report.get(col['key'], '')
-                if value is None:
-                    value = ''
-
-                # Format approval status with color
-                cell_color = colors["text_muted"] if is_deleted else colors["text_primary"]
-                if col['key'] == 'approval_status' and not is_deleted:
-                    if value == 'approved':
-                        cell_color = colors["success"]
-                    elif value == 'pending_approval':
-                        cell_color = colors["warning"]
-                    elif value == 'rejected':
-                        cell_color = colors["danger"]
-                    elif value == 'rework':
-                        cell_color = colors["info"]
-
-                # Truncate
-                max_len = col.get('max_length', 40)
-                text_value = str(value)
-                if len(text_value) > max_len:
-                    text_value = text_value[:max_len] + '...'
-
-                cells.append(
-                    ft.DataCell(
-                        ft.Text(
-                            text_value,
-                            size=11,
-                            color=cell_color,
-                            overflow=ft.TextOverflow.ELLIPSIS,
-                            style=ft.TextStyle(decoration=ft.TextDecoration.LINE_THROUGH) if is_deleted else None,
-                        ),
+            # Delete is admin only
+            if is_admin:
+                menu_items.append(
+                    ft.PopupMenuItem(
+                        icon=ft.Icons.DELETE_OUTLINE,
+                        text="Delete",
+                        on_click=lambda e, r=report: handle_delete_report(r),
                     )
                 )
 
-            # Row styling for deleted
-            row_color = f"{colors['danger']}10" if is_deleted else None
+            action_control = ft.PopupMenuButton(
+                icon=ft.Icons.MORE_VERT,
+                icon_color=colors["primary"] if can_edit else colors["text_secondary"],
+                icon_size=20,
+                tooltip="Actions",
+                items=menu_items,
+            )
 
-            rows.append(
-                ft.DataRow(
-                    cells=cells,
-                    color=row_color,
+        cells.append(ft.Container(content=action_control, width=ACTION_COLUMN_WIDTH))
+
+        # Data cells
+        for col in REPORT_COLUMNS:
+            value = report.get(col['key'], '')
+            if value is None:
+                value = ''
+
+            # Format approval status with color
+            cell_color = colors["text_muted"] if is_deleted else colors["text_primary"]
+            if col['key'] == 'approval_status' and not is_deleted:
+                if value == 'approved':
+                    cell_color = colors["success"]
+                elif value == 'pending_approval':
+                    cell_color = colors["warning"]
+                elif value == 'rejected':
+                    cell_color = colors["danger"]
+                elif value == 'rework':
+                    cell_color = colors["info"]
+
+            # Truncate
+            max_len = col.get('max_length', 40)
+            text_value = str(value)
+            if len(text_value) > max_len:
+                text_value = text_value[:max_len] + '...'
+
+            cells.append(
+                ft.Container(
+                    content=ft.Text(
+                        text_value,
+                        size=11,
+                        color=cell_color,
+                        overflow=ft.TextOverflow.ELLIPSIS,
+                        max_lines=1,
+                        style=ft.TextStyle(decoration=ft.TextDecoration.LINE_THROUGH) if is_deleted else None,
+                    ),
+                    width=col['width'],
                 )
             )
 
-        # Build columns
-        columns = []
+        # Row styling for deleted
+        row_color = f"{colors['danger']}10" if is_deleted else None
+
+        return ft.Container(
+            content=ft.Row(controls=cells, spacing=CELL_SPACING),
+            height=ROW_HEIGHT,
+            bgcolor=row_color,
+            padding=ft.padding.symmetric(horizontal=8),
+            border=ft.border.only(bottom=ft.BorderSide(1, colors["border"])),
+        )
+
+    def build_table_header() -> ft.Control:
+        """Build the fixed header row of the reports list."""
+        cells = []
 
         # Select All checkbox column (admin only)
         if is_admin:
-            all_ids = {r.get('report_id', r.get('id')) for r in state["reports_data"]}
-            all_selected = state["selected_ids"] == all_ids and all_ids
-            some_selected = bool(state["selected_ids"] & all_ids) and not all_selected
-
-            columns.append(
-                ft.DataColumn(
-                    ft.Checkbox(
+            cells.append(
+                ft.Container(
+                    content=ft.Checkbox(
                         ref=select_all_ref,
-                        value=all_selected,
-                        tristate=True if some_selected else False,
+                        value=False,
+                        tristate=True,
                         on_change=toggle_select_all,
                     ),
+                    width=SELECT_COLUMN_WIDTH,
                 )
             )
 
         # Actions column
-        columns.append(
-            ft.DataColumn(
-                ft.Text(
-                    "",
-                    weight=ft.FontWeight.BOLD,
-                    size=11,
-                    color=colors["text_primary"],
-                ),
-            )
-        )
+        cells.append(ft.Container(width=ACTION_COLUMN_WIDTH))
 
         # Data columns
-        columns.extend([
-            ft.DataColumn(
-                ft.Text(
+        cells.extend(
+            ft.Container(
+                content=ft.Text(
                     col['header'],
                     weight=ft.FontWeight.BOLD,
                     size=11,
                     color=colors["text_primary"],
+                    max_lines=1,
                 ),
+                width=col['width'],
             )
             for col in REPORT_COLUMNS
-        ])
+        )
 
-        return ft.DataTable(
-            columns=columns,
-            rows=rows,
-            column_spacing=16,
-            horizontal_lines=ft.BorderSide(1, colors["border"]),
-            heading_row_color=colors["bg_tertiary"],
-            data_row_color={
-                ft.ControlState.HOVERED: colors["hover"],
-            },
-            border_radius=8,
+        return ft.Container(
+            content=ft.Row(controls=cells, spacing=CELL_SPACING),
+            height=ROW_HEIGHT,
+            bgcolor=colors["bg_tertiary"],
+            padding=ft.padding.symmetric(horizontal=8),
+            border=ft.border.only(bottom=ft.BorderSide(1, colors["border"])),
         )
 
+    # Rows are keyed by report_id and only rebuilt when the report or its
+    # selection state changes, so refreshes send just the changed rows
+    reports_list = VirtualList(
+        build_row=build_report_row,
+        key_field='report_id',
+        signature=lambda r: (r, r.get('report_id') in state["selected_ids"]),
+        header=build_table_header(),
+        empty_state=ft.Container(
+            content=ft.Column(
+                controls=[
+                    ft.Icon(ft.Icons.DESCRIPTION, size=48, color=colors["text_muted"]),
+                    ft.Text("No reports found", color=colors["text_muted"]),
+                ],
+                horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                alignment=ft.MainAxisAlignment.CENTER,
+            ),
+            expand=True,
+            alignment=ft.alignment.center,
+        ),
+        item_extent=ROW_HEIGHT,
+        width=(
+            (SELECT_COLUMN_WIDTH if is_admin else 0) + ACTION_COLUMN_WIDTH
+            + sum(col['width'] for col in REPORT_COLUMNS)
+            + CELL_SPACING * (len(REPORT_COLUMNS) + (2 if is_admin else 1)) + 16
+        ),
+    )
+
     def handle_row_click(report: Dict):
         """Handle report row click."""
         if report.get('is_deleted', 0) == 1:
@@ -1219,7 +1222,7 @@ def build_reports_view(
     # Table container
     table_container = ft.Container(
         ref=table_ref,
-        content=ft.Text("Loading...", color=colors["text_muted"]),
+        content=reports_list.control,
         expand=True,
         visible=False,
     )
@@ -1240,20 +1243,7 @@ def build_reports_view(
                 content=ft.Stack(
                     controls=[
                         loading_container,
-                        ft.Container(
-                            content=ft.Column(
-                                controls=[
-                                    ft.Row(
-                                        controls=[table_container],
-                                        scroll=ft.ScrollMode.ALWAYS,
-                                        expand=True,
-                                    ),
-                                ],
-                                scroll=ft.ScrollMode.ALWAYS,
-                                expand=True,
-                            ),
-                            expand=True,
-                        ),
+                        table_container,
                     ],
                 ),
                 expand=True,
@@ -0,0 +1,114 @@
+"""
+Bulk Report Import
+Imports reports from a CSV or XLSX file in validated, chunked transactions.
+
+Usage:
+  python import_reports.py reports.csv --user admin
+  python import_reports.py reports.xlsx --user analyst --dry-run
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database.db_manager import DatabaseManager
+from services.logging_service import LoggingService
+from services.validation_service import ValidationService
+from services.report_import_service import ReportImportService
+from config import Config
+
+
+def load_user(db_manager, username):
+    """Look up the importing user."""
+    result = db_manager.execute_with_retry(
+        "SELECT user_id, username, role FROM users WHERE username = ? AND is_active = 1",
+        (username,)
+    )
+    if not result:
+        return None
+    return {'user_id': result[0][0], 'username': result[0][1], 'role': result[0][2]}
+
+
+def print_progress(percent, message):
+    """Print progress on a single line."""
+    print(f"\r  [{percent:3d}%] {message}".ljust(70), end='', flush=True)
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Import reports in bulk from a CSV or XLSX file",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python import_reports.py reports.csv --user admin             # Import as admin (auto-approved)
+  python import_reports.py reports.xlsx --user analyst          # Import for approval
+  python import_reports.py reports.csv -u admin --dry-run       # Validate only
+  python import_reports.py reports.csv -u admin -c 1000 -r rejects.csv
+        """
+    )
+
+    parser.add_argument('file', help='CSV or XLSX file to import')
+    parser.add_argument('-u', '--user', required=True,
+                        help='Username the reports are created by')
+    parser.add_argument('-c', '--chunk-size', type=int, default=ReportImportService.DEFAULT_CHUNK_SIZE,
+                        help=f'Rows per transaction (default: {ReportImportService.DEFAULT_CHUNK_SIZE})')
+    parser.add_argument('-r', '--rejects',
+                        help='Reject file path (default: <file>.rejects.csv)')
+    parser.add_argument('-n', '--dry-run', action='store_true',
+                        help='Validate and number rows without saving them')
+
+    args = parser.parse_args()
+
+    try:
+        if not Config.load():
+            print("\n❌ ERROR: Configuration not loaded. Please run the application first.")
+            return 1
+
+        if not Path(args.file).exists():
+            print(f"\n❌ ERROR: File not found: {args.file}")
+            return 1
+
+        db_manager = DatabaseManager(Config.DATABASE_PATH)
+        logging_service = LoggingService(db_manager)
+        validation_service = ValidationService(db_manager, logging_service)
+        import_service = ReportImportService(db_manager, logging_service, validation_service)
+
+        user = load_user(db_manager, args.user)
+        if not user:
+            print(f"\n❌ ERROR: Active user not found: {args.user}")
+            return 1
+
+        print(f"\nImporting {args.file} as {user['username']} ({user['role']})"
+              f"{' [dry run]' if args.dry_run else ''}")
+
+        success, message, stats = import_service.import_file(
+            args.file,
+            user,
+            progress_callback=print_progress,
+            reject_path=args.rejects,
+            chunk_size=args.chunk_size,
+            dry_run=args.dry_run
+        )
+        print()
+
+        if not success:
+            print(f"\n❌ ERROR: {message}")
+            return 1
+
+        print(f"\n✓ {message}")
+        print(f"  Elapsed: {stats['elapsed_seconds']}s")
+        return 2 if stats['rejected'] else 0
+
+    except Exception as e:
+        print(f"\n❌ ERROR: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
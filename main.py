@@ -7,16 +7,28 @@ Technology: Python 3.9+ | PyQt6 | SQLite3
 """
 
 import sys
+import importlib
 import logging
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication, QMessageBox
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont
 
 # Add project root to path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+# Profile imports from here on when requested
+from utils.startup_profiler import startup_profiler
+if '--profile-startup' in sys.argv:
+    startup_profiler.enable()
+
+# Service tracing can also be toggled at runtime from the log management view
+from utils.tracing import tracer
+if '--trace' in sys.argv:
+    tracer.enable()
+
+from PyQt6.QtWidgets import QApplication, QMessageBox
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+
 # Import configuration
 from config import Config
 
@@ -24,6 +36,7 @@ from config import Config
 from database.db_manager import DatabaseManager
 from database.init_db import validate_database
 from database.migrations import migrate_database
+from database.query_profiler import configure_profiling
 
 # Import services
 from services.logging_service import LoggingService
@@ -36,22 +49,15 @@ from services.settings_service import SettingsService
 from services.dropdown_service import DropdownService
 from services.validation_service import ValidationService
 from services.report_number_service import ReportNumberService
+from services.backup_service import BackupService
+from services.backup_scheduler_service import BackupSchedulerService
+from services.archive_service import ArchiveService
+from services.report_import_service import ReportImportService
 
-# Import UI windows
+# Import UI windows (the main window and views are imported on demand)
 from ui.windows.login_window import LoginWindow
-from ui.windows.main_window import MainWindow
-from ui.windows.setup_wizard import SetupWizard
-from ui.widgets.dashboard_view import DashboardView
-from ui.widgets.log_management_view import LogManagementView
-from ui.widgets.reports_view import ReportsView
-from ui.widgets.export_view import ExportView
-from ui.widgets.admin_panel import AdminPanel
-from ui.widgets.approval_panel import ApprovalPanel
-from ui.widgets.placeholder_view import PlaceholderView
-from ui.widgets.settings_view import SettingsView
-from ui.widgets.dropdown_management_view import DropdownManagementView
-from ui.widgets.system_settings_view import SystemSettingsView
-from ui.widgets.field_management_view import FieldManagementView
+from ui.themes import application_stylesheet_path, get_application_stylesheet, stylesheet_cache_info
+from services.icon_service import get_icon_service
 
 
 class FIUApplication:
@@ -73,15 +79,21 @@ class FIUApplication:
         self.settings_service = None
         self.dropdown_service = None
         self.validation_service = None
+        self.backup_service = None
+        self.backup_scheduler_service = None
+        self.archive_service = None
+        self.report_import_service = None
 
         self.setup_wizard = None
         self.login_window = None
         self.main_window = None
+        self.applied_stylesheet = None
 
     def run(self):
         """Run the application."""
         # Create QApplication
-        self.app = QApplication(sys.argv)
+        with startup_profiler.phase("Create QApplication"):
+            self.app = QApplication(sys.argv)
         self.app.setApplicationName("finan")
         self.app.setApplicationVersion("2.0.0")
         self.app.setOrganizationName("FIU")
@@ -94,7 +106,8 @@ class FIUApplication:
         self.app.setFont(font)
 
         # Load configuration
-        Config.load()
+        with startup_profiler.phase("Load configuration"):
+            Config.load()
 
         # Check if system is configured
         if not Config.is_configured():
@@ -130,6 +143,7 @@ class FIUApplication:
 
     def show_setup_wizard(self):
         """Show setup wizard for first-time configuration."""
+        from ui.windows.setup_wizard import SetupWizard
         self.setup_wizard = SetupWizard()
         self.setup_wizard.setup_completed.connect(self.on_setup_completed)
         self.setup_wizard.show()
@@ -196,10 +210,12 @@ class FIUApplication:
 
             # Initialize database manager
             db_path = Path(Config.DATABASE_PATH)
-            self.db_manager = DatabaseManager(str(db_path))
+            with startup_profiler.phase("Open database"):
+                self.db_manager = DatabaseManager(str(db_path))
 
             # Validate database
-            is_valid, message = validate_database(str(db_path))
+            with startup_profiler.phase("Validate database"):
+                is_valid, message = validate_database(str(db_path))
             if not is_valid:
                 QMessageBox.critical(
                     None,
@@ -214,7 +230,8 @@ class FIUApplication:
             self.logging_service = LoggingService(self.db_manager, log_dir)
 
             # Run migrations
-            success, migration_msg = migrate_database(str(db_path))
+            with startup_profiler.phase("Run migrations"):
+                success, migration_msg = migrate_database(str(db_path))
             if not success:
                 QMessageBox.warning(
                     None,
@@ -223,23 +240,47 @@ class FIUApplication:
                 )
             elif "No migrations needed" not in migration_msg:
                 self.logging_service.info(f"Database migration: {migration_msg}")
+
+            # Opt-in query profiling (system setting or FIU_QUERY_PROFILE)
+            if configure_profiling(self.db_manager):
+                self.logging_service.info("Query profiling enabled")
             self.logging_service.info("=" * 60)
             self.logging_service.info("FIU Report Management System Starting")
             self.logging_service.info("Version 2.0.0 - PyQt6 Edition")
             self.logging_service.info("=" * 60)
 
             # Initialize services
-            self.auth_service = AuthService(self.db_manager, self.logging_service)
-            self.settings_service = SettingsService(self.db_manager, self.auth_service)
-            self.report_service = ReportService(self.db_manager, self.logging_service, self.auth_service)
-            self.dashboard_service = DashboardService(self.db_manager, self.logging_service)
-            self.dropdown_service = DropdownService(self.db_manager, self.logging_service)
-            self.validation_service = ValidationService(self.db_manager, self.logging_service)
-            self.report_number_service = ReportNumberService(self.db_manager, self.logging_service)
-
-            # Initialize version and approval services (depend on report_service)
-            self.version_service = VersionService(self.db_manager, self.logging_service, self.auth_service, self.report_service)
-            self.approval_service = ApprovalService(self.db_manager, self.logging_service, self.auth_service, self.version_service, self.report_service)
+            with startup_profiler.phase("Initialize services"):
+                self.auth_service = AuthService(self.db_manager, self.logging_service)
+                self.settings_service = SettingsService(self.db_manager, self.auth_service)
+                self.app.aboutToQuit.connect(self.settings_service.flush)
+                self.report_service = ReportService(self.db_manager, self.logging_service, self.auth_service)
+                self.dashboard_service = DashboardService(self.db_manager, self.logging_service)
+                self.dropdown_service = DropdownService(self.db_manager, self.logging_service)
+                self.validation_service = ValidationService(self.db_manager, self.logging_service)
+                self.report_number_service = ReportNumberService(self.db_manager, self.logging_service)
+
+                # Initialize version and approval services (depend on report_service)
+                self.version_service = VersionService(self.db_manager, self.logging_service, self.auth_service, self.report_service)
+                self.approval_service = ApprovalService(self.db_manager, self.logging_service, self.auth_service, self.version_service, self.report_service)
+
+                # Old logs move to monthly archive databases after each scheduled backup
+                self.archive_service = ArchiveService(self.db_manager, self.logging_service)
+                self.logging_service.set_archive_service(self.archive_service)
+
+                # Scheduled backups (only the elected leader client runs them)
+                self.backup_service = BackupService(
+                    self.db_manager, self.logging_service, Config.BACKUP_PATH, self.archive_service
+                )
+                self.backup_scheduler_service = BackupSchedulerService(
+                    self.db_manager, self.logging_service, self.backup_service, self.archive_service
+                )
+                self.backup_scheduler_service.start()
+                self.app.aboutToQuit.connect(self.backup_scheduler_service.stop)
+
+                self.report_import_service = ReportImportService(
+                    self.db_manager, self.logging_service, self.validation_service
+                )
 
             self.logging_service.info("All services initialized successfully")
             return True
@@ -254,7 +295,8 @@ class FIUApplication:
     def load_theme(self):
         """Load and apply the dark theme."""
         try:
-            self.apply_theme()
+            with startup_profiler.phase("Apply theme"):
+                self.apply_theme()
         except Exception as e:
             if self.logging_service:
                 self.logging_service.error(f"Error loading theme: {str(e)}")
@@ -262,18 +304,20 @@ class FIUApplication:
     def apply_theme(self):
         """Apply the dark theme."""
         try:
-            stylesheet_path = project_root / "resources" / "style_dark.qss"
+            stylesheet_path = application_stylesheet_path('dark')
+            if not stylesheet_path.exists() and self.logging_service:
+                self.logging_service.warning(f"Theme file not found: {stylesheet_path}")
 
-            if stylesheet_path.exists():
-                with open(stylesheet_path, 'r', encoding='utf-8') as f:
-                    stylesheet = f.read()
-                    self.app.setStyleSheet(stylesheet)
+            # Compiled once per theme and DPI scale; re-applying an identical
+            # sheet would still re-polish every widget, so it is skipped
+            stylesheet = get_application_stylesheet('dark')
+            if stylesheet is not self.applied_stylesheet:
+                self.app.setStyleSheet(stylesheet)
+                self.applied_stylesheet = stylesheet
 
                 if self.logging_service:
                     self.logging_service.info("Dark theme applied")
-            else:
-                if self.logging_service:
-                    self.logging_service.warning(f"Theme file not found: {stylesheet_path}")
+            startup_profiler.note(f"Stylesheet cache: {stylesheet_cache_info()}")
 
         except Exception as e:
             if self.logging_service:
@@ -281,9 +325,11 @@ class FIUApplication:
 
     def show_login(self):
         """Show the login window."""
-        self.login_window = LoginWindow(self.auth_service)
-        self.login_window.login_successful.connect(self.on_login_successful)
-        self.login_window.show()
+        with startup_profiler.phase("Show login window"):
+            self.login_window = LoginWindow(self.auth_service)
+            self.login_window.login_successful.connect(self.on_login_successful)
+            self.login_window.show()
+        startup_profiler.report("login window shown")
 
     def on_login_successful(self, user: dict):
         """
@@ -294,20 +340,28 @@ class FIUApplication:
         """
         self.logging_service.info(f"User logged in: {user['username']}")
 
+        # Views read settings from memory from here on
+        with startup_profiler.phase("Load user settings"):
+            self.settings_service.load_user_settings(user['user_id'])
+
         # Create and show main window
         self.show_main_window()
 
     def show_main_window(self):
         """Show the main application window."""
-        self.main_window = MainWindow(
-            self.auth_service,
-            self.logging_service,
-            self.report_service,
-            self.dashboard_service,
-            approval_service=self.approval_service,
-            db_manager=self.db_manager,
-            report_number_service=self.report_number_service
-        )
+        with startup_profiler.phase("Import main window"):
+            from ui.windows.main_window import MainWindow
+
+        with startup_profiler.phase("Build main window"):
+            self.main_window = MainWindow(
+                self.auth_service,
+                self.logging_service,
+                self.report_service,
+                self.dashboard_service,
+                approval_service=self.approval_service,
+                db_manager=self.db_manager,
+                report_number_service=self.report_number_service
+            )
 
         # Add views to main window
         self.setup_views()
@@ -317,90 +371,69 @@ class FIUApplication:
 
         # Show main window
         self.main_window.show()
+        startup_profiler.note(f"Icon cache: {get_icon_service().cache_info()}")
+
+    def lazy_view(self, view_id: str, module_name: str, class_name: str, *args, **kwargs):
+        """
+        Build a factory that imports and constructs a view on first navigation.
+
+        Args:
+            view_id: View identifier (used for profiling)
+            module_name: Module containing the view class
+            class_name: View class name
+            *args, **kwargs: Constructor arguments
+
+        Returns:
+            Callable returning the view widget
+        """
+        def factory():
+            with startup_profiler.phase(f"Build view '{view_id}'"):
+                view_class = getattr(importlib.import_module(module_name), class_name)
+                return view_class(*args, **kwargs)
+        return factory
 
     def setup_views(self):
-        """Setup and add views to the main window."""
-        # Dashboard view
-        dashboard_view = DashboardView(
-            self.dashboard_service,
-            self.logging_service
-        )
-        self.main_window.add_view('dashboard', dashboard_view)
-
-        # Reports view
-        reports_view = ReportsView(
-            self.report_service,
-            self.logging_service,
-            self.auth_service,
-            self.version_service,
-            self.approval_service
-        )
-        self.main_window.add_view('reports', reports_view)
+        """Register views with the main window; each is built on first navigation."""
+        views = {
+            'dashboard': ('ui.widgets.dashboard_view', 'DashboardView',
+                          (self.dashboard_service, self.logging_service)),
+            'reports': ('ui.widgets.reports_view', 'ReportsView',
+                        (self.report_service, self.logging_service, self.auth_service,
+                         self.version_service, self.approval_service, self.settings_service)),
+        }
 
         # Export view
         if self.auth_service.has_permission('export'):
-            export_view = ExportView(
-                self.db_manager,
-                self.logging_service
-            )
-            self.main_window.add_view('export', export_view)
+            views['export'] = ('ui.widgets.export_view', 'ExportView',
+                               (self.db_manager, self.logging_service))
 
         # Admin views (admin only)
         if self.auth_service.get_current_user()['role'] == 'admin':
-            # Approval management
             current_user = self.auth_service.get_current_user()
-            approvals_view = ApprovalPanel(
-                self.report_service,
-                current_user,
-                self.approval_service,
-                self.version_service
-            )
-            self.main_window.add_view('approvals', approvals_view)
-
-            # Users management
-            users_view = AdminPanel(
-                self.db_manager,
-                self.logging_service
+            views.update({
+                'approvals': ('ui.widgets.approval_panel', 'ApprovalPanel',
+                              (self.report_service, current_user,
+                               self.approval_service, self.version_service)),
+                'users': ('ui.widgets.admin_panel', 'AdminPanel',
+                          (self.db_manager, self.logging_service, self.backup_scheduler_service,
+                           self.report_import_service, current_user)),
+                'logs': ('ui.widgets.log_management_view', 'LogManagementView',
+                         (self.logging_service,)),
+                'settings': ('ui.widgets.settings_view', 'SettingsView',
+                             (self.settings_service, self.auth_service, self,
+                              self.db_manager, self.logging_service)),
+                'dropdown_mgmt': ('ui.widgets.dropdown_management_view', 'DropdownManagementView',
+                                  (self.dropdown_service, self.logging_service, current_user)),
+                'system_settings': ('ui.widgets.system_settings_view', 'SystemSettingsView',
+                                    (self.db_manager, self.logging_service, current_user)),
+                'field_management': ('ui.widgets.field_management_view', 'FieldManagementView',
+                                     (self.validation_service, self.logging_service, current_user)),
+            })
+
+        for view_id, (module_name, class_name, args) in views.items():
+            self.main_window.register_view(
+                view_id, self.lazy_view(view_id, module_name, class_name, *args)
             )
-            self.main_window.add_view('users', users_view)
-
-            # System logs view
-            log_view = LogManagementView(self.logging_service)
-            self.main_window.add_view('logs', log_view)
-
-            # Settings view
-            settings_view = SettingsView(
-                self.settings_service,
-                self.auth_service,
-                self,
-                self.db_manager,
-                self.logging_service
-            )
-            self.main_window.add_view('settings', settings_view)
-
-            # Dropdown Management view
-            dropdown_mgmt_view = DropdownManagementView(
-                self.dropdown_service,
-                self.logging_service,
-                current_user
-            )
-            self.main_window.add_view('dropdown_mgmt', dropdown_mgmt_view)
-
-            # System Settings view
-            system_settings_view = SystemSettingsView(
-                self.db_manager,
-                self.logging_service,
-                current_user
-            )
-            self.main_window.add_view('system_settings', system_settings_view)
-
-            # Field Management view
-            field_management_view = FieldManagementView(
-                self.validation_service,
-                self.logging_service,
-                current_user
-            )
-            self.main_window.add_view('field_management', field_management_view)
 
         # Switch to dashboard
         self.main_window.switch_view('dashboard')
@@ -409,6 +442,9 @@ class FIUApplication:
         """Handle logout."""
         self.logging_service.info("User logged out")
 
+        # Write pending setting changes and drop the user's cached settings
+        self.settings_service.unload_user_settings()
+
         # Close main window if open
         if self.main_window:
             self.main_window.close()
@@ -0,0 +1,138 @@
+"""
+Query Profile Report
+Shows the hottest SQL statements and the slow query log recorded by the query profiler.
+
+Profiling is opt-in: enable the query_profiling_enabled system setting or
+start the application with FIU_QUERY_PROFILE=1.
+
+Usage:
+  python query_report.py
+  python query_report.py --sort p95_ms --limit 10 --plans
+  python query_report.py --slow 20
+"""
+
+import sys
+import argparse
+import textwrap
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from database.db_manager import DatabaseManager
+from database.query_profiler import (
+    PROFILE_SORT_COLUMNS, load_profile_report, load_slow_queries, reset_profile_data
+)
+from config import Config
+
+
+def shorten(statement, width):
+    """Shorten a statement to a single line."""
+    return textwrap.shorten(statement or '', width=width, placeholder='...')
+
+
+def print_profile(db_manager, sort_by, limit, show_plans, width):
+    """Print the per-statement report."""
+    rows = load_profile_report(db_manager, sort_by=sort_by, limit=limit)
+
+    print("\n" + "=" * 110)
+    print(f"TOP {limit} STATEMENTS BY {sort_by.upper()}")
+    print("=" * 110)
+
+    if not rows:
+        print("\nNo statements recorded yet. Is profiling enabled?")
+        return
+
+    print(f"\n{'Calls':>8} {'Total ms':>11} {'Avg':>8} {'p50':>8} {'p95':>8} {'Max':>9} "
+          f"{'Rows':>9} {'Locks':>6} {'Sleep ms':>9}  Statement")
+    print("-" * 110)
+    for row in rows:
+        print(f"{row['calls']:>8} {row['total_ms']:>11.1f} {row['avg_ms']:>8.2f} "
+              f"{row['p50_ms'] or 0:>8.2f} {row['p95_ms'] or 0:>8.2f} {row['max_ms'] or 0:>9.2f} "
+              f"{row['rows']:>9} {row['lock_retries']:>6} {row['backoff_ms']:>9.0f}  "
+              f"{shorten(row['statement'], width)}")
+        if show_plans and row['query_plan']:
+            for line in row['query_plan'].splitlines():
+                print(f"{'':>12}| {line}")
+
+
+def print_slow_log(db_manager, limit, width):
+    """Print the most recent slow queries."""
+    rows = load_slow_queries(db_manager, limit=limit)
+
+    print("\n" + "=" * 110)
+    print(f"SLOW QUERY LOG (last {limit})")
+    print("=" * 110)
+
+    if not rows:
+        print("\nNo slow queries logged.")
+        return
+
+    for row in rows:
+        print(f"\n[{row['created_at'][:19]}] {row['duration_ms']:.1f} ms, {row['rows']} rows, "
+              f"{row['lock_retries']} lock retries ({row['client_id']})")
+        print(f"  {shorten(row['statement'], width + 40)}")
+        for line in (row['query_plan'] or '(no plan)').splitlines():
+            print(f"    {line}")
+
+
+def main():
+    """Main function."""
+    parser = argparse.ArgumentParser(
+        description="Report statement timings recorded by the query profiler",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python query_report.py                          # Top 25 statements by total time
+  python query_report.py --sort p95_ms --plans    # Slowest typical calls, with query plans
+  python query_report.py --slow 20                # Last 20 slow queries
+  python query_report.py --reset                  # Clear recorded data
+        """
+    )
+
+    parser.add_argument('-s', '--sort', choices=sorted(PROFILE_SORT_COLUMNS), default='total_ms',
+                        help='Column to rank statements by (default: total_ms)')
+    parser.add_argument('-l', '--limit', type=int, default=25,
+                        help='Number of statements to show (default: 25)')
+    parser.add_argument('-p', '--plans', action='store_true',
+                        help='Show the last captured query plan for each statement')
+    parser.add_argument('--slow', type=int, metavar='N', default=0,
+                        help='Show the last N slow query log entries')
+    parser.add_argument('-w', '--width', type=int, default=60,
+                        help='Statement column width (default: 60)')
+    parser.add_argument('--reset', action='store_true',
+                        help='Clear the profile and slow query log for all clients')
+
+    args = parser.parse_args()
+
+    try:
+        if not Config.load():
+            print("\n❌ ERROR: Configuration not loaded. Please run the application first.")
+            return 1
+
+        db_manager = DatabaseManager(Config.DATABASE_PATH)
+
+        if not db_manager.table_exists('query_profile'):
+            print("\n❌ ERROR: Query profiler tables not found. Start the application once to migrate the database.")
+            return 1
+
+        if args.reset:
+            reset_profile_data(db_manager)
+            print("\n✓ Query profile and slow query log cleared")
+            return 0
+
+        print_profile(db_manager, args.sort, args.limit, args.plans, args.width)
+        if args.slow:
+            print_slow_log(db_manager, args.slow, args.width)
+        print()
+        return 0
+
+    except Exception as e:
+        print(f"\n❌ ERROR: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Benchmark Suite
+Generates a seeded synthetic database and times the main user-facing
+operations against it, optionally comparing with a stored baseline.
+
+Usage:
+  python run_benchmarks.py                                  # 10k reports, print results
+  python run_benchmarks.py --reports 100000 -o results.json # Larger dataset, save JSON
+  python run_benchmarks.py --baseline baseline.json         # Flag regressions (exit code 2)
+
+Scenarios whose service calls raise or log an error are reported as FAILED
+and make the run exit with code 3.
+"""
+
+import sys
+import argparse
+import tempfile
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from benchmarks.synthetic_data import SyntheticDataGenerator, read_dataset_parameters
+from benchmarks.runner import (
+    SCENARIOS, run_benchmarks, write_results, load_results, compare_results, format_comparison
+)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Run the FIU performance benchmarks on a synthetic database',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  python run_benchmarks.py --list
+  python run_benchmarks.py --reports 50000 --db bench_50k.db
+  python run_benchmarks.py --db bench_50k.db --scenario list dashboard
+  python run_benchmarks.py --db bench_50k.db --save-baseline benchmarks/baseline.json
+  python run_benchmarks.py --db bench_50k.db --baseline benchmarks/baseline.json --tolerance 0.3
+
+The --db file is generated on first use and reused afterwards; the
+benchmarks always run on a temporary copy of it.
+        """
+    )
+
+    parser.add_argument('--reports', type=int, default=10000, help='Reports to generate (default: 10000)')
+    parser.add_argument('--users', type=int, default=20, help='Users to generate (default: 20)')
+    parser.add_argument('--seed', type=int, default=42, help='Random seed (default: 42)')
+    parser.add_argument('--end-date', help='Last day of generated data, YYYY-MM-DD (default: today)')
+    parser.add_argument('--db', help='Synthetic database to reuse or create (default: temporary)')
+    parser.add_argument('-r', '--repeat', type=int, default=5, help='Timed runs per scenario (default: 5)')
+    parser.add_argument('-s', '--scenario', nargs='+', help='Only run scenarios whose name contains one of these')
+    parser.add_argument('-o', '--output', help='Write results JSON to this file')
+    parser.add_argument('--baseline', help='Compare against this results file')
+    parser.add_argument('--save-baseline', help='Write results as the new baseline file')
+    parser.add_argument('--tolerance', type=float, default=0.20,
+                        help='Allowed median slowdown before flagging a regression (default: 0.20)')
+    parser.add_argument('--list', action='store_true', help='List scenarios and exit')
+
+    args = parser.parse_args()
+
+    if args.list:
+        for item in SCENARIOS:
+            marker = " (writes)" if item.mutates else ""
+            print(f"  {item.name:<24} {item.description}{marker}")
+        return 0
+
+    end_date = None
+    if args.end_date:
+        from datetime import datetime
+        try:
+            end_date = datetime.strptime(args.end_date, '%Y-%m-%d')
+        except ValueError:
+            print(f"\n❌ ERROR: Invalid --end-date '{args.end_date}', expected YYYY-MM-DD")
+            return 1
+
+    temp_dir = None
+    try:
+        if args.db:
+            db_path = Path(args.db)
+        else:
+            temp_dir = tempfile.TemporaryDirectory(prefix='fiu_bench_')
+            db_path = Path(temp_dir.name) / 'synthetic.db'
+
+        if db_path.exists():
+            parameters = read_dataset_parameters(str(db_path))
+            if parameters is None:
+                print(f"\n❌ ERROR: {db_path} is not a synthetic benchmark database")
+                return 1
+            print(f"\nUsing {db_path} ({parameters['reports']} reports, seed {parameters['seed']})")
+        else:
+            generator = SyntheticDataGenerator(
+                seed=args.seed, reports=args.reports, users=args.users, end_date=end_date
+            )
+            print(f"\nGenerating {args.reports} reports (seed {args.seed}) into {db_path} ...")
+
+            def show_progress(percent, message):
+                print(f"\r  [{percent:3d}%] {message:<50}", end='', flush=True)
+
+            counts = generator.generate(str(db_path), progress_callback=show_progress)
+            print("\r" + " " * 60 + "\r", end='')
+            print("  " + ", ".join(f"{table}: {count}" for table, count in counts.items()))
+
+        print("\n" + "=" * 80)
+        print(f"  {'Scenario':<24} {'Median ms':>10} {'p95 ms':>10} {'Min ms':>10} {'Runs':>5} {'Ops':>7}")
+        print("=" * 80)
+
+        def show_result(name, result):
+            if 'error' in result:
+                print(f"  {name:<24} FAILED: {result['error'][:60]}")
+                return
+            print(f"  {name:<24} {result['median_ms']:>10.1f} {result['p95_ms']:>10.1f} "
+                  f"{result['min_ms']:>10.1f} {result['runs']:>5} {result['ops']:>7}")
+
+        results = run_benchmarks(
+            str(db_path), repeat=args.repeat, patterns=args.scenario,
+            seed=args.seed, progress_callback=show_result
+        )
+        print("=" * 80)
+
+        if args.output:
+            write_results(results, args.output)
+            print(f"\n✓ Results written to {args.output}")
+        if args.save_baseline:
+            write_results(results, args.save_baseline)
+            print(f"✓ Baseline saved to {args.save_baseline}")
+
+        if args.baseline:
+            comparison = compare_results(results, load_results(args.baseline), tolerance=args.tolerance)
+            print(f"\nComparison with {args.baseline}:\n")
+            print(format_comparison(comparison))
+            if comparison['regressions']:
+                print(f"\n❌ {len(comparison['regressions'])} regression(s): {', '.join(comparison['regressions'])}")
+                return 2
+            print("\n✓ No regressions")
+
+        failed = [name for name, result in results['scenarios'].items() if 'error' in result]
+        if failed:
+            print(f"\n❌ {len(failed)} scenario(s) failed: {', '.join(failed)}")
+            return 3
+
+        return 0
+
+    except KeyboardInterrupt:
+        print("\n\nBenchmark cancelled.")
+        return 1
+    except Exception as e:
+        print(f"\n❌ ERROR: {str(e)}")
+        import traceback
+        traceback.print_exc()
+        return 1
+    finally:
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,11 +3,17 @@ Activity Service - GitHub-style Activity Logging
 Tracks and displays user activities like creates, updates, deletes, approvals, etc.
 """
 
+import atexit
 import json
-from datetime import datetime, timedelta
+import threading
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from typing import Optional, Dict, List, Tuple, Any
 
+from utils.tracing import trace_service
 
+
+@trace_service
 class ActivityService:
     """Service for managing GitHub-style activity logs."""
 
@@ -43,6 +49,24 @@ class ActivityService:
         'VERSION_RESTORE': '#9c27b0', # Purple
     }
 
+    VALID_ACTIONS = (
+        'CREATE', 'UPDATE', 'DELETE', 'RESTORE', 'APPROVE',
+        'REJECT', 'VERSION_CREATE', 'VERSION_DELETE', 'VERSION_RESTORE',
+        'HARD_DELETE', 'SOFT_DELETE', 'UNDELETE'
+    )
+
+    INSERT_QUERY = """
+        INSERT INTO activity_log
+        (user_id, username, action_type, report_id, report_number,
+         version_id, version_number, description, metadata, created_at)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # Buffered writer: flush early once this many activities are queued
+    BATCH_SIZE = 200
+    # Queued activities kept while the database is unavailable
+    MAX_PENDING = 20000
+
     def __init__(self, db_manager, logging_service, auth_service):
         """
         Initialize the activity service.
@@ -55,6 +79,20 @@ class ActivityService:
         self.db_manager = db_manager
         self.logger = logging_service
         self.auth_service = auth_service
+        self.archive_service = None  # Set via set_archive_service (late binding)
+
+        # Buffered writer state (inactive until start_writer())
+        self.flush_interval = 1.0
+        self._pending = deque()
+        self._pending_lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread = None
+
+    def set_archive_service(self, archive_service):
+        """Set archive service so timeline queries include archived months."""
+        self.archive_service = archive_service
 
     def log_activity(
         self,
@@ -69,6 +107,9 @@ class ActivityService:
         """
         Log a user activity.
 
+        While the buffered writer runs, the activity is queued and written
+        with the next batch; the user and timestamp are captured now.
+
         Args:
             action_type: Type of action (CREATE, UPDATE, DELETE, etc.)
             description: Human-readable description of the activity
@@ -79,7 +120,8 @@ class ActivityService:
             metadata: Additional metadata as JSON (optional)
 
         Returns:
-            Tuple of (success, activity_id, message)
+            Tuple of (success, activity_id, message); activity_id is None
+            when the activity was queued
         """
         try:
             current_user = self.auth_service.get_current_user()
@@ -90,33 +132,27 @@ class ActivityService:
             username = current_user.get('username')
 
             # Validate action type
-            valid_actions = [
-                'CREATE', 'UPDATE', 'DELETE', 'RESTORE', 'APPROVE',
-                'REJECT', 'VERSION_CREATE', 'VERSION_DELETE', 'VERSION_RESTORE',
-                'HARD_DELETE', 'SOFT_DELETE', 'UNDELETE'
-            ]
-            if action_type not in valid_actions:
+            if action_type not in self.VALID_ACTIONS:
                 return False, None, f"Invalid action type: {action_type}"
 
             # Serialize metadata
             metadata_json = json.dumps(metadata, default=str) if metadata else None
 
-            # Insert activity
-            insert_query = """
-                INSERT INTO activity_log
-                (user_id, username, action_type, report_id, report_number,
-                 version_id, version_number, description, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """
-            self.db_manager.execute_with_retry(
-                insert_query,
-                (user_id, username, action_type, report_id, report_number,
-                 version_id, version_number, description, metadata_json)
-            )
+            # Same UTC format as the column default datetime('now')
+            created_at = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+            row = (user_id, username, action_type, report_id, report_number,
+                   version_id, version_number, description, metadata_json, created_at)
 
-            # Get the activity_id
-            result = self.db_manager.execute_with_retry("SELECT last_insert_rowid()")
-            activity_id = result[0][0] if result else None
+            if self._thread is not None:
+                with self._pending_lock:
+                    self._pending.append(row)
+                    queued = len(self._pending)
+                if queued >= self.BATCH_SIZE:
+                    self._wake.set()
+                return True, None, "Activity queued"
+
+            with self.db_manager.get_connection() as conn:
+                activity_id = conn.execute(self.INSERT_QUERY, row).lastrowid
 
             return True, activity_id, "Activity logged successfully"
 
@@ -124,6 +160,312 @@ class ActivityService:
             self.logger.error(f"Error logging activity: {str(e)}", exc_info=True)
             return False, None, f"Error logging activity: {str(e)}"
 
+    # ==================== BUFFERED WRITER ====================
+
+    def start_writer(self, flush_interval: float = 1.0):
+        """
+        Queue activities in memory and write them in batches from a background thread.
+
+        Args:
+            flush_interval: Seconds between flushes
+        """
+        if self._thread and self._thread.is_alive():
+            return
+        self.flush_interval = flush_interval
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self._run, name="ActivityWriter", daemon=True)
+        self._thread.start()
+        atexit.register(self.stop_writer)
+
+    def stop_writer(self):
+        """Stop the background thread and write every queued activity."""
+        thread = self._thread
+        self._thread = None
+        self._stop_event.set()
+        self._wake.set()
+        if thread and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout=5)
+        self.flush()
+        atexit.unregister(self.stop_writer)
+
+    @property
+    def pending_count(self) -> int:
+        """Number of queued activities not yet written."""
+        return len(self._pending)
+
+    def _run(self):
+        """Flush loop."""
+        while not self._stop_event.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> bool:
+        """
+        Write queued activities in one transaction, oldest first.
+
+        Flushes are serialized, so activity_ids follow the order in which
+        activities were logged. On failure the batch goes back to the
+        front of the queue for the next attempt.
+
+        Returns:
+            True if the write succeeded (or there was nothing to write)
+        """
+        with self._flush_lock:
+            with self._pending_lock:
+                if not self._pending:
+                    return True
+                batch = list(self._pending)
+                self._pending.clear()
+
+            try:
+                with self.db_manager.get_connection() as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    conn.executemany(self.INSERT_QUERY, batch)
+                return True
+
+            except Exception as e:
+                with self._pending_lock:
+                    self._pending.extendleft(reversed(batch))
+                    dropped = len(self._pending) - self.MAX_PENDING
+                    for _ in range(max(dropped, 0)):
+                        self._pending.pop()
+                self.logger.error(f"Error writing {len(batch)} queued activities: {str(e)}", exc_info=True)
+                return False
+
+    # Columns shared by every timeline query; age is computed by SQLite
+    # in the same pass so rows need no date parsing in Python
+    SELECT_COLUMNS = """
+        SELECT activity_id, user_id, username, action_type,
+               report_id, report_number, version_id, version_number,
+               description, metadata, created_at,
+               CAST((julianday('now') - julianday(created_at)) * 86400 AS INTEGER) AS age_seconds
+        FROM {table}
+    """
+
+    # (upper bound in seconds, divisor, unit) for relative times
+    RELATIVE_TIME_UNITS = (
+        (3600, 60, 'minute'),
+        (86400, 3600, 'hour'),
+        (7 * 86400, 86400, 'day'),
+        (28 * 86400, 7 * 86400, 'week'),
+        (365 * 86400, 30 * 86400, 'month'),
+    )
+
+    def _build_activity_filters(
+        self,
+        user_id: int = None,
+        action_types: List[str] = None,
+        report_id: int = None,
+        date_from: str = None,
+        date_to: str = None
+    ) -> Tuple[List[str], List[Any]]:
+        """
+        Build WHERE conditions for the timeline filters.
+
+        Returns:
+            Tuple of (conditions, params)
+        """
+        conditions = []
+        params = []
+
+        if user_id:
+            conditions.append("user_id = ?")
+            params.append(user_id)
+
+        if action_types:
+            placeholders = ', '.join(['?' for _ in action_types])
+            conditions.append(f"action_type IN ({placeholders})")
+            params.extend(action_types)
+
+        if report_id:
+            conditions.append("report_id = ?")
+            params.append(report_id)
+
+        if date_from:
+            conditions.append("created_at >= ?")
+            params.append(date_from)
+
+        if date_to:
+            # Include the whole end day
+            conditions.append("created_at < DATE(?, '+1 day')")
+            params.append(date_to)
+
+        return conditions, params
+
+    def _select_activities(self, query: str, params: List[Any], limit: int,
+                           date_from: str = None, date_to: str = None) -> List[Any]:
+        """
+        Run a newest-first timeline query, continuing into archived months.
+
+        Args:
+            query: SELECT with a {table} placeholder, ending in 'LIMIT ?'
+            params: Query parameters, excluding the limit
+            limit: Maximum number of rows
+            date_from: Optional start date, used to skip older archives
+            date_to: Optional end date, used to skip newer archives
+
+        Returns:
+            List of rows
+        """
+        if self.archive_service:
+            return self.archive_service.select_across(
+                'activity_log', query, params, limit, date_from, date_to
+            )
+        return self.db_manager.execute_with_retry(
+            query.format(table='activity_log'), tuple(params) + (limit,)
+        )
+
+    def _row_to_activity(self, row) -> 'ActivityRecord':
+        """Convert a SELECT_COLUMNS row into an activity dictionary."""
+        return ActivityRecord(
+            row[9],
+            activity_id=row[0],
+            user_id=row[1],
+            username=row[2],
+            action_type=row[3],
+            report_id=row[4],
+            report_number=row[5],
+            version_id=row[6],
+            version_number=row[7],
+            description=row[8],
+            created_at=row[10],
+            icon=self.ACTION_ICONS.get(row[3], 'info'),
+            color=self.ACTION_COLORS.get(row[3], '#757575'),
+            relative_time=self.format_age(row[11])
+        )
+
+    def query_activities(
+        self,
+        cursor: Optional[Tuple[str, int]] = None,
+        limit: int = 50,
+        **filters
+    ) -> Tuple[List[Dict], Optional[Tuple[str, int]]]:
+        """
+        Get one page of the activity timeline, newest first.
+
+        Pages are keyed on (created_at, activity_id) instead of OFFSET, so
+        every page costs the same however far back the user scrolls.
+
+        Args:
+            cursor: Cursor returned with the previous page, None for the first page
+            limit: Maximum number of activities per page
+            **filters: user_id, action_types, report_id, date_from, date_to
+
+        Returns:
+            Tuple of (activities, cursor of the next page or None when this
+            is the last page)
+        """
+        try:
+            # Show activities still waiting in the buffered writer
+            self.flush()
+
+            conditions, params = self._build_activity_filters(**filters)
+            if cursor is not None:
+                conditions.append("(created_at, activity_id) < (?, ?)")
+                params.extend(cursor)
+
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = f"""
+                {self.SELECT_COLUMNS}
+                {where_clause}
+                ORDER BY created_at DESC, activity_id DESC
+                LIMIT ?
+            """
+            # Archives newer than the cursor hold nothing for this page
+            date_to = filters.get('date_to')
+            if cursor is not None and (not date_to or cursor[0] < date_to):
+                date_to = cursor[0]
+            result = self._select_activities(query, params, limit + 1, filters.get('date_from'), date_to)
+
+            activities = [self._row_to_activity(row) for row in result[:limit]]
+
+            next_cursor = None
+            if len(result) > limit:
+                last = activities[-1]
+                next_cursor = (last['created_at'], last['activity_id'])
+
+            return activities, next_cursor
+
+        except Exception as e:
+            self.logger.error(f"Error fetching activity page: {str(e)}", exc_info=True)
+            return [], None
+
+    def get_activities_since(
+        self,
+        last_seen_id: int,
+        limit: int = 200,
+        **filters
+    ) -> List[Dict]:
+        """
+        Get activities recorded after the newest one a timeline already shows.
+
+        Keyed on activity_id rather than created_at, so activities that were
+        queued on another client and written late are still picked up.
+
+        Args:
+            last_seen_id: Highest activity_id already displayed
+            limit: Maximum number of activities to return
+            **filters: user_id, action_types, report_id, date_from, date_to
+
+        Returns:
+            New activities, newest first
+        """
+        try:
+            self.flush()
+
+            conditions, params = self._build_activity_filters(**filters)
+            conditions.append("activity_id > ?")
+            params.append(last_seen_id or 0)
+
+            # New activity is always in the live table
+            query = f"""
+                {self.SELECT_COLUMNS.format(table='activity_log')}
+                WHERE {' AND '.join(conditions)}
+                ORDER BY activity_id DESC
+                LIMIT ?
+            """
+            params.append(limit)
+            result = self.db_manager.execute_with_retry(query, tuple(params))
+
+            activities = [self._row_to_activity(row) for row in result]
+            activities.sort(key=lambda a: (a['created_at'] or '', a['activity_id']), reverse=True)
+            return activities
+
+        except Exception as e:
+            self.logger.error(f"Error fetching new activities: {str(e)}", exc_info=True)
+            return []
+
+    def count_activities(self, **filters) -> int:
+        """
+        Count the activities matching the timeline filters.
+
+        Args:
+            **filters: user_id, action_types, report_id, date_from, date_to
+
+        Returns:
+            Number of matching activities
+        """
+        try:
+            self.flush()
+
+            conditions, params = self._build_activity_filters(**filters)
+            if self.archive_service:
+                return self.archive_service.count_across(
+                    'activity_log', ' AND '.join(conditions) or '1=1', params,
+                    filters.get('date_from'), filters.get('date_to')
+                )
+
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            result = self.db_manager.execute_with_retry(
+                f"SELECT COUNT(*) FROM activity_log {where_clause}", tuple(params)
+            )
+            return result[0][0] if result else 0
+
+        except Exception as e:
+            self.logger.error(f"Error counting activities: {str(e)}", exc_info=True)
+            return 0
+
     def get_recent_activities(
         self,
         limit: int = 50,
@@ -137,6 +479,9 @@ class ActivityService:
         """
         Get recent activities with optional filtering.
 
+        Prefer query_activities for paging; this OFFSET variant also counts
+        every matching row.
+
         Args:
             limit: Maximum number of activities to return
             offset: Number of activities to skip
@@ -150,71 +495,21 @@ class ActivityService:
             Tuple of (list of activities, total count)
         """
         try:
-            conditions = []
-            params = []
-
-            if user_id:
-                conditions.append("user_id = ?")
-                params.append(user_id)
-
-            if action_types:
-                placeholders = ', '.join(['?' for _ in action_types])
-                conditions.append(f"action_type IN ({placeholders})")
-                params.extend(action_types)
+            filters = dict(user_id=user_id, action_types=action_types, report_id=report_id,
+                           date_from=date_from, date_to=date_to)
+            total_count = self.count_activities(**filters)
 
-            if report_id:
-                conditions.append("report_id = ?")
-                params.append(report_id)
-
-            if date_from:
-                conditions.append("created_at >= ?")
-                params.append(date_from)
-
-            if date_to:
-                conditions.append("created_at <= ?")
-                params.append(date_to)
-
-            where_clause = " AND ".join(conditions) if conditions else "1=1"
-
-            # Get total count
-            count_query = f"SELECT COUNT(*) FROM activity_log WHERE {where_clause}"
-            count_result = self.db_manager.execute_with_retry(count_query, params)
-            total_count = count_result[0][0] if count_result else 0
-
-            # Get activities
+            conditions, params = self._build_activity_filters(**filters)
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
             query = f"""
-                SELECT activity_id, user_id, username, action_type,
-                       report_id, report_number, version_id, version_number,
-                       description, metadata, created_at
-                FROM activity_log
-                WHERE {where_clause}
-                ORDER BY created_at DESC
-                LIMIT ? OFFSET ?
+                {self.SELECT_COLUMNS}
+                {where_clause}
+                ORDER BY created_at DESC, activity_id DESC
+                LIMIT ?
             """
-            params.extend([limit, offset])
-            result = self.db_manager.execute_with_retry(query, params)
+            result = self._select_activities(query, params, limit + offset, date_from, date_to)
 
-            activities = []
-            for row in result:
-                metadata = json.loads(row[9]) if row[9] else None
-                activities.append({
-                    'activity_id': row[0],
-                    'user_id': row[1],
-                    'username': row[2],
-                    'action_type': row[3],
-                    'report_id': row[4],
-                    'report_number': row[5],
-                    'version_id': row[6],
-                    'version_number': row[7],
-                    'description': row[8],
-                    'metadata': metadata,
-                    'created_at': row[10],
-                    'icon': self.ACTION_ICONS.get(row[3], 'info'),
-                    'color': self.ACTION_COLORS.get(row[3], '#757575'),
-                    'relative_time': self._get_relative_time(row[10])
-                })
-
-            return activities, total_count
+            return [self._row_to_activity(row) for row in result[offset:]], total_count
 
         except Exception as e:
             self.logger.error(f"Error fetching activities: {str(e)}", exc_info=True)
@@ -231,7 +526,7 @@ class ActivityService:
         Returns:
             List of activity dictionaries
         """
-        activities, _ = self.get_recent_activities(
+        activities, _ = self.query_activities(
             limit=limit,
             report_id=report_id
         )
@@ -248,7 +543,7 @@ class ActivityService:
         Returns:
             List of activity dictionaries
         """
-        activities, _ = self.get_recent_activities(
+        activities, _ = self.query_activities(
             limit=limit,
             user_id=user_id
         )
@@ -265,6 +560,7 @@ class ActivityService:
             Dictionary with summary statistics
         """
         try:
+            self.flush()
             date_from = (datetime.now() - timedelta(days=days)).isoformat()
 
             # Get counts by action type
@@ -405,51 +701,61 @@ class ActivityService:
         Returns:
             Relative time string (e.g., "2 hours ago")
         """
-        try:
-            if not timestamp_str:
-                return "Unknown"
-
-            # Parse timestamp - SQLite stores UTC time via datetime('now')
-            clean_timestamp = timestamp_str.replace('Z', '').split('+')[0]
-            timestamp_utc = datetime.fromisoformat(clean_timestamp)
-
-            # Use UTC now for comparison since database stores UTC
-            now_utc = datetime.utcnow()
-
-            # Calculate difference
-            diff = now_utc - timestamp_utc
-
-            seconds = diff.total_seconds()
-            minutes = seconds / 60
-            hours = minutes / 60
-            days = hours / 24
-            weeks = days / 7
-            months = days / 30
-            years = days / 365
-
-            if seconds < 60:
-                return "Just now"
-            elif minutes < 60:
-                mins = int(minutes)
-                return f"{mins} minute{'s' if mins != 1 else ''} ago"
-            elif hours < 24:
-                hrs = int(hours)
-                return f"{hrs} hour{'s' if hrs != 1 else ''} ago"
-            elif days < 7:
-                d = int(days)
-                return f"{d} day{'s' if d != 1 else ''} ago"
-            elif weeks < 4:
-                w = int(weeks)
-                return f"{w} week{'s' if w != 1 else ''} ago"
-            elif months < 12:
-                m = int(months)
-                return f"{m} month{'s' if m != 1 else ''} ago"
-            else:
-                y = int(years)
-                return f"{y} year{'s' if y != 1 else ''} ago"
+        return self.format_relative_times([timestamp_str])[0]
 
-        except Exception:
+    def format_relative_times(self, timestamps: List[str], now: datetime = None) -> List[str]:
+        """
+        Convert many timestamps to relative time strings in one pass.
+
+        Uses a single reference time and parses each distinct timestamp once,
+        so a timeline can relabel all of its rows cheaply.
+
+        Args:
+            timestamps: Timestamp strings (stored as UTC in database)
+            now: Reference UTC time (defaults to now)
+
+        Returns:
+            Relative time strings in the same order
+        """
+        # Stored timestamps are naive UTC, so compare against naive UTC
+        now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+        labels = {}
+        result = []
+        for timestamp_str in timestamps:
+            label = labels.get(timestamp_str)
+            if label is None:
+                try:
+                    # SQLite stores UTC time via datetime('now')
+                    clean_timestamp = timestamp_str.replace('Z', '').split('+')[0]
+                    age = (now - datetime.fromisoformat(clean_timestamp)).total_seconds()
+                    label = self.format_age(age)
+                except Exception:
+                    label = "Unknown"
+                labels[timestamp_str] = label
+            result.append(label)
+        return result
+
+    @classmethod
+    def format_age(cls, seconds: Optional[float]) -> str:
+        """
+        Format an age in seconds as a relative time string.
+
+        Args:
+            seconds: Age in seconds (None when the timestamp is missing)
+
+        Returns:
+            Relative time string (e.g., "2 hours ago")
+        """
+        if seconds is None:
             return "Unknown"
+        if seconds < 60:
+            return "Just now"
+        for limit, divisor, unit in cls.RELATIVE_TIME_UNITS:
+            if seconds < limit:
+                count = int(seconds // divisor)
+                return f"{count} {unit}{'s' if count != 1 else ''} ago"
+        count = int(seconds // (365 * 86400))
+        return f"{count} year{'s' if count != 1 else ''} ago"
 
     def delete_old_activities(self, days_to_keep: int = 365) -> Tuple[bool, int, str]:
         """
@@ -469,20 +775,28 @@ class ActivityService:
             if current_user.get('role') != 'admin':
                 return False, 0, "Only administrators can delete activity logs"
 
-            cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).isoformat()
+            cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).date().isoformat()
 
-            # Get count first
-            count_query = "SELECT COUNT(*) FROM activity_log WHERE created_at < ?"
-            count_result = self.db_manager.execute_with_retry(count_query, (cutoff_date,))
-            delete_count = count_result[0][0] if count_result else 0
+            # Delete in short batches (live table and archived months)
+            if self.archive_service:
+                delete_count = self.archive_service.delete_rows('activity_log', cutoff_date)
+            else:
+                delete_query = """
+                    DELETE FROM activity_log WHERE activity_id IN (
+                        SELECT activity_id FROM activity_log WHERE created_at < ? LIMIT ?
+                    )
+                """
+                delete_count = 0
+                while True:
+                    with self.db_manager.get_connection() as conn:
+                        count = conn.execute(delete_query, (cutoff_date, self.BATCH_SIZE)).rowcount
+                    delete_count += count
+                    if count < self.BATCH_SIZE:
+                        break
 
             if delete_count == 0:
                 return True, 0, "No old activities to delete"
 
-            # Delete old activities
-            delete_query = "DELETE FROM activity_log WHERE created_at < ?"
-            self.db_manager.execute_with_retry(delete_query, (cutoff_date,))
-
             self.logger.log_user_action(
                 "ACTIVITY_CLEANUP",
                 {'deleted_count': delete_count, 'cutoff_date': cutoff_date}
@@ -493,3 +807,34 @@ class ActivityService:
         except Exception as e:
             self.logger.error(f"Error deleting old activities: {str(e)}", exc_info=True)
             return False, 0, f"Error deleting old activities: {str(e)}"
+
+
+class ActivityRecord(dict):
+    """
+    Activity dictionary whose metadata JSON is decoded on first access.
+
+    Timelines show many more rows than they ever expand, so the metadata
+    column is kept as text until something reads activity['metadata'].
+    """
+
+    def __init__(self, metadata_json: Optional[str] = None, **fields):
+        super().__init__(**fields)
+        self._metadata_json = metadata_json
+
+    def _decode_metadata(self):
+        metadata = json.loads(self._metadata_json) if self._metadata_json else None
+        dict.__setitem__(self, 'metadata', metadata)
+        return metadata
+
+    def __missing__(self, key):
+        if key == 'metadata':
+            return self._decode_metadata()
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if key == 'metadata' and not dict.__contains__(self, key):
+            return self._decode_metadata()
+        return super().get(key, default)
+
+    def __contains__(self, key):
+        return key == 'metadata' or super().__contains__(key)
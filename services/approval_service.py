@@ -3,13 +3,25 @@ Approval & Notification Service
 Handles report approval workflow and user notifications.
 """
 
+import json
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple
 
+from utils.tracing import trace_service
 
+
+@trace_service
 class ApprovalService:
     """Service for managing report approvals and notifications."""
 
+    # One row per active admin from a single statement
+    ADMIN_FAN_OUT_QUERY = """
+        INSERT INTO notifications (user_id, title, message, notification_type, related_report_id)
+        SELECT user_id, ?, ?, ?, ?
+        FROM users
+        WHERE role = 'admin' AND is_active = 1
+    """
+
     def __init__(self, db_manager, logging_service, auth_service, version_service, report_service, activity_service=None):
         """
         Initialize the approval service.
@@ -83,30 +95,21 @@ class ApprovalService:
                 (current_user['username'], datetime.now().isoformat(), report_id)
             )
 
-            # Create approval request
-            insert_query = """
-                INSERT INTO report_approvals (report_id, version_id, approval_status, requested_by, approval_comment)
-                VALUES (?, ?, 'pending', ?, ?)
-            """
-            self.db_manager.execute_with_retry(
-                insert_query,
-                (report_id, version_id, current_user['username'], comment)
-            )
-
-            # Get approval_id
-            result = self.db_manager.execute_with_retry("SELECT last_insert_rowid()")
-            approval_id = result[0][0] if result else None
+            # Create approval request (lastrowid is only valid on the inserting connection)
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO report_approvals (report_id, version_id, approval_status, requested_by, approval_comment)
+                    VALUES (?, ?, 'pending', ?, ?)
+                """, (report_id, version_id, current_user['username'], comment))
+                approval_id = cursor.lastrowid
 
             # Notify all admins
-            admins = self.get_admin_users()
-            for admin in admins:
-                self.create_notification(
-                    admin['user_id'],
-                    "New Approval Request",
-                    f"Report #{report.get('report_number', report_id)} has been submitted for approval by {current_user['username']}",
-                    "approval_request",
-                    report_id
-                )
+            self.notify_admins(
+                "New Approval Request",
+                f"Report #{report.get('report_number', report_id)} has been submitted for approval by {current_user['username']}",
+                "approval_request",
+                report_id
+            )
 
             self.logger.log_user_action(
                 "APPROVAL_REQUESTED",
@@ -327,12 +330,533 @@ class ApprovalService:
             self.logger.error(f"Error rejecting report: {str(e)}", exc_info=True)
             return False, f"Error rejecting report: {str(e)}"
 
-    def get_pending_approvals(self, approver_id: Optional[int] = None) -> List[Dict]:
+    # ==================== Bulk Approval Methods ====================
+
+    # Largest IN (...) list per query, well below SQLite's variable limit
+    BULK_ID_CHUNK = 500
+
+    def _select_in_chunks(self, cursor, query: str, ids: List[int]) -> List[Dict]:
+        """
+        Run a query with an IN ({ids}) placeholder over an id list in chunks.
+
+        Args:
+            cursor: Cursor inside the bulk transaction
+            query: Query containing '{ids}' where the placeholders go
+            ids: Ids to bind
+
+        Returns:
+            List of row dictionaries
+        """
+        rows = []
+        for start in range(0, len(ids), self.BULK_ID_CHUNK):
+            chunk = ids[start:start + self.BULK_ID_CHUNK]
+            cursor.execute(query.format(ids=', '.join(['?'] * len(chunk))), chunk)
+            rows.extend(dict(row) for row in cursor.fetchall())
+        return rows
+
+    def bulk_request_approval(self, report_ids: Optional[List[int]] = None,
+                              filters: Optional[Dict] = None,
+                              comment: str = "") -> Tuple[bool, str, List[Dict]]:
+        """
+        Submit many reports for approval in one transaction.
+
+        Reports are selected by id list or by filter. Filters take the
+        ReportService list filters (status, search_term, date_from, date_to,
+        created_by) plus approval_status; without approval_status every
+        report that is not pending or approved is selected.
+
+        Args:
+            report_ids: Report IDs to submit
+            filters: Report filters, used when report_ids is None
+            comment: Optional comment for the approval requests
+
+        Returns:
+            Tuple of (success, message, results) where results holds one
+            {'report_id', 'approval_id', 'success', 'message'} per report,
+            in report_ids order when ids are given
+        """
+        try:
+            current_user = self.auth_service.get_current_user()
+            if not current_user:
+                return False, "User not authenticated", []
+
+            username = current_user['username']
+            now = datetime.now().isoformat()
+            results = []
+
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.cursor()
+
+                if report_ids is not None:
+                    report_ids = list(dict.fromkeys(report_ids))
+                    found = {
+                        report['report_id']: report for report in self._select_in_chunks(
+                            cursor,
+                            "SELECT * FROM reports WHERE report_id IN ({ids}) AND is_deleted = 0",
+                            report_ids
+                        )
+                    }
+                    reports = []
+                    for report_id in report_ids:
+                        if report_id in found:
+                            reports.append(found[report_id])
+                        else:
+                            results.append({'report_id': report_id, 'approval_id': None,
+                                            'success': False, 'message': "Report not found"})
+                else:
+                    where_clause, params = self._build_submission_filters(filters)
+                    cursor.execute(
+                        f"SELECT * FROM reports WHERE {where_clause} ORDER BY report_id", params
+                    )
+                    reports = [dict(row) for row in cursor.fetchall()]
+
+                eligible = []
+                for report in reports:
+                    status = report.get('approval_status') or 'draft'
+                    if status == 'pending_approval':
+                        message = "Report is already pending approval"
+                    elif status == 'approved':
+                        message = "Report is already approved"
+                    else:
+                        eligible.append(report)
+                        continue
+                    if report_ids is not None:
+                        results.append({'report_id': report['report_id'], 'approval_id': None,
+                                        'success': False, 'message': message})
+
+                activity_rows = []
+                for report in eligible:
+                    report_id = report['report_id']
+                    version_number = (report.get('current_version') or 1) + 1
+
+                    # Version snapshot of the submitted state (as create_version_snapshot)
+                    cursor.execute("""
+                        INSERT INTO report_versions (report_id, version_number, snapshot_data, change_summary, created_by)
+                        VALUES (?, ?, ?, 'Submitted for approval', ?)
+                    """, (report_id, version_number, json.dumps(report, default=str), username))
+                    version_id = cursor.lastrowid
+
+                    cursor.execute("""
+                        INSERT INTO report_approvals (report_id, version_id, approval_status, requested_by, approval_comment)
+                        VALUES (?, ?, 'pending', ?, ?)
+                    """, (report_id, version_id, username, comment))
+                    approval_id = cursor.lastrowid
+
+                    report_number = report.get('report_number') or str(report_id)
+                    report.update(version_id=version_id, version_number=version_number)
+                    results.append({'report_id': report_id, 'approval_id': approval_id,
+                                    'success': True, 'message': "Submitted for approval"})
+                    activity_rows.append((
+                        current_user.get('user_id'), username, 'VERSION_CREATE', report_id, report_number,
+                        version_id, version_number,
+                        f"{username} created version {version_number} of Report #{report_number}",
+                        json.dumps({'change_summary': 'Submitted for approval',
+                                    'entity_name': report.get('reported_entity_name', '')})
+                    ))
+
+                cursor.executemany("""
+                    UPDATE reports
+                    SET approval_status = 'pending_approval', current_version = ?, updated_by = ?, updated_at = ?
+                    WHERE report_id = ?
+                """, [(report['version_number'], username, now, report['report_id']) for report in eligible])
+
+                # Notify all admins about every submitted report, fanned out in SQL
+                cursor.executemany(self.ADMIN_FAN_OUT_QUERY, [
+                    ("New Approval Request",
+                     f"Report #{report.get('report_number', report['report_id'])} has been submitted "
+                     f"for approval by {username}",
+                     'approval_request',
+                     report['report_id'])
+                    for report in eligible
+                ])
+
+                if self.activity_service:
+                    cursor.executemany("""
+                        INSERT INTO activity_log
+                        (user_id, username, action_type, report_id, report_number,
+                         version_id, version_number, description, metadata)
+                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """, activity_rows)
+
+            if report_ids is not None:
+                # Failures were collected first; hand results back in input order
+                position = {report_id: index for index, report_id in enumerate(report_ids)}
+                results.sort(key=lambda result: position[result['report_id']])
+
+            self.logger.log_user_action(
+                "BULK_APPROVAL_REQUESTED",
+                {'submitted': len(eligible), 'failed': len(results) - len(eligible)}
+            )
+
+            return True, f"Submitted {len(eligible)} report(s) for approval", results
+
+        except Exception as e:
+            self.logger.error(f"Error requesting bulk approval: {str(e)}", exc_info=True)
+            return False, f"Error requesting bulk approval: {str(e)}", []
+
+    def _build_submission_filters(self, filters: Optional[Dict]) -> Tuple[str, List]:
+        """
+        Build the WHERE clause selecting reports for a filtered bulk submit.
+
+        Args:
+            filters: ReportService list filters plus optional approval_status
+
+        Returns:
+            Tuple of (where_clause, params)
+        """
+        filters = dict(filters or {})
+        approval_status = filters.pop('approval_status', None)
+        where_clause, params = self.report_service._build_report_filters(**filters)
+        if approval_status:
+            where_clause += " AND COALESCE(approval_status, 'draft') = ?"
+            params.append(approval_status)
+        else:
+            where_clause += " AND COALESCE(approval_status, 'draft') NOT IN ('pending_approval', 'approved')"
+        return where_clause, params
+
+    def count_submittable_reports(self, filters: Optional[Dict] = None) -> int:
+        """
+        Count the reports a filtered bulk_request_approval would select.
+
+        Args:
+            filters: Same filters as bulk_request_approval
+
+        Returns:
+            Number of matching reports
+        """
+        try:
+            where_clause, params = self._build_submission_filters(filters)
+            result = self.db_manager.execute_with_retry(
+                f"SELECT COUNT(*) FROM reports WHERE {where_clause}", tuple(params)
+            )
+            return result[0][0] if result else 0
+
+        except Exception as e:
+            self.logger.error(f"Error counting submittable reports: {str(e)}", exc_info=True)
+            return 0
+
+    def bulk_approve(self, approval_ids: Optional[List[int]] = None,
+                     filters: Optional[Dict] = None,
+                     comment: str = "") -> Tuple[bool, str, List[Dict]]:
+        """
+        Approve many pending approval requests in one transaction (admin only).
+
+        Args:
+            approval_ids: Approval request IDs
+            filters: Pending request filters (requested_by, date_from, date_to, search),
+                used when approval_ids is None
+            comment: Optional approval comment
+
+        Returns:
+            Tuple of (success, message, results) where results holds one
+            {'approval_id', 'report_id', 'success', 'message'} per request,
+            in approval_ids order when ids are given
+        """
+        return self._bulk_review('approved', approval_ids, filters, comment)
+
+    def bulk_reject(self, approval_ids: Optional[List[int]] = None,
+                    filters: Optional[Dict] = None,
+                    comment: str = "",
+                    request_rework: bool = False) -> Tuple[bool, str, List[Dict]]:
+        """
+        Reject many pending approval requests or request rework (admin only).
+
+        Args:
+            approval_ids: Approval request IDs
+            filters: Pending request filters (requested_by, date_from, date_to, search),
+                used when approval_ids is None
+            comment: Rejection/rework comment
+            request_rework: If True, set status to 'rework', otherwise 'rejected'
+
+        Returns:
+            Tuple of (success, message, results) where results holds one
+            {'approval_id', 'report_id', 'success', 'message'} per request,
+            in approval_ids order when ids are given
+        """
+        return self._bulk_review('rework' if request_rework else 'rejected', approval_ids, filters, comment)
+
+    def _bulk_review(self, new_status: str, approval_ids: Optional[List[int]],
+                     filters: Optional[Dict], comment: str) -> Tuple[bool, str, List[Dict]]:
+        """Apply one review decision to many approval requests in one transaction."""
+        try:
+            current_user = self.auth_service.get_current_user()
+            if not current_user:
+                return False, "User not authenticated", []
+
+            if current_user.get('role') != 'admin':
+                verb = "approve" if new_status == 'approved' else "reject"
+                return False, f"Only administrators can {verb} reports", []
+
+            username = current_user['username']
+            now = datetime.now().isoformat()
+            results = []
+
+            select_query = """
+                SELECT ra.approval_id, ra.report_id, ra.approval_status, ra.requested_by,
+                       r.report_number, u.user_id AS requester_id
+                FROM report_approvals ra
+                LEFT JOIN reports r ON ra.report_id = r.report_id
+                LEFT JOIN users u ON ra.requested_by = u.username
+            """
+
+            with self.db_manager.get_connection() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                cursor = conn.cursor()
+
+                if approval_ids is not None:
+                    approval_ids = list(dict.fromkeys(approval_ids))
+                    found = {
+                        row['approval_id']: row for row in self._select_in_chunks(
+                            cursor, select_query + " WHERE ra.approval_id IN ({ids})", approval_ids
+                        )
+                    }
+                    approvals = []
+                    for approval_id in approval_ids:
+                        approval = found.get(approval_id)
+                        if approval is None:
+                            results.append({'approval_id': approval_id, 'report_id': None,
+                                            'success': False, 'message': "Approval request not found"})
+                        elif approval['approval_status'] != 'pending':
+                            results.append({'approval_id': approval_id, 'report_id': approval['report_id'],
+                                            'success': False,
+                                            'message': f"Approval request is already {approval['approval_status']}"})
+                        else:
+                            approvals.append(approval)
+                else:
+                    conditions, params = self._build_approval_filters(dict(filters or {}, status='pending'))
+                    cursor.execute(
+                        select_query + f" WHERE {' AND '.join(conditions)} ORDER BY ra.approval_id", params
+                    )
+                    approvals = [dict(row) for row in cursor.fetchall()]
+
+                cursor.executemany("""
+                    UPDATE report_approvals
+                    SET approval_status = ?,
+                        approver_id = ?,
+                        approval_comment = ?,
+                        reviewed_at = ?
+                    WHERE approval_id = ?
+                """, [(new_status, current_user.get('user_id'), comment, now, approval['approval_id'])
+                      for approval in approvals])
+
+                cursor.executemany("""
+                    UPDATE reports
+                    SET approval_status = ?, updated_by = ?, updated_at = ?
+                    WHERE report_id = ?
+                """, [(new_status, username, now, approval['report_id']) for approval in approvals])
+
+                if new_status == 'approved':
+                    title = "Report Approved"
+                    notify_text = "has been approved"
+                    action_type, action_text = 'APPROVE', "approved"
+                else:
+                    title = "Report Needs Attention"
+                    notify_text = "requires rework" if new_status == 'rework' else "has been rejected"
+                    action_type = 'REJECT'
+                    action_text = "requested rework for" if new_status == 'rework' else "rejected"
+
+                cursor.executemany("""
+                    INSERT INTO notifications (user_id, title, message, notification_type, related_report_id)
+                    VALUES (?, ?, ?, 'approval_result', ?)
+                """, [
+                    (approval['requester_id'], title,
+                     f"Your report {notify_text} by {username}: {comment}", approval['report_id'])
+                    for approval in approvals if approval['requester_id'] is not None
+                ])
+
+                if self.activity_service:
+                    metadata = {'comment': comment}
+                    if new_status != 'approved':
+                        metadata['request_rework'] = new_status == 'rework'
+                    cursor.executemany("""
+                        INSERT INTO activity_log
+                        (user_id, username, action_type, report_id, report_number, description, metadata)
+                        VALUES (?, ?, ?, ?, ?, ?, ?)
+                    """, [
+                        (current_user.get('user_id'), username, action_type, approval['report_id'],
+                         approval['report_number'] or str(approval['report_id']),
+                         f"{username} {action_text} Report #{approval['report_number'] or approval['report_id']}",
+                         json.dumps(dict(metadata, requested_by=approval['requested_by'])))
+                        for approval in approvals
+                    ])
+
+            status_text = "marked for rework" if new_status == 'rework' else new_status
+            for approval in approvals:
+                results.append({'approval_id': approval['approval_id'], 'report_id': approval['report_id'],
+                                'success': True, 'message': f"Report {status_text}"})
+
+            if approval_ids is not None:
+                # Failures were collected first; hand results back in input order
+                position = {approval_id: index for index, approval_id in enumerate(approval_ids)}
+                results.sort(key=lambda result: position[result['approval_id']])
+
+            self.logger.log_user_action(
+                "REPORTS_BULK_APPROVED" if new_status == 'approved' else "REPORTS_BULK_REJECTED",
+                {'status': new_status, 'processed': len(approvals),
+                 'failed': len(results) - len(approvals), 'comment': comment}
+            )
+
+            return True, f"{len(approvals)} report(s) {status_text}", results
+
+        except Exception as e:
+            self.logger.error(f"Error processing bulk approval decision: {str(e)}", exc_info=True)
+            return False, f"Error processing bulk approval decision: {str(e)}", []
+
+    def _build_approval_filters(self, filters: Optional[Dict]) -> Tuple[List[str], List]:
+        """
+        Build WHERE conditions for approval queue queries.
+
+        Date bounds compare requested_at directly so the
+        (approval_status, requested_at) index can serve them.
+
+        Args:
+            filters: Optional dictionary with status, requested_by,
+                date_from, date_to (YYYY-MM-DD, inclusive) and search
+
+        Returns:
+            Tuple of (conditions, parameters)
+        """
+        conditions = []
+        params = []
+        filters = filters or {}
+
+        if filters.get('status'):
+            conditions.append("ra.approval_status = ?")
+            params.append(filters['status'])
+
+        if filters.get('requested_by'):
+            conditions.append("ra.requested_by = ?")
+            params.append(filters['requested_by'])
+
+        if filters.get('date_from'):
+            conditions.append("ra.requested_at >= DATE(?)")
+            params.append(filters['date_from'])
+
+        if filters.get('date_to'):
+            conditions.append("ra.requested_at < DATE(?, '+1 day')")
+            params.append(filters['date_to'])
+
+        if filters.get('search'):
+            conditions.append("""ra.report_id IN (
+                    SELECT report_id FROM reports
+                    WHERE report_number LIKE ? OR reported_entity_name LIKE ? OR cic LIKE ?
+                )""")
+            search_pattern = f"%{filters['search']}%"
+            params.extend([search_pattern, search_pattern, search_pattern])
+
+        return conditions, params
+
+    def query_approvals(self, filters: Optional[Dict] = None,
+                        cursor: Optional[Tuple[str, int]] = None,
+                        limit: int = 100) -> Tuple[List[Dict], Optional[Tuple[str, int]]]:
+        """
+        Get one page of the approval queue, newest request first (admin only).
+
+        Pages are keyed on (requested_at, approval_id) instead of OFFSET, so
+        every page costs the same however deep the backlog is.
+
+        Args:
+            filters: Optional filters (status, requested_by, date_from, date_to, search)
+            cursor: Cursor returned with the previous page, None for the first page
+            limit: Maximum number of requests per page
+
+        Returns:
+            Tuple of (approval dictionaries, cursor of the next page or None
+            when this is the last page)
+        """
+        try:
+            current_user = self.auth_service.get_current_user()
+            if not current_user or current_user.get('role') != 'admin':
+                return [], None
+
+            conditions, params = self._build_approval_filters(filters)
+            if cursor is not None:
+                conditions.append("(ra.requested_at, ra.approval_id) < (?, ?)")
+                params.extend(cursor)
+
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            query = f"""
+                SELECT
+                    ra.approval_id,
+                    ra.report_id,
+                    r.report_number,
+                    r.reported_entity_name,
+                    ra.approval_status,
+                    ra.requested_by,
+                    ra.requested_at,
+                    ra.reviewed_at,
+                    ra.approval_comment,
+                    u.username as approver_name,
+                    u.full_name as approver_full_name,
+                    r.approval_status as report_status
+                FROM report_approvals ra
+                JOIN reports r ON ra.report_id = r.report_id
+                LEFT JOIN users u ON ra.approver_id = u.user_id
+                {where_clause}
+                ORDER BY ra.requested_at DESC, ra.approval_id DESC
+                LIMIT ?
+            """
+            params.append(limit + 1)
+            result = self.db_manager.execute_with_retry(query, tuple(params))
+
+            approvals = [{
+                'approval_id': row[0],
+                'report_id': row[1],
+                'report_number': row[2],
+                'reported_entity_name': row[3],
+                'approval_status': row[4],
+                'requested_by': row[5],
+                'requested_at': row[6],
+                'reviewed_at': row[7],
+                'comment': row[8] or '',
+                'approver_name': row[9],
+                'approver_full_name': row[10],
+                'report_status': row[11]
+            } for row in result[:limit]]
+
+            next_cursor = None
+            if len(result) > limit:
+                last = approvals[-1]
+                next_cursor = (last['requested_at'], last['approval_id'])
+
+            return approvals, next_cursor
+
+        except Exception as e:
+            self.logger.error(f"Error querying approvals: {str(e)}", exc_info=True)
+            return [], None
+
+    def count_approvals(self, filters: Optional[Dict] = None) -> int:
+        """
+        Count approval requests matching the queue filters.
+
+        Args:
+            filters: Optional filters (status, requested_by, date_from, date_to, search)
+
+        Returns:
+            Number of matching approval requests
+        """
+        try:
+            conditions, params = self._build_approval_filters(filters)
+            where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            result = self.db_manager.execute_with_retry(
+                f"SELECT COUNT(*) FROM report_approvals ra {where_clause}", tuple(params)
+            )
+            return result[0][0] if result else 0
+
+        except Exception as e:
+            self.logger.error(f"Error counting approvals: {str(e)}", exc_info=True)
+            return 0
+
+    def get_pending_approvals(self, approver_id: Optional[int] = None,
+                              limit: Optional[int] = None) -> List[Dict]:
         """
         Get list of pending approval requests.
 
         Args:
             approver_id: Optional filter by approver (admin) ID
+            limit: Optional maximum number of requests (newest first);
+                use query_approvals for paging
 
         Returns:
             List of pending approval dictionaries with report details
@@ -347,13 +871,17 @@ class ApprovalService:
                     ra.requested_by,
                     ra.requested_at,
                     ra.approval_comment,
-                    r.status
+                    r.approval_status
                 FROM report_approvals ra
                 JOIN reports r ON ra.report_id = r.report_id
                 WHERE ra.approval_status = 'pending'
-                ORDER BY ra.requested_at DESC
+                ORDER BY ra.requested_at DESC, ra.approval_id DESC
             """
-            result = self.db_manager.execute_with_retry(query)
+            params = ()
+            if limit is not None:
+                query += " LIMIT ?"
+                params = (limit,)
+            result = self.db_manager.execute_with_retry(query, params)
 
             approvals = []
             for row in result:
@@ -487,7 +1015,7 @@ class ApprovalService:
                     ra.approval_comment,
                     u.username as approver_name,
                     u.full_name as approver_full_name,
-                    r.status as report_status
+                    r.approval_status as report_status
                 FROM report_approvals ra
                 JOIN reports r ON ra.report_id = r.report_id
                 LEFT JOIN users u ON ra.approver_id = u.user_id
@@ -523,6 +1051,32 @@ class ApprovalService:
 
     # ==================== Notification Methods ====================
 
+    def notify_admins(self, title: str, message: str, notification_type: str = "info",
+                      related_report_id: Optional[int] = None) -> int:
+        """
+        Create the same notification for every active admin in one statement.
+
+        Args:
+            title: Notification title
+            message: Notification message
+            notification_type: Type (info, warning, approval_request, approval_result)
+            related_report_id: Optional related report ID
+
+        Returns:
+            Number of notifications created
+        """
+        try:
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.execute(
+                    self.ADMIN_FAN_OUT_QUERY,
+                    (title, message, notification_type, related_report_id)
+                )
+                return cursor.rowcount
+
+        except Exception as e:
+            self.logger.error(f"Error notifying admins: {str(e)}", exc_info=True)
+            return 0
+
     def create_notification(self, user_id: int, title: str, message: str,
                           notification_type: str = "info", related_report_id: Optional[int] = None) -> Tuple[bool, Optional[int]]:
         """
@@ -539,17 +1093,12 @@ class ApprovalService:
             Tuple of (success, notification_id)
         """
         try:
-            query = """
-                INSERT INTO notifications (user_id, title, message, notification_type, related_report_id)
-                VALUES (?, ?, ?, ?, ?)
-            """
-            self.db_manager.execute_with_retry(
-                query,
-                (user_id, title, message, notification_type, related_report_id)
-            )
-
-            result = self.db_manager.execute_with_retry("SELECT last_insert_rowid()")
-            notification_id = result[0][0] if result else None
+            with self.db_manager.get_connection() as conn:
+                cursor = conn.execute("""
+                    INSERT INTO notifications (user_id, title, message, notification_type, related_report_id)
+                    VALUES (?, ?, ?, ?, ?)
+                """, (user_id, title, message, notification_type, related_report_id))
+                notification_id = cursor.lastrowid
 
             return True, notification_id
 
@@ -620,7 +1169,7 @@ class ApprovalService:
             Tuple of (success, message)
         """
         try:
-            query = "UPDATE notifications SET is_read = 1 WHERE notification_id = ?"
+            query = "UPDATE notifications SET is_read = 1 WHERE notification_id = ? AND is_read = 0"
             self.db_manager.execute_with_retry(query, (notification_id,))
             return True, "Notification marked as read"
 
@@ -628,10 +1177,39 @@ class ApprovalService:
             self.logger.error(f"Error marking notification as read: {str(e)}", exc_info=True)
             return False, f"Error: {str(e)}"
 
+    def mark_all_notifications_read(self, user_id: Optional[int] = None) -> Tuple[bool, str]:
+        """
+        Mark every unread notification of a user as read in one statement.
+
+        Args:
+            user_id: User ID (None for current user)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            current_user = self.auth_service.get_current_user()
+            if not current_user:
+                return False, "User not authenticated"
+
+            target_user_id = user_id or current_user.get('user_id')
+            self.db_manager.execute_with_retry(
+                "UPDATE notifications SET is_read = 1 WHERE user_id = ? AND is_read = 0",
+                (target_user_id,)
+            )
+            return True, "Notifications marked as read"
+
+        except Exception as e:
+            self.logger.error(f"Error marking notifications as read: {str(e)}", exc_info=True)
+            return False, f"Error: {str(e)}"
+
     def get_unread_notification_count(self, user_id: Optional[int] = None) -> int:
         """
         Get count of unread notifications for a user.
 
+        Reads the trigger-maintained counter row instead of counting
+        notifications.
+
         Args:
             user_id: User ID (None for current user)
 
@@ -647,7 +1225,7 @@ class ApprovalService:
             if not target_user_id:
                 return 0
 
-            query = "SELECT COUNT(*) FROM notifications WHERE user_id = ? AND is_read = 0"
+            query = "SELECT unread_count FROM notification_counters WHERE user_id = ?"
             result = self.db_manager.execute_with_retry(query, (target_user_id,))
             return result[0][0] if result else 0
 
@@ -0,0 +1,515 @@
+"""
+Archive Service
+Moves old system_logs and activity_log rows into monthly archive databases
+and reads them back for the log and activity viewers.
+
+Archives live next to the main database (archive/<name>_YYYY_MM.db) and are
+ATTACHed only while rows are moved or read, so the hot database stays small
+and its lock is only ever held for one short batch at a time.
+
+BackupService stores every archive database with each backup and puts them
+back when a backup is restored from the store.
+"""
+
+import re
+from contextlib import contextmanager
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from utils.tracing import trace_service
+
+
+# Archived tables: table -> (key column, timestamp column)
+ARCHIVED_TABLES = {
+    'system_logs': ('log_id', 'timestamp'),
+    'activity_log': ('activity_id', 'created_at'),
+}
+
+
+@trace_service
+class ArchiveService:
+    """
+    Service for time-partitioned archival of logs and activity.
+
+    Features:
+    - One archive database per month, holding that month's archived rows
+    - Rows are moved in small batches (one short write transaction each)
+    - Reads walk the live table, then archives newest first, until the
+      requested number of rows is found
+    - Incremental vacuum returns freed pages to the filesystem
+    """
+
+    ALIAS = 'archive'
+    PARTITION_PATTERN = re.compile(r'_(\d{4})_(\d{2})\.db$')
+
+    DEFAULT_SETTINGS = {
+        'log_archive_enabled': '1',
+        'log_archive_after_days': '90',
+        'log_archive_batch_size': '1000',
+        'log_archive_vacuum_pages': '5000',
+    }
+
+    def __init__(self, db_manager, logging_service, archive_dir: Optional[str] = None):
+        """
+        Initialize the archive service.
+
+        Args:
+            db_manager: DatabaseManager instance
+            logging_service: LoggingService instance
+            archive_dir: Directory for archive databases (defaults to
+                         an 'archive' folder next to the database)
+        """
+        self.db_manager = db_manager
+        self.logger = logging_service
+
+        db_path = Path(db_manager.db_path)
+        self.archive_dir = Path(archive_dir) if archive_dir else db_path.parent / 'archive'
+        self.archive_prefix = db_path.stem
+
+    # ==================== Settings & Partitions ====================
+
+    def get_settings(self) -> Dict[str, str]:
+        """
+        Read archive settings from system_settings, falling back to defaults.
+
+        Returns:
+            Dictionary of setting_key -> setting_value
+        """
+        settings = dict(self.DEFAULT_SETTINGS)
+        try:
+            placeholders = ','.join('?' * len(settings))
+            query = f"""
+                SELECT setting_key, setting_value FROM system_settings
+                WHERE setting_key IN ({placeholders})
+            """
+            for row in self.db_manager.execute_with_retry(query, tuple(settings.keys())):
+                if row[1] is not None and str(row[1]).strip():
+                    settings[row[0]] = str(row[1]).strip()
+        except Exception as e:
+            self.logger.warning(f"Using default archive settings: {str(e)}")
+        return settings
+
+    def archive_path(self, month: str) -> Path:
+        """
+        Path of the archive database for a month.
+
+        Args:
+            month: Month as 'YYYY-MM'
+
+        Returns:
+            Archive database path
+        """
+        return self.archive_dir / f"{self.archive_prefix}_{month.replace('-', '_')}.db"
+
+    def list_partitions(self) -> List[str]:
+        """
+        List archived months, newest first.
+
+        Returns:
+            Months as 'YYYY-MM'
+        """
+        if not self.archive_dir.exists():
+            return []
+        months = []
+        for path in self.archive_dir.glob(f"{self.archive_prefix}_*.db"):
+            match = self.PARTITION_PATTERN.search(path.name)
+            if match:
+                months.append(f"{match.group(1)}-{match.group(2)}")
+        return sorted(months, reverse=True)
+
+    def partitions_in_range(self, date_from: Optional[str], date_to: Optional[str]) -> List[str]:
+        """Archived months overlapping a date range, newest first."""
+        return [
+            month for month in self.list_partitions()
+            if (not date_from or month >= date_from[:7]) and (not date_to or month <= date_to[:7])
+        ]
+
+    @contextmanager
+    def _attached(self, month: str):
+        """
+        Connection with a month's archive ATTACHed as 'archive'.
+
+        Args:
+            month: Month as 'YYYY-MM'; the archive file is created if missing
+
+        Yields:
+            sqlite3.Connection
+        """
+        self.archive_dir.mkdir(parents=True, exist_ok=True)
+        with self.db_manager.get_connection() as conn:
+            conn.execute(f"ATTACH DATABASE ? AS {self.ALIAS}", (str(self.archive_path(month)),))
+            try:
+                yield conn
+                if conn.in_transaction:
+                    conn.commit()
+            except BaseException:
+                if conn.in_transaction:
+                    conn.rollback()
+                raise
+            finally:
+                conn.execute(f"DETACH DATABASE {self.ALIAS}")
+
+    def _ensure_archive_table(self, conn, table: str) -> List[str]:
+        """
+        Create or extend the archive copy of a table to match the live one.
+
+        Archive tables keep the primary key, so re-running an interrupted
+        batch cannot duplicate rows, but carry no foreign keys.
+
+        Returns:
+            Column names shared by the live and archive tables
+        """
+        key_column, time_column = ARCHIVED_TABLES[table]
+        columns = [(row[1], row[2]) for row in conn.execute(f"PRAGMA main.table_info({table})")]
+        existing = {row[1] for row in conn.execute(f"PRAGMA {self.ALIAS}.table_info({table})")}
+
+        if not existing:
+            definitions = ', '.join(
+                f"{name} INTEGER PRIMARY KEY" if name == key_column else f"{name} {col_type}"
+                for name, col_type in columns
+            )
+            conn.execute(f"CREATE TABLE {self.ALIAS}.{table} ({definitions})")
+            conn.execute(
+                f"CREATE INDEX {self.ALIAS}.idx_{table}_{time_column} ON {table}({time_column}, {key_column})"
+            )
+        else:
+            for name, col_type in columns:
+                if name not in existing:
+                    conn.execute(f"ALTER TABLE {self.ALIAS}.{table} ADD COLUMN {name} {col_type}")
+
+        return [name for name, _ in columns]
+
+    # ==================== Archival ====================
+
+    def archive_old_rows(self, older_than_days: Optional[int] = None,
+                         batch_size: Optional[int] = None,
+                         progress_callback: Optional[Callable[[str, int], None]] = None
+                         ) -> Tuple[bool, Dict[str, int], str]:
+        """
+        Move rows older than the cutoff into their monthly archives.
+
+        Each batch is copied and deleted in one short transaction; other
+        clients can write between batches.
+
+        Args:
+            older_than_days: Archive rows older than this (defaults to the
+                             log_archive_after_days setting)
+            batch_size: Rows per transaction (defaults to log_archive_batch_size)
+            progress_callback: Called with (table, rows moved so far)
+
+        Returns:
+            Tuple of (success, rows moved per table, message)
+        """
+        settings = self.get_settings()
+        days = older_than_days if older_than_days is not None else int(settings['log_archive_after_days'])
+        batch_size = batch_size or int(settings['log_archive_batch_size'])
+        cutoff = (date.today() - timedelta(days=days)).isoformat()
+
+        moved = {table: 0 for table in ARCHIVED_TABLES}
+        try:
+            for table, (key_column, time_column) in ARCHIVED_TABLES.items():
+                months = [row[0] for row in self.db_manager.execute_with_retry(f"""
+                    SELECT DISTINCT substr({time_column}, 1, 7) FROM {table}
+                    WHERE {time_column} < ?
+                """, (cutoff,)) if row[0]]
+
+                for month in sorted(months):
+                    moved[table] += self._move_month(table, month, cutoff, batch_size,
+                                                     moved[table], progress_callback)
+
+            total = sum(moved.values())
+            message = f"Archived {total} rows older than {cutoff}"
+            if total:
+                self.logger.info(f"{message} ({', '.join(f'{t}: {n}' for t, n in moved.items())})")
+            return True, moved, message
+
+        except Exception as e:
+            self.logger.error(f"Error archiving old rows: {str(e)}", exc_info=True)
+            return False, moved, f"Archiving failed: {str(e)}"
+
+    def _move_month(self, table: str, month: str, cutoff: str, batch_size: int,
+                    already_moved: int, progress_callback: Optional[Callable[[str, int], None]]) -> int:
+        """Move one month of a table into its archive, batch by batch."""
+        key_column, time_column = ARCHIVED_TABLES[table]
+        year, month_number = int(month[:4]), int(month[5:7])
+        month_start = f"{month}-01"
+        month_end = f"{year + month_number // 12:04d}-{month_number % 12 + 1:02d}-01"
+        upper = min(month_end, cutoff)
+
+        moved = 0
+        with self._attached(month) as conn:
+            columns = ', '.join(self._ensure_archive_table(conn, table))
+            conn.commit()
+
+            while True:
+                conn.execute("BEGIN IMMEDIATE")
+                last_key = conn.execute(f"""
+                    SELECT MAX({key_column}) FROM (
+                        SELECT {key_column} FROM main.{table}
+                        WHERE {time_column} >= ? AND {time_column} < ?
+                        ORDER BY {key_column} LIMIT ?
+                    )
+                """, (month_start, upper, batch_size)).fetchone()[0]
+
+                if last_key is None:
+                    conn.commit()
+                    break
+
+                batch = (month_start, upper, last_key)
+                conn.execute(f"""
+                    INSERT OR IGNORE INTO {self.ALIAS}.{table} ({columns})
+                    SELECT {columns} FROM main.{table}
+                    WHERE {time_column} >= ? AND {time_column} < ? AND {key_column} <= ?
+                """, batch)
+                deleted = conn.execute(f"""
+                    DELETE FROM main.{table}
+                    WHERE {time_column} >= ? AND {time_column} < ? AND {key_column} <= ?
+                """, batch).rowcount
+                conn.commit()
+
+                moved += deleted
+                if progress_callback:
+                    progress_callback(table, already_moved + moved)
+
+        return moved
+
+    def delete_rows(self, table: str, before: Optional[str] = None,
+                    batch_size: Optional[int] = None) -> int:
+        """
+        Delete live and archived rows older than a date, in small batches.
+
+        Archives whose whole month is before the date are removed as files.
+
+        Args:
+            table: 'system_logs' or 'activity_log'
+            before: Delete rows before this date ('YYYY-MM-DD'); None deletes all
+            batch_size: Rows per transaction (defaults to log_archive_batch_size)
+
+        Returns:
+            Number of rows deleted
+        """
+        key_column, time_column = ARCHIVED_TABLES[table]
+        batch_size = batch_size or int(self.get_settings()['log_archive_batch_size'])
+        condition = f"{time_column} < ?" if before else "1=1"
+        params = (before,) if before else ()
+
+        deleted = self._delete_batched(table, 'main', condition, params, batch_size)
+
+        for month in self.list_partitions():
+            with self._attached(month) as conn:
+                tables = {row[0] for row in conn.execute(
+                    f"SELECT name FROM {self.ALIAS}.sqlite_master WHERE type='table'"
+                )}
+                if table not in tables:
+                    continue
+
+                if before and month >= before[:7]:
+                    # Month overlaps the cutoff; trim it in batches
+                    deleted += self._delete_batched(table, self.ALIAS, condition, params, batch_size, conn)
+                    continue
+
+                deleted += conn.execute(f"SELECT COUNT(*) FROM {self.ALIAS}.{table}").fetchone()[0]
+                conn.execute(f"DROP TABLE {self.ALIAS}.{table}")
+                conn.commit()
+
+            if not tables - {table}:
+                try:
+                    self.archive_path(month).unlink()
+                except OSError as e:
+                    self.logger.warning(f"Could not remove empty archive {month}: {str(e)}")
+
+        return deleted
+
+    def _delete_batched(self, table: str, schema: str, condition: str, params: tuple,
+                        batch_size: int, conn=None) -> int:
+        """Delete matching rows in batches of batch_size, one transaction each."""
+        key_column, _ = ARCHIVED_TABLES[table]
+        if schema != 'main' and conn is None:
+            raise ValueError("Archived rows must be deleted through an attached connection")
+
+        query = f"""
+            DELETE FROM {schema}.{table} WHERE {key_column} IN (
+                SELECT {key_column} FROM {schema}.{table}
+                WHERE {condition} LIMIT ?
+            )
+        """
+        deleted = 0
+        while True:
+            if conn is None:
+                with self.db_manager.get_connection() as batch_conn:
+                    count = batch_conn.execute(query, params + (batch_size,)).rowcount
+            else:
+                count = conn.execute(query, params + (batch_size,)).rowcount
+                conn.commit()
+            deleted += count
+            if count < batch_size:
+                return deleted
+
+    # ==================== Space Reclamation ====================
+
+    def reclaim_space(self, max_pages: Optional[int] = None) -> Tuple[bool, str]:
+        """
+        Return free pages of the main database to the filesystem.
+
+        Databases created before incremental vacuum was enabled are switched
+        over with a one-time full VACUUM; after that each call frees at most
+        max_pages pages, which keeps the write lock short.
+
+        Args:
+            max_pages: Pages to free (defaults to log_archive_vacuum_pages)
+
+        Returns:
+            Tuple of (success, message)
+        """
+        max_pages = max_pages or int(self.get_settings()['log_archive_vacuum_pages'])
+        try:
+            with self.db_manager.get_connection() as conn:
+                mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+                free_pages = conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+                if mode != 2:
+                    conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+                    conn.execute("VACUUM")
+                    message = f"Enabled incremental vacuum ({free_pages} free pages reclaimed)"
+                else:
+                    if not free_pages:
+                        return True, "No free pages to reclaim"
+                    # execute() steps the pragma only once (one page);
+                    # executescript() runs it to completion
+                    conn.executescript(f"PRAGMA incremental_vacuum({int(max_pages)});")
+                    remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                    message = (f"Reclaimed {free_pages - remaining} of {free_pages} free pages "
+                               f"({remaining} remaining)")
+
+            self.logger.info(message)
+            return True, message
+
+        except Exception as e:
+            self.logger.error(f"Error reclaiming database space: {str(e)}", exc_info=True)
+            return False, f"Space reclamation failed: {str(e)}"
+
+    def run_maintenance(self) -> Tuple[bool, str]:
+        """
+        Archive old rows and reclaim the space they used.
+
+        Called by the backup scheduler after the nightly backup.
+
+        Returns:
+            Tuple of (success, message)
+        """
+        if self.get_settings()['log_archive_enabled'] != '1':
+            return True, "Log archiving is disabled"
+
+        success, moved, message = self.archive_old_rows()
+        if not success:
+            return False, message
+        if sum(moved.values()):
+            vacuum_success, vacuum_message = self.reclaim_space()
+            message = f"{message}; {vacuum_message}"
+            success = vacuum_success
+        return success, message
+
+    # ==================== Cross-partition Reads ====================
+
+    def read_partition(self, table: str, month: Optional[str], query: str,
+                       params: List[Any]) -> List[Any]:
+        """
+        Run a query against one partition on its own short-lived connection.
+
+        Args:
+            table: 'system_logs' or 'activity_log'
+            month: Archived month ('YYYY-MM'), or None for the live table
+            query: SELECT with a {table} placeholder
+            params: Query parameters
+
+        Returns:
+            List of sqlite3.Row (empty when the archive does not hold the table)
+        """
+        if month is None:
+            return self.db_manager.execute_with_retry(query.format(table=table), list(params))
+        with self._attached(month) as conn:
+            has_table = conn.execute(
+                f"SELECT 1 FROM {self.ALIAS}.sqlite_master WHERE type='table' AND name=?", (table,)
+            ).fetchone()
+            if not has_table:
+                return []
+            return conn.execute(query.format(table=f"{self.ALIAS}.{table}"), list(params)).fetchall()
+
+    def iter_partitions(self, table: str, date_from: Optional[str] = None,
+                        date_to: Optional[str] = None) -> Iterator[Tuple[Any, str]]:
+        """
+        Yield connections for the live table, then each archive newest first.
+
+        Only archives overlapping the date range are attached.
+
+        Args:
+            table: 'system_logs' or 'activity_log'
+            date_from: Optional start date ('YYYY-MM-DD...')
+            date_to: Optional end date ('YYYY-MM-DD...')
+
+        Yields:
+            Tuple of (connection, qualified table name)
+        """
+        with self.db_manager.get_connection() as conn:
+            yield conn, f"main.{table}"
+
+        for month in self.partitions_in_range(date_from, date_to):
+            with self._attached(month) as conn:
+                has_table = conn.execute(
+                    f"SELECT 1 FROM {self.ALIAS}.sqlite_master WHERE type='table' AND name=?", (table,)
+                ).fetchone()
+                if has_table:
+                    yield conn, f"{self.ALIAS}.{table}"
+
+    def select_across(self, table: str, query: str, params: List[Any], limit: int,
+                      date_from: Optional[str] = None, date_to: Optional[str] = None) -> List[Any]:
+        """
+        Run a newest-first query over live and archived rows.
+
+        The query names its source as {table} and ends with 'LIMIT ?'; it
+        runs per partition until limit rows are found. Partitions hold
+        disjoint, successively older time ranges, so concatenating the
+        per-partition results keeps the query's order.
+
+        Args:
+            table: 'system_logs' or 'activity_log'
+            query: SELECT with a {table} placeholder, ordered newest first
+            params: Query parameters, excluding the limit
+            limit: Maximum number of rows
+            date_from: Optional start date, used to skip older archives
+            date_to: Optional end date, used to skip newer archives
+
+        Returns:
+            List of sqlite3.Row
+        """
+        rows = []
+        partitions = self.iter_partitions(table, date_from, date_to)
+        try:
+            for conn, source in partitions:
+                rows.extend(conn.execute(query.format(table=source), list(params) + [limit - len(rows)]).fetchall())
+                if len(rows) >= limit:
+                    break
+        finally:
+            partitions.close()
+        return rows
+
+    def count_across(self, table: str, conditions: str, params: List[Any],
+                     date_from: Optional[str] = None, date_to: Optional[str] = None) -> int:
+        """
+        Count matching rows over live and archived partitions.
+
+        Args:
+            table: 'system_logs' or 'activity_log'
+            conditions: WHERE clause body (or '1=1')
+            params: Condition parameters
+            date_from: Optional start date, used to skip older archives
+            date_to: Optional end date, used to skip newer archives
+
+        Returns:
+            Number of matching rows
+        """
+        total = 0
+        for conn, source in self.iter_partitions(table, date_from, date_to):
+            total += conn.execute(f"SELECT COUNT(*) FROM {source} WHERE {conditions}", list(params)).fetchone()[0]
+        return total
@@ -6,9 +6,11 @@ Handles user authentication, session management, and user CRUD operations.
 import bcrypt
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple
-from services.security_service import SecurityService
+from services.security_service import SecurityService, get_password_hasher
+from utils.tracing import trace_service
 
 
+@trace_service
 class AuthService:
     """Service for handling authentication and user management."""
 
@@ -24,6 +26,10 @@ class AuthService:
         self.logger = logging_service
         self.current_user = None
         self.current_session_id = None
+        self.password_hasher = get_password_hasher()
+
+        # Calibrate the bcrypt cost in the background so the first hash doesn't pay for it
+        self.password_hasher.warm_up()
 
     def authenticate(self, username: str, password: str) -> Tuple[bool, Optional[Dict], str]:
         """
@@ -67,23 +73,17 @@ class AuthService:
             password_valid = False
 
             if SecurityService.is_bcrypt_hash(db_password):
-                # Use bcrypt verification
-                password_valid = SecurityService.verify_password(password, db_password)
+                # Use bcrypt verification (runs in the hasher pool)
+                password_valid = self.password_hasher.verify_password(password, db_password)
             else:
                 # Legacy plain text password (backward compatibility)
                 password_valid = (password == db_password)
 
-                # Auto-migrate to bcrypt on successful login
+                # Auto-migrate to bcrypt on successful login, without making the login wait
                 if password_valid:
-                    try:
-                        hashed_password = SecurityService.hash_password(password)
-                        self.db_manager.execute_with_retry(
-                            "UPDATE users SET password = ? WHERE user_id = ?",
-                            (hashed_password, user_id)
-                        )
-                        self.logger.info(f"Auto-migrated password to bcrypt for user: {username}")
-                    except Exception as e:
-                        self.logger.error(f"Error auto-migrating password: {str(e)}")
+                    self.password_hasher.submit_hash(password).add_done_callback(
+                        lambda future: self._store_migrated_password(user_id, username, db_password, future)
+                    )
 
             if not password_valid:
                 # Increment failed attempts
@@ -139,6 +139,18 @@ class AuthService:
             self.logger.error(f"Error during authentication: {str(e)}", exc_info=True)
             return False, None, "An error occurred during login"
 
+    def _store_migrated_password(self, user_id: int, username: str, plain_password: str, future):
+        """Store a password hashed in the background after a legacy login."""
+        try:
+            # Skip if the password was changed while it was being hashed
+            self.db_manager.execute_with_retry(
+                "UPDATE users SET password = ? WHERE user_id = ? AND password = ?",
+                (future.result(), user_id, plain_password)
+            )
+            self.logger.info(f"Auto-migrated password to bcrypt for user: {username}")
+        except Exception as e:
+            self.logger.error(f"Error auto-migrating password: {str(e)}")
+
     def logout(self):
         """Logout the current user."""
         if self.current_user and self.current_session_id:
@@ -408,7 +420,7 @@ class AuthService:
 
             # Support both bcrypt and legacy plain text passwords
             if SecurityService.is_bcrypt_hash(db_password):
-                return SecurityService.verify_password(password, db_password)
+                return self.password_hasher.verify_password(password, db_password)
             else:
                 # Legacy plain text comparison
                 return password == db_password
@@ -430,7 +442,7 @@ class AuthService:
         """
         try:
             # Hash the new password with bcrypt
-            hashed_password = SecurityService.hash_password(new_password)
+            hashed_password = self.password_hasher.hash_password(new_password)
 
             query = "UPDATE users SET password = ?, updated_by = ?, updated_at = ? WHERE user_id = ?"
             self.db_manager.execute_with_retry(
@@ -0,0 +1,347 @@
+"""
+Backup Scheduler Service
+Runs scheduled backups in the background with APScheduler.
+Only the elected leader among the clients sharing the database runs the job,
+and runs are deferred while the database is under heavy write activity.
+"""
+
+import os
+import socket
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Tuple
+
+
+class BackupSchedulerService:
+    """
+    Service for scheduled, leader-elected, activity-throttled backups.
+
+    Features:
+    - Cron schedule read from system_settings (backup_schedule_cron)
+    - Lease-based leader election in scheduler_leases, so one client runs it
+    - Deferral while the WAL is large or the write rate is high
+    - Every run is logged to backup_log with duration and throughput
+    - After a successful backup, old logs and activity are archived
+    """
+
+    LEASE_NAME = 'scheduled_backup'
+    LEASE_TTL_SECONDS = 180
+    HEARTBEAT_SECONDS = 60
+    ACTIVITY_SAMPLE_SECONDS = 5
+    RETRY_DELAY_MINUTES = 10
+
+    DEFAULT_SETTINGS = {
+        'backup_schedule_enabled': '1',
+        'backup_schedule_cron': '0 2 * * *',
+        'backup_max_wal_mb': '64',
+        'backup_max_write_kbps': '256',
+        'backup_max_deferral_minutes': '120',
+    }
+
+    def __init__(self, db_manager, logging_service, backup_service, archive_service=None):
+        """
+        Initialize the backup scheduler service.
+
+        Args:
+            db_manager: DatabaseManager instance
+            logging_service: LoggingService instance
+            backup_service: BackupService instance
+            archive_service: Optional ArchiveService run after each backup
+        """
+        self.db_manager = db_manager
+        self.logger = logging_service
+        self.backup_service = backup_service
+        self.archive_service = archive_service
+
+        self.client_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._scheduler = None
+        self._cron = None
+        self._is_leader = False
+        self._deferred_since: Optional[datetime] = None
+
+    # ==================== Lifecycle ====================
+
+    def start(self) -> bool:
+        """
+        Start the background scheduler.
+
+        Returns:
+            True if the scheduler is running
+        """
+        settings = self.get_settings()
+        if settings['backup_schedule_enabled'] != '1':
+            self.logger.info("Scheduled backups are disabled")
+            return False
+
+        try:
+            from apscheduler.schedulers.background import BackgroundScheduler
+            from apscheduler.triggers.cron import CronTrigger
+        except ImportError:
+            self.logger.warning("APScheduler is not installed; scheduled backups are unavailable")
+            return False
+
+        try:
+            self._cron = settings['backup_schedule_cron']
+            trigger = CronTrigger.from_crontab(self._cron)
+
+            self._scheduler = BackgroundScheduler(daemon=True)
+            self._scheduler.add_job(
+                self._heartbeat, 'interval', seconds=self.HEARTBEAT_SECONDS,
+                id='backup_leader_heartbeat', next_run_time=datetime.now(),
+                coalesce=True, max_instances=1
+            )
+            self._scheduler.add_job(
+                self._run_scheduled_backup, trigger,
+                id='scheduled_backup', coalesce=True, max_instances=1,
+                misfire_grace_time=3600
+            )
+            self._scheduler.start()
+
+            self.logger.info(f"Backup scheduler started ({self._cron}) as {self.client_id}")
+            return True
+
+        except Exception as e:
+            self.logger.error(f"Failed to start backup scheduler: {str(e)}", exc_info=True)
+            self._scheduler = None
+            return False
+
+    def stop(self):
+        """Stop the scheduler and give up leadership."""
+        if self._scheduler is not None:
+            try:
+                self._scheduler.shutdown(wait=False)
+            except Exception:
+                pass
+            self._scheduler = None
+
+        if self._is_leader:
+            self._release_lease()
+            self._is_leader = False
+
+    # ==================== Settings & Status ====================
+
+    def get_settings(self) -> Dict[str, str]:
+        """
+        Read scheduler settings from system_settings, falling back to defaults.
+
+        Returns:
+            Dictionary of setting_key -> setting_value
+        """
+        settings = dict(self.DEFAULT_SETTINGS)
+        try:
+            placeholders = ','.join('?' * len(settings))
+            query = f"""
+                SELECT setting_key, setting_value FROM system_settings
+                WHERE setting_key IN ({placeholders})
+            """
+            for row in self.db_manager.execute_with_retry(query, tuple(settings.keys())):
+                if row[1] is not None:
+                    settings[row[0]] = str(row[1]).strip()
+        except Exception as e:
+            self.logger.warning(f"Using default backup schedule settings: {str(e)}")
+        return settings
+
+    def get_next_run_time(self) -> Optional[datetime]:
+        """Get the next scheduled backup time."""
+        if self._scheduler is not None:
+            job = self._scheduler.get_job('scheduled_backup')
+            if job is not None and job.next_run_time is not None:
+                return job.next_run_time.replace(tzinfo=None)
+
+        # Not running in this client - compute from the cron expression
+        settings = self.get_settings()
+        if settings['backup_schedule_enabled'] != '1':
+            return None
+        try:
+            from apscheduler.triggers.cron import CronTrigger
+            trigger = CronTrigger.from_crontab(settings['backup_schedule_cron'])
+            next_time = trigger.get_next_fire_time(None, datetime.now(trigger.timezone))
+            return next_time.replace(tzinfo=None) if next_time else None
+        except Exception:
+            return None
+
+    def get_last_run(self) -> Optional[Dict[str, Any]]:
+        """
+        Get statistics of the last scheduled backup.
+
+        Returns:
+            Dictionary with backup_log fields or None if none ran yet
+        """
+        try:
+            query = """
+                SELECT backup_filename, created_at, created_by, logical_size,
+                       backup_size, duration_seconds, throughput_bytes_per_sec
+                FROM backup_log
+                WHERE trigger_type = 'scheduled'
+                ORDER BY backup_id DESC
+                LIMIT 1
+            """
+            result = self.db_manager.execute_with_retry(query)
+            if not result:
+                return None
+            return {key: result[0][key] for key in result[0].keys()}
+        except Exception as e:
+            self.logger.warning(f"Could not read last scheduled backup: {str(e)}")
+            return None
+
+    def get_status(self) -> Dict[str, Any]:
+        """
+        Get scheduler status for the admin panel.
+
+        Returns:
+            Dictionary with enabled, cron, running, leader, next_run and last_run
+        """
+        settings = self.get_settings()
+        return {
+            'enabled': settings['backup_schedule_enabled'] == '1',
+            'cron': settings['backup_schedule_cron'],
+            'running': self._scheduler is not None,
+            'is_leader': self._is_leader,
+            'leader': self._get_lease_holder(),
+            'next_run': self.get_next_run_time(),
+            'last_run': self.get_last_run(),
+        }
+
+    # ==================== Jobs ====================
+
+    def _heartbeat(self):
+        """Acquire or renew the leader lease."""
+        was_leader = self._is_leader
+        self._is_leader = self._acquire_lease()
+        if self._is_leader and not was_leader:
+            self.logger.info(f"Backup scheduler leadership acquired by {self.client_id}")
+        elif was_leader and not self._is_leader:
+            self.logger.warning(f"Backup scheduler leadership lost by {self.client_id}")
+
+    def _run_scheduled_backup(self):
+        """Scheduled job: run the backup if this client leads and the DB is quiet."""
+        if not self._acquire_lease():
+            self._is_leader = False
+            return
+        self._is_leader = True
+
+        settings = self.get_settings()
+        is_busy, reason = self._is_write_activity_high(settings)
+
+        if is_busy:
+            if self._deferred_since is None:
+                self._deferred_since = datetime.now()
+            max_deferral = timedelta(minutes=int(settings['backup_max_deferral_minutes']))
+
+            if datetime.now() - self._deferred_since < max_deferral:
+                retry_at = datetime.now() + timedelta(minutes=self.RETRY_DELAY_MINUTES)
+                self.logger.info(f"Scheduled backup deferred ({reason}); retrying at {retry_at:%H:%M}")
+                if self._scheduler is not None:
+                    self._scheduler.add_job(
+                        self._run_scheduled_backup, 'date', run_date=retry_at,
+                        id='scheduled_backup_retry', replace_existing=True
+                    )
+                return
+
+            self.logger.warning(f"Running scheduled backup despite write activity ({reason})")
+
+        self._deferred_since = None
+        success, message, manifest = self.backup_service.create_backup('SCHEDULER', trigger_type='scheduled')
+        if not success:
+            self.logger.error(f"Scheduled backup failed: {message}")
+            return
+
+        self.backup_service.apply_retention()
+
+        # Archive only once the rows are safely in a backup. Every later
+        # backup stores the archive databases too, so the rows stay covered
+        # after retention prunes this one.
+        if self.archive_service is not None:
+            success, message = self.archive_service.run_maintenance()
+            if not success:
+                self.logger.error(f"Scheduled log archival failed: {message}")
+
+    def _is_write_activity_high(self, settings: Dict[str, str]) -> Tuple[bool, str]:
+        """
+        Measure WAL size and write rate.
+
+        The WAL frame count is sampled twice, ACTIVITY_SAMPLE_SECONDS apart,
+        with a passive checkpoint (which never blocks writers).
+
+        Returns:
+            Tuple of (is_busy, reason)
+        """
+        try:
+            page_size, first_frames = self._sample_wal()
+            time.sleep(self.ACTIVITY_SAMPLE_SECONDS)
+            _, second_frames = self._sample_wal()
+
+            # A checkpoint restart resets the frame counter
+            new_frames = second_frames - first_frames if second_frames >= first_frames else second_frames
+            write_kbps = new_frames * page_size / 1024 / self.ACTIVITY_SAMPLE_SECONDS
+            wal_mb = second_frames * page_size / (1024 * 1024)
+
+            if wal_mb > float(settings['backup_max_wal_mb']):
+                return True, f"WAL is {wal_mb:.1f} MB"
+            if write_kbps > float(settings['backup_max_write_kbps']):
+                return True, f"write rate is {write_kbps:.0f} KB/s"
+            return False, ""
+
+        except Exception as e:
+            self.logger.warning(f"Could not measure write activity: {str(e)}")
+            return False, ""
+
+    def _sample_wal(self) -> Tuple[int, int]:
+        """Return (page_size, frames currently in the WAL)."""
+        with self.db_manager.get_connection() as conn:
+            page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+            _, log_frames, _ = conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()
+        return page_size, max(log_frames, 0)
+
+    # ==================== Leader Election ====================
+
+    def _acquire_lease(self) -> bool:
+        """
+        Take or renew the leader lease.
+
+        A single upsert only succeeds when the lease is free, expired, or
+        already ours, so two clients can never both hold it.
+        """
+        try:
+            query = f"""
+                INSERT INTO scheduler_leases (lease_name, holder, acquired_at, expires_at)
+                VALUES (?, ?, datetime('now'), datetime('now', '+{self.LEASE_TTL_SECONDS} seconds'))
+                ON CONFLICT(lease_name) DO UPDATE SET
+                    holder = excluded.holder,
+                    acquired_at = CASE WHEN scheduler_leases.holder = excluded.holder
+                                       THEN scheduler_leases.acquired_at
+                                       ELSE excluded.acquired_at END,
+                    expires_at = excluded.expires_at
+                WHERE scheduler_leases.holder = excluded.holder
+                   OR scheduler_leases.expires_at < datetime('now')
+            """
+            self.db_manager.execute_with_retry(query, (self.LEASE_NAME, self.client_id))
+            return self._get_lease_holder() == self.client_id
+        except Exception as e:
+            self.logger.warning(f"Backup scheduler lease check failed: {str(e)}")
+            return False
+
+    def _release_lease(self):
+        """Release the lease so another client can take over immediately."""
+        try:
+            self.db_manager.execute_with_retry(
+                "DELETE FROM scheduler_leases WHERE lease_name = ? AND holder = ?",
+                (self.LEASE_NAME, self.client_id)
+            )
+        except Exception:
+            pass
+
+    def _get_lease_holder(self) -> Optional[str]:
+        """Get the current, unexpired lease holder."""
+        try:
+            result = self.db_manager.execute_with_retry(
+                """
+                SELECT holder FROM scheduler_leases
+                WHERE lease_name = ? AND expires_at >= datetime('now')
+                """,
+                (self.LEASE_NAME,)
+            )
+            return result[0][0] if result else None
+        except Exception:
+            return None
@@ -0,0 +1,846 @@
+"""
+Backup Service - Deduplicated Backup Store
+Stores database backups as compressed, content-addressed page chunks with a
+small manifest per backup, so daily backup cost scales with churn rather than
+database size.
+
+Every backup also stores the monthly archive databases (see ArchiveService),
+so archived logs and activity stay covered after retention prunes the backup
+taken before they were archived. Unchanged archive months add no new chunks.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import uuid
+import zlib
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from services.archive_service import ArchiveService
+from utils.tracing import trace_service
+
+
+@trace_service
+class BackupService:
+    """
+    Service for creating, restoring and pruning deduplicated backups.
+
+    Store layout (inside the configured backup directory):
+        store/chunks/ab/abcdef...   zlib-compressed chunk, named by SHA-256
+        store/manifests/<name>.json  ordered chunk list for one backup
+        store/.lock                  exclusive lock while writing or pruning
+
+    Features:
+    - Consistent snapshot through the SQLite backup API
+    - Fixed-size chunks aligned to the database page size
+    - Only chunks not already in the store are written
+    - Keep N daily / M weekly retention with chunk garbage collection
+    - Validated, single-transaction restore into the live database
+    - Archive databases are stored with each backup and restored with it
+    """
+
+    STORE_DIRNAME = 'store'
+    MANIFEST_VERSION = 1
+    PAGES_PER_CHUNK = 32  # 128 KB chunks for the default 4 KB page size
+    COMPRESSION_LEVEL = 6
+    LOCK_STALE_SECONDS = 3600
+    LOCK_WAIT_SECONDS = 60
+
+    DEFAULT_KEEP_DAILY = 7
+    DEFAULT_KEEP_WEEKLY = 4
+
+    RESTORE_QUIESCE_SECONDS = 10  # wait for this client's in-flight queries
+    RESTORE_BUSY_SECONDS = 30  # wait for other clients' write transactions
+
+    def __init__(self, db_manager, logging_service, backup_dir: str, archive_service=None):
+        """
+        Initialize the backup service.
+
+        Args:
+            db_manager: DatabaseManager instance
+            logging_service: LoggingService instance
+            backup_dir: Root backup directory (Config.BACKUP_PATH)
+            archive_service: ArchiveService whose archive databases are backed
+                             up (defaults to the archive folder next to the database)
+        """
+        self.db_manager = db_manager
+        self.logger = logging_service
+        self.archive_service = archive_service or ArchiveService(db_manager, logging_service)
+        self.backup_dir = Path(backup_dir)
+        self.store_dir = self.backup_dir / self.STORE_DIRNAME
+        self.chunks_dir = self.store_dir / 'chunks'
+        self.manifests_dir = self.store_dir / 'manifests'
+
+    # ==================== Backup ====================
+
+    def create_backup(self, created_by: str = 'SYSTEM',
+                      trigger_type: str = 'manual') -> Tuple[bool, str, Optional[Dict]]:
+        """
+        Snapshot the database and store it as deduplicated chunks.
+
+        Args:
+            created_by: Username recorded in the manifest and backup_log
+            trigger_type: 'manual', 'scheduled' or 'pre_restore', recorded in backup_log
+
+        Returns:
+            Tuple of (success, message, manifest)
+        """
+        snapshot_path = None
+        started = time.perf_counter()
+
+        try:
+            self._ensure_store()
+            timestamp = datetime.now()
+            name = f"fiu_backup_{timestamp.strftime('%Y%m%d_%H%M%S')}"
+            suffix = 1
+            while self._manifest_path(name).exists():
+                suffix += 1
+                name = f"fiu_backup_{timestamp.strftime('%Y%m%d_%H%M%S')}_{suffix}"
+            snapshot_path = self.store_dir / f".{name}.snapshot"
+
+            # Consistent point-in-time copy (safe while other clients write)
+            if not self.db_manager.backup_database(str(snapshot_path)):
+                return False, "Failed to snapshot database", None
+
+            page_size = self._read_page_size(snapshot_path)
+            chunk_size = page_size * self.PAGES_PER_CHUNK
+
+            with self._store_lock():
+                chunks, sha256, new_chunks, stored_bytes = self._store_file(snapshot_path, chunk_size)
+
+                archives = []
+                for month in self.archive_service.list_partitions():
+                    entry = self._store_archive(month, snapshot_path.with_suffix('.archive'))
+                    new_chunks += entry.pop('new_chunks')
+                    stored_bytes += entry.pop('stored_bytes')
+                    archives.append(entry)
+
+                manifest = {
+                    'version': self.MANIFEST_VERSION,
+                    'name': name,
+                    'created_at': timestamp.isoformat(timespec='seconds'),
+                    'created_by': created_by,
+                    'source_db': str(self.db_manager.db_path),
+                    'page_size': page_size,
+                    'chunk_size': chunk_size,
+                    'total_size': snapshot_path.stat().st_size,
+                    'sha256': sha256,
+                    'chunk_count': len(chunks),
+                    'new_chunks': new_chunks,
+                    'stored_bytes': stored_bytes,
+                    'chunks': chunks,
+                    'archives': archives,
+                }
+                self._write_json_atomic(self._manifest_path(name), manifest)
+
+            manifest['duration_seconds'] = round(time.perf_counter() - started, 3)
+            self._log_backup(manifest, trigger_type)
+
+            self.logger.info(
+                f"Backup {name} stored: {len(chunks)} chunks, {new_chunks} new, "
+                f"{self._format_size(stored_bytes)} written for "
+                f"{self._format_size(manifest['total_size'])} database "
+                f"and {len(archives)} archive(s) in {manifest['duration_seconds']:.2f}s"
+            )
+            return True, f"Backup created: {name}", manifest
+
+        except Exception as e:
+            self.logger.error(f"Error creating backup: {str(e)}", exc_info=True)
+            return False, f"Backup failed: {str(e)}", None
+
+        finally:
+            if snapshot_path is not None:
+                for path in (snapshot_path, snapshot_path.with_suffix('.archive')):
+                    if path.exists():
+                        try:
+                            path.unlink()
+                        except OSError:
+                            pass
+
+    def _store_file(self, path: Path, chunk_size: int) -> Tuple[List[str], str, int, int]:
+        """
+        Split a file into chunks and write the ones not already stored.
+
+        Caller must hold the store lock.
+
+        Returns:
+            Tuple of (chunk digests, file sha256, new_chunks, stored_bytes)
+        """
+        chunks = []
+        new_chunks = 0
+        stored_bytes = 0
+        file_hash = hashlib.sha256()
+
+        with open(path, 'rb') as f:
+            while True:
+                data = f.read(chunk_size)
+                if not data:
+                    break
+                file_hash.update(data)
+                digest = hashlib.sha256(data).hexdigest()
+                chunks.append(digest)
+
+                written = self._write_chunk(digest, data)
+                if written:
+                    new_chunks += 1
+                    stored_bytes += written
+
+        return chunks, file_hash.hexdigest(), new_chunks, stored_bytes
+
+    def _store_archive(self, month: str, snapshot_path: Path) -> Dict:
+        """
+        Snapshot one archive database and store its chunks.
+
+        Caller must hold the store lock.
+
+        Returns:
+            Manifest entry for the archive, with new_chunks and stored_bytes
+        """
+        archive_path = self.archive_service.archive_path(month)
+        self._copy_database(archive_path, snapshot_path)
+        try:
+            chunk_size = self._read_page_size(snapshot_path) * self.PAGES_PER_CHUNK
+            chunks, sha256, new_chunks, stored_bytes = self._store_file(snapshot_path, chunk_size)
+            return {
+                'month': month,
+                'file': archive_path.name,
+                'total_size': snapshot_path.stat().st_size,
+                'sha256': sha256,
+                'chunks': chunks,
+                'new_chunks': new_chunks,
+                'stored_bytes': stored_bytes,
+            }
+        finally:
+            snapshot_path.unlink(missing_ok=True)
+
+    def list_backups(self) -> List[Dict]:
+        """
+        List backups in the store, newest first.
+
+        Returns:
+            List of manifest summaries (without the chunk list)
+        """
+        backups = []
+        if not self.manifests_dir.exists():
+            return backups
+
+        for manifest_file in self.manifests_dir.glob('*.json'):
+            try:
+                manifest = self._read_manifest_file(manifest_file)
+            except Exception as e:
+                self.logger.warning(f"Skipping unreadable manifest {manifest_file.name}: {str(e)}")
+                continue
+
+            summary = {k: v for k, v in manifest.items() if k != 'chunks'}
+            if 'archives' in summary:
+                summary['archives'] = [
+                    {k: v for k, v in entry.items() if k != 'chunks'} for entry in summary['archives']
+                ]
+            summary['manifest_path'] = str(manifest_file)
+            backups.append(summary)
+
+        backups.sort(key=lambda b: (b.get('created_at', ''), b.get('name', '')), reverse=True)
+        return backups
+
+    def get_manifest(self, name: str) -> Optional[Dict]:
+        """
+        Load a backup manifest by name.
+
+        Args:
+            name: Backup name (manifest file stem)
+
+        Returns:
+            Manifest dictionary or None if not found
+        """
+        path = self._manifest_path(name)
+        if not path.exists():
+            return None
+        return self._read_manifest_file(path)
+
+    def is_manifest_path(self, path: str) -> bool:
+        """Check whether a path points at a manifest in this store."""
+        p = Path(path)
+        return p.suffix == '.json' and p.parent.resolve() == self.manifests_dir.resolve()
+
+    # ==================== Restore ====================
+
+    def restore_to_file(self, name: str, target_path: str) -> Tuple[bool, str]:
+        """
+        Reassemble a backup from its manifest into a standalone database file.
+
+        The file is written next to the target and renamed into place only
+        after the full-file checksum matches the manifest.
+
+        Args:
+            name: Backup name
+            target_path: Destination database file
+
+        Returns:
+            Tuple of (success, message)
+        """
+        target = Path(target_path)
+
+        try:
+            manifest = self.get_manifest(name)
+            if manifest is None:
+                return False, f"Backup not found: {name}"
+
+            self._reassemble(manifest['chunks'], manifest['sha256'], target)
+            return True, f"Backup {name} restored to {target}"
+
+        except Exception as e:
+            self.logger.error(f"Error restoring backup {name}: {str(e)}", exc_info=True)
+            return False, f"Restore failed: {str(e)}"
+
+    def _reassemble(self, chunks: List[str], sha256: str, target: Path):
+        """
+        Write chunks to a file, renaming it into place only if the checksum matches.
+
+        Raises:
+            ValueError: If the reassembled file does not match sha256
+        """
+        temp_path = target.with_name(f".{target.name}.partial")
+        try:
+            file_hash = hashlib.sha256()
+            with open(temp_path, 'wb') as out:
+                for digest in chunks:
+                    data = self._read_chunk(digest)
+                    file_hash.update(data)
+                    out.write(data)
+                out.flush()
+                os.fsync(out.fileno())
+
+            if file_hash.hexdigest() != sha256:
+                raise ValueError("Checksum mismatch after reassembly")
+
+            os.replace(temp_path, target)
+
+        finally:
+            if temp_path.exists():
+                try:
+                    temp_path.unlink()
+                except OSError:
+                    pass
+
+    def restore_database(self, source_path: str, restored_by: str = 'SYSTEM',
+                         progress_callback: Optional[Callable[[int, str], None]] = None
+                         ) -> Tuple[bool, str, Optional[Dict]]:
+        """
+        Restore the live database from a store manifest or a standalone .db file.
+
+        Pipeline:
+        1. Validate the backup (checksum, PRAGMA integrity_check, schema)
+        2. Stage it in a temp file next to the database via the backup API
+        3. Checkpoint the live WAL and hold back this client's connections
+        4. Copy the staged file into the live database in one transaction
+        5. Stamp a new restore_generation so other clients reload
+
+        Restoring from a store manifest also puts back the archive databases
+        as they were at backup time: archives are staged and verified with
+        the database, swapped in after it, and archives created since the
+        backup are removed (the pre-restore backup keeps them). Standalone
+        .db files and manifests written before archives were backed up
+        leave the archive folder untouched.
+
+        The live file is never renamed or overwritten on disk: step 4 goes
+        through SQLite's own locking, so other clients see either the old or
+        the restored database, never a half-written file, and their -wal/-shm
+        files stay consistent.
+
+        Args:
+            source_path: Manifest path from this store or a .db backup file
+            restored_by: Username recorded with the restore generation
+            progress_callback: Optional callable(percent, message)
+
+        Returns:
+            Tuple of (success, message, stats)
+        """
+        def report(percent: int, message: str):
+            if progress_callback:
+                progress_callback(percent, message)
+
+        target = Path(self.db_manager.db_path)
+        staging_path = target.with_name(f".{target.name}.restoring")
+        staged_archives = None
+        started = time.perf_counter()
+
+        try:
+            from database.init_db import validate_database
+
+            # 1-2. Validate the backup and stage it next to the live database
+            report(5, "Validating backup...")
+            if self.is_manifest_path(source_path):
+                success, message = self.restore_to_file(Path(source_path).stem, str(staging_path))
+                if not success:
+                    raise ValueError(message)
+                self._check_integrity(staging_path)
+                staged_archives = self._stage_archives(self.get_manifest(Path(source_path).stem))
+            else:
+                if not Path(source_path).exists():
+                    raise FileNotFoundError("Backup file not found")
+                self._check_integrity(Path(source_path))
+                report(20, "Staging backup...")
+                self._copy_database(Path(source_path), staging_path)
+
+            is_valid, message = validate_database(str(staging_path))
+            if not is_valid:
+                raise ValueError(f"Backup is not a valid FIU database: {message}")
+
+            generation = f"{datetime.now().strftime('%Y%m%d%H%M%S')}-{uuid.uuid4().hex[:8]}"
+            self._stamp_restore_generation(staging_path, generation, restored_by)
+            prepare_seconds = time.perf_counter() - started
+
+            # Safety net: the current state goes into the store first
+            report(45, "Backing up current database...")
+            success, message, pre_restore = self.create_backup(restored_by, trigger_type='pre_restore')
+            if not success:
+                raise RuntimeError(f"Could not back up current database: {message}")
+
+            # 3-4. Quiesce, then swap in a single transaction
+            report(70, "Restoring database...")
+            downtime_seconds = self._swap_into_live(staging_path, target)
+
+            # 5. Our own client already sees the new generation
+            self.db_manager.restore_generation = generation
+
+            if staged_archives is not None:
+                report(90, "Restoring archives...")
+                self._swap_in_archives(staged_archives)
+
+            stats = {
+                'generation': generation,
+                'pre_restore_backup': pre_restore['name'],
+                'size': target.stat().st_size,
+                'prepare_seconds': round(prepare_seconds, 3),
+                'downtime_seconds': round(downtime_seconds, 3),
+                'total_seconds': round(time.perf_counter() - started, 3),
+            }
+            self.logger.info(
+                f"Database restored from {Path(source_path).name} by {restored_by}: "
+                f"{self._format_size(stats['size'])}, downtime {stats['downtime_seconds']:.2f}s, "
+                f"total {stats['total_seconds']:.2f}s"
+            )
+            report(100, "Restore completed!")
+            return True, f"Database restored from {Path(source_path).stem}", stats
+
+        except Exception as e:
+            self.logger.error(f"Error restoring database: {str(e)}", exc_info=True)
+            return False, f"Restore failed: {str(e)}", None
+
+        finally:
+            leftovers = [staging_path, staging_path.with_name(staging_path.name + '-wal'),
+                         staging_path.with_name(staging_path.name + '-shm')]
+            leftovers.extend(staged_archives or {})
+            for path in leftovers:
+                if path.exists():
+                    try:
+                        path.unlink()
+                    except OSError:
+                        pass
+
+    def _stage_archives(self, manifest: Dict) -> Optional[Dict[Path, Path]]:
+        """
+        Reassemble and verify a backup's archive databases next to the live ones.
+
+        Returns:
+            Mapping of staged file -> archive path, or None for manifests
+            written before archives were backed up
+        """
+        if manifest is None or 'archives' not in manifest:
+            return None
+
+        archive_dir = self.archive_service.archive_dir
+        archive_dir.mkdir(parents=True, exist_ok=True)
+        staged = {}
+        for entry in manifest['archives']:
+            archive_path = self.archive_service.archive_path(entry['month'])
+            staging = archive_dir / f".{archive_path.name}.restoring"
+            staged[staging] = archive_path
+            self._reassemble(entry['chunks'], entry['sha256'], staging)
+            self._check_integrity(staging)
+        return staged
+
+    def _swap_in_archives(self, staged: Dict[Path, Path]):
+        """Replace the archive databases with the staged ones."""
+        restored = set(staged.values())
+        for month in self.archive_service.list_partitions():
+            archive_path = self.archive_service.archive_path(month)
+            if archive_path not in restored:
+                archive_path.unlink(missing_ok=True)
+        for staging, archive_path in staged.items():
+            os.replace(staging, archive_path)
+
+    def _swap_into_live(self, staging_path: Path, target: Path) -> float:
+        """
+        Copy the staged database into the live one in a single transaction.
+
+        Returns:
+            Seconds during which this client's connections were held back
+        """
+        source = sqlite3.connect(str(staging_path))
+        dest = sqlite3.connect(str(target), timeout=self.RESTORE_BUSY_SECONDS)
+        try:
+            source_page_size = source.execute("PRAGMA page_size").fetchone()[0]
+            dest_page_size = dest.execute("PRAGMA page_size").fetchone()[0]
+            if source_page_size != dest_page_size:
+                raise ValueError(
+                    f"Backup page size ({source_page_size}) differs from "
+                    f"the live database ({dest_page_size})"
+                )
+
+            # Start from an empty WAL so the copy is the only thing in it
+            dest.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+            # No logging in here - the log handler writes through db_manager
+            quiesce_started = time.perf_counter()
+            with self.db_manager.quiesce(self.RESTORE_QUIESCE_SECONDS):
+                source.backup(dest)
+                dest.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+            return time.perf_counter() - quiesce_started
+
+        finally:
+            source.close()
+            dest.close()
+
+    @staticmethod
+    def _check_integrity(db_path: Path):
+        """Raise if PRAGMA integrity_check does not report ok."""
+        conn = sqlite3.connect(str(db_path))
+        try:
+            result = [row[0] for row in conn.execute("PRAGMA integrity_check").fetchall()]
+        except sqlite3.DatabaseError as e:
+            raise ValueError(f"Backup file is corrupted: {str(e)}")
+        finally:
+            conn.close()
+        if result != ['ok']:
+            raise ValueError(f"Backup file is corrupted: {'; '.join(result[:3])}")
+
+    @staticmethod
+    def _copy_database(source_path: Path, dest_path: Path):
+        """Copy a database file through the SQLite backup API."""
+        source = sqlite3.connect(str(source_path))
+        dest = sqlite3.connect(str(dest_path))
+        try:
+            source.backup(dest)
+        finally:
+            source.close()
+            dest.close()
+
+    @staticmethod
+    def _stamp_restore_generation(db_path: Path, generation: str, restored_by: str):
+        """Write the restore marker other clients poll for."""
+        conn = sqlite3.connect(str(db_path))
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO system_metadata (key, value, updated_at, updated_by)
+                VALUES ('restore_generation', ?, datetime('now'), ?)
+                """,
+                (generation, restored_by)
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+    # ==================== Retention ====================
+
+    def get_retention_policy(self) -> Tuple[int, int]:
+        """
+        Read the retention policy from system_settings.
+
+        Returns:
+            Tuple of (keep_daily, keep_weekly)
+        """
+        keep_daily = self.DEFAULT_KEEP_DAILY
+        keep_weekly = self.DEFAULT_KEEP_WEEKLY
+
+        try:
+            query = """
+                SELECT setting_key, setting_value FROM system_settings
+                WHERE setting_key IN ('backup_keep_daily', 'backup_keep_weekly')
+            """
+            for row in self.db_manager.execute_with_retry(query):
+                if row[0] == 'backup_keep_daily':
+                    keep_daily = int(row[1])
+                elif row[0] == 'backup_keep_weekly':
+                    keep_weekly = int(row[1])
+        except Exception as e:
+            self.logger.warning(f"Using default backup retention: {str(e)}")
+
+        return keep_daily, keep_weekly
+
+    def apply_retention(self, keep_daily: Optional[int] = None,
+                        keep_weekly: Optional[int] = None) -> Dict:
+        """
+        Delete manifests outside the retention window and collect orphan chunks.
+
+        The newest backup of each of the last ``keep_daily`` days and of each of
+        the last ``keep_weekly`` ISO weeks is kept; everything else is pruned.
+        The newest backup is always kept and holds every archive database, so
+        pruning never leaves archived rows without a backup.
+
+        Args:
+            keep_daily: Number of daily backups to keep (defaults to settings)
+            keep_weekly: Number of weekly backups to keep (defaults to settings)
+
+        Returns:
+            Dictionary with removed_backups, removed_chunks and freed_bytes
+        """
+        if keep_daily is None or keep_weekly is None:
+            default_daily, default_weekly = self.get_retention_policy()
+            keep_daily = default_daily if keep_daily is None else keep_daily
+            keep_weekly = default_weekly if keep_weekly is None else keep_weekly
+
+        backups = self.list_backups()  # newest first
+        keep = set()
+        days_seen = []
+        weeks_seen = []
+
+        for backup in backups:
+            created = datetime.fromisoformat(backup['created_at'])
+            day = created.date()
+            week = created.isocalendar()[:2]
+
+            if day not in days_seen and len(days_seen) < keep_daily:
+                days_seen.append(day)
+                keep.add(backup['name'])
+            if week not in weeks_seen and len(weeks_seen) < keep_weekly:
+                weeks_seen.append(week)
+                keep.add(backup['name'])
+
+        # Never prune the most recent backup
+        if backups:
+            keep.add(backups[0]['name'])
+
+        removed = [b['name'] for b in backups if b['name'] not in keep]
+
+        with self._store_lock():
+            for name in removed:
+                self._manifest_path(name).unlink(missing_ok=True)
+            removed_chunks, freed_bytes = self._collect_garbage()
+
+        result = {
+            'removed_backups': removed,
+            'removed_chunks': removed_chunks,
+            'freed_bytes': freed_bytes,
+        }
+
+        if removed or removed_chunks:
+            self.logger.info(
+                f"Backup retention: removed {len(removed)} backups and "
+                f"{removed_chunks} chunks ({self._format_size(freed_bytes)} freed)"
+            )
+        return result
+
+    def delete_backup(self, name: str) -> Tuple[bool, str]:
+        """
+        Delete a single backup and any chunks only it referenced.
+
+        Args:
+            name: Backup name
+
+        Returns:
+            Tuple of (success, message)
+        """
+        try:
+            with self._store_lock():
+                path = self._manifest_path(name)
+                if not path.exists():
+                    return False, f"Backup not found: {name}"
+                path.unlink()
+                removed_chunks, freed_bytes = self._collect_garbage()
+
+            self.logger.info(
+                f"Deleted backup {name} ({removed_chunks} chunks, "
+                f"{self._format_size(freed_bytes)} freed)"
+            )
+            return True, f"Backup {name} deleted"
+
+        except Exception as e:
+            self.logger.error(f"Error deleting backup {name}: {str(e)}")
+            return False, f"Delete failed: {str(e)}"
+
+    def get_store_statistics(self) -> Dict:
+        """
+        Summarize store usage.
+
+        Returns:
+            Dictionary with backup_count, chunk_count, stored_bytes and logical_bytes
+        """
+        backups = self.list_backups()
+        chunk_count = 0
+        stored_bytes = 0
+        if self.chunks_dir.exists():
+            for chunk_file in self.chunks_dir.glob('*/*'):
+                chunk_count += 1
+                stored_bytes += chunk_file.stat().st_size
+
+        return {
+            'backup_count': len(backups),
+            'chunk_count': chunk_count,
+            'stored_bytes': stored_bytes,
+            'logical_bytes': sum(
+                b.get('total_size', 0) + sum(a.get('total_size', 0) for a in b.get('archives', []))
+                for b in backups
+            ),
+        }
+
+    # ==================== Internals ====================
+
+    def _ensure_store(self):
+        """Create the store directories if needed."""
+        self.chunks_dir.mkdir(parents=True, exist_ok=True)
+        self.manifests_dir.mkdir(parents=True, exist_ok=True)
+
+    def _manifest_path(self, name: str) -> Path:
+        return self.manifests_dir / f"{name}.json"
+
+    def _chunk_path(self, digest: str) -> Path:
+        return self.chunks_dir / digest[:2] / digest
+
+    def _write_chunk(self, digest: str, data: bytes) -> int:
+        """
+        Store a chunk if it is not already present.
+
+        Returns:
+            Number of compressed bytes written (0 if the chunk already existed)
+        """
+        path = self._chunk_path(digest)
+        if path.exists():
+            return 0
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        compressed = zlib.compress(data, self.COMPRESSION_LEVEL)
+        temp_path = path.with_name(f".{digest}.tmp")
+        with open(temp_path, 'wb') as f:
+            f.write(compressed)
+        os.replace(temp_path, path)
+        return len(compressed)
+
+    def _read_chunk(self, digest: str) -> bytes:
+        """Read, decompress and verify a chunk."""
+        path = self._chunk_path(digest)
+        if not path.exists():
+            raise FileNotFoundError(f"Missing chunk {digest}")
+
+        with open(path, 'rb') as f:
+            data = zlib.decompress(f.read())
+
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Corrupted chunk {digest}")
+        return data
+
+    def _collect_garbage(self) -> Tuple[int, int]:
+        """
+        Delete chunks no manifest references. Caller must hold the store lock.
+
+        Returns:
+            Tuple of (removed_chunks, freed_bytes)
+        """
+        if not self.chunks_dir.exists():
+            return 0, 0
+
+        referenced = set()
+        for manifest_file in self.manifests_dir.glob('*.json'):
+            manifest = self._read_manifest_file(manifest_file)
+            referenced.update(manifest['chunks'])
+            for entry in manifest.get('archives', []):
+                referenced.update(entry['chunks'])
+
+        removed = 0
+        freed = 0
+        for chunk_file in self.chunks_dir.glob('*/*'):
+            if chunk_file.name not in referenced:
+                freed += chunk_file.stat().st_size
+                chunk_file.unlink()
+                removed += 1
+
+        return removed, freed
+
+    @staticmethod
+    def _read_manifest_file(path: Path) -> Dict:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+
+    @staticmethod
+    def _write_json_atomic(path: Path, data: Dict):
+        temp_path = path.with_name(f".{path.name}.tmp")
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+
+    @staticmethod
+    def _read_page_size(db_path: Path) -> int:
+        conn = sqlite3.connect(str(db_path))
+        try:
+            return conn.execute("PRAGMA page_size").fetchone()[0]
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _store_lock(self):
+        """
+        Exclusive lock on the store, shared by every client on the backup share.
+
+        Uses an O_EXCL lock file because the store usually lives on a network
+        share where OS file locks are unreliable. Locks older than
+        LOCK_STALE_SECONDS are treated as abandoned.
+        """
+        lock_path = self.store_dir / '.lock'
+        deadline = time.time() + self.LOCK_WAIT_SECONDS
+
+        while True:
+            try:
+                fd = os.open(str(lock_path), os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, f"{os.getpid()} {datetime.now().isoformat()}".encode())
+                os.close(fd)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - lock_path.stat().st_mtime > self.LOCK_STALE_SECONDS:
+                        lock_path.unlink(missing_ok=True)
+                        continue
+                except FileNotFoundError:
+                    continue
+                if time.time() > deadline:
+                    raise TimeoutError("Backup store is locked by another client")
+                time.sleep(0.5)
+
+        try:
+            yield
+        finally:
+            lock_path.unlink(missing_ok=True)
+
+    def _log_backup(self, manifest: Dict, trigger_type: str):
+        """Record the backup in backup_log with duration and throughput."""
+        try:
+            duration = manifest['duration_seconds']
+            throughput = manifest['total_size'] / duration if duration > 0 else None
+
+            query = """
+                INSERT INTO backup_log (backup_filename, backup_path, backup_size, created_at, created_by,
+                                        logical_size, duration_seconds, throughput_bytes_per_sec, trigger_type)
+                VALUES (?, ?, ?, datetime('now'), ?, ?, ?, ?, ?)
+            """
+            self.db_manager.execute_with_retry(
+                query,
+                (f"{manifest['name']}.json", str(self.manifests_dir),
+                 manifest['stored_bytes'], manifest['created_by'],
+                 manifest['total_size'], duration, throughput, trigger_type)
+            )
+        except Exception as e:
+            self.logger.warning(f"Could not record backup in backup_log: {str(e)}")
+
+    @staticmethod
+    def _format_size(size: int) -> str:
+        for unit in ('B', 'KB', 'MB', 'GB'):
+            if size < 1024 or unit == 'GB':
+                return f"{size:.1f} {unit}" if unit != 'B' else f"{size} B"
+            size /= 1024
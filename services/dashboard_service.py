@@ -5,7 +5,10 @@ Provides aggregated data for dashboard widgets and analytics.
 
 from typing import Dict, List, Any, Optional
 
+from utils.tracing import trace_service
 
+
+@trace_service
 class DashboardService:
     """Service for dashboard statistics and analytics."""
 
@@ -6,7 +6,11 @@ Handles CRUD operations for admin-managed dropdown values in system_config table
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime
 
+from services.reference_data_cache import get_reference_data_cache
+from utils.tracing import trace_service
 
+
+@trace_service
 class DropdownService:
     """Service for managing dropdown values that admins can customize."""
 
@@ -37,6 +41,7 @@ class DropdownService:
         """
         self.db_manager = db_manager
         self.logger = logging_service
+        self.reference_cache = get_reference_data_cache(db_manager, logging_service)
 
     def get_dropdown_values(self, category: str) -> List[Dict]:
         """
@@ -80,31 +85,16 @@ class DropdownService:
         """
         Get only active dropdown values for a specific category (for UI display).
 
+        Served from the shared reference data cache, so report dialogs
+        open without a query per category.
+
         Args:
             category: Category name
 
         Returns:
             List of string values
         """
-        try:
-            query = """
-                SELECT config_value
-                FROM system_config
-                WHERE config_type = 'dropdown'
-                  AND config_category = ?
-                  AND is_active = 1
-                ORDER BY display_order, config_value
-            """
-            results = self.db_manager.execute_with_retry(query, (category,))
-
-            if not results:
-                return []
-
-            return [row[0] for row in results]
-
-        except Exception as e:
-            self.logger.error(f"Error getting active dropdown values for {category}: {str(e)}")
-            return []
+        return self.reference_cache.get_active_dropdown_values(category)
 
     def get_all_categories(self) -> Dict[str, List[str]]:
         """
@@ -195,6 +185,7 @@ class DropdownService:
                 (config_key, value, category, display_order, datetime.now().isoformat(), username)
             )
 
+            self.reference_cache.invalidate()
             self.logger.info(f"User {username} added dropdown value '{value}' to category '{category}'")
             return True, "Dropdown value added successfully."
 
@@ -234,6 +225,7 @@ class DropdownService:
 
             self.db_manager.execute_with_retry(update_query, params)
 
+            self.reference_cache.invalidate()
             self.logger.info(f"User {username} updated dropdown value (ID: {config_id}) to '{new_value}'")
             return True, "Dropdown value updated successfully."
 
@@ -265,6 +257,7 @@ class DropdownService:
                 (datetime.now().isoformat(), username, config_id)
             )
 
+            self.reference_cache.invalidate()
             self.logger.info(f"User {username} deleted dropdown value (ID: {config_id})")
             return True, "Dropdown value deleted successfully."
 
@@ -297,6 +290,7 @@ class DropdownService:
                     (order, datetime.now().isoformat(), username, config_id, category)
                 )
 
+            self.reference_cache.invalidate()
             self.logger.info(f"User {username} reordered dropdown values for category '{category}'")
             return True, "Dropdown values reordered successfully."
 
@@ -326,6 +320,7 @@ class DropdownService:
                 (datetime.now().isoformat(), username, config_id)
             )
 
+            self.reference_cache.invalidate()
             self.logger.info(f"User {username} restored dropdown value (ID: {config_id})")
             return True, "Dropdown value restored successfully."
 
@@ -378,6 +373,7 @@ class DropdownService:
                 if success:
                     added_count += 1
 
+            self.reference_cache.invalidate()
             self.logger.info(f"User {username} bulk imported {added_count} values to category '{category}'")
             return True, f"Successfully imported {added_count} of {len(values)} values."
 
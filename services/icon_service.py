@@ -3,11 +3,15 @@ Icon Service
 Centralized icon management with QtAwesome integration and fallbacks.
 """
 
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 from PyQt6.QtGui import QIcon, QPixmap, QPainter, QColor
 from PyQt6.QtCore import Qt, QSize
 from PyQt6.QtWidgets import QStyle, QApplication
 
+from utils.tracing import tracer
+
 
 class IconService:
     """
@@ -19,6 +23,7 @@ class IconService:
     - Built-in Qt icons fallback
     - Consistent icon sizing
     - Theme-aware icons (dark/light mode)
+    - LRU cache of rendered icons and pixmaps keyed by (name, color, size)
     """
 
     # Icon size constants
@@ -27,10 +32,24 @@ class IconService:
     LARGE = 32
     XLARGE = 48
 
-    def __init__(self):
-        """Initialize icon service."""
+    # Rendered icons and pixmaps kept; a full window uses well under this
+    CACHE_SIZE = 256
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        """
+        Initialize icon service.
+
+        Args:
+            cache_size: Maximum number of cached icons (and, separately, pixmaps)
+        """
+        # QtAwesome loads its fonts on import; defer it to the first icon
         self._qtawesome = None
-        self._init_qtawesome()
+        self._qtawesome_loaded = False
+
+        self._cache_size = cache_size
+        self._icons: 'OrderedDict[Tuple[str, Optional[str], int], QIcon]' = OrderedDict()
+        self._pixmaps: 'OrderedDict[Tuple[str, Optional[str], int], QPixmap]' = OrderedDict()
+        self._stats = {'hits': 0, 'misses': 0, 'render_seconds': 0.0}
 
         # Icon mappings for fallback
         self._fallback_icons = {
@@ -111,7 +130,10 @@ class IconService:
         }
 
     def _init_qtawesome(self):
-        """Try to initialize QtAwesome."""
+        """Try to initialize QtAwesome (once, on first use)."""
+        if self._qtawesome_loaded:
+            return
+        self._qtawesome_loaded = True
         try:
             import qtawesome as qta
             self._qtawesome = qta
@@ -122,6 +144,9 @@ class IconService:
         """
         Get an icon by name.
 
+        Icons are rendered once per (name, color, size) and served from an
+        LRU cache afterwards.
+
         Args:
             name: Icon name (Font Awesome icon name)
             color: Icon color (hex string)
@@ -130,7 +155,86 @@ class IconService:
         Returns:
             QIcon object
         """
+        key = (name, color, size)
+        icon = self._cache_get(self._icons, key)
+        if icon is None:
+            with tracer.span('IconService.render_icon', 'ui', name=name, color=color, size=size):
+                start = time.perf_counter()
+                icon = self._render_icon(name, color, size)
+                self._stats['render_seconds'] += time.perf_counter() - start
+            # Before a QApplication exists the fallback is an empty icon; retry later
+            if not icon.isNull():
+                self._cache_put(self._icons, key, icon)
+        return icon
+
+    def get_pixmap(self, name: str, color: Optional[str] = None, size: int = MEDIUM) -> QPixmap:
+        """
+        Get an icon rendered to a square pixmap, for labels and painters.
+
+        Args:
+            name: Icon name (Font Awesome icon name)
+            color: Icon color (hex string)
+            size: Pixmap width and height in pixels
+
+        Returns:
+            QPixmap object
+        """
+        key = (name, color, size)
+        pixmap = self._cache_get(self._pixmaps, key)
+        if pixmap is None:
+            icon = self.get_icon(name, color, size)
+            with tracer.span('IconService.render_pixmap', 'ui', name=name, color=color, size=size):
+                start = time.perf_counter()
+                pixmap = icon.pixmap(QSize(size, size))
+                self._stats['render_seconds'] += time.perf_counter() - start
+            if not pixmap.isNull():
+                self._cache_put(self._pixmaps, key, pixmap)
+        return pixmap
+
+    def _cache_get(self, cache: OrderedDict, key: Tuple) -> Any:
+        """Look up a cached render and mark it most recently used."""
+        value = cache.get(key)
+        if value is None:
+            self._stats['misses'] += 1
+            return None
+        cache.move_to_end(key)
+        self._stats['hits'] += 1
+        return value
+
+    def _cache_put(self, cache: OrderedDict, key: Tuple, value: Any):
+        """Store a render, evicting the least recently used past the limit."""
+        cache[key] = value
+        if len(cache) > self._cache_size:
+            cache.popitem(last=False)
+
+    def clear_cache(self):
+        """Drop cached icons and pixmaps (e.g. after the icon font changes)."""
+        self._icons.clear()
+        self._pixmaps.clear()
+
+    def cache_info(self) -> Dict[str, Any]:
+        """
+        Get icon cache statistics.
+
+        Returns:
+            Dictionary with 'icons', 'pixmaps', 'max_size', 'hits', 'misses',
+            'hit_rate' and 'render_ms' (total time spent rendering misses)
+        """
+        lookups = self._stats['hits'] + self._stats['misses']
+        return {
+            'icons': len(self._icons),
+            'pixmaps': len(self._pixmaps),
+            'max_size': self._cache_size,
+            'hits': self._stats['hits'],
+            'misses': self._stats['misses'],
+            'hit_rate': self._stats['hits'] / lookups if lookups else 0.0,
+            'render_ms': round(self._stats['render_seconds'] * 1000, 2),
+        }
+
+    def _render_icon(self, name: str, color: Optional[str], size: int) -> QIcon:
+        """Build an icon with QtAwesome, or a Qt standard icon as fallback."""
         # Try QtAwesome first
+        self._init_qtawesome()
         if self._qtawesome:
             try:
                 options = {}
@@ -296,6 +400,7 @@ class IconService:
         Returns:
             True if QtAwesome is available
         """
+        self._init_qtawesome()
         return self._qtawesome is not None
 
 
@@ -329,3 +434,18 @@ def get_icon(name: str, color: Optional[str] = None, size: int = IconService.MED
         QIcon object
     """
     return get_icon_service().get_icon(name, color, size)
+
+
+def get_pixmap(name: str, color: Optional[str] = None, size: int = IconService.MEDIUM) -> QPixmap:
+    """
+    Convenience function to get an icon as a pixmap.
+
+    Args:
+        name: Icon name
+        color: Icon color (hex string)
+        size: Pixmap size in pixels
+
+    Returns:
+        QPixmap object
+    """
+    return get_icon_service().get_pixmap(name, color, size)
@@ -3,14 +3,20 @@ Database-backed logging service for FIU Report Management System.
 Provides comprehensive logging with database persistence and audit trail.
 """
 
+import csv
+import gzip
 import logging
+import os
 import traceback
 import json
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import date, datetime, timedelta
+from typing import Optional, Dict, Any, Callable, Iterator, List, Tuple
 from pathlib import Path
 import sys
 
+from utils.log_fingerprint import ERROR_LEVELS, error_fingerprint
+from utils.tracing import trace_service
+
 
 class DatabaseLogHandler(logging.Handler):
     """
@@ -58,13 +64,15 @@ class DatabaseLogHandler(logging.Handler):
                               'thread', 'threadName', 'exc_info', 'exc_text', 'stack_info']:
                     extra_data[key] = value
 
-            # Insert log into database
+            message = self.format(record)
+
+            # Insert log into database; triggers keep the hourly rollups current
             query = """
                 INSERT INTO system_logs (
                     timestamp, log_level, module, function_name, message,
                     user_id, username, exception_type, exception_message,
-                    stack_trace, extra_data
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    stack_trace, extra_data, error_fingerprint
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
 
             params = (
@@ -72,13 +80,15 @@ class DatabaseLogHandler(logging.Handler):
                 record.levelname,
                 record.module,
                 record.funcName,
-                self.format(record),
+                message,
                 self.user_context.get('user_id'),
                 self.user_context.get('username'),
                 exception_type,
                 exception_message,
                 stack_trace,
-                json.dumps(extra_data) if extra_data else None
+                json.dumps(extra_data) if extra_data else None,
+                error_fingerprint(record.levelname, exception_type, stack_trace,
+                                  record.module, record.funcName, message)
             )
 
             # Use the database manager to execute the insert
@@ -107,12 +117,21 @@ class DatabaseLogHandler(logging.Handler):
         self.user_context = {}
 
 
+@trace_service
 class LoggingService:
     """
     Centralized logging service that manages both file and database logging.
     Provides convenient methods for logging throughout the application.
     """
 
+    # Columns written by export_logs, in file order
+    EXPORT_COLUMNS = [
+        'log_id', 'timestamp', 'log_level', 'module', 'function_name', 'message',
+        'user_id', 'username', 'exception_type', 'exception_message',
+        'stack_trace', 'extra_data',
+    ]
+    EXPORT_FORMATS = ('jsonl', 'csv', 'txt')
+
     def __init__(self, db_manager, log_dir: Optional[Path] = None):
         """
         Initialize the logging service.
@@ -122,6 +141,7 @@ class LoggingService:
             log_dir: Optional directory for file logs (defaults to ~/.fiu_system/)
         """
         self.db_manager = db_manager
+        self.archive_service = None  # Set via set_archive_service (late binding)
         self.log_dir = log_dir or Path.home() / '.fiu_system'
         self.log_dir.mkdir(parents=True, exist_ok=True)
 
@@ -163,6 +183,15 @@ class LoggingService:
 
         self.logger.info("Logging service initialized")
 
+    def set_archive_service(self, archive_service):
+        """
+        Set the archive service so log queries include archived months.
+
+        Args:
+            archive_service: ArchiveService instance
+        """
+        self.archive_service = archive_service
+
     def set_user_context(self, user_id: int, username: str):
         """
         Set the current user context for logging.
@@ -256,30 +285,16 @@ class LoggingService:
         Returns:
             List of log dictionaries
         """
-        query = "SELECT * FROM system_logs WHERE 1=1"
-        params = []
+        conditions, params = self._build_log_filters(level, module, start_date, end_date)
+        query = f"SELECT * FROM {{table}} WHERE {' AND '.join(conditions) or '1=1'} ORDER BY timestamp DESC LIMIT ?"
 
-        if level:
-            query += " AND log_level = ?"
-            params.append(level)
-
-        if module:
-            query += " AND module = ?"
-            params.append(module)
-
-        if start_date:
-            query += " AND timestamp >= ?"
-            params.append(start_date)
-
-        if end_date:
-            # Add time component to include entire end date
-            query += " AND timestamp <= ?"
-            params.append(f"{end_date} 23:59:59")
-
-        query += " ORDER BY timestamp DESC LIMIT ?"
-        params.append(limit)
-
-        result = self.db_manager.execute_with_retry(query, params)
+        if self.archive_service:
+            # Continue into archived months when the live table runs out
+            result = self.archive_service.select_across(
+                'system_logs', query, params, limit, start_date, end_date
+            )
+        else:
+            result = self.db_manager.execute_with_retry(query.format(table='system_logs'), params + [limit])
 
         # Convert sqlite3.Row objects to dictionaries
         logs = []
@@ -290,36 +305,287 @@ class LoggingService:
 
         return logs
 
-    def clear_logs(self, older_than_days: Optional[int] = None) -> int:
+    def clear_logs(self, older_than_days: Optional[int] = None, before_date: Optional[str] = None,
+                   batch_size: int = 1000) -> int:
         """
-        Clear logs from the database.
+        Clear logs from the database, including archived months.
+
+        Rows are deleted in batches, one short transaction each, so other
+        clients can keep writing while a large log table is cleared.
 
         Args:
             older_than_days: If specified, only delete logs older than this many days
+            before_date: If specified, only delete logs before this date (YYYY-MM-DD)
+            batch_size: Rows deleted per transaction
 
         Returns:
             Number of logs deleted
         """
+        before = before_date
         if older_than_days:
-            query = """
-                DELETE FROM system_logs
-                WHERE timestamp < datetime('now', '-' || ? || ' days')
-            """
-            params = (older_than_days,)
+            before = (date.today() - timedelta(days=older_than_days)).isoformat()
+
+        if self.archive_service:
+            deleted_count = self.archive_service.delete_rows('system_logs', before, batch_size)
         else:
-            query = "DELETE FROM system_logs"
-            params = ()
+            condition, params = ("timestamp < ?", (before,)) if before else ("1=1", ())
+            query = f"""
+                DELETE FROM system_logs WHERE log_id IN (
+                    SELECT log_id FROM system_logs WHERE {condition} LIMIT ?
+                )
+            """
+            deleted_count = 0
+            while True:
+                with self.db_manager.get_connection() as conn:
+                    count = conn.execute(query, params + (batch_size,)).rowcount
+                deleted_count += count
+                if count < batch_size:
+                    break
+
+        self._prune_rollups(before)
+        self.logger.info(f"Cleared {deleted_count} logs from database")
+        return deleted_count
 
-        self.db_manager.execute_with_retry(query, params)
+    def _prune_rollups(self, before: Optional[str] = None):
+        """
+        Drop rollups for hours before a date, or all of them.
 
-        # Get the number of deleted rows
-        result = self.db_manager.execute_with_retry(
-            "SELECT changes()"
-        )
-        deleted_count = result[0][0] if result else 0
+        Args:
+            before: Date (YYYY-MM-DD); None drops every rollup
+        """
+        condition, params = ("hour < ?", (before,)) if before else ("1=1", ())
+        with self.db_manager.get_connection() as conn:
+            conn.execute(f"DELETE FROM log_rollups_hourly WHERE {condition}", params)
+            conn.execute(f"DELETE FROM log_error_rollups_hourly WHERE {condition}", params)
+            conn.execute("""
+                DELETE FROM log_error_fingerprints
+                WHERE NOT EXISTS (
+                    SELECT 1 FROM log_error_rollups_hourly r
+                    WHERE r.fingerprint = log_error_fingerprints.fingerprint
+                )
+            """)
 
-        self.logger.info(f"Cleared {deleted_count} logs from database")
-        return deleted_count
+    def _build_log_filters(self,
+                           level: Optional[str] = None,
+                           module: Optional[str] = None,
+                           start_date: Optional[str] = None,
+                           end_date: Optional[str] = None) -> Tuple[List[str], List[Any]]:
+        """
+        Build WHERE conditions for the log filters.
+
+        Returns:
+            Tuple of (conditions, params)
+        """
+        conditions = []
+        params = []
+
+        if level:
+            conditions.append("log_level = ?")
+            params.append(level)
+
+        if module:
+            conditions.append("module = ?")
+            params.append(module)
+
+        if start_date:
+            conditions.append("timestamp >= ?")
+            params.append(start_date)
+
+        if end_date:
+            # Include the entire end date whatever the timestamp format
+            conditions.append("timestamp < DATE(?, '+1 day')")
+            params.append(end_date)
+
+        return conditions, params
+
+    def _log_partitions(self, start_date: Optional[str], end_date: Optional[str]) -> List[Optional[str]]:
+        """Archived months in the range, oldest first, then None for the live table."""
+        months = []
+        if self.archive_service:
+            months = list(reversed(self.archive_service.partitions_in_range(start_date, end_date)))
+        return months + [None]
+
+    def _read_log_partition(self, month: Optional[str], query: str, params: List[Any]) -> list:
+        """Run a {table} query against the live table or one archived month."""
+        if month is None:
+            return self.db_manager.execute_with_retry(query.format(table='system_logs'), params)
+        return self.archive_service.read_partition('system_logs', month, query, params)
+
+    def count_logs(self,
+                   level: Optional[str] = None,
+                   module: Optional[str] = None,
+                   start_date: Optional[str] = None,
+                   end_date: Optional[str] = None) -> int:
+        """
+        Count logs matching the filters, including archived months.
+
+        Returns:
+            Number of matching logs
+        """
+        conditions, params = self._build_log_filters(level, module, start_date, end_date)
+        where = ' AND '.join(conditions) or '1=1'
+        if self.archive_service:
+            return self.archive_service.count_across('system_logs', where, params, start_date, end_date)
+        result = self.db_manager.execute_with_retry(f"SELECT COUNT(*) FROM system_logs WHERE {where}", params)
+        return result[0][0] if result else 0
+
+    def iter_logs(self,
+                  level: Optional[str] = None,
+                  module: Optional[str] = None,
+                  start_date: Optional[str] = None,
+                  end_date: Optional[str] = None,
+                  batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """
+        Stream logs oldest first without loading them all at once.
+
+        Pages are keyed on (timestamp, log_id), and each page is read on its
+        own short connection, so a long export neither holds a read
+        transaction open nor slows down as it goes deeper.
+
+        Args:
+            level: Filter by log level
+            module: Filter by module name
+            start_date: Start date for filtering
+            end_date: End date for filtering (inclusive)
+            batch_size: Rows read per page
+
+        Yields:
+            Log dictionaries
+        """
+        conditions, params = self._build_log_filters(level, module, start_date, end_date)
+        columns = ', '.join(self.EXPORT_COLUMNS)
+
+        for month in self._log_partitions(start_date, end_date):
+            cursor = None
+            while True:
+                page_conditions = list(conditions)
+                page_params = list(params)
+                if cursor is not None:
+                    page_conditions.append("(timestamp, log_id) > (?, ?)")
+                    page_params.extend(cursor)
+
+                query = f"""
+                    SELECT {columns} FROM {{table}}
+                    WHERE {' AND '.join(page_conditions) or '1=1'}
+                    ORDER BY timestamp, log_id
+                    LIMIT ?
+                """
+                rows = self._read_log_partition(month, query, page_params + [batch_size])
+
+                for row in rows:
+                    yield {key: row[key] for key in row.keys()}
+
+                if len(rows) < batch_size:
+                    break
+                cursor = (rows[-1]['timestamp'], rows[-1]['log_id'])
+
+    def export_logs(self,
+                    file_path: str,
+                    export_format: Optional[str] = None,
+                    compress: Optional[bool] = None,
+                    level: Optional[str] = None,
+                    module: Optional[str] = None,
+                    start_date: Optional[str] = None,
+                    end_date: Optional[str] = None,
+                    progress_callback: Optional[Callable[[int, str], None]] = None,
+                    batch_size: int = 1000) -> int:
+        """
+        Stream logs to a JSON Lines, CSV or text file, optionally gzipped.
+
+        Memory use does not depend on the number of logs; there is no row
+        cap. The file is written under a temporary name and renamed when
+        complete, so a failed export never leaves a truncated file behind.
+
+        Args:
+            file_path: Path to the output file
+            export_format: 'jsonl', 'csv' or 'txt' (inferred from the extension
+                           when omitted, e.g. logs.csv.gz)
+            compress: Gzip the output (inferred from a .gz extension when omitted)
+            level: Filter by log level
+            module: Filter by module name
+            start_date: Start date for filtering
+            end_date: End date for filtering (inclusive)
+            progress_callback: Called with (percent, message) after each page
+            batch_size: Rows read per page
+
+        Returns:
+            Number of logs exported
+        """
+        name = file_path.lower()
+        if compress is None:
+            compress = name.endswith('.gz')
+        if export_format is None:
+            base = name[:-3] if name.endswith('.gz') else name
+            export_format = os.path.splitext(base)[1].lstrip('.') or 'txt'
+            if export_format not in self.EXPORT_FORMATS:
+                export_format = 'txt'
+        if export_format not in self.EXPORT_FORMATS:
+            raise ValueError(f"Unsupported export format: {export_format}")
+
+        total = self.count_logs(level, module, start_date, end_date)
+        if progress_callback:
+            progress_callback(0, f"Exporting {total} logs...")
+
+        temp_path = f"{file_path}.part"
+        opener = gzip.open if compress else open
+        count = 0
+        try:
+            # utf-8-sig lets Excel detect the encoding of uncompressed CSV files
+            encoding = 'utf-8-sig' if export_format == 'csv' and not compress else 'utf-8'
+            with opener(temp_path, 'wt', encoding=encoding, newline='') as f:
+                writer = None
+                if export_format == 'csv':
+                    writer = csv.writer(f)
+                    writer.writerow(self.EXPORT_COLUMNS)
+                elif export_format == 'txt':
+                    f.write("FIU Report Management System - System Logs\n")
+                    f.write("=" * 80 + "\n\n")
+
+                for log in self.iter_logs(level, module, start_date, end_date, batch_size):
+                    if export_format == 'jsonl':
+                        f.write(json.dumps(log, ensure_ascii=False, default=str) + "\n")
+                    elif export_format == 'csv':
+                        writer.writerow([log[column] for column in self.EXPORT_COLUMNS])
+                    else:
+                        self._write_text_log(f, log)
+
+                    count += 1
+                    if progress_callback and count % batch_size == 0:
+                        percent = min(99, count * 100 // total) if total else 99
+                        progress_callback(percent, f"Exported {count} of {total} logs")
+
+            os.replace(temp_path, file_path)
+
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        if progress_callback:
+            progress_callback(100, f"Exported {count} logs")
+        self.logger.info(f"Exported {count} logs to {file_path}")
+        return count
+
+    def _write_text_log(self, f, log: Dict[str, Any]):
+        """Write one log entry in the plain-text export layout."""
+        f.write(f"[{log['timestamp']}] [{log['log_level']}] ")
+        f.write(f"[{log['module']}::{log['function_name'] or 'N/A'}]\n")
+
+        if log['username']:
+            f.write(f"User: {log['username']} (ID: {log['user_id']})\n")
+
+        f.write(f"Message: {log['message']}\n")
+
+        if log['exception_type']:
+            f.write(f"Exception: {log['exception_type']}: {log['exception_message']}\n")
+
+        if log['stack_trace']:
+            f.write(f"Stack Trace:\n{log['stack_trace']}\n")
+
+        if log['extra_data']:
+            f.write(f"Extra Data: {log['extra_data']}\n")
+
+        f.write("-" * 80 + "\n\n")
 
     def export_logs_to_file(self,
                            file_path: str,
@@ -340,70 +606,205 @@ class LoggingService:
         Returns:
             Number of logs exported
         """
-        logs = self.get_logs(level, module, start_date, end_date, limit=100000)
-
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write("FIU Report Management System - System Logs\n")
-            f.write("=" * 80 + "\n\n")
-
-            for log in logs:
-                f.write(f"[{log['timestamp']}] [{log['log_level']}] ")
-                f.write(f"[{log['module']}::{log['function_name'] or 'N/A'}]\n")
-
-                if log['username']:
-                    f.write(f"User: {log['username']} (ID: {log['user_id']})\n")
+        return self.export_logs(file_path, 'txt', False, level, module, start_date, end_date)
 
-                f.write(f"Message: {log['message']}\n")
+    # ==================== Analytics ====================
 
-                if log['exception_type']:
-                    f.write(f"Exception: {log['exception_type']}: {log['exception_message']}\n")
-
-                if log['stack_trace']:
-                    f.write(f"Stack Trace:\n{log['stack_trace']}\n")
-
-                if log['extra_data']:
-                    f.write(f"Extra Data: {log['extra_data']}\n")
-
-                f.write("-" * 80 + "\n\n")
-
-        self.logger.info(f"Exported {len(logs)} logs to {file_path}")
-        return len(logs)
+    @staticmethod
+    def _hour_key(moment: datetime) -> str:
+        """Rollup key ('YYYY-MM-DD HH:00') of the hour containing a moment."""
+        return moment.strftime('%Y-%m-%d %H:00')
 
     def get_log_statistics(self) -> Dict[str, Any]:
         """
         Get statistics about logs in the database.
 
+        Read from the hourly rollups, so the cost does not grow with the
+        number of logs; archived logs are included.
+
         Returns:
             Dictionary with log statistics
         """
         stats = {}
 
-        # Total logs
-        result = self.db_manager.execute_with_retry(
-            "SELECT COUNT(*) FROM system_logs"
-        )
-        stats['total_logs'] = result[0][0] if result else 0
-
         # Logs by level
         result = self.db_manager.execute_with_retry(
-            "SELECT log_level, COUNT(*) FROM system_logs GROUP BY log_level"
+            "SELECT log_level, SUM(log_count) FROM log_rollups_hourly GROUP BY log_level"
         )
         stats['by_level'] = {row[0]: row[1] for row in result} if result else {}
 
+        # Total logs
+        stats['total_logs'] = sum(stats['by_level'].values())
+
         # Logs by module
         result = self.db_manager.execute_with_retry(
-            "SELECT module, COUNT(*) FROM system_logs GROUP BY module ORDER BY COUNT(*) DESC LIMIT 10"
+            "SELECT module, SUM(log_count) FROM log_rollups_hourly GROUP BY module ORDER BY 2 DESC LIMIT 10"
         )
         stats['top_modules'] = {row[0]: row[1] for row in result} if result else {}
 
-        # Recent errors
+        # Recent errors, to the hour
+        since = self._hour_key(datetime.now() - timedelta(hours=24))
         result = self.db_manager.execute_with_retry(
-            "SELECT COUNT(*) FROM system_logs WHERE log_level IN ('ERROR', 'CRITICAL') AND timestamp >= datetime('now', '-24 hours')"
+            "SELECT SUM(log_count) FROM log_rollups_hourly WHERE hour >= ? AND log_level IN ('ERROR', 'CRITICAL')",
+            (since,)
         )
-        stats['errors_last_24h'] = result[0][0] if result else 0
+        stats['errors_last_24h'] = (result[0][0] or 0) if result else 0
 
         return stats
 
+    def get_hourly_log_counts(self, hours: int = 48, module: Optional[str] = None,
+                              until: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Get per-hour log counts for error-rate charts.
+
+        Every hour in the window is present, with zeros where nothing was
+        logged.
+
+        Args:
+            hours: Number of hours, ending with the current hour
+            module: Optional module name
+            until: Last hour of the window (default: now)
+
+        Returns:
+            List of dicts with 'hour', 'total', 'errors', 'warnings' and
+            'error_rate' (errors / total), oldest first
+        """
+        last = (until or datetime.now()).replace(minute=0, second=0, microsecond=0)
+        keys = [self._hour_key(last - timedelta(hours=offset)) for offset in range(hours - 1, -1, -1)]
+
+        query = f"""
+            SELECT hour,
+                   SUM(log_count),
+                   SUM(CASE WHEN log_level IN {ERROR_LEVELS} THEN log_count ELSE 0 END),
+                   SUM(CASE WHEN log_level = 'WARNING' THEN log_count ELSE 0 END)
+            FROM log_rollups_hourly
+            WHERE hour BETWEEN ? AND ?{' AND module = ?' if module else ''}
+            GROUP BY hour
+        """
+        params = [keys[0], keys[-1]] + ([module] if module else [])
+        result = self.db_manager.execute_with_retry(query, params)
+        counts = {row[0]: (row[1], row[2], row[3]) for row in result} if result else {}
+
+        series = []
+        for key in keys:
+            total, errors, warnings = counts.get(key, (0, 0, 0))
+            series.append({
+                'hour': key,
+                'total': total,
+                'errors': errors,
+                'warnings': warnings,
+                'error_rate': errors / total if total else 0.0,
+            })
+        return series
+
+    def get_top_exceptions(self, hours: int = 168, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Get the most frequent recurring errors, grouped by fingerprint.
+
+        Args:
+            hours: Look-back window in hours
+            limit: Maximum number of fingerprints
+
+        Returns:
+            List of dicts with 'fingerprint', 'exception_type', 'module',
+            'function_name', 'sample_message', 'count', 'first_seen' and
+            'last_seen', most frequent first
+        """
+        since = self._hour_key(datetime.now() - timedelta(hours=hours - 1))
+        result = self.db_manager.execute_with_retry("""
+            SELECT f.fingerprint, f.exception_type, f.module, f.function_name, f.sample_message,
+                   r.error_count, f.first_seen, f.last_seen
+            FROM (
+                SELECT fingerprint, SUM(error_count) AS error_count
+                FROM log_error_rollups_hourly
+                WHERE hour >= ?
+                GROUP BY fingerprint
+                ORDER BY error_count DESC
+                LIMIT ?
+            ) r
+            JOIN log_error_fingerprints f ON f.fingerprint = r.fingerprint
+            ORDER BY r.error_count DESC, f.last_seen DESC
+        """, (since, limit))
+
+        return [
+            {
+                'fingerprint': row[0],
+                'exception_type': row[1],
+                'module': row[2],
+                'function_name': row[3],
+                'sample_message': row[4],
+                'count': row[5],
+                'first_seen': row[6],
+                'last_seen': row[7],
+            }
+            for row in result
+        ] if result else []
+
+    def detect_error_spikes(self, hours: int = 48, baseline_hours: int = 24,
+                            threshold: float = 3.0, min_errors: int = 5,
+                            series: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """
+        Find hours whose error count is far above the preceding hours.
+
+        Each hour is compared with the mean of the baseline_hours before
+        it; it is a spike when it has at least min_errors errors and lies
+        more than threshold deviations above that mean. The deviation is
+        floored at the square root of the mean (Poisson noise) and at 1,
+        so a quiet baseline does not turn every stray error into a spike.
+
+        Args:
+            hours: Hours to check, ending with the current hour
+            baseline_hours: Hours before each checked hour used as its baseline
+            threshold: Deviations above the baseline mean that count as a spike
+            min_errors: Smallest error count reported as a spike
+            series: Output of get_hourly_log_counts covering at least
+                    hours + baseline_hours (fetched when omitted)
+
+        Returns:
+            List of dicts with 'hour', 'errors', 'baseline' and 'score',
+            oldest first
+        """
+        if series is None:
+            series = self.get_hourly_log_counts(hours + baseline_hours)
+
+        errors = [point['errors'] for point in series]
+        spikes = []
+        for index in range(max(len(series) - hours, baseline_hours), len(series)):
+            window = errors[index - baseline_hours:index]
+            if not window or errors[index] < min_errors:
+                continue
+            mean = sum(window) / len(window)
+            deviation = (sum((value - mean) ** 2 for value in window) / len(window)) ** 0.5
+            score = (errors[index] - mean) / max(deviation, mean ** 0.5, 1.0)
+            if score > threshold:
+                spikes.append({
+                    'hour': series[index]['hour'],
+                    'errors': errors[index],
+                    'baseline': round(mean, 2),
+                    'score': round(score, 2),
+                })
+        return spikes
+
+    def get_log_analytics(self, hours: int = 48, top_limit: int = 10) -> Dict[str, Any]:
+        """
+        Everything the log management view's analytics panel shows.
+
+        Args:
+            hours: Chart window in hours
+            top_limit: Number of recurring exceptions
+
+        Returns:
+            Dictionary with 'statistics', 'hourly', 'top_exceptions' and 'spikes'
+        """
+        baseline_hours = 24
+        series = self.get_hourly_log_counts(hours + baseline_hours)
+        return {
+            'statistics': self.get_log_statistics(),
+            'hourly': series[baseline_hours:],
+            'top_exceptions': self.get_top_exceptions(hours, top_limit),
+            'spikes': self.detect_error_spikes(hours, baseline_hours, series=series),
+        }
+
 
 # Import logging.handlers for RotatingFileHandler
 import logging.handlers
@@ -0,0 +1,229 @@
+"""
+Reference Data Cache
+Shared, versioned in-process cache of dropdown values, column settings and validation rules.
+"""
+
+import json
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Caches shared by every service instance pointing at the same database file
+_caches: Dict[str, 'ReferenceDataCache'] = {}
+_caches_lock = threading.Lock()
+
+
+class ReferenceDataCache:
+    """
+    Versioned snapshot of rarely-changing reference data.
+
+    All dropdown categories and column settings are loaded together with
+    the reference_data_version counter in a single query. The counter is
+    bumped by triggers whenever system_config dropdowns or column_settings
+    change, so writes from other processes are picked up at the next
+    version check. Local writes call invalidate() and take effect at once.
+    """
+
+    # Seconds between change-counter checks; reads in between never touch the DB
+    VERSION_CHECK_INTERVAL = 5.0
+
+    VERSION_KEY = 'reference_data_version'
+
+    def __init__(self, db_manager, logging_service=None):
+        """
+        Initialize the reference data cache.
+
+        Args:
+            db_manager: DatabaseManager instance
+            logging_service: Optional LoggingService instance
+        """
+        self.db_manager = db_manager
+        self.logger = logging_service
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict] = None
+        self._version: Optional[str] = None
+        self._restore_generation = None
+        self._checked_at = 0.0
+
+    def _load(self) -> Dict:
+        """Load every dropdown value and column setting in one query."""
+        query = """
+            SELECT 'dropdown', config_category, config_value, config_id,
+                   display_order, is_active, config_key
+            FROM system_config
+            WHERE config_type = 'dropdown'
+            UNION ALL
+            SELECT 'column', column_name, display_name_en, display_name_ar,
+                   is_required, is_visible, validation_rules
+            FROM column_settings
+            UNION ALL
+            SELECT 'version', key, value, NULL, NULL, NULL, NULL
+            FROM system_metadata
+            WHERE key = ?
+        """
+        rows = self.db_manager.execute_with_retry(query, (self.VERSION_KEY,))
+
+        dropdowns: Dict[str, List[Dict]] = {}
+        columns: Dict[str, Dict] = {}
+        version = None
+        for kind, name, value, extra, flag_a, flag_b, text in rows:
+            if kind == 'dropdown':
+                dropdowns.setdefault(name, []).append({
+                    'id': extra,
+                    'key': text,
+                    'value': value,
+                    'display_order': flag_a,
+                    'is_active': flag_b,
+                })
+            elif kind == 'column':
+                validation_rules = None
+                if text:
+                    try:
+                        validation_rules = json.loads(text)
+                    except ValueError:
+                        validation_rules = None
+                columns[name] = {
+                    'column_name': name,
+                    'display_name_en': value,
+                    'display_name_ar': extra,
+                    'is_required': flag_a,
+                    'is_visible': flag_b,
+                    'validation_rules': validation_rules,
+                }
+            else:
+                version = value
+
+        for values in dropdowns.values():
+            values.sort(key=lambda item: (item['display_order'] or 0, item['value']))
+
+        self._version = version
+        self._restore_generation = getattr(self.db_manager, 'restore_generation', None)
+        return {
+            'dropdowns': dropdowns,
+            'active_dropdowns': {
+                category: [item['value'] for item in values if item['is_active']]
+                for category, values in dropdowns.items()
+            },
+            'columns': columns,
+        }
+
+    def _read_version(self) -> Optional[str]:
+        """Read the reference data change counter."""
+        result = self.db_manager.execute_with_retry(
+            "SELECT value FROM system_metadata WHERE key = ?", (self.VERSION_KEY,)
+        )
+        return result[0][0] if result else None
+
+    def snapshot(self) -> Dict:
+        """
+        Get the current snapshot, reloading it if the data changed.
+
+        Returns:
+            Dictionary with 'dropdowns', 'active_dropdowns' and 'columns'
+        """
+        with self._lock:
+            now = time.monotonic()
+            if self._snapshot is not None and now - self._checked_at < self.VERSION_CHECK_INTERVAL:
+                return self._snapshot
+
+            try:
+                if (self._snapshot is not None
+                        and self._restore_generation == getattr(self.db_manager, 'restore_generation', None)
+                        and self._read_version() == self._version):
+                    self._checked_at = now
+                    return self._snapshot
+
+                self._snapshot = self._load()
+                self._checked_at = now
+            except Exception as e:
+                if self.logger:
+                    self.logger.error(f"Error loading reference data: {str(e)}")
+                if self._snapshot is None:
+                    return {'dropdowns': {}, 'active_dropdowns': {}, 'columns': {}}
+
+            return self._snapshot
+
+    def invalidate(self):
+        """Drop the snapshot so the next read reloads it."""
+        with self._lock:
+            self._snapshot = None
+            self._version = None
+
+    def derived(self, name: str, builder: Callable[[Dict], Any]) -> Any:
+        """
+        Get a value computed from the snapshot, building it once per snapshot.
+
+        Derived values (e.g. compiled validators) are dropped together with
+        the snapshot, so they never outlive the data they were built from.
+
+        Args:
+            name: Name of the derived value
+            builder: Function building the value from the snapshot
+
+        Returns:
+            The derived value
+        """
+        snapshot = self.snapshot()
+        derived = snapshot.setdefault('derived', {})
+        if name not in derived:
+            derived[name] = builder(snapshot)
+        return derived[name]
+
+    def get_active_dropdown_values(self, category: str) -> List[str]:
+        """
+        Get active dropdown values for a category.
+
+        Args:
+            category: Category name
+
+        Returns:
+            List of string values in display order
+        """
+        return list(self.snapshot()['active_dropdowns'].get(category, []))
+
+    def get_column_setting(self, column_name: str) -> Optional[Dict]:
+        """
+        Get settings for a column.
+
+        Args:
+            column_name: Column name in column_settings table
+
+        Returns:
+            Dictionary with column settings, or None if not found
+        """
+        return self.snapshot()['columns'].get(column_name)
+
+    def get_validation_rules(self, column_name: str) -> Optional[Dict]:
+        """
+        Get parsed validation rules for a column.
+
+        Args:
+            column_name: Column name in column_settings table
+
+        Returns:
+            Dictionary with validation rules, or None if not set
+        """
+        setting = self.get_column_setting(column_name)
+        return setting['validation_rules'] if setting else None
+
+
+def get_reference_data_cache(db_manager, logging_service=None) -> ReferenceDataCache:
+    """
+    Get the shared reference data cache for a database.
+
+    Args:
+        db_manager: DatabaseManager instance
+        logging_service: Optional LoggingService instance
+
+    Returns:
+        ReferenceDataCache instance
+    """
+    with _caches_lock:
+        cache = _caches.get(db_manager.db_path)
+        if cache is None:
+            cache = ReferenceDataCache(db_manager, logging_service)
+            _caches[db_manager.db_path] = cache
+        elif cache.logger is None:
+            cache.logger = logging_service
+        return cache
@@ -0,0 +1,553 @@
+"""
+Report Import Service
+Bulk import of reports from CSV/XLSX files in validated, chunked transactions.
+"""
+
+import csv
+import json
+import os
+import re
+import time
+from datetime import date, datetime
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from services.report_service import ReportService
+from services.validation_service import RequiredRule
+from utils.tracing import trace_service
+
+
+# Fields an import file may set; versioning and approval state are owned by the importer
+IMPORT_FIELDS = ReportService.ALLOWED_FIELDS - {'current_version', 'approval_status'}
+
+# Fields that are assigned in blocks when the file leaves them empty
+ASSIGNED_FIELDS = ('sn', 'report_number')
+
+CHECKBOX_FIELDS = ('legal_entity_owner_checkbox', 'acc_membership_checkbox')
+
+# Accepted report_date formats; dates are stored as DD/MM/YYYY
+DATE_INPUT_FORMATS = ('%d/%m/%Y', '%Y-%m-%d', '%d-%m-%Y', '%Y/%m/%d')
+DATE_STORAGE_FORMAT = '%d/%m/%Y'
+
+TRUE_VALUES = {'1', 'true', 'yes', 'y', 'x', 'نعم'}
+
+
+@trace_service
+class ReportImportService:
+    """
+    Service for importing reports in bulk.
+
+    Rows are streamed from the source file and processed in chunks. Each
+    chunk is validated column-wise, gets its missing serial and report
+    numbers assigned in one block, and is written (reports, change
+    history, initial versions and approval requests) with executemany in
+    a single transaction. Rejected rows are streamed to a reject CSV with
+    the reason next to the original values.
+    """
+
+    DEFAULT_CHUNK_SIZE = 500
+
+    def __init__(self, db_manager, logging_service, validation_service):
+        """
+        Initialize the report import service.
+
+        Args:
+            db_manager: DatabaseManager instance
+            logging_service: LoggingService instance
+            validation_service: ValidationService instance
+        """
+        self.db_manager = db_manager
+        self.logger = logging_service
+        self.validation_service = validation_service
+        self.import_rules = {
+            'reported_entity_name': [RequiredRule("Reported entity name is required")],
+        }
+
+    # ==================== READING ====================
+
+    def read_rows(self, file_path: str) -> Tuple[List[str], Iterator[Tuple[int, Dict[str, Any]]], int]:
+        """
+        Open an import file for streaming.
+
+        Args:
+            file_path: Path to a .csv or .xlsx file
+
+        Returns:
+            Tuple of (headers, iterator of (row_number, raw_row), estimated_total_rows)
+
+        Raises:
+            ValueError: If the file type is not supported or the file has no header
+        """
+        extension = os.path.splitext(file_path)[1].lower()
+        if extension == '.csv':
+            return self._read_csv(file_path)
+        if extension in ('.xlsx', '.xlsm'):
+            return self._read_xlsx(file_path)
+        raise ValueError(f"Unsupported import file type: {extension or file_path}")
+
+    def _read_csv(self, file_path: str):
+        """Stream rows from a CSV file."""
+        with open(file_path, 'r', encoding='utf-8-sig', newline='') as f:
+            total = max(sum(1 for _ in f) - 1, 0)
+
+        f = open(file_path, 'r', encoding='utf-8-sig', newline='')
+        reader = csv.reader(f)
+        headers = next(reader, None)
+        if not headers:
+            f.close()
+            raise ValueError("Import file has no header row")
+        headers = [header.strip() for header in headers]
+
+        def rows():
+            try:
+                # Row 1 is the header, so data rows start at 2 like in a spreadsheet
+                for row_number, values in enumerate(reader, start=2):
+                    if not any(value.strip() for value in values):
+                        continue
+                    yield row_number, dict(zip(headers, values))
+            finally:
+                f.close()
+
+        return headers, rows(), total
+
+    def _read_xlsx(self, file_path: str):
+        """Stream rows from the first worksheet of an XLSX file."""
+        try:
+            from openpyxl import load_workbook
+        except ImportError:
+            raise ValueError("The openpyxl library is required for Excel import")
+
+        workbook = load_workbook(file_path, read_only=True, data_only=True)
+        sheet = workbook.worksheets[0]
+        row_iter = sheet.iter_rows(values_only=True)
+        header_row = next(row_iter, None)
+        if not header_row or not any(header_row):
+            workbook.close()
+            raise ValueError("Import file has no header row")
+        headers = [str(header).strip() if header is not None else '' for header in header_row]
+        total = max((sheet.max_row or 1) - 1, 0)
+
+        def rows():
+            try:
+                for row_number, values in enumerate(row_iter, start=2):
+                    if not any(value not in (None, '') for value in values):
+                        continue
+                    yield row_number, dict(zip(headers, values))
+            finally:
+                workbook.close()
+
+        return headers, rows(), total
+
+    # ==================== MAPPING ====================
+
+    @staticmethod
+    def _normalize_header(header: str) -> str:
+        """Normalize a header for matching (case, spaces and punctuation)."""
+        return re.sub(r'[^0-9a-z؀-ۿ]+', '_', str(header).strip().lower()).strip('_')
+
+    def map_headers(self, headers: List[str]) -> Dict[str, str]:
+        """
+        Map file headers to report columns.
+
+        Headers match a column name or its English/Arabic display name
+        from column settings.
+
+        Args:
+            headers: Headers of the import file
+
+        Returns:
+            Dictionary of header -> column name (unmapped headers are left out)
+        """
+        lookup = {self._normalize_header(field): field for field in IMPORT_FIELDS}
+        reference_cache = getattr(self.validation_service, 'reference_cache', None)
+        if reference_cache:
+            for column_name, setting in reference_cache.snapshot()['columns'].items():
+                if column_name not in IMPORT_FIELDS:
+                    continue
+                for display_name in (setting.get('display_name_en'), setting.get('display_name_ar')):
+                    if display_name:
+                        lookup.setdefault(self._normalize_header(display_name), column_name)
+
+        mapping = {}
+        for header in headers:
+            column_name = lookup.get(self._normalize_header(header))
+            if column_name and column_name not in mapping.values():
+                mapping[header] = column_name
+        return mapping
+
+    @staticmethod
+    def _convert_value(column_name: str, value: Any) -> Any:
+        """Convert a raw cell value to the form stored in the reports table."""
+        if value is None:
+            return None
+        if isinstance(value, str):
+            value = value.strip()
+            if not value:
+                return None
+
+        if column_name in CHECKBOX_FIELDS:
+            return 1 if str(value).strip().lower() in TRUE_VALUES else 0
+
+        if isinstance(value, datetime):
+            value = value.date()
+        if isinstance(value, date):
+            return value.strftime(DATE_STORAGE_FORMAT)
+
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+
+        if column_name == 'sn':
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return str(value)
+
+        return value if isinstance(value, (int, str)) else str(value)
+
+    @staticmethod
+    def _normalize_date(value: Any) -> Optional[str]:
+        """Return a report date as DD/MM/YYYY, or None if it cannot be parsed."""
+        if not isinstance(value, str):
+            return None
+        for date_format in DATE_INPUT_FORMATS:
+            try:
+                return datetime.strptime(value, date_format).strftime(DATE_STORAGE_FORMAT)
+            except ValueError:
+                continue
+        return None
+
+    def _build_record(self, raw_row: Dict[str, Any], mapping: Dict[str, str]) -> Dict[str, Any]:
+        """Build a report record from a raw row."""
+        record = {}
+        for header, column_name in mapping.items():
+            value = self._convert_value(column_name, raw_row.get(header))
+            if value is not None:
+                record[column_name] = value
+        return record
+
+    # ==================== IMPORT ====================
+
+    def import_file(self, file_path: str, user: Dict[str, Any],
+                    progress_callback: Optional[Callable[[int, str], None]] = None,
+                    reject_path: Optional[str] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    dry_run: bool = False) -> Tuple[bool, str, Dict[str, Any]]:
+        """
+        Import reports from a CSV or XLSX file.
+
+        Reports created by an admin are approved directly; reports imported
+        by other users are submitted for approval, as in create_report().
+
+        Args:
+            file_path: Path to the import file
+            user: Importing user (dictionary with 'user_id', 'username' and 'role')
+            progress_callback: Optional callback(percent, message)
+            reject_path: Reject CSV path (defaults to <file>.rejects.csv)
+            chunk_size: Number of rows per validation batch and transaction
+            dry_run: Validate and number the rows but roll every chunk back
+
+        Returns:
+            Tuple of (success, message, stats)
+        """
+        stats = {
+            'total_rows': 0,
+            'imported': 0,
+            'rejected': 0,
+            'elapsed_seconds': 0.0,
+            'rows_per_second': 0.0,
+            'reject_file': None,
+            'dry_run': dry_run,
+        }
+        reject_path = reject_path or f"{os.path.splitext(file_path)[0]}.rejects.csv"
+        reject_file = None
+        started = time.monotonic()
+
+        try:
+            headers, rows, estimated_total = self.read_rows(file_path)
+            mapping = self.map_headers(headers)
+            if 'reported_entity_name' not in mapping.values() or 'report_date' not in mapping.values():
+                return False, "Import file must have report date and reported entity name columns", stats
+
+            unmapped = [header for header in headers if header and header not in mapping]
+            if unmapped:
+                self.logger.warning(f"Report import ignores unknown columns: {unmapped}")
+
+            reject_writer = None
+            seen = {'sn': set(), 'report_number': set()}
+
+            def write_rejects(rejects: List[Tuple[int, Dict[str, Any], str]]):
+                nonlocal reject_file, reject_writer
+                if not rejects:
+                    return
+                if reject_writer is None:
+                    reject_file = open(reject_path, 'w', encoding='utf-8-sig', newline='')
+                    reject_writer = csv.writer(reject_file)
+                    reject_writer.writerow(headers + ['import_row', 'import_errors'])
+                for row_number, raw_row, message in rejects:
+                    reject_writer.writerow(
+                        [raw_row.get(header, '') for header in headers] + [row_number, message]
+                    )
+                stats['rejected'] += len(rejects)
+
+            chunk = []
+            for row in rows:
+                chunk.append(row)
+                if len(chunk) >= chunk_size:
+                    self._process_chunk(chunk, mapping, user, seen, stats, write_rejects, dry_run)
+                    self._report_progress(progress_callback, stats, estimated_total, started)
+                    chunk = []
+            if chunk:
+                self._process_chunk(chunk, mapping, user, seen, stats, write_rejects, dry_run)
+                self._report_progress(progress_callback, stats, estimated_total, started)
+
+        except Exception as e:
+            self.logger.error(f"Error importing reports from {file_path}: {str(e)}", exc_info=True)
+            return False, f"Error importing reports: {str(e)}", stats
+        finally:
+            if reject_file:
+                reject_file.close()
+
+        elapsed = time.monotonic() - started
+        stats['elapsed_seconds'] = round(elapsed, 2)
+        stats['rows_per_second'] = round(stats['total_rows'] / elapsed, 1) if elapsed > 0 else 0.0
+        if stats['rejected']:
+            stats['reject_file'] = reject_path
+
+        if stats['imported'] and not dry_run:
+            self._log_import(file_path, user, stats)
+
+        message = (f"{'Validated' if dry_run else 'Imported'} {stats['imported']} of "
+                   f"{stats['total_rows']} rows ({stats['rows_per_second']} rows/sec)")
+        if stats['rejected']:
+            message += f"; {stats['rejected']} rejected, see {reject_path}"
+        return True, message, stats
+
+    def _report_progress(self, progress_callback, stats: Dict, estimated_total: int, started: float):
+        """Emit progress with the current throughput."""
+        if not progress_callback:
+            return
+        elapsed = time.monotonic() - started
+        rate = stats['total_rows'] / elapsed if elapsed > 0 else 0.0
+        percent = min(99, int(stats['total_rows'] * 100 / estimated_total)) if estimated_total else 0
+        progress_callback(percent, f"{stats['total_rows']} rows processed, {rate:.0f} rows/sec")
+
+    def _process_chunk(self, chunk: List[Tuple[int, Dict[str, Any]]], mapping: Dict[str, str],
+                       user: Dict[str, Any], seen: Dict[str, set], stats: Dict,
+                       write_rejects: Callable, dry_run: bool):
+        """Validate, number and insert one chunk of rows."""
+        stats['total_rows'] += len(chunk)
+        records = [self._build_record(raw_row, mapping) for _, raw_row in chunk]
+        row_errors: Dict[int, List[str]] = {}
+
+        for index, record in enumerate(records):
+            if 'report_date' in record:
+                normalized = self._normalize_date(record['report_date'])
+                if normalized:
+                    record['report_date'] = normalized
+                else:
+                    row_errors.setdefault(index, []).append(
+                        "report_date: Invalid date (use DD/MM/YYYY)"
+                    )
+            else:
+                row_errors.setdefault(index, []).append("report_date: Report date is required")
+            if 'sn' in record and not isinstance(record['sn'], int):
+                row_errors.setdefault(index, []).append("sn: Serial number must be a whole number")
+
+        result = self.validation_service.validate_records(
+            records, rules=self.import_rules, optional_fields=ASSIGNED_FIELDS
+        )
+        for index, field_errors in result['errors'].items():
+            row_errors.setdefault(index, []).extend(
+                f"{field_name}: {message}" for field_name, message in field_errors.items()
+            )
+
+        # Duplicates inside the file
+        for field_name in ASSIGNED_FIELDS:
+            for index, record in enumerate(records):
+                value = record.get(field_name)
+                if value is None or index in row_errors:
+                    continue
+                if value in seen[field_name]:
+                    row_errors.setdefault(index, []).append(f"{field_name}: Duplicate in import file")
+                else:
+                    seen[field_name].add(value)
+
+        valid = [index for index in range(len(records)) if index not in row_errors]
+        if valid:
+            try:
+                conflicts = self._insert_chunk([records[index] for index in valid], user, dry_run)
+                for position, message in conflicts.items():
+                    row_errors.setdefault(valid[position], []).append(message)
+            except Exception as e:
+                self.logger.error(f"Error importing report chunk: {str(e)}", exc_info=True)
+                for index in valid:
+                    row_errors.setdefault(index, []).append(f"Database error: {str(e)}")
+
+        stats['imported'] += len(records) - len(row_errors)
+        write_rejects([
+            (chunk[index][0], chunk[index][1], '; '.join(messages))
+            for index, messages in sorted(row_errors.items())
+        ])
+
+    def _insert_chunk(self, records: List[Dict[str, Any]], user: Dict[str, Any],
+                      dry_run: bool) -> Dict[int, str]:
+        """
+        Insert validated records in one transaction.
+
+        Args:
+            records: Validated records (modified in place with assigned numbers)
+            user: Importing user
+            dry_run: Roll the transaction back instead of committing
+
+        Returns:
+            Dictionary of record position -> error for records that were not inserted
+        """
+        username = user['username']
+        is_admin = user.get('role') == 'admin'
+        conflicts: Dict[int, str] = {}
+
+        with self.db_manager.get_connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            cursor = conn.cursor()
+
+            # Supplied numbers that already exist in the database
+            for field_name in ASSIGNED_FIELDS:
+                supplied = {record[field_name] for record in records if record.get(field_name) is not None}
+                if not supplied:
+                    continue
+                placeholders = ', '.join(['?'] * len(supplied))
+                cursor.execute(
+                    f"SELECT {field_name} FROM reports WHERE {field_name} IN ({placeholders})",
+                    list(supplied)
+                )
+                existing = {row[0] for row in cursor.fetchall()}
+                for position, record in enumerate(records):
+                    if record.get(field_name) in existing:
+                        conflicts.setdefault(position, f"{field_name}: Already exists")
+
+            to_insert = [record for position, record in enumerate(records) if position not in conflicts]
+            if not to_insert:
+                conn.rollback()
+                return conflicts
+
+            self._assign_numbers(cursor, to_insert)
+
+            now = datetime.now().isoformat()
+            approval_status = 'approved' if is_admin else 'pending_approval'
+
+            # Group rows by the columns they set so column defaults still apply
+            groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+            for record in to_insert:
+                groups.setdefault(tuple(sorted(record)), []).append(record)
+            for columns, group in groups.items():
+                fields = list(columns) + ['approval_status', 'current_version', 'created_by', 'created_at']
+                cursor.executemany(
+                    f"INSERT INTO reports ({', '.join(fields)}) VALUES ({', '.join(['?'] * len(fields))})",
+                    [[record[column] for column in columns] + [approval_status, 1, username, now]
+                     for record in group]
+                )
+
+            report_numbers = [record['report_number'] for record in to_insert]
+            cursor.execute(
+                f"SELECT * FROM reports WHERE report_number IN ({', '.join(['?'] * len(report_numbers))})",
+                report_numbers
+            )
+            created = [dict(row) for row in cursor.fetchall()]
+
+            cursor.executemany("""
+                INSERT INTO change_history (table_name, record_id, field_name, old_value, new_value, change_type, changed_by)
+                VALUES ('reports', ?, 'report_created', NULL, ?, 'INSERT', ?)
+            """, [(report['report_id'], report['report_number'], username) for report in created])
+
+            cursor.executemany("""
+                INSERT INTO report_versions (report_id, version_number, snapshot_data, change_summary, created_by)
+                VALUES (?, 1, ?, 'Initial creation (import)', ?)
+            """, [(report['report_id'], json.dumps(report, default=str), username) for report in created])
+
+            if not is_admin:
+                cursor.executemany("""
+                    INSERT INTO report_approvals (report_id, version_id, approval_status, requested_by, approval_comment, requested_at)
+                    VALUES (?, NULL, 'pending', ?, 'Auto-submitted on import', datetime('now'))
+                """, [(report['report_id'], username) for report in created])
+
+            if dry_run:
+                conn.rollback()
+
+        return conflicts
+
+    @staticmethod
+    def _assign_numbers(cursor, records: List[Dict[str, Any]]):
+        """
+        Assign serial and report numbers to records that have none.
+
+        Numbers are allocated in one block per chunk, after the highest
+        number in use by reports, unused reservations and the chunk itself,
+        so they never collide with numbers handed out by ReportNumberService.
+        Must run inside the chunk's write transaction.
+        """
+        missing_sn = [record for record in records if record.get('sn') is None]
+        if missing_sn:
+            cursor.execute("""
+                SELECT MAX(
+                    (SELECT COALESCE(MAX(sn), 0) FROM reports),
+                    (SELECT COALESCE(MAX(serial_number), 0) FROM report_number_reservations WHERE is_used = 0)
+                )
+            """)
+            next_sn = max(
+                [cursor.fetchone()[0]]
+                + [record['sn'] for record in records if isinstance(record.get('sn'), int)]
+            ) + 1
+            for record in missing_sn:
+                record['sn'] = next_sn
+                next_sn += 1
+
+        missing_number: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            if record.get('report_number') is None:
+                day, month, year = record['report_date'].split('/')
+                missing_number.setdefault(f"{year}/{month}/", []).append(record)
+
+        for prefix, group in missing_number.items():
+            highest = 0
+            for query in (
+                "SELECT report_number FROM reports WHERE report_number LIKE ?",
+                "SELECT report_number FROM report_number_reservations WHERE report_number LIKE ? AND is_used = 0",
+            ):
+                cursor.execute(query, (f"{prefix}%",))
+                numbers = [row[0] for row in cursor.fetchall()]
+                numbers += [record['report_number'] for record in records
+                            if str(record.get('report_number') or '').startswith(prefix)]
+                for number in numbers:
+                    suffix = str(number)[len(prefix):]
+                    if suffix.isdigit():
+                        highest = max(highest, int(suffix))
+
+            for record in group:
+                highest += 1
+                record['report_number'] = f"{prefix}{highest:03d}"
+
+    def _log_import(self, file_path: str, user: Dict[str, Any], stats: Dict[str, Any]):
+        """Record the import in the system log and activity feed."""
+        details = {
+            'file': os.path.basename(file_path),
+            'imported': stats['imported'],
+            'rejected': stats['rejected'],
+            'rows_per_second': stats['rows_per_second'],
+        }
+        self.logger.log_user_action("REPORTS_IMPORTED", details)
+
+        if user.get('user_id') is None:
+            return
+        try:
+            with self.db_manager.get_connection() as conn:
+                conn.execute("""
+                    INSERT INTO activity_log
+                    (user_id, username, action_type, description, metadata)
+                    VALUES (?, ?, 'CREATE', ?, ?)
+                """, (
+                    user.get('user_id'),
+                    user['username'],
+                    f"{user['username']} imported {stats['imported']} reports from {details['file']}",
+                    json.dumps(details)
+                ))
+        except Exception as e:
+            self.logger.warning(f"Failed to record import activity: {str(e)}")
@@ -15,7 +15,10 @@ from datetime import datetime, timedelta
 import threading
 import time
 
+from utils.tracing import trace_service
 
+
+@trace_service
 class ReportNumberService:
     """
     Thread-safe service for managing report numbers and serial numbers.
@@ -7,7 +7,10 @@ import json
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple, Any
 
+from utils.tracing import trace_service
 
+
+@trace_service
 class ReportService:
     """Service for managing financial crime reports."""
 
@@ -440,47 +443,11 @@ class ReportService:
         """
         try:
             # Build query
-            if include_deleted:
-                query = "SELECT * FROM reports WHERE 1=1"
-                count_query = "SELECT COUNT(*) FROM reports WHERE 1=1"
-            else:
-                query = "SELECT * FROM reports WHERE is_deleted = 0"
-                count_query = "SELECT COUNT(*) FROM reports WHERE is_deleted = 0"
-            params = []
-
-            if status:
-                query += " AND status = ?"
-                count_query += " AND status = ?"
-                params.append(status)
-
-            if search_term:
-                query += """ AND (
-                    report_number LIKE ? OR
-                    reported_entity_name LIKE ? OR
-                    cic LIKE ?
-                )"""
-                count_query += """ AND (
-                    report_number LIKE ? OR
-                    reported_entity_name LIKE ? OR
-                    cic LIKE ?
-                )"""
-                search_pattern = f"%{search_term}%"
-                params.extend([search_pattern, search_pattern, search_pattern])
-
-            if date_from:
-                query += " AND report_date >= ?"
-                count_query += " AND report_date >= ?"
-                params.append(date_from)
-
-            if date_to:
-                query += " AND report_date <= ?"
-                count_query += " AND report_date <= ?"
-                params.append(date_to)
-
-            if created_by:
-                query += " AND created_by = ?"
-                count_query += " AND created_by = ?"
-                params.append(created_by)
+            where_clause, params = self._build_report_filters(
+                status, search_term, date_from, date_to, created_by, include_deleted
+            )
+            query = f"SELECT * FROM reports WHERE {where_clause}"
+            count_query = f"SELECT COUNT(*) FROM reports WHERE {where_clause}"
 
             # Get total count
             count_result = self.db_manager.execute_with_retry(count_query, params)
@@ -509,6 +476,119 @@ class ReportService:
             self.logger.error(f"Error fetching reports: {str(e)}", exc_info=True)
             return [], 0
 
+    def get_report_rows(self,
+                        columns: List[str],
+                        status: Optional[str] = None,
+                        search_term: Optional[str] = None,
+                        date_from: Optional[str] = None,
+                        date_to: Optional[str] = None,
+                        created_by: Optional[str] = None,
+                        sort_column: str = 'created_at',
+                        sort_descending: bool = True,
+                        limit: int = 500,
+                        offset: int = 0,
+                        with_count: bool = True) -> Tuple[List[tuple], Optional[int]]:
+        """
+        Get a batch of reports as compact tuples for the virtualized reports grid.
+
+        Only the requested columns are read and sorting happens in the
+        database, so the grid can page through large result sets cheaply.
+
+        Args:
+            columns: Column names to return (unknown columns come back as None)
+            status: Filter by status
+            search_term: Search in report_number, reported_entity_name, cic
+            date_from: Filter by start date (YYYY-MM-DD)
+            date_to: Filter by end date (YYYY-MM-DD)
+            created_by: Filter by creator
+            sort_column: Column to sort by
+            sort_descending: Sort direction
+            limit: Batch size
+            offset: Rows to skip
+            with_count: Whether to also count all matching rows
+
+        Returns:
+            Tuple of (rows as (report_id, *columns) tuples, total count or None)
+        """
+        try:
+            table_columns = set(self.db_manager.get_table_columns('reports'))
+            select_list = ', '.join(
+                column if column in table_columns else f"NULL AS {column}"
+                for column in columns
+                if column.isidentifier()
+            )
+            if sort_column not in table_columns:
+                sort_column = 'created_at'
+            direction = 'DESC' if sort_descending else 'ASC'
+
+            where_clause, params = self._build_report_filters(
+                status, search_term, date_from, date_to, created_by
+            )
+
+            total_count = None
+            if with_count:
+                count_result = self.db_manager.execute_with_retry(
+                    f"SELECT COUNT(*) FROM reports WHERE {where_clause}", params
+                )
+                total_count = count_result[0][0] if count_result else 0
+
+            # report_id breaks ties so batches never overlap or skip rows
+            query = f"""
+                SELECT report_id, {select_list} FROM reports
+                WHERE {where_clause}
+                ORDER BY {sort_column} {direction}, report_id {direction}
+                LIMIT ? OFFSET ?
+            """
+            result = self.db_manager.execute_with_retry(query, params + [limit, offset])
+            return [tuple(row) for row in result], total_count
+
+        except Exception as e:
+            self.logger.error(f"Error fetching report rows: {str(e)}", exc_info=True)
+            raise
+
+    def _build_report_filters(self,
+                              status: Optional[str] = None,
+                              search_term: Optional[str] = None,
+                              date_from: Optional[str] = None,
+                              date_to: Optional[str] = None,
+                              created_by: Optional[str] = None,
+                              include_deleted: bool = False) -> Tuple[str, List]:
+        """
+        Build the WHERE clause shared by report list queries.
+
+        Returns:
+            Tuple of (where clause, parameters)
+        """
+        conditions = ["1=1"] if include_deleted else ["is_deleted = 0"]
+        params = []
+
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+
+        if search_term:
+            conditions.append("""(
+                    report_number LIKE ? OR
+                    reported_entity_name LIKE ? OR
+                    cic LIKE ?
+                )""")
+            search_pattern = f"%{search_term}%"
+            params.extend([search_pattern, search_pattern, search_pattern])
+
+        if date_from:
+            conditions.append("report_date >= ?")
+            params.append(date_from)
+
+        if date_to:
+            conditions.append("report_date <= ?")
+            params.append(date_to)
+
+        if created_by:
+            conditions.append("created_by = ?")
+            params.append(created_by)
+
+        return " AND ".join(conditions), params
+
     def update_report_status(self, report_id: int, new_status: str, comment: Optional[str] = None) -> Tuple[bool, str]:
         """
         Update report status.
@@ -7,7 +7,10 @@ import json
 from typing import Tuple, Optional, Dict, List
 from datetime import datetime
 
+from utils.tracing import trace_service
 
+
+@trace_service
 class RestoreService:
     """
     Service for restoring deleted reports with complete audit trail.
@@ -3,16 +3,30 @@ Settings Service
 Manages application settings and preferences with database persistence.
 """
 
+import atexit
 import json
-from typing import Any, Dict, Optional
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from utils.tracing import trace_service
 
+
+@trace_service
 class SettingsService:
     """
     Service for managing application settings.
 
     Settings are stored per-user in the database with JSON serialization.
     Provides defaults and type-safe access to settings.
+
+    Each user's settings are read once (at login, or on first access)
+    and kept in memory, so lookups never touch the database. Changes
+    update the cache immediately and are written behind: a burst of
+    saves, such as column resizes, is coalesced into one write once
+    the changes settle. Only the changed keys are written, merged into
+    the stored row, so changes saved meanwhile by another client are
+    kept. Listeners are notified of each changed key.
     """
 
     # Default settings
@@ -72,17 +86,45 @@ class SettingsService:
         'verbose_logging': False,
     }
 
-    def __init__(self, db_manager, auth_service):
+    UPSERT_QUERY = """
+        INSERT INTO user_settings (user_id, settings_json, updated_at)
+        VALUES (?, ?, CURRENT_TIMESTAMP)
+        ON CONFLICT(user_id) DO UPDATE SET
+            settings_json = excluded.settings_json,
+            updated_at = CURRENT_TIMESTAMP
+    """
+
+    # Write-behind: persist once changes have been quiet this long...
+    WRITE_DELAY = 1.0
+    # ...but never hold a change back longer than this
+    MAX_WRITE_DELAY = 5.0
+
+    def __init__(self, db_manager, auth_service, write_delay: float = WRITE_DELAY):
         """
         Initialize settings service.
 
         Args:
             db_manager: DatabaseManager instance
             auth_service: AuthService instance
+            write_delay: Seconds to wait for further changes before writing;
+                0 writes every change immediately
         """
         self.db_manager = db_manager
         self.auth_service = auth_service
+        self.write_delay = write_delay
+
+        # user_id -> settings merged with defaults
+        self._cache: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+        # user_id -> {key: value} saved but not yet written
+        self._dirty: Dict[int, Dict[str, Any]] = {}
+        self._dirty_since = None
+        self._timer = None
+        self._listeners: List[Tuple[Callable[[int, str, Any], None], Optional[str]]] = []
+
         self._ensure_settings_table()
+        atexit.register(self.flush)
 
     def _ensure_settings_table(self):
         """Ensure settings table exists in database."""
@@ -96,9 +138,44 @@ class SettingsService:
         """
         self.db_manager.execute_with_retry(create_table_sql)
 
-    def get_all_settings(self, user_id: Optional[int] = None) -> Dict[str, Any]:
+    def _resolve_user_id(self, user_id: Optional[int]) -> Optional[int]:
+        """Default to the current user; None when nobody is logged in."""
+        if user_id is not None:
+            return user_id
+        current_user = self.auth_service.get_current_user()
+        return current_user['user_id'] if current_user else None
+
+    def _read_settings(self, user_id: int) -> Dict[str, Any]:
+        """Read a user's settings from the database, merged with defaults."""
+        settings = self.DEFAULTS.copy()
+
+        query = "SELECT settings_json FROM user_settings WHERE user_id = ?"
+        result = self.db_manager.execute_with_retry(query, (user_id,))
+
+        if result and len(result) > 0:
+            try:
+                # result is a list of tuples, get first row, first column
+                settings.update(json.loads(result[0][0]))
+            except json.JSONDecodeError:
+                pass
+
+        return settings
+
+    def _cached_settings(self, user_id: int) -> Dict[str, Any]:
+        """Get the cached settings for a user, loading them on first access."""
+        with self._lock:
+            settings = self._cache.get(user_id)
+            if settings is None:
+                settings = self._read_settings(user_id)
+                self._cache[user_id] = settings
+            return settings
+
+    def load_user_settings(self, user_id: Optional[int] = None) -> Dict[str, Any]:
         """
-        Get all settings for a user.
+        Load a user's settings into the cache, replacing anything cached.
+
+        Called at login so later lookups are served from memory. Changes
+        still waiting to be written are kept.
 
         Args:
             user_id: User ID (if None, uses current user)
@@ -106,27 +183,47 @@ class SettingsService:
         Returns:
             Dictionary of all settings with defaults for missing values
         """
+        user_id = self._resolve_user_id(user_id)
         if user_id is None:
-            current_user = self.auth_service.get_current_user()
-            if not current_user:
-                return self.DEFAULTS.copy()
-            user_id = current_user['user_id']
+            return self.DEFAULTS.copy()
 
-        query = "SELECT settings_json FROM user_settings WHERE user_id = ?"
-        result = self.db_manager.execute_with_retry(query, (user_id,))
+        self.flush()
+        settings = self._read_settings(user_id)
+        with self._lock:
+            self._cache[user_id] = settings
+            return settings.copy()
 
-        if result and len(result) > 0:
-            try:
-                # result is a list of tuples, get first row, first column
-                user_settings = json.loads(result[0][0])
-                # Merge with defaults (defaults for missing keys)
-                settings = self.DEFAULTS.copy()
-                settings.update(user_settings)
-                return settings
-            except json.JSONDecodeError:
-                return self.DEFAULTS.copy()
+    def unload_user_settings(self, user_id: Optional[int] = None):
+        """
+        Write a user's pending changes and drop their cached settings.
 
-        return self.DEFAULTS.copy()
+        Called at logout.
+
+        Args:
+            user_id: User ID (if None, uses current user)
+        """
+        user_id = self._resolve_user_id(user_id)
+        self.flush()
+        if user_id is not None:
+            with self._lock:
+                self._cache.pop(user_id, None)
+
+    def get_all_settings(self, user_id: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Get all settings for a user.
+
+        Args:
+            user_id: User ID (if None, uses current user)
+
+        Returns:
+            Dictionary of all settings with defaults for missing values
+        """
+        user_id = self._resolve_user_id(user_id)
+        if user_id is None:
+            return self.DEFAULTS.copy()
+
+        with self._lock:
+            return self._cached_settings(user_id).copy()
 
     def get_setting(self, key: str, default: Any = None, user_id: Optional[int] = None) -> Any:
         """
@@ -140,13 +237,19 @@ class SettingsService:
         Returns:
             Setting value or default
         """
-        settings = self.get_all_settings(user_id)
-        return settings.get(key, default if default is not None else self.DEFAULTS.get(key))
+        fallback = default if default is not None else self.DEFAULTS.get(key)
+        user_id = self._resolve_user_id(user_id)
+        if user_id is None:
+            return self.DEFAULTS.get(key, fallback)
+        return self._cached_settings(user_id).get(key, fallback)
 
     def save_settings(self, settings: Dict[str, Any], user_id: Optional[int] = None) -> bool:
         """
         Save settings for a user.
 
+        The cache is updated immediately; the database write is deferred
+        until changes have settled (see WRITE_DELAY).
+
         Args:
             settings: Dictionary of settings to save
             user_id: User ID (if None, uses current user)
@@ -154,34 +257,32 @@ class SettingsService:
         Returns:
             True if successful
         """
+        user_id = self._resolve_user_id(user_id)
         if user_id is None:
-            current_user = self.auth_service.get_current_user()
-            if not current_user:
-                return False
-            user_id = current_user['user_id']
-
-        # Get existing settings and merge
-        existing = self.get_all_settings(user_id)
-        existing.update(settings)
-
-        settings_json = json.dumps(existing)
-
-        # Insert or update
-        query = """
-        INSERT INTO user_settings (user_id, settings_json, updated_at)
-        VALUES (?, ?, CURRENT_TIMESTAMP)
-        ON CONFLICT(user_id) DO UPDATE SET
-            settings_json = excluded.settings_json,
-            updated_at = CURRENT_TIMESTAMP
-        """
+            return False
 
         try:
-            self.db_manager.execute_with_retry(query, (user_id, settings_json))
-            return True
+            with self._lock:
+                cached = self._cached_settings(user_id)
+                changed = {key: value for key, value in settings.items()
+                           if key not in cached or cached[key] != value}
+                if not changed:
+                    return True
+                cached.update(changed)
+                self._dirty.setdefault(user_id, {}).update(changed)
+                if self._dirty_since is None:
+                    self._dirty_since = time.monotonic()
         except Exception as e:
             print(f"Error saving settings: {e}")
             return False
 
+        self._notify_listeners(user_id, changed)
+
+        if self.write_delay <= 0:
+            return self.flush()
+        self._schedule_write()
+        return True
+
     def save_setting(self, key: str, value: Any, user_id: Optional[int] = None) -> bool:
         """
         Save a single setting.
@@ -196,6 +297,129 @@ class SettingsService:
         """
         return self.save_settings({key: value}, user_id)
 
+    # ==================== WRITE-BEHIND ====================
+
+    def _schedule_write(self):
+        """(Re)start the write timer, bounded by MAX_WRITE_DELAY."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+            waited = time.monotonic() - (self._dirty_since or time.monotonic())
+            delay = max(0.0, min(self.write_delay, self.MAX_WRITE_DELAY - waited))
+            self._timer = threading.Timer(delay, self.flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    @property
+    def has_pending_writes(self) -> bool:
+        """True if some changes have not been written yet."""
+        return bool(self._dirty)
+
+    def flush(self) -> bool:
+        """
+        Write every user's pending changes now.
+
+        Each user's stored row is re-read inside the write transaction and
+        only the changed keys are merged into it, so settings saved in the
+        meantime by another client (the other UI, or another machine on
+        the shared database) are not overwritten. Keys this client has not
+        changed are refreshed in the cache from the merged row.
+
+        On failure the changes stay pending and the write is retried after
+        the next change or flush.
+
+        Returns:
+            True if the write succeeded (or there was nothing to write)
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not self._dirty:
+                    return True
+                pending = self._dirty
+                self._dirty = {}
+                self._dirty_since = None
+
+            try:
+                merged = {}
+                with self.db_manager.get_connection() as conn:
+                    conn.execute("BEGIN IMMEDIATE")
+                    for user_id, changes in pending.items():
+                        row = conn.execute(
+                            "SELECT settings_json FROM user_settings WHERE user_id = ?", (user_id,)
+                        ).fetchone()
+                        stored = {}
+                        if row:
+                            try:
+                                stored = json.loads(row[0])
+                            except json.JSONDecodeError:
+                                pass
+                        stored.update(changes)
+                        conn.execute(self.UPSERT_QUERY, (user_id, json.dumps(stored)))
+                        merged[user_id] = stored
+
+            except Exception as e:
+                with self._lock:
+                    for user_id, changes in pending.items():
+                        # Changes saved since the snapshot win over the retried ones
+                        changes.update(self._dirty.get(user_id, {}))
+                        self._dirty[user_id] = changes
+                    if self._dirty_since is None:
+                        self._dirty_since = time.monotonic()
+                print(f"Error saving settings: {e}")
+                return False
+
+            with self._lock:
+                for user_id, stored in merged.items():
+                    cached = self._cache.get(user_id)
+                    if cached is None:
+                        continue
+                    newer = self._dirty.get(user_id, {})
+                    cached.update({key: value for key, value in stored.items() if key not in newer})
+            return True
+
+    # ==================== LISTENERS ====================
+
+    def add_listener(self, callback: Callable[[int, str, Any], None], key: Optional[str] = None):
+        """
+        Register a callback for setting changes.
+
+        Callbacks run on the thread that saved the setting, after the
+        cache has been updated.
+
+        Args:
+            callback: Called as callback(user_id, key, value)
+            key: Only report changes to this key (if None, all keys)
+        """
+        with self._lock:
+            self._listeners.append((callback, key))
+
+    def remove_listener(self, callback: Callable[[int, str, Any], None]):
+        """
+        Unregister a change callback.
+
+        Args:
+            callback: Callback passed to add_listener
+        """
+        with self._lock:
+            self._listeners = [(cb, key) for cb, key in self._listeners if cb != callback]
+
+    def _notify_listeners(self, user_id: int, changed: Dict[str, Any]):
+        """Report changed settings to listeners."""
+        with self._lock:
+            listeners = list(self._listeners)
+
+        for callback, watched_key in listeners:
+            for key, value in changed.items():
+                if watched_key is not None and key != watched_key:
+                    continue
+                try:
+                    callback(user_id, key, value)
+                except Exception as e:
+                    print(f"Error in settings listener: {e}")
+
     def reset_to_defaults(self, user_id: Optional[int] = None) -> bool:
         """
         Reset all settings to defaults for a user.
@@ -218,6 +442,10 @@ class SettingsService:
         Returns:
             True if successful
         """
+        with self._lock:
+            self._cache.pop(user_id, None)
+            self._dirty.pop(user_id, None)
+
         query = "DELETE FROM user_settings WHERE user_id = ?"
         try:
             self.db_manager.execute_with_retry(query, (user_id,))
@@ -8,6 +8,9 @@ from typing import Callable, List, Optional, Dict, Any, Tuple
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
 
+from services.reference_data_cache import get_reference_data_cache
+from utils.tracing import trace_service
+
 
 class ValidationRule:
     """Base class for validation rules."""
@@ -323,6 +326,7 @@ class PasswordStrengthRule(ValidationRule):
         return True, ""
 
 
+@trace_service
 class ValidationService:
     """
     Service for validating form data and providing validation feedback.
@@ -351,6 +355,7 @@ class ValidationService:
         """
         self.db_manager = db_manager
         self.logger = logging_service
+        self.reference_cache = get_reference_data_cache(db_manager, logging_service) if db_manager else None
 
     @staticmethod
     def validate_field(value: Any, rules: List[ValidationRule]) -> Tuple[bool, str]:
@@ -476,29 +481,10 @@ class ValidationService:
         Returns:
             Dictionary with validation rules, or None if not found
         """
-        if not self.db_manager:
+        if not self.reference_cache:
             return None
 
-        try:
-            import json
-            query = """
-                SELECT validation_rules
-                FROM column_settings
-                WHERE column_name = ?
-            """
-            result = self.db_manager.execute_with_retry(query, (field_name,))
-
-            if not result or not result[0][0]:
-                return None
-
-            # Parse JSON validation rules
-            rules_json = result[0][0]
-            return json.loads(rules_json) if rules_json else None
-
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error getting validation rules for {field_name}: {str(e)}")
-            return None
+        return self.reference_cache.get_validation_rules(field_name)
 
     def update_validation_rules(self, field_name: str, rules: Dict, username: str) -> Tuple[bool, str]:
         """
@@ -530,6 +516,7 @@ class ValidationService:
                 update_query,
                 (rules_json, datetime.now().isoformat(), username, field_name)
             )
+            self.reference_cache.invalidate()
 
             if self.logger:
                 self.logger.info(f"User {username} updated validation rules for field '{field_name}'")
@@ -615,6 +602,7 @@ class ValidationService:
                 update_query,
                 (1 if is_required else 0, datetime.now().isoformat(), username, field_name)
             )
+            self.reference_cache.invalidate()
 
             status = "required" if is_required else "optional"
             if self.logger:
@@ -626,6 +614,25 @@ class ValidationService:
                 self.logger.error(f"Error updating required status: {str(e)}")
             return False, f"Error updating required status: {str(e)}"
 
+    def get_compiled_validator(self, field_name: str) -> Optional[Callable[..., Tuple[bool, str]]]:
+        """
+        Get the compiled validator for a field's database-stored rules.
+
+        Validators are compiled once per reference data snapshot and
+        rebuilt automatically when the rules change.
+
+        Args:
+            field_name: Field name (id_cr or account_membership)
+
+        Returns:
+            Validator taking (value, nationality, is_cr, is_membership), or None if no rules
+        """
+        if not self.reference_cache:
+            return None
+
+        validators = self.reference_cache.derived('compiled_validators', _compile_column_validators)
+        return validators.get(field_name)
+
     def validate_field_from_db(self, field_name: str, value: str, nationality: Optional[str] = None,
                               is_cr: bool = False, is_membership: bool = False) -> Tuple[bool, str]:
         """
@@ -642,9 +649,8 @@ class ValidationService:
             Tuple of (is_valid, error_message)
         """
         try:
-            # Get validation rules from database
-            rules = self.get_validation_rules(field_name)
-            if not rules:
+            validator = self.get_compiled_validator(field_name)
+            if not validator:
                 return True, ""  # No rules = always valid
 
             # Strip whitespace
@@ -654,63 +660,101 @@ class ValidationService:
             if not value:
                 return True, ""
 
-            # Validate based on field type
-            if field_name == 'id_cr':
-                return self._validate_id_cr(value, rules, nationality, is_cr)
-            elif field_name == 'account_membership':
-                return self._validate_account_membership(value, rules, is_membership)
-            else:
-                return True, ""
+            return validator(value, nationality, is_cr, is_membership)
 
         except Exception as e:
             if self.logger:
                 self.logger.error(f"Error validating field {field_name}: {str(e)}")
             return False, f"Validation error: {str(e)}"
 
-    def _validate_id_cr(self, value: str, rules: Dict, nationality: Optional[str], is_cr: bool) -> Tuple[bool, str]:
-        """Validate ID or CR number."""
-        # Check length
-        required_length = rules.get('length', 10)
-        if len(value) != required_length:
-            return False, f"Must be {required_length} digits"
-
-        # Check if all digits
-        pattern = rules.get('pattern', r'^[0-9]{10}$')
-        if not re.match(pattern, value):
-            return False, "Must contain only digits"
-
-        # Check starting digit based on type
-        if is_cr:
-            # CR must start with 7
-            cr_starts_with = rules.get('cr_starts_with', '7')
-            if not value.startswith(cr_starts_with):
-                return False, f"CR number must start with {cr_starts_with}"
-        else:
-            # ID - check if Saudi
-            if nationality and 'Saudi' in nationality:
-                saudi_starts_with = rules.get('saudi_starts_with', '1')
-                if not value.startswith(saudi_starts_with):
-                    return False, f"Saudi ID must start with {saudi_starts_with}"
+    def _required_report_fields(self, snapshot: Dict) -> List[Tuple[str, str]]:
+        """List (column_name, display name) of required settings that are real report columns."""
+        report_columns = set(self.db_manager.get_table_columns('reports'))
+        return [
+            (name, setting['display_name_en'] or name)
+            for name, setting in snapshot['columns'].items()
+            if setting['is_required'] and name in report_columns
+        ]
+
+    def validate_records(self, records: List[Dict[str, Any]],
+                         rules: Optional[Dict[str, List[ValidationRule]]] = None,
+                         check_required: bool = True,
+                         optional_fields: Tuple[str, ...] = ()) -> Dict[str, Any]:
+        """
+        Validate a batch of records (e.g. an import chunk) in one pass.
 
-        return True, ""
+        Each check runs column by column over the whole batch, so rule
+        lookup and compilation happen once per field instead of once per
+        record. Only the first error per record field is kept.
 
-    def _validate_account_membership(self, value: str, rules: Dict, is_membership: bool) -> Tuple[bool, str]:
-        """Validate Account or Membership number."""
-        # Check if all digits
-        if not value.isdigit():
-            return False, "Must contain only digits"
+        Args:
+            records: Records as dictionaries of field_name -> value
+            rules: Optional extra rules per field
+            check_required: Whether to enforce column_settings required fields
+            optional_fields: Required fields to skip (e.g. values assigned later)
 
-        # Check length based on type
-        if is_membership:
-            required_length = rules.get('membership_length', 8)
-            if len(value) != required_length:
-                return False, f"Membership must be {required_length} digits"
-        else:
-            required_length = rules.get('account_length', 21)
-            if len(value) != required_length:
-                return False, f"Account number must be {required_length} digits"
+        Returns:
+            Dictionary with:
+                'total': number of records,
+                'valid_rows': indexes of records without errors,
+                'errors': {row index: {field_name: error_message}},
+                'summary': {field_name: {error_message: count}}
+        """
+        errors: Dict[int, Dict[str, str]] = {}
+
+        def add_error(row: int, field_name: str, message: str):
+            errors.setdefault(row, {}).setdefault(field_name, message)
+
+        # Required fields from column_settings
+        if check_required and self.reference_cache:
+            required_fields = self.reference_cache.derived('required_fields', self._required_report_fields)
+            for field_name, display_name in required_fields:
+                if field_name in optional_fields:
+                    continue
+                message = f"{display_name} is required"
+                for row, record in enumerate(records):
+                    value = record.get(field_name)
+                    if value is None or (isinstance(value, str) and not value.strip()):
+                        add_error(row, field_name, message)
+
+        # Database-stored rules (compiled validators)
+        for field_name in VALIDATABLE_FIELD_COMPILERS:
+            validator = self.get_compiled_validator(field_name)
+            if not validator:
+                continue
+            for row, record in enumerate(records):
+                value = record.get(field_name)
+                value = str(value).strip() if value is not None else ''
+                if not value:
+                    continue
+                is_valid, message = validator(
+                    value,
+                    record.get('nationality'),
+                    record.get('id_type') == 'CR',
+                    bool(record.get('acc_membership_checkbox'))
+                )
+                if not is_valid:
+                    add_error(row, field_name, message)
+
+        # Caller-supplied rules
+        for field_name, field_rules in (rules or {}).items():
+            for row, record in enumerate(records):
+                is_valid, message = self.validate_field(record.get(field_name), field_rules)
+                if not is_valid:
+                    add_error(row, field_name, message)
+
+        summary: Dict[str, Dict[str, int]] = {}
+        for row_errors in errors.values():
+            for field_name, message in row_errors.items():
+                field_summary = summary.setdefault(field_name, {})
+                field_summary[message] = field_summary.get(message, 0) + 1
 
-        return True, ""
+        return {
+            'total': len(records),
+            'valid_rows': [row for row in range(len(records)) if row not in errors],
+            'errors': errors,
+            'summary': summary,
+        }
 
     def is_field_required(self, field_name: str) -> bool:
         """
@@ -722,23 +766,79 @@ class ValidationService:
         Returns:
             True if field is required
         """
-        if not self.db_manager:
+        if not self.reference_cache:
             return False
 
-        try:
-            query = """
-                SELECT is_required
-                FROM column_settings
-                WHERE column_name = ?
-            """
-            result = self.db_manager.execute_with_retry(query, (field_name,))
+        setting = self.reference_cache.get_column_setting(field_name)
+        return bool(setting['is_required']) if setting else False
 
-            if not result:
-                return False
 
-            return bool(result[0][0])
+# ==================================================
+# Rule Compiler for column_settings.validation_rules
+# ==================================================
 
-        except Exception as e:
-            if self.logger:
-                self.logger.error(f"Error checking if field is required: {str(e)}")
-            return False
+def _compile_id_cr_rules(rules: Dict) -> Callable[..., Tuple[bool, str]]:
+    """Compile ID/CR rules into a validator closure."""
+    required_length = rules.get('length', 10)
+    pattern = re.compile(rules.get('pattern', r'^[0-9]{10}$'))
+    cr_starts_with = rules.get('cr_starts_with', '7')
+    saudi_starts_with = rules.get('saudi_starts_with', '1')
+
+    length_error = f"Must be {required_length} digits"
+    cr_error = f"CR number must start with {cr_starts_with}"
+    saudi_error = f"Saudi ID must start with {saudi_starts_with}"
+
+    def validate(value: str, nationality: Optional[str] = None,
+                 is_cr: bool = False, is_membership: bool = False) -> Tuple[bool, str]:
+        if len(value) != required_length:
+            return False, length_error
+        if not pattern.match(value):
+            return False, "Must contain only digits"
+        if is_cr:
+            # CR must start with 7
+            if not value.startswith(cr_starts_with):
+                return False, cr_error
+        elif nationality and 'Saudi' in nationality and not value.startswith(saudi_starts_with):
+            return False, saudi_error
+        return True, ""
+
+    return validate
+
+
+def _compile_account_membership_rules(rules: Dict) -> Callable[..., Tuple[bool, str]]:
+    """Compile Account/Membership rules into a validator closure."""
+    membership_length = rules.get('membership_length', 8)
+    account_length = rules.get('account_length', 21)
+
+    membership_error = f"Membership must be {membership_length} digits"
+    account_error = f"Account number must be {account_length} digits"
+
+    def validate(value: str, nationality: Optional[str] = None,
+                 is_cr: bool = False, is_membership: bool = False) -> Tuple[bool, str]:
+        if not value.isdigit():
+            return False, "Must contain only digits"
+        if is_membership:
+            if len(value) != membership_length:
+                return False, membership_error
+        elif len(value) != account_length:
+            return False, account_error
+        return True, ""
+
+    return validate
+
+
+# Compilers for admin-manageable fields (see ValidationService.VALIDATABLE_FIELDS)
+VALIDATABLE_FIELD_COMPILERS = {
+    'id_cr': _compile_id_cr_rules,
+    'account_membership': _compile_account_membership_rules,
+}
+
+
+def _compile_column_validators(snapshot: Dict) -> Dict[str, Callable[..., Tuple[bool, str]]]:
+    """Compile validators for every field with rules in a reference data snapshot."""
+    validators = {}
+    for field_name, compiler in VALIDATABLE_FIELD_COMPILERS.items():
+        setting = snapshot['columns'].get(field_name)
+        if setting and setting['validation_rules']:
+            validators[field_name] = compiler(setting['validation_rules'])
+    return validators
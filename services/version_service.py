@@ -7,6 +7,8 @@ import json
 from datetime import datetime
 from typing import Optional, Dict, List, Tuple, Any
 
+from utils.tracing import trace_service
+
 
 # System fields to exclude from diff comparison
 SYSTEM_FIELDS = {
@@ -15,6 +17,7 @@ SYSTEM_FIELDS = {
 }
 
 
+@trace_service
 class VersionService:
     """Service for managing report version history."""
 
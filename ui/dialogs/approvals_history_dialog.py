@@ -10,7 +10,7 @@ from PyQt6.QtWidgets import (QDialog, QVBoxLayout, QHBoxLayout, QLabel,
                              QListView)
 from PyQt6.QtCore import Qt, QSettings
 from PyQt6.QtGui import QFont, QColor
-from datetime import datetime
+from datetime import datetime, timedelta
 import csv
 from ui.utils.table_utils import configure_table_row_heights
 from ui.utils.responsive_sizing import ResponsiveSize
@@ -22,23 +22,25 @@ class ApprovalsHistoryDialog(QDialog):
     Admin-only access to all approval requests across all statuses.
     """
 
-    def __init__(self, report_service, logging_service, parent=None):
+    def __init__(self, approval_service, logging_service, parent=None):
         """
         Initialize the approvals history dialog.
 
         Args:
-            report_service: ReportService instance
+            approval_service: ApprovalService instance
             logging_service: LoggingService instance
             parent: Parent widget
         """
         super().__init__(parent)
-        self.report_service = report_service
+        self.approval_service = approval_service
         self.logging_service = logging_service
 
-        # Pagination state
+        # Keyset pagination state: cursors[i] is the cursor that loads page i
         self.current_page = 0
         self.page_size = 50
         self.total_count = 0
+        self.cursors = [None]
+        self.next_cursor = None
         self.current_filter = None  # None = All
 
         self.setup_ui()
@@ -113,13 +115,36 @@ class ApprovalsHistoryDialog(QDialog):
 
         filter_layout.addSpacing(20)
 
-        # Search box (future enhancement)
+        # Requested window
+        period_label = QLabel("Requested:")
+        period_label.setObjectName("filterLabel")
+        filter_layout.addWidget(period_label)
+
+        self.period_filter = QComboBox()
+        self.period_filter.setView(QListView())
+        self.period_filter.addItem("Any time", None)
+        self.period_filter.addItem("Last 7 days", 7)
+        self.period_filter.addItem("Last 30 days", 30)
+        self.period_filter.addItem("Last 90 days", 90)
+        self.period_filter.currentIndexChanged.connect(self.apply_search)
+        filter_layout.addWidget(self.period_filter)
+
+        filter_layout.addSpacing(20)
+
+        # Requester
+        self.requester_input = QLineEdit()
+        self.requester_input.setPlaceholderText("Requested by (username)")
+        self.requester_input.setMinimumWidth(160)
+        self.requester_input.returnPressed.connect(self.apply_search)
+        filter_layout.addWidget(self.requester_input)
+
+        # Search box
         search_label = QLabel("Search:")
         search_label.setObjectName("filterLabel")
         filter_layout.addWidget(search_label)
 
         self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Search by report number or entity...")
+        self.search_input.setPlaceholderText("Search by report number, entity or CIC...")
         self.search_input.setMinimumWidth(300)
         self.search_input.returnPressed.connect(self.apply_search)
         filter_layout.addWidget(self.search_input)
@@ -228,17 +253,40 @@ class ApprovalsHistoryDialog(QDialog):
 
         layout.addLayout(button_layout)
 
-    def load_approvals(self):
-        """Load approvals from database with current filter and pagination."""
+    def current_filters(self):
+        """Return the server-side filters for the current selections."""
+        days = self.period_filter.currentData()
+        return {
+            'status': self.current_filter,
+            'search': self.search_input.text().strip() or None,
+            'requested_by': self.requester_input.text().strip() or None,
+            'date_from': (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d') if days else None,
+        }
+
+    def reset_paging(self):
+        """Go back to the first page."""
+        self.current_page = 0
+        self.cursors = [None]
+
+    def load_approvals(self, recount=True):
+        """
+        Load the current page of approvals.
+
+        Args:
+            recount: Recount the matching approvals (skipped when only paging)
+        """
         try:
-            offset = self.current_page * self.page_size
-            approvals, total_count = self.report_service.get_all_approvals(
-                status_filter=self.current_filter,
-                limit=self.page_size,
-                offset=offset
+            filters = self.current_filters()
+            approvals, self.next_cursor = self.approval_service.query_approvals(
+                filters,
+                cursor=self.cursors[self.current_page],
+                limit=self.page_size
             )
 
-            self.total_count = total_count
+            if recount:
+                self.total_count = self.approval_service.count_approvals(filters)
+            total_count = self.total_count
+            offset = self.current_page * self.page_size
 
             # Update info label
             if self.current_filter:
@@ -262,7 +310,7 @@ class ApprovalsHistoryDialog(QDialog):
 
             # Enable/disable pagination buttons
             self.prev_button.setEnabled(self.current_page > 0)
-            self.next_button.setEnabled(end_idx < total_count)
+            self.next_button.setEnabled(self.next_cursor is not None)
 
             # Populate table
             self.approvals_table.setRowCount(len(approvals))
@@ -350,30 +398,25 @@ class ApprovalsHistoryDialog(QDialog):
     def apply_filter(self):
         """Apply status filter and reload data."""
         self.current_filter = self.status_filter.currentData()
-        self.current_page = 0  # Reset to first page
+        self.reset_paging()
         self.load_approvals()
 
     def apply_search(self):
-        """Apply search filter (future enhancement)."""
-        search_term = self.search_input.text().strip()
-        if search_term:
-            # TODO: Implement search functionality
-            # For now, show a message
-            QMessageBox.information(
-                self,
-                "Search",
-                f"Search functionality for '{search_term}' will be implemented in a future update."
-            )
-        else:
-            self.load_approvals()
+        """Apply the search, requester and period filters."""
+        self.reset_paging()
+        self.load_approvals()
 
     def clear_search(self):
         """Clear search input and reload."""
         self.search_input.clear()
+        self.requester_input.clear()
+        self.period_filter.setCurrentIndex(0)
+        self.reset_paging()
         self.load_approvals()
 
     def refresh_data(self):
         """Refresh the approvals data."""
+        self.reset_paging()
         self.load_approvals()
         self.logging_service.info("Approvals history refreshed")
 
@@ -381,14 +424,16 @@ class ApprovalsHistoryDialog(QDialog):
         """Go to previous page."""
         if self.current_page > 0:
             self.current_page -= 1
-            self.load_approvals()
+            self.load_approvals(recount=False)
 
     def next_page(self):
         """Go to next page."""
-        total_pages = (self.total_count + self.page_size - 1) // self.page_size
-        if self.current_page < total_pages - 1:
-            self.current_page += 1
-            self.load_approvals()
+        if self.next_cursor is None:
+            return
+        self.current_page += 1
+        del self.cursors[self.current_page:]
+        self.cursors.append(self.next_cursor)
+        self.load_approvals(recount=False)
 
     def view_approval_details(self, index):
         """View detailed information about an approval request."""
@@ -445,12 +490,12 @@ Comment:
             if not file_path:
                 return
 
-            # Get all data (not just current page) with same filter
-            all_approvals, _ = self.report_service.get_all_approvals(
-                status_filter=self.current_filter,
-                limit=10000,  # Large limit to get all
-                offset=0
-            )
+            # Get all data (not just current page) with same filters, page by page
+            filters = self.current_filters()
+            all_approvals, cursor = self.approval_service.query_approvals(filters, limit=1000)
+            while cursor is not None:
+                page, cursor = self.approval_service.query_approvals(filters, cursor=cursor, limit=1000)
+                all_approvals.extend(page)
 
             # Write to CSV
             with open(file_path, 'w', newline='', encoding='utf-8') as csvfile:
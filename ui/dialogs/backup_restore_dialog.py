@@ -12,58 +12,45 @@ from PyQt6.QtGui import QFont
 from pathlib import Path
 from datetime import datetime
 import shutil
-import sqlite3
 from services.icon_service import get_icon
+from services.backup_service import BackupService
 from ui.theme_colors import ThemeColors
 from ui.utils.responsive_sizing import ResponsiveSize
 
 
 class BackupWorker(QThread):
-    """Worker thread for creating backups."""
+    """Worker thread for creating backups in the deduplicated backup store."""
 
-    finished = pyqtSignal(bool, str, str)  # success, message, file_path
+    finished = pyqtSignal(bool, str, str)  # success, message, manifest path
     progress = pyqtSignal(int, str)
 
-    def __init__(self, source_db_path, backup_dir):
+    def __init__(self, backup_service, created_by):
         super().__init__()
-        self.source_db_path = source_db_path
-        self.backup_dir = backup_dir
+        self.backup_service = backup_service
+        self.created_by = created_by
 
     def run(self):
         """Create database backup."""
         try:
-            self.progress.emit(10, "Preparing backup...")
+            self.progress.emit(10, "Snapshotting database...")
 
-            # Create backup directory if it doesn't exist
-            backup_path = Path(self.backup_dir)
-            backup_path.mkdir(parents=True, exist_ok=True)
+            success, message, manifest = self.backup_service.create_backup(self.created_by)
+            if not success:
+                raise Exception(message)
 
-            self.progress.emit(30, "Creating backup...")
-
-            # Generate backup filename with timestamp
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_filename = f"fiu_backup_{timestamp}.db"
-            backup_file_path = backup_path / backup_filename
-
-            # Copy database file
-            shutil.copy2(self.source_db_path, str(backup_file_path))
-
-            self.progress.emit(70, "Verifying backup...")
-
-            # Verify backup integrity
-            try:
-                conn = sqlite3.connect(str(backup_file_path))
-                conn.execute("PRAGMA integrity_check")
-                conn.close()
-            except Exception as e:
-                raise Exception(f"Backup verification failed: {str(e)}")
+            self.progress.emit(80, "Applying retention policy...")
+            self.backup_service.apply_retention()
 
             self.progress.emit(100, "Backup completed!")
 
+            stored_mb = manifest['stored_bytes'] / (1024 * 1024)
+            total_mb = manifest['total_size'] / (1024 * 1024)
             self.finished.emit(
                 True,
-                f"Backup created successfully:\n{backup_file_path}",
-                str(backup_file_path)
+                f"Backup created successfully:\n{manifest['name']}\n\n"
+                f"{manifest['new_chunks']} of {manifest['chunk_count']} chunks changed "
+                f"({stored_mb:.2f} MB stored for a {total_mb:.2f} MB database)",
+                str(self.backup_service.manifests_dir / f"{manifest['name']}.json")
             )
 
         except Exception as e:
@@ -71,56 +58,38 @@ class BackupWorker(QThread):
 
 
 class RestoreWorker(QThread):
-    """Worker thread for restoring from backup."""
+    """Worker thread for restoring the live database from a backup."""
 
     finished = pyqtSignal(bool, str)  # success, message
     progress = pyqtSignal(int, str)
 
-    def __init__(self, backup_file_path, target_db_path):
+    def __init__(self, backup_file_path, backup_service, restored_by):
         super().__init__()
         self.backup_file_path = backup_file_path
-        self.target_db_path = target_db_path
+        self.backup_service = backup_service
+        self.restored_by = restored_by
 
     def run(self):
         """Restore database from backup."""
         try:
-            self.progress.emit(10, "Verifying backup file...")
-
-            # Verify backup file exists
-            if not Path(self.backup_file_path).exists():
-                raise Exception("Backup file not found")
-
-            # Verify backup integrity
-            try:
-                conn = sqlite3.connect(self.backup_file_path)
-                conn.execute("PRAGMA integrity_check")
-                conn.close()
-            except Exception as e:
-                raise Exception(f"Backup file is corrupted: {str(e)}")
-
-            self.progress.emit(40, "Creating backup of current database...")
-
-            # Create backup of current database before restoring
-            current_db_path = Path(self.target_db_path)
-            if current_db_path.exists():
-                backup_timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                temp_backup = current_db_path.parent / f"pre_restore_backup_{backup_timestamp}.db"
-                shutil.copy2(str(current_db_path), str(temp_backup))
-
-            self.progress.emit(70, "Restoring database...")
-
-            # Restore database
-            shutil.copy2(self.backup_file_path, self.target_db_path)
-
-            self.progress.emit(100, "Restore completed!")
+            success, message, stats = self.backup_service.restore_database(
+                self.backup_file_path,
+                self.restored_by,
+                progress_callback=self.progress.emit
+            )
+            if not success:
+                raise Exception(message)
 
             self.finished.emit(
                 True,
-                "Database restored successfully!\n\nPlease restart the application to complete the restore process."
+                f"Database restored successfully!\n\n"
+                f"Database was unavailable for {stats['downtime_seconds']:.2f}s. "
+                f"Other connected clients will reload automatically.\n\n"
+                f"Previous state saved as backup {stats['pre_restore_backup']}."
             )
 
         except Exception as e:
-            self.finished.emit(False, f"Restore failed: {str(e)}")
+            self.finished.emit(False, str(e))
 
 
 class BackupRestoreDialog(QDialog):
@@ -154,6 +123,7 @@ class BackupRestoreDialog(QDialog):
         self.logging_service = logging_service
         self.backup_worker = None
         self.restore_worker = None
+        self.backup_service = BackupService(db_manager, logging_service, config.BACKUP_PATH)
 
         self.setup_ui()
         self.refresh_backup_list()
@@ -304,7 +274,21 @@ class BackupRestoreDialog(QDialog):
                 backup_dir.mkdir(parents=True, exist_ok=True)
                 return
 
-            # Find all backup files
+            # Deduplicated store backups (newest first)
+            for backup in self.backup_service.list_backups():
+                item = QListWidgetItem(f"{backup['name']} (store)")
+                item.setData(Qt.ItemDataRole.UserRole, backup['manifest_path'])
+
+                total_size = backup['total_size'] / (1024 * 1024)
+                stored_size = backup['stored_bytes'] / (1024 * 1024)
+                tooltip = (f"Database size: {total_size:.2f} MB\n"
+                           f"Stored for this backup: {stored_size:.2f} MB\n"
+                           f"Created: {backup['created_at']}")
+                item.setToolTip(tooltip)
+
+                self.backup_list.addItem(item)
+
+            # Legacy full-copy backup files
             backup_files = list(backup_dir.glob("*.db"))
             backup_files.sort(key=lambda x: x.stat().st_mtime, reverse=True)
 
@@ -352,6 +336,19 @@ class BackupRestoreDialog(QDialog):
 
         # Show backup info
         backup_path = Path(current.data(Qt.ItemDataRole.UserRole))
+
+        if self.backup_service.is_manifest_path(str(backup_path)):
+            manifest = self.backup_service.get_manifest(backup_path.stem) or {}
+            info_text = f"""<b>Backup Information</b><br><br>
+<b>Backup:</b> {manifest.get('name', backup_path.stem)}<br>
+<b>Database Size:</b> {manifest.get('total_size', 0) / (1024 * 1024):.2f} MB<br>
+<b>Chunks:</b> {manifest.get('new_chunks', 0)} new of {manifest.get('chunk_count', 0)}<br>
+<b>Stored:</b> {manifest.get('stored_bytes', 0) / (1024 * 1024):.2f} MB<br>
+<b>Created:</b> {manifest.get('created_at', '')} by {manifest.get('created_by', '')}
+"""
+            self.backup_info_text.setHtml(info_text)
+            return
+
         file_stat = backup_path.stat()
         file_size = file_stat.st_size / (1024 * 1024)
         created_time = datetime.fromtimestamp(file_stat.st_ctime)
@@ -381,10 +378,9 @@ class BackupRestoreDialog(QDialog):
             self.progress_bar.setValue(0)
 
             # Create worker
-            db_path = self.config.DATABASE_PATH
-            backup_dir = self.config.BACKUP_PATH
+            username = self.logging_service.db_handler.user_context.get('username') or 'SYSTEM'
 
-            self.backup_worker = BackupWorker(db_path, backup_dir)
+            self.backup_worker = BackupWorker(self.backup_service, username)
             self.backup_worker.progress.connect(self.on_progress)
             self.backup_worker.finished.connect(self.on_backup_finished)
             self.backup_worker.start()
@@ -435,9 +431,9 @@ class BackupRestoreDialog(QDialog):
             self.progress_bar.setValue(0)
 
             # Create worker
-            target_db_path = self.config.DATABASE_PATH
+            restored_by = self.logging_service.db_handler.user_context.get('username') or 'SYSTEM'
 
-            self.restore_worker = RestoreWorker(backup_path, target_db_path)
+            self.restore_worker = RestoreWorker(backup_path, self.backup_service, restored_by)
             self.restore_worker.progress.connect(self.on_progress)
             self.restore_worker.finished.connect(self.on_restore_finished)
             self.restore_worker.start()
@@ -471,17 +467,25 @@ class BackupRestoreDialog(QDialog):
             return
 
         backup_path = current_item.data(Qt.ItemDataRole.UserRole)
+        is_store_backup = self.backup_service.is_manifest_path(backup_path)
+        export_name = f"{Path(backup_path).stem}.db" if is_store_backup else Path(backup_path).name
 
         file_path, _ = QFileDialog.getSaveFileName(
             self,
             "Export Backup",
-            str(Path.home() / Path(backup_path).name),
+            str(Path.home() / export_name),
             "Database Files (*.db);;All Files (*)"
         )
 
         if file_path:
             try:
-                shutil.copy2(backup_path, file_path)
+                if is_store_backup:
+                    # Export store backups as standalone database files
+                    success, message = self.backup_service.restore_to_file(Path(backup_path).stem, file_path)
+                    if not success:
+                        raise Exception(message)
+                else:
+                    shutil.copy2(backup_path, file_path)
                 QMessageBox.information(
                     self,
                     "Export Success",
@@ -548,7 +552,12 @@ class BackupRestoreDialog(QDialog):
 
         if reply == QMessageBox.StandardButton.Yes:
             try:
-                backup_path.unlink()
+                if self.backup_service.is_manifest_path(str(backup_path)):
+                    success, message = self.backup_service.delete_backup(backup_path.stem)
+                    if not success:
+                        raise Exception(message)
+                else:
+                    backup_path.unlink()
                 QMessageBox.information(self, "Deleted", "Backup deleted successfully.")
                 self.refresh_backup_list()
                 self.logging_service.log_user_action("BACKUP_DELETED", {'file_path': str(backup_path)})
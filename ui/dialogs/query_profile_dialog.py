@@ -0,0 +1,257 @@
+"""
+Query Profiler Dialog for Admin.
+Shows the hottest SQL statements and the slow query log recorded by the query profiler.
+"""
+
+from PyQt6.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QPushButton, QLabel, QMessageBox, QHeaderView, QTabWidget, QWidget,
+    QTextEdit, QComboBox, QCheckBox, QSplitter, QSizePolicy
+)
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont
+from database.query_profiler import load_profile_report, load_slow_queries, reset_profile_data
+from ui.utils.responsive_sizing import ResponsiveSize
+from ui.theme_colors import ThemeColors
+
+
+class QueryProfileDialog(QDialog):
+    """Dialog for inspecting query timings (Admin only)."""
+
+    SORT_OPTIONS = [
+        ("Total time", 'total_ms'),
+        ("p95 latency", 'p95_ms'),
+        ("Max latency", 'max_ms'),
+        ("Calls", 'calls'),
+        ("Lock retries", 'lock_retries'),
+    ]
+
+    PROFILE_COLUMNS = [
+        ("Calls", 'calls'), ("Total ms", 'total_ms'), ("Avg ms", 'avg_ms'),
+        ("p50 ms", 'p50_ms'), ("p95 ms", 'p95_ms'), ("Max ms", 'max_ms'),
+        ("Rows", 'rows'), ("Lock Retries", 'lock_retries'), ("Backoff ms", 'backoff_ms'),
+        ("Statement", 'statement'),
+    ]
+
+    SLOW_COLUMNS = [
+        ("Time", 'created_at'), ("Duration ms", 'duration_ms'), ("Rows", 'rows'),
+        ("Lock Retries", 'lock_retries'), ("Client", 'client_id'), ("Statement", 'statement'),
+    ]
+
+    def __init__(self, db_manager, logging_service, parent=None):
+        """
+        Initialize the query profiler dialog.
+
+        Args:
+            db_manager: DatabaseManager instance
+            logging_service: LoggingService instance
+            parent: Parent widget
+        """
+        super().__init__(parent)
+        self.db_manager = db_manager
+        self.logging_service = logging_service
+        self.profile_rows = []
+        self.slow_rows = []
+
+        self.setWindowTitle("Query Profiler")
+
+        # Responsive dialog sizing
+        dialog_width, dialog_height, min_width, min_height = ResponsiveSize.get_dialog_size('large')
+        self.setMinimumSize(min_width, min_height)
+        self.resize(dialog_width, dialog_height)
+
+        self.setup_ui()
+        self.load_data()
+
+    def setup_ui(self):
+        """Setup the user interface."""
+        layout = QVBoxLayout(self)
+
+        # Title
+        title = QLabel("Query Profiler")
+        title_font = QFont()
+        title_font.setPointSize(14)
+        title_font.setBold(True)
+        title.setFont(title_font)
+        layout.addWidget(title)
+
+        # Controls
+        controls_layout = QHBoxLayout()
+
+        self.profiling_checkbox = QCheckBox("Profile queries in this session")
+        self.profiling_checkbox.setChecked(self.db_manager.profiler is not None)
+        self.profiling_checkbox.toggled.connect(self.toggle_profiling)
+        controls_layout.addWidget(self.profiling_checkbox)
+
+        controls_layout.addStretch()
+
+        controls_layout.addWidget(QLabel("Sort by:"))
+        self.sort_combo = QComboBox()
+        for label, key in self.SORT_OPTIONS:
+            self.sort_combo.addItem(label, key)
+        self.sort_combo.currentIndexChanged.connect(self.load_profile)
+        controls_layout.addWidget(self.sort_combo)
+
+        layout.addLayout(controls_layout)
+
+        info = QLabel(
+            "Statistics are combined across every workstation with profiling enabled "
+            "and are written to the database about once a minute."
+        )
+        info.setStyleSheet(f"color: {ThemeColors.TEXT_SECONDARY}; font-style: italic;")
+        layout.addWidget(info)
+
+        # Tabs
+        self.tabs = QTabWidget()
+        layout.addWidget(self.tabs)
+
+        self.profile_table, self.profile_plan = self.create_tab("Top Statements", self.PROFILE_COLUMNS)
+        self.profile_table.itemSelectionChanged.connect(
+            lambda: self.show_plan(self.profile_table, self.profile_rows, self.profile_plan)
+        )
+
+        self.slow_table, self.slow_plan = self.create_tab("Slow Query Log", self.SLOW_COLUMNS)
+        self.slow_table.itemSelectionChanged.connect(
+            lambda: self.show_plan(self.slow_table, self.slow_rows, self.slow_plan)
+        )
+
+        # Bottom buttons
+        button_layout = QHBoxLayout()
+
+        refresh_btn = QPushButton("Refresh")
+        refresh_btn.clicked.connect(self.refresh_data)
+        button_layout.addWidget(refresh_btn)
+
+        reset_btn = QPushButton("Clear Recorded Data")
+        reset_btn.clicked.connect(self.reset_data)
+        button_layout.addWidget(reset_btn)
+
+        button_layout.addStretch()
+
+        close_btn = QPushButton("Close")
+        close_btn.clicked.connect(self.accept)
+        button_layout.addWidget(close_btn)
+
+        layout.addLayout(button_layout)
+
+    def create_tab(self, title, columns):
+        """
+        Create a tab with a statement table and a query plan viewer.
+
+        Args:
+            title: Tab title
+            columns: (header, key) column definitions
+
+        Returns:
+            Tuple of (table, plan text edit)
+        """
+        tab = QWidget()
+        tab_layout = QVBoxLayout(tab)
+        splitter = QSplitter(Qt.Orientation.Vertical)
+
+        table = QTableWidget()
+        table.setColumnCount(len(columns))
+        table.setHorizontalHeaderLabels([header for header, _ in columns])
+        header = table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeMode.ResizeToContents)
+        header.setSectionResizeMode(len(columns) - 1, QHeaderView.ResizeMode.Stretch)
+        table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        table.setAlternatingRowColors(True)
+        table.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        splitter.addWidget(table)
+
+        plan = QTextEdit()
+        plan.setReadOnly(True)
+        plan.setFont(QFont("Consolas", 9))
+        plan.setPlaceholderText("Select a statement to see its full text and query plan")
+        splitter.addWidget(plan)
+        splitter.setSizes([400, 150])
+
+        tab_layout.addWidget(splitter)
+        self.tabs.addTab(tab, title)
+        return table, plan
+
+    def load_data(self):
+        """Load all data for the dialog."""
+        self.load_profile()
+        self.load_slow_log()
+
+    def refresh_data(self):
+        """Flush this session's statistics and reload."""
+        if self.db_manager.profiler:
+            self.db_manager.profiler.flush()
+        self.load_data()
+
+    def load_profile(self):
+        """Load the top statements table."""
+        try:
+            sort_by = self.sort_combo.currentData() or 'total_ms'
+            self.profile_rows = load_profile_report(self.db_manager, sort_by=sort_by, limit=100)
+            self.fill_table(self.profile_table, self.PROFILE_COLUMNS, self.profile_rows)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load query profile: {str(e)}")
+
+    def load_slow_log(self):
+        """Load the slow query log table."""
+        try:
+            self.slow_rows = load_slow_queries(self.db_manager, limit=200)
+            self.fill_table(self.slow_table, self.SLOW_COLUMNS, self.slow_rows)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load slow query log: {str(e)}")
+
+    def fill_table(self, table, columns, rows):
+        """Fill a table from row dictionaries."""
+        table.setRowCount(len(rows))
+        for row_index, row in enumerate(rows):
+            for column_index, (_, key) in enumerate(columns):
+                value = row.get(key)
+                if key == 'created_at' and value:
+                    value = value[:19].replace('T', ' ')
+                item = QTableWidgetItem('' if value is None else str(value))
+                if key != 'statement':
+                    item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                table.setItem(row_index, column_index, item)
+
+    def show_plan(self, table, rows, plan_view):
+        """Show the statement and query plan of the selected row."""
+        row_index = table.currentRow()
+        if row_index < 0 or row_index >= len(rows):
+            plan_view.clear()
+            return
+        row = rows[row_index]
+        plan_view.setPlainText(
+            f"{row['statement']}\n\nQuery plan:\n{row.get('query_plan') or '(not captured)'}"
+        )
+
+    def toggle_profiling(self, enabled):
+        """Turn profiling on or off for this session."""
+        try:
+            if enabled:
+                self.db_manager.enable_profiling()
+                self.logging_service.info("Query profiling enabled for this session")
+            else:
+                self.db_manager.disable_profiling()
+                self.logging_service.info("Query profiling disabled for this session")
+        except Exception as e:
+            self.logging_service.error(f"Error toggling query profiling: {str(e)}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Failed to toggle query profiling: {str(e)}")
+
+    def reset_data(self):
+        """Clear the recorded statistics for all clients."""
+        reply = QMessageBox.question(
+            self,
+            "Clear Recorded Data",
+            "Clear the query profile and slow query log for all workstations?",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply != QMessageBox.StandardButton.Yes:
+            return
+
+        try:
+            reset_profile_data(self.db_manager)
+            self.logging_service.info("Query profile data cleared")
+            self.load_data()
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to clear query profile: {str(e)}")
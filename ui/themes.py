@@ -3,7 +3,12 @@ Modern Theme System
 Professional color schemes and styles with DPI-aware responsive sizing
 """
 
+import time
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
 from ui.utils.responsive_sizing import ResponsiveSize
+from ui.theme_colors import ThemeColors
 
 
 class ModernTheme:
@@ -53,6 +58,11 @@ class ModernTheme:
 
     @classmethod
     def get_stylesheet(cls):
+        """Theme stylesheet, built once per DPI scale (see build_stylesheet)."""
+        return _cached_stylesheet((cls.__name__,), cls.build_stylesheet)
+
+    @classmethod
+    def build_stylesheet(cls):
         # Calculate DPI-aware sizes
         card_radius = ResponsiveSize.get_scaled_size(12)
         card_padding = ResponsiveSize.get_scaled_size(16)
@@ -672,3 +682,195 @@ THEMES = {
 def get_theme(theme_name='Modern Blue'):
     """Get theme by name"""
     return THEMES.get(theme_name, ModernTheme)
+
+
+# ==================== Compiled Stylesheets ====================
+
+# Application stylesheet files by theme, under resources/
+APPLICATION_STYLESHEETS = {
+    'dark': 'style_dark.qss',
+}
+
+# Built stylesheets keyed by (name..., DPI scale). Building one formats
+# hundreds of lines, and every setStyleSheet call re-polishes the widgets
+# it covers, so each sheet is built once and applied once.
+_stylesheet_cache: Dict[Tuple, str] = {}
+_stylesheet_stats = {'hits': 0, 'builds': 0, 'build_seconds': 0.0}
+
+
+def _cached_stylesheet(key: Tuple, build: Callable[[], str]) -> str:
+    """Return a cached stylesheet, building it on first use at this DPI scale."""
+    key = key + (ResponsiveSize.get_dpi_scale_factor(),)
+    stylesheet = _stylesheet_cache.get(key)
+    if stylesheet is not None:
+        _stylesheet_stats['hits'] += 1
+        return stylesheet
+
+    start = time.perf_counter()
+    stylesheet = build()
+    _stylesheet_stats['build_seconds'] += time.perf_counter() - start
+    _stylesheet_stats['builds'] += 1
+    _stylesheet_cache[key] = stylesheet
+    return stylesheet
+
+
+def application_stylesheet_path(theme: str = 'dark') -> Path:
+    """Path of a theme's application stylesheet file."""
+    filename = APPLICATION_STYLESHEETS.get(theme, APPLICATION_STYLESHEETS['dark'])
+    return Path(__file__).parent.parent / 'resources' / filename
+
+
+def get_application_stylesheet(theme: str = 'dark') -> str:
+    """
+    Stylesheet for QApplication.setStyleSheet: the theme's QSS file plus
+    the main window rules, compiled once per theme and DPI scale.
+
+    The same string object is returned while the cache holds it, so
+    callers can skip re-applying an unchanged sheet with an identity check.
+
+    Args:
+        theme: Theme key in APPLICATION_STYLESHEETS
+
+    Returns:
+        Stylesheet text
+    """
+    def build():
+        path = application_stylesheet_path(theme)
+        base = path.read_text(encoding='utf-8') if path.exists() else ''
+        return f"{base}\n{main_window_stylesheet()}"
+
+    return _cached_stylesheet(('application', theme), build)
+
+
+def main_window_stylesheet() -> str:
+    """
+    Main window chrome (sidebar, user panel, header) by object name.
+
+    These rules used to be set widget by widget when the window was
+    built; as application rules they are parsed once. Each keeps the
+    reach of the widget sheet it replaced (the widget and its
+    descendants), and rules for widgets inside the sidebar name the
+    sidebar so they outrank its generic button rule.
+    """
+    padding_v = ResponsiveSize.get_scaled_size(12)
+    padding_h = ResponsiveSize.get_scaled_size(16)
+    font_size = ResponsiveSize.get_font_size('normal')
+    border_radius = ResponsiveSize.get_scaled_size(4)
+
+    return f"""
+        /* ========== Main Window: Sidebar ========== */
+        QFrame#sidebar {{
+            background-color: {ModernTheme.SIDEBAR_BG};
+            border-right: 1px solid {ModernTheme.BORDER};
+        }}
+        QFrame#sidebar QPushButton {{
+            color: {ModernTheme.SIDEBAR_TEXT};
+            background-color: transparent;
+            border: none;
+            text-align: left;
+            padding: {padding_v}px {padding_h}px;
+            font-size: {font_size}pt;
+            border-radius: {border_radius}px;
+        }}
+        QFrame#sidebar QPushButton:hover {{
+            background-color: {ModernTheme.SIDEBAR_HOVER};
+        }}
+        QFrame#sidebar QPushButton:checked {{
+            background-color: {ModernTheme.PRIMARY};
+            color: white;
+            font-weight: 600;
+        }}
+        QFrame#sidebar QLabel#sidebarTitle {{
+            color: white;
+            font-size: 16pt;
+            font-weight: 600;
+            padding: 12px;
+        }}
+        QFrame#sidebar QScrollArea#sidebarScroll,
+        QFrame#sidebar QScrollArea#sidebarScroll QScrollArea {{
+            background: transparent;
+            border: none;
+        }}
+        QFrame#sidebar QLabel#adminSectionLabel {{
+            color: {ThemeColors.TEXT_SECONDARY};
+            font-size: 9pt;
+            font-weight: 600;
+            padding: 8px 16px;
+        }}
+
+        /* ========== Main Window: User Panel ========== */
+        QFrame#sidebar QFrame#userFrame,
+        QFrame#sidebar QFrame#userFrame QFrame {{
+            background-color: #2c3e50;
+            border-radius: 6px;
+            padding: 8px;
+        }}
+        QFrame#sidebar QFrame#userFrame QLabel {{
+            color: white;
+        }}
+        QFrame#sidebar QFrame#userFrame QLabel#userNameLabel {{
+            font-weight: 600;
+            font-size: 10pt;
+        }}
+        QFrame#sidebar QFrame#userFrame QLabel#userRoleLabel {{
+            color: {ThemeColors.TEXT_SECONDARY};
+            font-size: 9pt;
+        }}
+        QFrame#sidebar QFrame#userFrame QPushButton#profileLinkButton {{
+            background-color: transparent;
+            color: #0d7377;
+            border: 1px solid #0d7377;
+            padding: 6px;
+            border-radius: 4px;
+            margin-top: 8px;
+        }}
+        QFrame#sidebar QFrame#userFrame QPushButton#profileLinkButton:hover {{
+            background-color: #0d7377;
+            color: white;
+        }}
+        QFrame#sidebar QPushButton#logoutButton {{
+            background-color: #e74c3c;
+            color: white;
+            padding: 10px;
+            border-radius: 4px;
+        }}
+        QFrame#sidebar QPushButton#logoutButton:hover {{
+            background-color: #c0392b;
+        }}
+
+        /* ========== Main Window: Header ========== */
+        QFrame#appHeader,
+        QFrame#appHeader QFrame {{
+            background-color: #0d1117;
+            border-bottom: 1px solid #30363d;
+        }}
+        QFrame#appHeader QPushButton#profileButton {{
+            background-color: transparent;
+            border: none;
+            padding: 8px;
+        }}
+        QFrame#appHeader QPushButton#profileButton:hover {{
+            background-color: rgba(255, 255, 255, 0.1);
+            border-radius: 4px;
+        }}
+    """
+
+
+def clear_stylesheet_cache():
+    """Drop compiled stylesheets (e.g. after editing a QSS file)."""
+    _stylesheet_cache.clear()
+
+
+def stylesheet_cache_info() -> Dict[str, float]:
+    """
+    Get stylesheet cache statistics.
+
+    Returns:
+        Dictionary with 'cached', 'hits', 'builds' and 'build_ms'
+    """
+    return {
+        'cached': len(_stylesheet_cache),
+        'hits': _stylesheet_stats['hits'],
+        'builds': _stylesheet_stats['builds'],
+        'build_ms': round(_stylesheet_stats['build_seconds'] * 1000, 2),
+    }
@@ -6,7 +6,8 @@ Modern interface for creating, editing, and managing users.
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QTableWidget, QTableWidgetItem,
                              QLineEdit, QComboBox, QHeaderView, QMessageBox,
-                             QDialog, QFormLayout, QDialogButtonBox, QFrame, QSizePolicy)
+                             QDialog, QFormLayout, QDialogButtonBox, QFrame, QSizePolicy,
+                             QFileDialog, QProgressBar)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from datetime import datetime
@@ -211,23 +212,34 @@ class AdminPanel(QWidget):
     - Edit existing users
     - Delete users (soft delete)
     - Filter by role and status
+    - Scheduled backup status (next run, last run stats)
+    - Bulk report import from CSV/XLSX
     """
 
-    def __init__(self, db_manager, logging_service):
+    def __init__(self, db_manager, logging_service, backup_scheduler_service=None,
+                 report_import_service=None, current_user=None):
         """
         Initialize admin panel.
 
         Args:
             db_manager: DatabaseManager instance
             logging_service: LoggingService instance
+            backup_scheduler_service: Optional BackupSchedulerService instance
+            report_import_service: Optional ReportImportService instance
+            current_user: Logged-in user (imports are created by this user)
         """
         super().__init__()
         self.db_manager = db_manager
         self.logging_service = logging_service
+        self.backup_scheduler_service = backup_scheduler_service
+        self.report_import_service = report_import_service
+        self.current_user = current_user
+        self.import_worker = None
         self.current_users = []
 
         self.setup_ui()
         self.load_users()
+        self.load_backup_status()
 
     def setup_ui(self):
         """Setup the user interface."""
@@ -247,6 +259,12 @@ class AdminPanel(QWidget):
 
         header_layout.addStretch()
 
+        # Import Reports button
+        if self.report_import_service is not None:
+            self.import_btn = QPushButton("Import Reports")
+            self.import_btn.clicked.connect(self.import_reports)
+            header_layout.addWidget(self.import_btn)
+
         # Add User button
         add_btn = QPushButton("Add New User")
         add_btn.setObjectName("primaryButton")
@@ -283,6 +301,41 @@ class AdminPanel(QWidget):
 
         layout.addLayout(filters_layout)
 
+        # Scheduled backup status
+        if self.backup_scheduler_service is not None:
+            backup_frame = QFrame()
+            backup_frame.setObjectName("card")
+            backup_layout = QHBoxLayout(backup_frame)
+            backup_layout.setContentsMargins(16, 12, 16, 12)
+
+            self.backup_next_label = QLabel("Next scheduled backup: -")
+            backup_layout.addWidget(self.backup_next_label)
+
+            backup_layout.addStretch()
+
+            self.backup_last_label = QLabel("Last scheduled backup: -")
+            self.backup_last_label.setObjectName("subtitleLabel")
+            backup_layout.addWidget(self.backup_last_label)
+
+            layout.addWidget(backup_frame)
+
+        # Report import progress
+        if self.report_import_service is not None:
+            self.import_frame = QFrame()
+            self.import_frame.setObjectName("card")
+            import_layout = QVBoxLayout(self.import_frame)
+            import_layout.setContentsMargins(16, 12, 16, 12)
+
+            self.import_label = QLabel("")
+            import_layout.addWidget(self.import_label)
+
+            self.import_progress = QProgressBar()
+            self.import_progress.setRange(0, 100)
+            import_layout.addWidget(self.import_progress)
+
+            self.import_frame.setVisible(False)
+            layout.addWidget(self.import_frame)
+
         # Stats
         self.stats_label = QLabel("0 users")
         self.stats_label.setObjectName("subtitleLabel")
@@ -473,9 +526,92 @@ class AdminPanel(QWidget):
                 QMessageBox.critical(self, "Error", f"Failed to delete user: {str(e)}")
                 self.logging_service.error(f"User deletion error: {str(e)}", exc_info=True)
 
+    def load_backup_status(self):
+        """Show the next scheduled backup and the last run's stats."""
+        if self.backup_scheduler_service is None:
+            return
+
+        try:
+            status = self.backup_scheduler_service.get_status()
+
+            if not status['enabled']:
+                next_text = "Scheduled backups: disabled"
+            elif status['next_run']:
+                leader = "this client" if status['is_leader'] else (status['leader'] or "no active client")
+                next_text = (f"Next scheduled backup: {status['next_run'].strftime('%Y-%m-%d %H:%M')} "
+                             f"({status['cron']}, run by {leader})")
+            else:
+                next_text = f"Next scheduled backup: unavailable ({status['cron']})"
+            self.backup_next_label.setText(next_text)
+
+            last_run = status['last_run']
+            if last_run:
+                logical_mb = (last_run['logical_size'] or 0) / (1024 * 1024)
+                stored_mb = (last_run['backup_size'] or 0) / (1024 * 1024)
+                throughput_mb = (last_run['throughput_bytes_per_sec'] or 0) / (1024 * 1024)
+                self.backup_last_label.setText(
+                    f"Last run: {last_run['created_at']} • {logical_mb:.1f} MB "
+                    f"({stored_mb:.1f} MB stored) in {last_run['duration_seconds'] or 0:.1f}s "
+                    f"• {throughput_mb:.1f} MB/s"
+                )
+            else:
+                self.backup_last_label.setText("Last run: never")
+
+        except Exception as e:
+            self.logging_service.error(f"Error loading backup status: {str(e)}")
+
+    def import_reports(self):
+        """Import reports from a CSV/XLSX file in a background thread."""
+        if self.import_worker is not None and self.import_worker.isRunning():
+            return
+
+        file_path, _ = QFileDialog.getOpenFileName(
+            self, "Import Reports", "", "Report files (*.csv *.xlsx);;CSV (*.csv);;Excel (*.xlsx)"
+        )
+        if not file_path:
+            return
+
+        from ui.workers import ReportImportWorker
+
+        self.import_btn.setEnabled(False)
+        self.import_frame.setVisible(True)
+
+        self.import_worker = ReportImportWorker(self.report_import_service, file_path, self.current_user)
+        self.import_worker.progress.connect(self.on_import_progress)
+        self.import_worker.finished.connect(self.on_import_finished)
+        self.import_worker.error.connect(self.on_import_error)
+        self.import_worker.start()
+
+    def on_import_progress(self, percent, message):
+        """Show import progress."""
+        self.import_progress.setValue(percent)
+        self.import_label.setText(message)
+
+    def on_import_finished(self, success, message, stats):
+        """Report the import result."""
+        self.import_btn.setEnabled(True)
+        self.import_label.setText(message)
+
+        if not success:
+            QMessageBox.critical(self, "Import Failed", message)
+        elif stats['rejected']:
+            QMessageBox.warning(
+                self, "Import Completed with Rejects",
+                f"{message}\n\nRejected rows and their errors were written to:\n{stats['reject_file']}"
+            )
+        else:
+            QMessageBox.information(self, "Import Complete", message)
+
+    def on_import_error(self, error_msg):
+        """Handle an import worker error."""
+        self.import_btn.setEnabled(True)
+        self.import_label.setText(f"Import failed: {error_msg}")
+        QMessageBox.critical(self, "Import Failed", error_msg)
+
     def refresh(self):
         """Refresh the view (called from main window)."""
         self.load_users()
+        self.load_backup_status()
 
     def save_table_geometry(self):
         """Save column widths and row heights to settings."""
@@ -28,7 +28,8 @@ class ApprovalDecisionDialog(QDialog):
         Initialize the approval decision dialog.
 
         Args:
-            approval_data: Dictionary with approval request details
+            approval_data: Dictionary with approval request details, or a list
+                of them to review several requests at once
             parent: Parent widget
         """
         super().__init__(parent)
@@ -48,7 +49,10 @@ class ApprovalDecisionDialog(QDialog):
         layout.setSpacing(15)
 
         # Header
-        header_label = QLabel(f"Review Approval Request")
+        is_bulk = isinstance(self.approval_data, list)
+        header_label = QLabel(
+            f"Review {len(self.approval_data)} Approval Requests" if is_bulk else "Review Approval Request"
+        )
         header_font = QFont()
         header_font.setPointSize(14)
         header_font.setWeight(QFont.Weight.Bold)
@@ -60,12 +64,21 @@ class ApprovalDecisionDialog(QDialog):
         details_frame.setObjectName("detailsFrame")
         details_layout = QVBoxLayout(details_frame)
 
-        details_layout.addWidget(QLabel(f"Report Number: {self.approval_data['report_number']}"))
-        details_layout.addWidget(QLabel(f"Entity: {self.approval_data['reported_entity_name']}"))
-        details_layout.addWidget(QLabel(f"Requested By: {self.approval_data['requested_by']}"))
-        details_layout.addWidget(QLabel(f"Requested At: {self.approval_data['requested_at']}"))
-
-        if self.approval_data.get('comment'):
+        if is_bulk:
+            numbers = [str(approval['report_number']) for approval in self.approval_data]
+            shown = ", ".join(numbers[:10]) + (f" and {len(numbers) - 10} more" if len(numbers) > 10 else "")
+            reports_label = QLabel(f"Reports: {shown}")
+            reports_label.setWordWrap(True)
+            details_layout.addWidget(reports_label)
+            requesters = sorted({approval['requested_by'] for approval in self.approval_data})
+            details_layout.addWidget(QLabel(f"Requested By: {', '.join(requesters)}"))
+        else:
+            details_layout.addWidget(QLabel(f"Report Number: {self.approval_data['report_number']}"))
+            details_layout.addWidget(QLabel(f"Entity: {self.approval_data['reported_entity_name']}"))
+            details_layout.addWidget(QLabel(f"Requested By: {self.approval_data['requested_by']}"))
+            details_layout.addWidget(QLabel(f"Requested At: {self.approval_data['requested_at']}"))
+
+        if not is_bulk and self.approval_data.get('comment'):
             request_comment = QLabel(f"Request Comment: {self.approval_data['comment']}")
             request_comment.setWordWrap(True)
             details_layout.addWidget(request_comment)
@@ -173,6 +186,11 @@ class ApprovalPanel(QWidget):
         self.version_service = version_service
         self.pending_approvals = []
 
+        # Keyset paging state for the pending queue
+        self.page_size = 100
+        self.next_cursor = None
+        self.total_pending = 0
+
         self.setup_ui()
         self.load_pending_approvals()
 
@@ -195,6 +213,13 @@ class ApprovalPanel(QWidget):
 
         header_layout.addStretch()
 
+        # Review selected button (bulk decision)
+        self.review_selected_button = QPushButton("Review Selected")
+        self.review_selected_button.setMinimumWidth(120)
+        self.review_selected_button.setEnabled(False)
+        self.review_selected_button.clicked.connect(self.review_selected)
+        header_layout.addWidget(self.review_selected_button)
+
         # Refresh button
         refresh_button = QPushButton("Refresh")
         refresh_button.setObjectName("primaryButton")
@@ -204,6 +229,34 @@ class ApprovalPanel(QWidget):
 
         layout.addLayout(header_layout)
 
+        # Server-side filters
+        filter_layout = QHBoxLayout()
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search by report number, entity or CIC...")
+        self.search_input.setMinimumWidth(280)
+        self.search_input.returnPressed.connect(self.load_pending_approvals)
+        filter_layout.addWidget(self.search_input)
+
+        self.requester_input = QLineEdit()
+        self.requester_input.setPlaceholderText("Requested by (username)")
+        self.requester_input.setMinimumWidth(160)
+        self.requester_input.returnPressed.connect(self.load_pending_approvals)
+        filter_layout.addWidget(self.requester_input)
+
+        search_button = QPushButton("Search")
+        search_button.setObjectName("secondaryButton")
+        search_button.clicked.connect(self.load_pending_approvals)
+        filter_layout.addWidget(search_button)
+
+        clear_button = QPushButton("Clear")
+        clear_button.setObjectName("secondaryButton")
+        clear_button.clicked.connect(self.clear_filters)
+        filter_layout.addWidget(clear_button)
+
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
         # Info label
         self.info_label = QLabel()
         self.info_label.setObjectName("subtitleLabel")
@@ -217,7 +270,8 @@ class ApprovalPanel(QWidget):
             'Status', 'Comment', 'Actions'
         ])
         self.approvals_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.approvals_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self.approvals_table.setSelectionMode(QTableWidget.SelectionMode.ExtendedSelection)
+        self.approvals_table.itemSelectionChanged.connect(self.update_selection_state)
         self.approvals_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
         self.approvals_table.verticalHeader().setVisible(True)
 
@@ -263,24 +317,92 @@ class ApprovalPanel(QWidget):
         self.empty_label.setVisible(False)
         layout.addWidget(self.empty_label)
 
+        # Next page of the queue
+        more_layout = QHBoxLayout()
+        more_layout.addStretch()
+        self.load_more_button = QPushButton("Load More")
+        self.load_more_button.setObjectName("secondaryButton")
+        self.load_more_button.setMinimumWidth(120)
+        self.load_more_button.setVisible(False)
+        self.load_more_button.clicked.connect(self.load_more_approvals)
+        more_layout.addWidget(self.load_more_button)
+        more_layout.addStretch()
+        layout.addLayout(more_layout)
+
+    def current_filters(self):
+        """Return the server-side filters for the pending queue."""
+        return {
+            'status': 'pending',
+            'search': self.search_input.text().strip() or None,
+            'requested_by': self.requester_input.text().strip() or None,
+        }
+
+    def clear_filters(self):
+        """Clear the filters and reload the queue."""
+        self.search_input.clear()
+        self.requester_input.clear()
+        self.load_pending_approvals()
+
     def load_pending_approvals(self):
-        """Load pending approval requests from database."""
+        """Load the first page of pending approval requests."""
         try:
-            self.pending_approvals = self.approval_service.get_pending_approvals()
+            filters = self.current_filters()
+            self.pending_approvals, self.next_cursor = self.approval_service.query_approvals(
+                filters, limit=self.page_size
+            )
+            self.total_pending = self.approval_service.count_approvals(filters)
+            self.approvals_table.setRowCount(0)
 
             if not self.pending_approvals:
-                self.info_label.setText("No pending approval requests at this time.")
+                filtered = filters['search'] or filters['requested_by']
+                self.info_label.setText(
+                    "No pending approval requests match the filters." if filtered
+                    else "No pending approval requests at this time."
+                )
                 self.approvals_table.setVisible(False)
                 self.empty_label.setVisible(True)
+                self.load_more_button.setVisible(False)
                 return
 
-            self.info_label.setText(f"Showing {len(self.pending_approvals)} pending approval request(s)")
             self.approvals_table.setVisible(True)
             self.empty_label.setVisible(False)
+            self.append_approval_rows(self.pending_approvals)
 
-            self.approvals_table.setRowCount(len(self.pending_approvals))
+        except Exception as e:
+            self.info_label.setText(f"Error loading approvals: {str(e)}")
+            self.approvals_table.setVisible(False)
+            self.empty_label.setVisible(True)
 
-            for row, approval in enumerate(self.pending_approvals):
+    def load_more_approvals(self):
+        """Append the next page of pending approval requests."""
+        if self.next_cursor is None:
+            return
+        try:
+            approvals, self.next_cursor = self.approval_service.query_approvals(
+                self.current_filters(), cursor=self.next_cursor, limit=self.page_size
+            )
+            self.pending_approvals.extend(approvals)
+            self.append_approval_rows(approvals)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load more approvals: {str(e)}")
+
+    def append_approval_rows(self, approvals):
+        """
+        Add approval requests to the end of the table.
+
+        Args:
+            approvals: Approval requests already appended to pending_approvals
+        """
+        try:
+            self.info_label.setText(
+                f"Showing {len(self.pending_approvals)} of {self.total_pending} pending approval request(s)"
+            )
+            self.load_more_button.setVisible(self.next_cursor is not None)
+
+            first_row = self.approvals_table.rowCount()
+            self.approvals_table.setRowCount(first_row + len(approvals))
+
+            for row, approval in enumerate(approvals, start=first_row):
                 # Report number
                 report_num_item = QTableWidgetItem(str(approval['report_number']))
                 self.approvals_table.setItem(row, 0, report_num_item)
@@ -347,16 +469,41 @@ class ApprovalPanel(QWidget):
         if dialog.exec() == QDialog.DialogCode.Accepted:
             self.process_decision(approval_data, dialog.decision, dialog.comment)
 
+    def selected_approvals(self):
+        """Return the approval requests of the selected rows."""
+        rows = sorted({index.row() for index in self.approvals_table.selectionModel().selectedRows()})
+        return [self.pending_approvals[row] for row in rows if row < len(self.pending_approvals)]
+
+    def update_selection_state(self):
+        """Enable bulk review when more than one request is selected."""
+        count = len(self.approvals_table.selectionModel().selectedRows())
+        self.review_selected_button.setEnabled(count > 1)
+        self.review_selected_button.setText(f"Review Selected ({count})" if count > 1 else "Review Selected")
+
+    def review_selected(self):
+        """Review all selected approval requests with one decision."""
+        approvals = self.selected_approvals()
+        if not approvals:
+            return
+
+        dialog = ApprovalDecisionDialog(approvals if len(approvals) > 1 else approvals[0], self)
+        if dialog.exec() == QDialog.DialogCode.Accepted:
+            self.process_decision(approvals, dialog.decision, dialog.comment)
+
     def process_decision(self, approval_data, decision, comment):
         """
         Process the approval decision.
 
         Args:
-            approval_data: Approval request data
+            approval_data: Approval request data, or a list of them (bulk)
             decision: 'approve', 'reject', or 'rework'
             comment: Admin's comment
         """
         try:
+            if isinstance(approval_data, list):
+                self.process_bulk_decision(approval_data, decision, comment)
+                return
+
             approval_id = approval_data['approval_id']
 
             if decision == 'approve':
@@ -377,6 +524,41 @@ class ApprovalPanel(QWidget):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to process approval: {str(e)}")
 
+    def process_bulk_decision(self, approvals, decision, comment):
+        """
+        Apply one decision to several approval requests in a single transaction.
+
+        Args:
+            approvals: Approval request data list
+            decision: 'approve', 'reject', or 'rework'
+            comment: Admin's comment
+        """
+        approval_ids = [approval['approval_id'] for approval in approvals]
+        if decision == 'approve':
+            success, message, results = self.approval_service.bulk_approve(approval_ids, comment=comment)
+        else:
+            success, message, results = self.approval_service.bulk_reject(
+                approval_ids, comment=comment, request_rework=(decision == 'rework')
+            )
+
+        if not success:
+            QMessageBox.warning(self, "Error", message)
+            return
+
+        failures = [result for result in results if not result['success']]
+        if failures:
+            QMessageBox.warning(
+                self, "Partial Success",
+                f"{message}\n\nNot processed:\n" + "\n".join(
+                    f"Request {result['approval_id']}: {result['message']}" for result in failures[:5]
+                )
+            )
+        else:
+            QMessageBox.information(self, "Success", message)
+
+        self.approval_processed.emit()
+        self.load_pending_approvals()
+
     def refresh(self):
         """Refresh the pending approvals list."""
         self.load_pending_approvals()
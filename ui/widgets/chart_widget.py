@@ -1,15 +1,337 @@
 """
 Chart Widget
 Base widget for displaying matplotlib charts with PyQt6.
+
+Charts are drawn with matplotlib's Agg backend on a worker thread and
+shown as images, so a dashboard refresh never blocks the UI thread on
+figure layout and rasterization. Rendered images are cached by a hash
+of the chart type, input series, theme and size; plotting identical
+data again reuses the cached image instead of redrawing, and the same
+cache backs PNG export of charts for reports.
 """
 
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy
-from PyQt6.QtCore import Qt
-import matplotlib
-matplotlib.use('Qt5Agg')
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
-import matplotlib.pyplot as plt
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QSizePolicy, QLabel
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QImage, QPixmap
+
+from ui.workers import Worker
+
+# matplotlib is the slowest import in the application, so it is loaded
+# when the first chart is rendered rather than when this module is imported
+Figure = None
+FigureCanvasAgg = None
+
+DPI = 100
+# Size used before a chart has been laid out (e.g. a tab not yet shown)
+DEFAULT_SIZE = (800, 600)
+# Delay before re-rendering at a new size while the window is resized
+RESIZE_DEBOUNCE_MS = 150
+
+CHART_THEMES = {
+    'dark': {
+        'bg': '#1a1f26',
+        'text': '#e0e6ed',
+        'grid': '#2c3e50',
+        'accent': '#0d7377',
+        'palette': [
+            '#0d7377',  # Teal
+            '#14ffec',  # Cyan
+            '#f39c12',  # Orange
+            '#e74c3c',  # Red
+            '#27ae60',  # Green
+            '#3498db',  # Blue
+            '#9b59b6',  # Purple
+            '#e67e22',  # Dark Orange
+        ],
+    },
+    'light': {
+        'bg': '#ffffff',
+        'text': '#2c3e50',
+        'grid': '#e0e0e0',
+        'accent': '#0d7377',
+        'palette': [
+            '#0d7377',  # Teal
+            '#3498db',  # Blue
+            '#f39c12',  # Orange
+            '#e74c3c',  # Red
+            '#27ae60',  # Green
+            '#9b59b6',  # Purple
+            '#1abc9c',  # Turquoise
+            '#e67e22',  # Dark Orange
+        ],
+    },
+}
+
+# matplotlib keeps process-wide font and text layout caches, so renders
+# are serialized even though each one uses its own figure
+_render_lock = threading.Lock()
+
+# Render workers are held here rather than on the widget so a chart that
+# is closed mid-render does not destroy a running thread
+_active_workers = set()
+
+
+def _release_worker(worker):
+    """
+    Drop a render worker once its thread has exited.
+
+    Worker emits finished/error from inside run(), so the thread may still
+    be running when the slot fires; wait() returns as soon as run() does,
+    after which releasing the last reference cannot destroy a live thread.
+    """
+    worker.wait()
+    _active_workers.discard(worker)
+
+
+def _load_matplotlib():
+    """Import matplotlib's Agg canvas on first use."""
+    global Figure, FigureCanvasAgg
+    if Figure is not None:
+        return
+
+    from matplotlib.backends.backend_agg import FigureCanvasAgg as AggCanvas
+    from matplotlib.figure import Figure as MplFigure
+
+    FigureCanvasAgg = AggCanvas
+    Figure = MplFigure
+
+
+def get_theme_colors(theme):
+    """
+    Get chart colors for a theme.
+
+    Args:
+        theme: Theme name ('dark' or 'light')
+
+    Returns:
+        Dictionary with bg, text, grid, accent and palette entries
+    """
+    return CHART_THEMES['dark' if theme == 'dark' else 'light']
+
+
+class ChartImageCache:
+    """
+    LRU cache of rendered chart images.
+
+    Shared by every chart widget and by PNG export. Entries are keyed by
+    chart_key() and hold a QImage, which unlike QPixmap can be created
+    and read from any thread.
+    """
+
+    def __init__(self, max_entries=32):
+        """
+        Initialize chart image cache.
+
+        Args:
+            max_entries: Number of rendered images to keep
+        """
+        self.max_entries = max_entries
+        self._images = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.renders = 0
+        self.render_ms = 0.0
+
+    def get(self, key):
+        """
+        Get a cached image.
+
+        Args:
+            key: Chart key
+
+        Returns:
+            QImage or None if not cached
+        """
+        with self._lock:
+            image = self._images.get(key)
+            if image is None:
+                self.misses += 1
+                return None
+            self._images.move_to_end(key)
+            self.hits += 1
+            return image
+
+    def put(self, key, image, render_ms=0.0):
+        """
+        Store a rendered image.
+
+        Args:
+            key: Chart key
+            image: Rendered QImage
+            render_ms: Time taken to render the image
+        """
+        with self._lock:
+            self._images[key] = image
+            self._images.move_to_end(key)
+            while len(self._images) > self.max_entries:
+                self._images.popitem(last=False)
+            self.renders += 1
+            self.render_ms += render_ms
+
+    def clear(self):
+        """Drop all cached images."""
+        with self._lock:
+            self._images.clear()
+
+    def info(self):
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with size, hits, misses, renders and average render time
+        """
+        with self._lock:
+            return {
+                'size': len(self._images),
+                'max_entries': self.max_entries,
+                'hits': self.hits,
+                'misses': self.misses,
+                'renders': self.renders,
+                'avg_render_ms': round(self.render_ms / self.renders, 2) if self.renders else 0.0,
+            }
+
+
+chart_cache = ChartImageCache()
+
+
+def chart_key(kind, series, theme, width, height, dpi=DPI):
+    """
+    Hash a chart's inputs.
+
+    Args:
+        kind: Chart type name
+        series: Tuple of plot_data arguments
+        theme: Theme name
+        width: Image width in pixels
+        height: Image height in pixels
+        dpi: Render resolution
+
+    Returns:
+        Hex digest identifying the rendered image
+    """
+    payload = json.dumps([kind, series, theme, width, height, dpi], default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def render_chart(chart_class, series, theme='dark', width=DEFAULT_SIZE[0],
+                 height=DEFAULT_SIZE[1], dpi=DPI):
+    """
+    Render a chart to an image, using the cache when possible.
+
+    Safe to call from a worker thread: drawing uses a standalone Agg
+    figure and never touches pyplot or Qt widgets.
+
+    Args:
+        chart_class: ChartWidget subclass whose draw() plots the series
+        series: Tuple of plot_data arguments
+        theme: Theme name
+        width: Image width in pixels
+        height: Image height in pixels
+        dpi: Render resolution
+
+    Returns:
+        Tuple of (chart key, QImage)
+    """
+    key = chart_key(chart_class.__name__, series, theme, width, height, dpi)
+    image = chart_cache.get(key)
+    if image is not None:
+        return key, image
+    return key, _rasterize(key, chart_class, series, theme, width, height, dpi)
+
+
+def _rasterize(key, chart_class, series, theme, width, height, dpi=DPI):
+    """Draw a chart with Agg, store the image in the cache and return it."""
+    started = time.perf_counter()
+    with _render_lock:
+        _load_matplotlib()
+        colors = get_theme_colors(theme)
+        figure = Figure(figsize=(width / dpi, height / dpi), dpi=dpi)
+        canvas = FigureCanvasAgg(figure)
+        figure.patch.set_facecolor(colors['bg'])
+
+        chart_class.draw(figure, colors, *series)
+
+        canvas.draw()
+        image_width, image_height = canvas.get_width_height()
+        # copy() detaches the image from the canvas buffer
+        image = QImage(bytes(canvas.buffer_rgba()), image_width, image_height,
+                       QImage.Format.Format_RGBA8888).copy()
+
+    chart_cache.put(key, image, (time.perf_counter() - started) * 1000)
+    return image
+
+
+def save_chart_png(chart_class, series, file_path, theme='dark',
+                   width=DEFAULT_SIZE[0], height=DEFAULT_SIZE[1], dpi=DPI):
+    """
+    Save a chart as a PNG file for reports.
+
+    Args:
+        chart_class: ChartWidget subclass whose draw() plots the series
+        series: Tuple of plot_data arguments
+        file_path: Destination PNG path
+        theme: Theme name
+        width: Image width in pixels
+        height: Image height in pixels
+        dpi: Render resolution
+
+    Returns:
+        True if the file was written
+    """
+    _, image = render_chart(chart_class, series, theme, width, height, dpi)
+    return image.save(file_path, 'PNG')
+
+
+def _rasterize_keyed(key, chart_class, series, theme, width, height):
+    """Rasterize a chart on a render worker, returning (key, QImage)."""
+    return key, _rasterize(key, chart_class, series, theme, width, height)
+
+
+def _draw_no_data(figure, colors):
+    """Draw the "No data available" placeholder."""
+    ax = figure.add_subplot(111)
+    ax.text(0.5, 0.5, 'No data available',
+           horizontalalignment='center',
+           verticalalignment='center',
+           fontsize=14,
+           color=colors['text'])
+    ax.set_xlim(0, 1)
+    ax.set_ylim(0, 1)
+    ax.axis('off')
+    ax.patch.set_facecolor(colors['bg'])
+
+
+def _style_axes(ax, colors, title, xlabel, ylabel, grid_axis='both'):
+    """Apply the shared title, label, spine and grid styling."""
+    ax.set_title(title, color=colors['text'], fontsize=12, fontweight='bold', pad=20)
+    ax.set_xlabel(xlabel, color=colors['text'], fontsize=10)
+    ax.set_ylabel(ylabel, color=colors['text'], fontsize=10)
+
+    # Style axes
+    ax.tick_params(axis='x', colors=colors['text'], labelsize=9)
+    ax.tick_params(axis='y', colors=colors['text'], labelsize=9)
+    ax.spines['bottom'].set_color(colors['text'])
+    ax.spines['left'].set_color(colors['text'])
+    ax.spines['top'].set_visible(False)
+    ax.spines['right'].set_visible(False)
+
+    # Add grid
+    ax.grid(True, alpha=0.3, color=colors['grid'], linestyle='--', linewidth=0.5, axis=grid_axis)
+    ax.set_axisbelow(True)
+
+
+def _rotate_x_labels(ax):
+    """Rotate x-axis tick labels so long category lists stay readable."""
+    for label in ax.get_xticklabels():
+        label.set_rotation(45)
+        label.set_horizontalalignment('right')
 
 
 class ChartWidget(QWidget):
@@ -17,10 +339,14 @@ class ChartWidget(QWidget):
     Base chart widget using matplotlib.
 
     Features:
-    - Embeds matplotlib canvas in PyQt6
+    - Renders charts off the UI thread with the Agg backend
+    - Skips redraws when plotted with identical data
     - Theme-aware styling
     - Responsive resizing
-    - Interactive features
+    - PNG export backed by the render cache
+
+    Subclasses implement draw(figure, colors, *series) as a staticmethod
+    and call _plot(*series) from plot_data().
     """
 
     def __init__(self, parent=None, theme='dark'):
@@ -33,45 +359,47 @@ class ChartWidget(QWidget):
         """
         super().__init__(parent)
         self.theme = theme
+        self._series = None
+        self._shown_key = None
+        self._pending_key = None
 
-        # Create matplotlib figure
-        self.figure = Figure(figsize=(8, 6), dpi=100)
-        self.canvas = FigureCanvas(self.figure)
+        # Rendered charts are shown as images
+        self.image_label = QLabel()
+        self.image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.image_label.setMinimumSize(1, 1)
+        self.image_label.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
 
         # Setup layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(0, 0, 0, 0)
-        layout.addWidget(self.canvas)
+        layout.addWidget(self.image_label)
 
-        # Configure canvas
-        self.canvas.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_DEBOUNCE_MS)
+        self._resize_timer.timeout.connect(self._render)
 
         # Apply theme
         self.apply_theme()
 
     def apply_theme(self):
         """Apply theme styling to the chart."""
-        if self.theme == 'dark':
-            # Dark theme colors
-            self.bg_color = '#1a1f26'
-            self.text_color = '#e0e6ed'
-            self.grid_color = '#2c3e50'
-            self.accent_color = '#0d7377'
-        else:
-            # Light theme colors
-            self.bg_color = '#ffffff'
-            self.text_color = '#2c3e50'
-            self.grid_color = '#e0e0e0'
-            self.accent_color = '#0d7377'
-
-        # Set figure background
-        self.figure.patch.set_facecolor(self.bg_color)
-        self.canvas.setStyleSheet(f"background-color: {self.bg_color};")
+        colors = get_theme_colors(self.theme)
+        self.bg_color = colors['bg']
+        self.text_color = colors['text']
+        self.grid_color = colors['grid']
+        self.accent_color = colors['accent']
+
+        self.image_label.setStyleSheet(f"background-color: {self.bg_color};")
+        if self._series is not None:
+            self._render()
 
     def clear(self):
         """Clear the chart."""
-        self.figure.clear()
-        self.canvas.draw()
+        self._series = None
+        self._shown_key = None
+        self._pending_key = None
+        self.image_label.clear()
 
     def get_color_palette(self):
         """
@@ -80,28 +408,111 @@ class ChartWidget(QWidget):
         Returns:
             List of colors
         """
-        if self.theme == 'dark':
-            return [
-                '#0d7377',  # Teal
-                '#14ffec',  # Cyan
-                '#f39c12',  # Orange
-                '#e74c3c',  # Red
-                '#27ae60',  # Green
-                '#3498db',  # Blue
-                '#9b59b6',  # Purple
-                '#e67e22',  # Dark Orange
-            ]
-        else:
-            return [
-                '#0d7377',  # Teal
-                '#3498db',  # Blue
-                '#f39c12',  # Orange
-                '#e74c3c',  # Red
-                '#27ae60',  # Green
-                '#9b59b6',  # Purple
-                '#1abc9c',  # Turquoise
-                '#e67e22',  # Dark Orange
-            ]
+        return list(get_theme_colors(self.theme)['palette'])
+
+    @staticmethod
+    def draw(figure, colors, *series):
+        """
+        Draw the chart onto a matplotlib figure.
+
+        Args:
+            figure: matplotlib Figure backed by an Agg canvas
+            colors: Theme colors from get_theme_colors()
+            *series: plot_data arguments
+        """
+        raise NotImplementedError
+
+    def _plot(self, *series):
+        """
+        Show a chart for the given plot_data arguments.
+
+        Args:
+            *series: plot_data arguments
+        """
+        self._series = series
+        self._render()
+
+    def _render_size(self):
+        """Get the pixel size to render at for the current widget size."""
+        width, height = self.image_label.width(), self.image_label.height()
+        if width < 50 or height < 50:
+            width, height = DEFAULT_SIZE
+        ratio = self.devicePixelRatioF()
+        return int(width * ratio), int(height * ratio)
+
+    def _render(self):
+        """Show the current chart from the cache or start rendering it."""
+        if self._series is None:
+            return
+
+        width, height = self._render_size()
+        key = chart_key(type(self).__name__, self._series, self.theme, width, height)
+        if key in (self._shown_key, self._pending_key):
+            return
+
+        image = chart_cache.get(key)
+        if image is not None:
+            self._pending_key = None
+            self._show(key, image)
+            return
+
+        self._pending_key = key
+        worker = Worker(_rasterize_keyed, key, type(self), self._series, self.theme, width, height)
+        worker.finished.connect(self._on_rendered)
+        worker.error.connect(self._on_render_error)
+        worker.finished.connect(lambda _: _release_worker(worker))
+        worker.error.connect(lambda _: _release_worker(worker))
+        _active_workers.add(worker)
+        worker.start()
+
+    def _on_rendered(self, result):
+        """Show a finished render unless newer data has been plotted since."""
+        key, image = result
+        if key != self._pending_key:
+            return
+        self._pending_key = None
+        self._show(key, image)
+
+    def _on_render_error(self, error):
+        """Fall back to a text message when rendering fails."""
+        self._pending_key = None
+        self._shown_key = None
+        self.image_label.setText(f"Chart unavailable: {error}")
+
+    def _show(self, key, image):
+        """Display a rendered image."""
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.devicePixelRatioF())
+        self.image_label.setPixmap(pixmap)
+        self._shown_key = key
+
+    def resizeEvent(self, event):
+        """Re-render at the new size once resizing settles."""
+        super().resizeEvent(event)
+        if self._series is not None:
+            self._resize_timer.start()
+
+    def export_png(self, file_path, width=None, height=None):
+        """
+        Save the current chart as a PNG file.
+
+        Exporting at the displayed size reuses the image already in the
+        render cache.
+
+        Args:
+            file_path: Destination PNG path
+            width: Image width in pixels (defaults to the displayed size)
+            height: Image height in pixels (defaults to the displayed size)
+
+        Returns:
+            True if the file was written, False if nothing has been plotted
+        """
+        if self._series is None:
+            return False
+
+        if width is None or height is None:
+            width, height = self._render_size()
+        return save_chart_png(type(self), self._series, file_path, self.theme, width, height)
 
 
 class PieChartWidget(ChartWidget):
@@ -128,37 +539,26 @@ class PieChartWidget(ChartWidget):
             labels: List of labels
             title: Chart title
         """
-        self.clear()
+        self._plot(list(data), list(labels), title)
 
+    @staticmethod
+    def draw(figure, colors, data, labels, title="Pie Chart"):
+        """Draw a pie chart onto a figure."""
         if not data or sum(data) == 0:
-            # Show "No data" message
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'No data available',
-                   horizontalalignment='center',
-                   verticalalignment='center',
-                   fontsize=14,
-                   color=self.text_color)
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            ax.patch.set_facecolor(self.bg_color)
-            self.canvas.draw()
+            _draw_no_data(figure, colors)
             return
 
-        ax = self.figure.add_subplot(111)
-        ax.patch.set_facecolor(self.bg_color)
-
-        # Get colors
-        colors = self.get_color_palette()[:len(data)]
+        ax = figure.add_subplot(111)
+        ax.patch.set_facecolor(colors['bg'])
 
         # Create pie chart
         wedges, texts, autotexts = ax.pie(
             data,
             labels=labels,
             autopct='%1.1f%%',
-            colors=colors,
+            colors=colors['palette'][:len(data)],
             startangle=90,
-            textprops={'color': self.text_color, 'fontsize': 10}
+            textprops={'color': colors['text'], 'fontsize': 10}
         )
 
         # Style percentage text
@@ -168,13 +568,12 @@ class PieChartWidget(ChartWidget):
             autotext.set_fontsize(9)
 
         # Add title
-        ax.set_title(title, color=self.text_color, fontsize=12, fontweight='bold', pad=20)
+        ax.set_title(title, color=colors['text'], fontsize=12, fontweight='bold', pad=20)
 
         # Equal aspect ratio ensures that pie is drawn as a circle
         ax.axis('equal')
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+        figure.tight_layout()
 
 
 class BarChartWidget(ChartWidget):
@@ -203,31 +602,21 @@ class BarChartWidget(ChartWidget):
             xlabel: X-axis label
             ylabel: Y-axis label
         """
-        self.clear()
+        self._plot(list(categories), list(values), title, xlabel, ylabel)
 
+    @staticmethod
+    def draw(figure, colors, categories, values, title="Bar Chart", xlabel="", ylabel="Count"):
+        """Draw a bar chart onto a figure."""
         if not values or sum(values) == 0:
-            # Show "No data" message
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'No data available',
-                   horizontalalignment='center',
-                   verticalalignment='center',
-                   fontsize=14,
-                   color=self.text_color)
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            ax.patch.set_facecolor(self.bg_color)
-            self.canvas.draw()
+            _draw_no_data(figure, colors)
             return
 
-        ax = self.figure.add_subplot(111)
-        ax.patch.set_facecolor(self.bg_color)
-
-        # Get colors
-        colors = self.get_color_palette()[:len(values)]
+        ax = figure.add_subplot(111)
+        ax.patch.set_facecolor(colors['bg'])
 
         # Create bar chart
-        bars = ax.bar(categories, values, color=colors, edgecolor=self.text_color, linewidth=0.5)
+        bars = ax.bar(categories, values, color=colors['palette'][:len(values)],
+                      edgecolor=colors['text'], linewidth=0.5)
 
         # Add value labels on bars
         for bar in bars:
@@ -235,33 +624,17 @@ class BarChartWidget(ChartWidget):
             ax.text(bar.get_x() + bar.get_width()/2., height,
                    f'{int(height)}',
                    ha='center', va='bottom',
-                   color=self.text_color,
+                   color=colors['text'],
                    fontsize=9,
                    fontweight='bold')
 
-        # Styling
-        ax.set_title(title, color=self.text_color, fontsize=12, fontweight='bold', pad=20)
-        ax.set_xlabel(xlabel, color=self.text_color, fontsize=10)
-        ax.set_ylabel(ylabel, color=self.text_color, fontsize=10)
-
-        # Style axes
-        ax.tick_params(axis='x', colors=self.text_color, labelsize=9)
-        ax.tick_params(axis='y', colors=self.text_color, labelsize=9)
-        ax.spines['bottom'].set_color(self.text_color)
-        ax.spines['left'].set_color(self.text_color)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-
-        # Add grid
-        ax.grid(True, alpha=0.3, color=self.grid_color, linestyle='--', linewidth=0.5)
-        ax.set_axisbelow(True)
+        _style_axes(ax, colors, title, xlabel, ylabel)
 
         # Rotate x-axis labels if needed
         if len(categories) > 5:
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+            _rotate_x_labels(ax)
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+        figure.tight_layout()
 
 
 class LineChartWidget(ChartWidget):
@@ -290,66 +663,42 @@ class LineChartWidget(ChartWidget):
             xlabel: X-axis label
             ylabel: Y-axis label
         """
-        self.clear()
+        self._plot(list(x_data),
+                   {label: list(values) for label, values in (y_data_dict or {}).items()},
+                   title, xlabel, ylabel)
 
+    @staticmethod
+    def draw(figure, colors, x_data, y_data_dict, title="Line Chart", xlabel="", ylabel="Value"):
+        """Draw a line chart onto a figure."""
         if not y_data_dict or not x_data:
-            # Show "No data" message
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'No data available',
-                   horizontalalignment='center',
-                   verticalalignment='center',
-                   fontsize=14,
-                   color=self.text_color)
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            ax.patch.set_facecolor(self.bg_color)
-            self.canvas.draw()
+            _draw_no_data(figure, colors)
             return
 
-        ax = self.figure.add_subplot(111)
-        ax.patch.set_facecolor(self.bg_color)
-
-        # Get colors
-        colors = self.get_color_palette()
+        ax = figure.add_subplot(111)
+        ax.patch.set_facecolor(colors['bg'])
 
         # Plot each line
+        palette = colors['palette']
         for idx, (label, y_data) in enumerate(y_data_dict.items()):
-            color = colors[idx % len(colors)]
+            color = palette[idx % len(palette)]
             ax.plot(x_data, y_data, marker='o', linewidth=2,
                    markersize=6, label=label, color=color)
 
-        # Styling
-        ax.set_title(title, color=self.text_color, fontsize=12, fontweight='bold', pad=20)
-        ax.set_xlabel(xlabel, color=self.text_color, fontsize=10)
-        ax.set_ylabel(ylabel, color=self.text_color, fontsize=10)
-
-        # Style axes
-        ax.tick_params(axis='x', colors=self.text_color, labelsize=9)
-        ax.tick_params(axis='y', colors=self.text_color, labelsize=9)
-        ax.spines['bottom'].set_color(self.text_color)
-        ax.spines['left'].set_color(self.text_color)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-
-        # Add grid
-        ax.grid(True, alpha=0.3, color=self.grid_color, linestyle='--', linewidth=0.5)
-        ax.set_axisbelow(True)
+        _style_axes(ax, colors, title, xlabel, ylabel)
 
         # Add legend if multiple lines
         if len(y_data_dict) > 1:
             legend = ax.legend(loc='best', framealpha=0.9)
-            legend.get_frame().set_facecolor(self.bg_color)
-            legend.get_frame().set_edgecolor(self.text_color)
+            legend.get_frame().set_facecolor(colors['bg'])
+            legend.get_frame().set_edgecolor(colors['text'])
             for text in legend.get_texts():
-                text.set_color(self.text_color)
+                text.set_color(colors['text'])
 
         # Rotate x-axis labels if needed
         if len(x_data) > 10:
-            plt.setp(ax.xaxis.get_majorticklabels(), rotation=45, ha='right')
+            _rotate_x_labels(ax)
 
-        self.figure.tight_layout()
-        self.canvas.draw()
+        figure.tight_layout()
 
 
 class HorizontalBarChartWidget(ChartWidget):
@@ -378,61 +727,35 @@ class HorizontalBarChartWidget(ChartWidget):
             xlabel: X-axis label
             ylabel: Y-axis label
         """
-        self.clear()
+        self._plot(list(categories), list(values), title, xlabel, ylabel)
 
+    @staticmethod
+    def draw(figure, colors, categories, values, title="Horizontal Bar Chart", xlabel="Count", ylabel=""):
+        """Draw a horizontal bar chart onto a figure."""
         if not values or sum(values) == 0:
-            # Show "No data" message
-            ax = self.figure.add_subplot(111)
-            ax.text(0.5, 0.5, 'No data available',
-                   horizontalalignment='center',
-                   verticalalignment='center',
-                   fontsize=14,
-                   color=self.text_color)
-            ax.set_xlim(0, 1)
-            ax.set_ylim(0, 1)
-            ax.axis('off')
-            ax.patch.set_facecolor(self.bg_color)
-            self.canvas.draw()
+            _draw_no_data(figure, colors)
             return
 
-        ax = self.figure.add_subplot(111)
-        ax.patch.set_facecolor(self.bg_color)
-
-        # Get colors
-        colors = self.get_color_palette()[:len(values)]
+        ax = figure.add_subplot(111)
+        ax.patch.set_facecolor(colors['bg'])
 
         # Create horizontal bar chart
         y_pos = range(len(categories))
-        bars = ax.barh(y_pos, values, color=colors, edgecolor=self.text_color, linewidth=0.5)
+        bars = ax.barh(y_pos, values, color=colors['palette'][:len(values)],
+                       edgecolor=colors['text'], linewidth=0.5)
 
         # Add value labels on bars
-        for idx, bar in enumerate(bars):
+        for bar in bars:
             width = bar.get_width()
             ax.text(width, bar.get_y() + bar.get_height()/2.,
                    f' {int(width)}',
                    ha='left', va='center',
-                   color=self.text_color,
+                   color=colors['text'],
                    fontsize=9,
                    fontweight='bold')
 
-        # Styling
-        ax.set_title(title, color=self.text_color, fontsize=12, fontweight='bold', pad=20)
-        ax.set_xlabel(xlabel, color=self.text_color, fontsize=10)
-        ax.set_ylabel(ylabel, color=self.text_color, fontsize=10)
+        _style_axes(ax, colors, title, xlabel, ylabel, grid_axis='x')
         ax.set_yticks(y_pos)
         ax.set_yticklabels(categories)
 
-        # Style axes
-        ax.tick_params(axis='x', colors=self.text_color, labelsize=9)
-        ax.tick_params(axis='y', colors=self.text_color, labelsize=9)
-        ax.spines['bottom'].set_color(self.text_color)
-        ax.spines['left'].set_color(self.text_color)
-        ax.spines['top'].set_visible(False)
-        ax.spines['right'].set_visible(False)
-
-        # Add grid
-        ax.grid(True, alpha=0.3, color=self.grid_color, linestyle='--', linewidth=0.5, axis='x')
-        ax.set_axisbelow(True)
-
-        self.figure.tight_layout()
-        self.canvas.draw()
+        figure.tight_layout()
@@ -2,13 +2,16 @@
 Dashboard view widget showing summary statistics and charts.
 """
 
+import os
+from datetime import datetime
+
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QFrame, QGridLayout, QPushButton, QTabWidget, QApplication,
-                             QScrollArea)
+                             QScrollArea, QFileDialog)
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from ui.workers import DashboardDataWorker
-from services.icon_service import get_icon, IconService
+from services.icon_service import get_icon, get_pixmap, IconService
 from ui.theme_colors import ThemeColors
 from ui.widgets.chart_widget import (PieChartWidget, BarChartWidget,
                                      LineChartWidget, HorizontalBarChartWidget)
@@ -46,8 +49,7 @@ class KPICard(QFrame):
         if icon_name:
             icon_label = QLabel()
             icon_color = {'info': '#3498db', 'success': '#27ae60', 'warning': '#f39c12', 'danger': '#e74c3c'}.get(card_type, '#3498db')
-            icon = get_icon(icon_name, color=icon_color, size=IconService.LARGE)
-            icon_label.setPixmap(icon.pixmap(32, 32))
+            icon_label.setPixmap(get_pixmap(icon_name, color=icon_color, size=IconService.LARGE))
             header_layout.addWidget(icon_label)
 
         # Title
@@ -222,12 +224,24 @@ class DashboardView(QWidget):
 
         layout.addWidget(charts_frame)
 
-        # Refresh button
+        # Action buttons
+        button_layout = QHBoxLayout()
+
         refresh_btn = QPushButton("Refresh Dashboard")
         refresh_btn.setIcon(get_icon('refresh', color=ThemeColors.ICON_DEFAULT))
         refresh_btn.clicked.connect(self.load_data)
         refresh_btn.setMaximumWidth(200)
-        layout.addWidget(refresh_btn)
+        button_layout.addWidget(refresh_btn)
+
+        export_charts_btn = QPushButton("Export Charts")
+        export_charts_btn.setIcon(get_icon('file-export', color=ThemeColors.ICON_DEFAULT))
+        export_charts_btn.setToolTip("Save the dashboard charts as PNG images for reports")
+        export_charts_btn.clicked.connect(self.export_charts)
+        export_charts_btn.setMaximumWidth(200)
+        button_layout.addWidget(export_charts_btn)
+
+        button_layout.addStretch()
+        layout.addLayout(button_layout)
 
         layout.addStretch()
 
@@ -302,7 +316,6 @@ class DashboardView(QWidget):
                 formatted_months = []
                 for month in months:
                     try:
-                        from datetime import datetime
                         dt = datetime.strptime(month, '%Y-%m')
                         formatted_months.append(dt.strftime('%b %Y'))
                     except:
@@ -336,6 +349,31 @@ class DashboardView(QWidget):
             self.logging_service.error(f"Error updating charts: {str(e)}")
             self.status_label.setText(f"Error updating charts: {str(e)}")
 
+    def export_charts(self):
+        """Save the dashboard charts as PNG images in a chosen directory."""
+        dir_path = QFileDialog.getExistingDirectory(self, "Select Output Directory")
+        if not dir_path:
+            return
+
+        stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        charts = {
+            'status_distribution': self.pie_chart,
+            'reports_trend': self.line_chart,
+            'top_contributors': self.bar_chart,
+        }
+
+        saved = []
+        for name, chart in charts.items():
+            file_path = os.path.join(dir_path, f"dashboard_{name}_{stamp}.png")
+            if chart.export_png(file_path):
+                saved.append(file_path)
+
+        if saved:
+            self.status_label.setText(f"Exported {len(saved)} chart(s) to {dir_path}")
+            self.logging_service.info(f"Exported {len(saved)} dashboard chart(s) to {dir_path}")
+        else:
+            self.status_label.setText("No charts to export yet")
+
     def on_data_error(self, error_message: str):
         """
         Handle data loading error.
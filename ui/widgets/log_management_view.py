@@ -6,11 +6,13 @@ Allows viewing, filtering, exporting, and clearing system logs.
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
                              QPushButton, QTableWidget, QTableWidgetItem,
                              QComboBox, QLineEdit, QMessageBox, QFileDialog,
-                             QHeaderView, QFrame, QDateEdit, QGroupBox)
+                             QHeaderView, QFrame, QDateEdit, QGroupBox, QCheckBox)
 from PyQt6.QtCore import Qt, QDate, pyqtSignal
 from PyQt6.QtGui import QFont
 from ui.workers import Worker, LogExportWorker
+from ui.widgets.chart_widget import LineChartWidget, HorizontalBarChartWidget
 from ui.theme_colors import ThemeColors
+from utils.tracing import tracer
 from datetime import datetime
 
 
@@ -20,10 +22,23 @@ class LogManagementView(QWidget):
 
     Features:
     - View logs with filtering
-    - Export logs to file
+    - Error-rate chart, top recurring exceptions and spike detection
+    - Export logs to JSON Lines, CSV or text, optionally gzipped
     - Clear logs with confirmation
+    - Toggle service tracing and export traces
     """
 
+    EXPORT_FILTERS = [
+        "JSON Lines, gzip (*.jsonl.gz)",
+        "JSON Lines (*.jsonl)",
+        "CSV, gzip (*.csv.gz)",
+        "CSV (*.csv)",
+        "Text Files (*.txt)",
+    ]
+
+    # Hours shown in the error-rate chart and checked for spikes
+    ANALYTICS_HOURS = 24
+
     def __init__(self, logging_service):
         """
         Initialize log management view.
@@ -35,9 +50,11 @@ class LogManagementView(QWidget):
         self.logging_service = logging_service
         self.current_logs = []
         self.worker = None
+        self.analytics_worker = None
 
         self.setup_ui()
         self.load_logs()
+        self.load_analytics()
 
     def setup_ui(self):
         """Setup the user interface."""
@@ -101,6 +118,59 @@ class LogManagementView(QWidget):
         filters_group.setLayout(filters_layout)
         layout.addWidget(filters_group)
 
+        # Tracing
+        tracing_group = QGroupBox("Tracing")
+        tracing_layout = QHBoxLayout()
+        tracing_layout.setSpacing(12)
+
+        self.tracing_checkbox = QCheckBox("Trace service and database calls")
+        self.tracing_checkbox.setChecked(tracer.enabled)
+        self.tracing_checkbox.toggled.connect(self.toggle_tracing)
+        tracing_layout.addWidget(self.tracing_checkbox)
+
+        self.tracing_label = QLabel("")
+        self.tracing_label.setStyleSheet(f"color: {ThemeColors.TEXT_SECONDARY};")
+        tracing_layout.addWidget(self.tracing_label)
+
+        tracing_layout.addStretch()
+
+        slowest_btn = QPushButton("Slowest Requests")
+        slowest_btn.clicked.connect(self.show_slowest_requests)
+        tracing_layout.addWidget(slowest_btn)
+
+        export_trace_btn = QPushButton("Export Trace")
+        export_trace_btn.clicked.connect(self.export_trace)
+        tracing_layout.addWidget(export_trace_btn)
+
+        clear_trace_btn = QPushButton("Clear Trace")
+        clear_trace_btn.clicked.connect(self.clear_trace)
+        tracing_layout.addWidget(clear_trace_btn)
+
+        tracing_group.setLayout(tracing_layout)
+        layout.addWidget(tracing_group)
+        self.update_tracing_label()
+
+        # Analytics (read from hourly rollups, so cheap at any log volume)
+        analytics_group = QGroupBox("Log Analytics")
+        analytics_layout = QHBoxLayout()
+
+        self.error_rate_chart = LineChartWidget(theme='dark')
+        self.error_rate_chart.setMinimumHeight(220)
+        analytics_layout.addWidget(self.error_rate_chart, 3)
+
+        self.top_exceptions_chart = HorizontalBarChartWidget(theme='dark')
+        self.top_exceptions_chart.setMinimumHeight(220)
+        analytics_layout.addWidget(self.top_exceptions_chart, 2)
+
+        self.analytics_label = QLabel("Loading analytics...")
+        self.analytics_label.setWordWrap(True)
+        self.analytics_label.setAlignment(Qt.AlignmentFlag.AlignTop)
+        self.analytics_label.setStyleSheet(f"color: {ThemeColors.TEXT_SECONDARY};")
+        analytics_layout.addWidget(self.analytics_label, 1)
+
+        analytics_group.setLayout(analytics_layout)
+        layout.addWidget(analytics_group)
+
         # Actions bar
         actions_layout = QHBoxLayout()
 
@@ -236,6 +306,60 @@ class LogManagementView(QWidget):
         self.stats_label.setText(f"{len(logs)} logs loaded")
         self.status_label.setText(f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
+    def load_analytics(self):
+        """Load the error-rate chart, recurring exceptions and spikes."""
+        def analytics_task():
+            return self.logging_service.get_log_analytics(hours=self.ANALYTICS_HOURS, top_limit=8)
+
+        self.analytics_worker = Worker(analytics_task)
+        self.analytics_worker.finished.connect(self.on_analytics_loaded)
+        self.analytics_worker.error.connect(
+            lambda message: self.analytics_label.setText(f"Error loading analytics: {message}")
+        )
+        self.analytics_worker.start()
+
+    def on_analytics_loaded(self, analytics: dict):
+        """
+        Handle analytics loaded.
+
+        Args:
+            analytics: Result of LoggingService.get_log_analytics
+        """
+        hourly = analytics['hourly']
+        self.error_rate_chart.plot_data(
+            [point['hour'][-5:] for point in hourly],
+            {
+                'Errors': [point['errors'] for point in hourly],
+                'Warnings': [point['warnings'] for point in hourly],
+            },
+            title=f"Errors per Hour (last {self.ANALYTICS_HOURS}h)",
+            ylabel="Logs",
+        )
+
+        top = analytics['top_exceptions']
+        self.top_exceptions_chart.plot_data(
+            [f"{item['exception_type'] or 'Error'} · {item['module'] or '-'}" for item in top],
+            [item['count'] for item in top],
+            title="Top Recurring Exceptions",
+        )
+
+        statistics = analytics['statistics']
+        lines = [
+            f"<b>Total logs:</b> {statistics['total_logs']:,}",
+            f"<b>Errors (24h):</b> {statistics['errors_last_24h']}",
+            "<br><b>Spikes</b>",
+        ]
+        spikes = analytics['spikes']
+        if spikes:
+            lines.extend(
+                f"<span style='color: {ThemeColors.DANGER};'>{spike['hour']}: {spike['errors']} errors "
+                f"(usual {spike['baseline']:g})</span>"
+                for spike in spikes[-5:]
+            )
+        else:
+            lines.append("No error spikes")
+        self.analytics_label.setText("<br>".join(lines))
+
     def on_load_error(self, error_message: str):
         """
         Handle log loading error.
@@ -247,18 +371,22 @@ class LogManagementView(QWidget):
         QMessageBox.critical(self, "Error", f"Failed to load logs:\n{error_message}")
 
     def export_logs(self):
-        """Export logs to text file."""
-        # Get file path from user
-        file_path, _ = QFileDialog.getSaveFileName(
+        """Stream logs matching the filters to a JSON Lines, CSV or text file."""
+        # Get file path from user; the extension picks the format (.gz compresses)
+        file_path, selected_filter = QFileDialog.getSaveFileName(
             self,
             "Export Logs",
-            f"system_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt",
-            "Text Files (*.txt);;All Files (*)"
+            f"system_logs_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl.gz",
+            ";;".join(self.EXPORT_FILTERS)
         )
 
         if not file_path:
             return
 
+        # Use the chosen filter's extension if the name has no known one
+        if not file_path.lower().endswith(('.jsonl', '.csv', '.txt', '.gz')):
+            file_path += selected_filter[selected_filter.find('*') + 1:selected_filter.find(')')]
+
         # Get filter values
         level = None if self.level_combo.currentText() == 'All' else self.level_combo.currentText()
         module = self.module_input.text().strip() or None
@@ -306,6 +434,64 @@ class LogManagementView(QWidget):
         self.status_label.setText(f"Export failed: {error_message}")
         QMessageBox.critical(self, "Export Error", f"Failed to export logs:\n{error_message}")
 
+    def toggle_tracing(self, enabled: bool):
+        """
+        Turn tracing on or off at runtime.
+
+        Args:
+            enabled: Whether to record spans
+        """
+        if enabled:
+            tracer.enable()
+            self.logging_service.info("Tracing enabled")
+        else:
+            self.logging_service.info("Tracing disabled")
+            tracer.disable()
+        self.update_tracing_label()
+
+    def update_tracing_label(self):
+        """Show how many spans are recorded."""
+        state = "recording" if tracer.enabled else "off"
+        self.tracing_label.setText(f"{tracer.span_count} spans recorded ({state})")
+
+    def show_slowest_requests(self):
+        """Show the slowest traced requests with their timing breakdown."""
+        self.update_tracing_label()
+        QMessageBox.information(self, "Slowest Requests", tracer.format_requests())
+
+    def export_trace(self):
+        """Export recorded spans as Chrome trace-event JSON."""
+        if not tracer.span_count:
+            QMessageBox.information(self, "Export Trace", "No spans recorded. Enable tracing first.")
+            return
+
+        file_path, _ = QFileDialog.getSaveFileName(
+            self,
+            "Export Trace",
+            f"trace_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+            "Chrome Trace (*.json);;All Files (*)"
+        )
+        if not file_path:
+            return
+
+        try:
+            count = tracer.export_chrome_trace(file_path)
+            self.status_label.setText(f"Exported {count} spans to {file_path}")
+            QMessageBox.information(
+                self,
+                "Export Complete",
+                f"Exported {count} spans to:\n{file_path}\n\n"
+                "Open it in chrome://tracing or https://ui.perfetto.dev"
+            )
+        except Exception as e:
+            self.logging_service.error(f"Error exporting trace: {str(e)}", exc_info=True)
+            QMessageBox.critical(self, "Export Error", f"Failed to export trace:\n{str(e)}")
+
+    def clear_trace(self):
+        """Drop recorded spans."""
+        tracer.clear()
+        self.update_tracing_label()
+
     def clear_logs(self):
         """Clear logs from database with confirmation."""
         # Confirmation dialog
@@ -357,6 +543,7 @@ class LogManagementView(QWidget):
         )
         # Reload logs
         self.load_logs()
+        self.load_analytics()
 
     def on_clear_error(self, error_message: str):
         """
@@ -370,4 +557,6 @@ class LogManagementView(QWidget):
 
     def refresh(self):
         """Refresh the view (called from main window)."""
+        self.update_tracing_label()
         self.load_logs()
+        self.load_analytics()
@@ -337,16 +337,20 @@ class NotificationWidget(QWidget):
         self.refresh_notifications()
 
     def start_auto_refresh(self):
-        """Start auto-refresh timer for notifications."""
+        """Start auto-refresh timer for the unread badge."""
         self.refresh_timer = QTimer(self)
         self.refresh_timer.timeout.connect(self.refresh_notifications)
         self.refresh_timer.start(30000)  # Refresh every 30 seconds
 
     def refresh_notifications(self):
-        """Refresh notifications from database."""
+        """
+        Refresh the unread badge.
+
+        Reads the per-user unread counter (one indexed lookup); the
+        notification list itself is loaded when the dropdown opens.
+        """
         try:
-            self.notifications = self.approval_service.get_user_notifications()
-            self.unread_count = len([n for n in self.notifications if not n.get('is_read', False)])
+            self.unread_count = self.approval_service.get_unread_notification_count()
 
             # Update badge
             if self.unread_count > 0:
@@ -372,6 +376,12 @@ class NotificationWidget(QWidget):
         if self.dropdown:
             self.dropdown.close()
 
+        try:
+            self.notifications = self.approval_service.get_user_notifications()
+        except Exception as e:
+            print(f"Error loading notifications: {e}")
+            self.notifications = []
+
         self.dropdown = NotificationDropdown(self.notifications, self)
         self.dropdown.notification_clicked.connect(self.on_notification_clicked)
         self.dropdown.mark_all_read.connect(self.mark_all_read)
@@ -414,7 +424,7 @@ class NotificationWidget(QWidget):
         """
         # Mark as read
         if not notification.get('is_read', False):
-            self.report_service.mark_notification_read(notification['notification_id'])
+            self.approval_service.mark_notification_read(notification['notification_id'])
             self.refresh_notifications()
 
         # Emit signal for parent to handle navigation
@@ -428,10 +438,7 @@ class NotificationWidget(QWidget):
     def mark_all_read(self):
         """Mark all notifications as read."""
         try:
-            for notification in self.notifications:
-                if not notification.get('is_read', False):
-                    self.report_service.mark_notification_read(notification['notification_id'])
-
+            self.approval_service.mark_all_notifications_read()
             self.refresh_notifications()
 
             if self.dropdown:
@@ -0,0 +1,266 @@
+"""
+Virtualized table model for the reports grid.
+Rows are fetched from the database in batches as the user scrolls and
+formatted on demand, so large result sets never block the UI.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, pyqtSignal
+from PyQt6.QtGui import QColor
+
+from ui.workers import Worker
+
+
+class ReportTableModel(QAbstractTableModel):
+    """
+    Table model backed by a compact tuple row store.
+
+    Rows are stored as (report_id, *column values) tuples exactly as read
+    from the database. Display text and colors are produced in data() only
+    for the cells the view paints. Sorting is delegated to the database.
+
+    Signals:
+        rows_loaded: Emitted with (loaded row count, total matching rows)
+        load_error: Emitted with error message
+    """
+
+    BATCH_SIZE = 500
+
+    rows_loaded = pyqtSignal(int, int)
+    load_error = pyqtSignal(str)
+
+    # Approval status labels and colors for special formatting
+    APPROVAL_LABELS = {
+        'draft': 'Draft',
+        'pending_approval': 'Pending',
+        'approved': 'Approved',
+        'rejected': 'Rejected',
+        'rework': 'Rework'
+    }
+    APPROVAL_COLORS = {
+        'draft': '#6e7681',
+        'pending_approval': '#d29922',
+        'approved': '#2ea043',
+        'rejected': '#f85149',
+        'rework': '#d29922'
+    }
+
+    def __init__(self, report_service, columns: List[Dict], parent=None):
+        """
+        Initialize report table model.
+
+        Args:
+            report_service: ReportService instance
+            columns: Column definitions (dicts with 'key' and 'header')
+            parent: Parent QObject
+        """
+        super().__init__(parent)
+        self.report_service = report_service
+        self.columns = columns
+        self._keys = [col['key'] for col in columns]
+        self._approval_brushes = {
+            status: QColor(color) for status, color in self.APPROVAL_COLORS.items()
+        }
+        self._default_approval_brush = QColor('#6e7681')
+
+        self._rows: List[tuple] = []
+        self._total = 0
+        self._filters: Dict[str, Any] = {}
+        self._sort_key = 'created_at'
+        self._sort_descending = True
+
+        # Bumped on every reset so results of superseded queries are dropped
+        self._generation = 0
+        self._loading = False
+        self._workers = set()
+
+    # ==================== LOADING ====================
+
+    def set_filters(self, **filters):
+        """
+        Replace the active filters and reload from the first batch.
+
+        Args:
+            **filters: Keyword filters accepted by ReportService.get_report_rows
+        """
+        self._filters = filters
+        self.reload()
+
+    def reload(self):
+        """Discard loaded rows and fetch the first batch again."""
+        self.beginResetModel()
+        self._rows = []
+        self._total = 0
+        self._generation += 1
+        self._loading = False
+        self.endResetModel()
+        self._fetch_batch(with_count=True)
+
+    def _fetch_batch(self, with_count: bool = False):
+        """Fetch the next batch of rows in a worker thread."""
+        if self._loading:
+            return
+        self._loading = True
+
+        generation = self._generation
+        offset = len(self._rows)
+        worker = Worker(
+            self.report_service.get_report_rows,
+            self._keys,
+            sort_column=self._sort_key,
+            sort_descending=self._sort_descending,
+            limit=self.BATCH_SIZE,
+            offset=offset,
+            with_count=with_count,
+            **self._filters
+        )
+        worker.finished.connect(
+            lambda result, w=worker: self._on_batch_loaded(w, generation, offset, result)
+        )
+        worker.error.connect(
+            lambda message, w=worker: self._on_batch_error(w, generation, message)
+        )
+        self._workers.add(worker)
+        worker.start()
+
+    def _on_batch_loaded(self, worker, generation: int, offset: int, result):
+        """Append a fetched batch unless the model was reset meanwhile."""
+        self._release_worker(worker)
+        if generation != self._generation:
+            return
+        self._loading = False
+
+        rows, total = result
+        if total is not None:
+            self._total = total
+        if offset != len(self._rows):
+            return
+
+        if rows:
+            first = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+            self._rows.extend(rows)
+            self.endInsertRows()
+
+        # Rows deleted since the count was taken; stop asking for more
+        if len(rows) < self.BATCH_SIZE:
+            self._total = len(self._rows)
+
+        self.rows_loaded.emit(len(self._rows), self._total)
+
+    def _on_batch_error(self, worker, generation: int, message: str):
+        """Report a failed batch unless the model was reset meanwhile."""
+        self._release_worker(worker)
+        if generation != self._generation:
+            return
+        self._loading = False
+        # Stop fetchMore from retrying the failing query on every scroll
+        self._total = len(self._rows)
+        self.load_error.emit(message)
+
+    def _release_worker(self, worker):
+        """
+        Drop a batch worker once its thread has exited.
+
+        Worker emits finished/error from inside run(), so wait() first;
+        it returns as soon as run() does.
+        """
+        worker.wait()
+        self._workers.discard(worker)
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        """Return whether more rows are available in the database."""
+        if parent.isValid():
+            return False
+        return not self._loading and len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        """Fetch the next batch when the view scrolls near the end."""
+        if parent.isValid():
+            return
+        self._fetch_batch()
+
+    # ==================== MODEL INTERFACE ====================
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """Return number of loaded rows."""
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """Return number of columns."""
+        return 0 if parent.isValid() else len(self.columns)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        """Return column headers and row numbers."""
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.columns[section]['header']
+        return section + 1
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        """Format a cell on demand."""
+        if not index.isValid():
+            return None
+
+        key = self._keys[index.column()]
+        value = self._rows[index.row()][index.column() + 1]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if value is None:
+                return ''
+            if key == 'current_version':
+                return f"v{value}" if value else ''
+            if key == 'approval_status':
+                return self.APPROVAL_LABELS.get(value, value)
+            if key in ('created_at', 'updated_at'):
+                # Timestamp formatting (remove microseconds)
+                return str(value)[:19]
+            return str(value)
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if key in ('current_version', 'approval_status'):
+                return Qt.AlignmentFlag.AlignCenter
+            return None
+
+        if role == Qt.ItemDataRole.ForegroundRole:
+            if key == 'approval_status' and value:
+                return self._approval_brushes.get(value, self._default_approval_brush)
+            return None
+
+        return None
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder):
+        """Re-run the query sorted by the given column."""
+        sort_key = self._keys[column]
+        descending = order == Qt.SortOrder.DescendingOrder
+        if sort_key == self._sort_key and descending == self._sort_descending:
+            return
+        self._sort_key = sort_key
+        self._sort_descending = descending
+        self.reload()
+
+    # ==================== ACCESSORS ====================
+
+    def report_id(self, row: int) -> Optional[int]:
+        """
+        Get the report ID of a loaded row.
+
+        Args:
+            row: Row index
+
+        Returns:
+            Report ID or None if the row is not loaded
+        """
+        if 0 <= row < len(self._rows):
+            return self._rows[row][0]
+        return None
+
+    def total_count(self) -> int:
+        """Return the number of reports matching the current filters."""
+        return self._total
+
+    def is_loading(self) -> bool:
+        """Return whether a batch is being fetched."""
+        return self._loading
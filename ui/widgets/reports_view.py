@@ -1,15 +1,15 @@
 """
 Reports view widget for managing financial crime reports.
-Enhanced with advanced filtering, Excel export, and pagination.
+Enhanced with advanced filtering, Excel export, and a virtualized grid.
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QPushButton, QTableWidget, QTableWidgetItem,
+                             QPushButton, QTableView, QAbstractItemView,
                              QLineEdit, QComboBox, QHeaderView, QMessageBox,
-                             QFrame, QDateEdit, QSpinBox, QCheckBox, QFileDialog)
+                             QFrame, QDateEdit, QCheckBox, QFileDialog)
 from PyQt6.QtCore import Qt, pyqtSignal, QDate
-from PyQt6.QtGui import QFont, QColor
-from ui.workers import ReportLoadWorker
+from PyQt6.QtGui import QFont
+from ui.widgets.report_table_model import ReportTableModel
 from services.icon_service import get_icon
 from ui.theme_colors import ThemeColors
 from pathlib import Path
@@ -26,7 +26,8 @@ class ReportsView(QWidget):
     - View/Edit reports
     """
 
-    def __init__(self, report_service, logging_service, auth_service, version_service, approval_service):
+    def __init__(self, report_service, logging_service, auth_service, version_service, approval_service,
+                 settings_service=None):
         """
         Initialize reports view.
 
@@ -36,6 +37,8 @@ class ReportsView(QWidget):
             auth_service: AuthService instance
             version_service: VersionService instance
             approval_service: ApprovalService instance
+            settings_service: SettingsService instance for per-user table
+                geometry (falls back to QSettings if not provided)
         """
         super().__init__()
         self.report_service = report_service
@@ -43,14 +46,8 @@ class ReportsView(QWidget):
         self.auth_service = auth_service
         self.version_service = version_service
         self.approval_service = approval_service
+        self.settings_service = settings_service
         self.current_user = auth_service.get_current_user()
-        self.current_reports = []
-        self.worker = None
-
-        # Pagination
-        self.current_page = 1
-        self.page_size = 50
-        self.total_count = 0
 
         # Advanced filter state
         self.advanced_filters_visible = False
@@ -210,59 +207,28 @@ class ReportsView(QWidget):
         # Load creators for filter
         self.load_creators()
 
-        # Stats and pagination
+        # Stats
         stats_row = QHBoxLayout()
         self.stats_label = QLabel("0 reports")
         self.stats_label.setObjectName("subtitleLabel")
         stats_row.addWidget(self.stats_label)
         stats_row.addStretch()
-
-        # Pagination controls
-        pagination_widget = QFrame()
-        pagination_layout = QHBoxLayout(pagination_widget)
-        pagination_layout.setContentsMargins(0, 0, 0, 0)
-        pagination_layout.setSpacing(8)
-
-        self.prev_btn = QPushButton("Previous")
-        self.prev_btn.setIcon(get_icon('chevron-left', color=ThemeColors.ICON_DEFAULT))
-        self.prev_btn.clicked.connect(self.previous_page)
-        self.prev_btn.setEnabled(False)
-        pagination_layout.addWidget(self.prev_btn)
-
-        self.page_label = QLabel("Page 1")
-        self.page_label.setStyleSheet(f"font-weight: 500; padding: 0 12px; color: {ThemeColors.TEXT_PRIMARY};")
-        pagination_layout.addWidget(self.page_label)
-
-        self.next_btn = QPushButton("Next")
-        self.next_btn.setIcon(get_icon('chevron-right', color=ThemeColors.ICON_DEFAULT))
-        self.next_btn.clicked.connect(self.next_page)
-        pagination_layout.addWidget(self.next_btn)
-
-        page_size_label = QLabel("Per Page:")
-        pagination_layout.addWidget(page_size_label)
-
-        self.page_size_spin = QSpinBox()
-        self.page_size_spin.setRange(10, 500)
-        self.page_size_spin.setSingleStep(10)
-        self.page_size_spin.setValue(self.page_size)
-        self.page_size_spin.valueChanged.connect(self.on_page_size_changed)
-        pagination_layout.addWidget(self.page_size_spin)
-
-        stats_row.addWidget(pagination_widget)
         layout.addLayout(stats_row)
 
-        # Reports table - configure dynamically based on database columns
-        self.reports_table = QTableWidget()
+        # Reports table - rows are fetched in batches as the user scrolls
+        self.reports_table = QTableView()
 
         # Define columns to display (excluding internal system fields)
         self.display_columns = self._get_display_columns()
-        self.reports_table.setColumnCount(len(self.display_columns))
-        self.reports_table.setHorizontalHeaderLabels([col['header'] for col in self.display_columns])
+        self.reports_model = ReportTableModel(self.report_service, self.display_columns, self)
+        self.reports_model.rows_loaded.connect(self.on_reports_loaded)
+        self.reports_model.load_error.connect(self.on_load_error)
+        self.reports_table.setModel(self.reports_model)
 
         # Configure table
         self.reports_table.setAlternatingRowColors(True)
-        self.reports_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
-        self.reports_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.reports_table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        self.reports_table.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
         self.reports_table.doubleClicked.connect(self.view_report)
 
         # Enable manual column resizing (drag column borders to resize)
@@ -270,6 +236,13 @@ class ReportsView(QWidget):
         header.setSectionResizeMode(QHeaderView.ResizeMode.Interactive)  # All columns manually resizable
         header.setStretchLastSection(False)
 
+        # Sorting runs in the database; newest reports first by default
+        created_at_column = next(
+            i for i, col in enumerate(self.display_columns) if col['key'] == 'created_at'
+        )
+        header.setSortIndicator(created_at_column, Qt.SortOrder.DescendingOrder)
+        self.reports_table.setSortingEnabled(True)
+
         # Set dynamic column widths based on column type
         for i, col_def in enumerate(self.display_columns):
             width = col_def.get('width', 120)  # Default width
@@ -352,7 +325,6 @@ class ReportsView(QWidget):
         self.date_from_edit.setDate(QDate.currentDate().addMonths(-6))
         self.date_to_edit.setDate(QDate.currentDate())
         self.creator_combo.setCurrentIndex(0)
-        self.current_page = 1
         self.on_filter_changed()
 
     def load_creators(self):
@@ -374,31 +346,12 @@ class ReportsView(QWidget):
         except Exception as e:
             self.logging_service.error(f"Error loading creators: {str(e)}")
 
-    def previous_page(self):
-        """Go to previous page."""
-        if self.current_page > 1:
-            self.current_page -= 1
-            self.load_reports()
-
-    def next_page(self):
-        """Go to next page."""
-        if self.current_page * self.page_size < self.total_count:
-            self.current_page += 1
-            self.load_reports()
-
-    def on_page_size_changed(self, value: int):
-        """Handle page size change."""
-        self.page_size = value
-        self.current_page = 1
-        self.load_reports()
-
     def on_filter_changed(self):
         """Handle filter change."""
-        self.current_page = 1
         self.load_reports()
 
     def load_reports(self):
-        """Load reports from database with filters and pagination."""
+        """Reload reports from the database with the current filters."""
         self.status_label.setText("Loading reports...")
 
         # Get filter values
@@ -414,98 +367,29 @@ class ReportsView(QWidget):
 
         created_by = self.creator_combo.currentData()
 
-        # Calculate offset for pagination
-        offset = (self.current_page - 1) * self.page_size
-
-        # Load in worker thread
-        self.worker = ReportLoadWorker(
-            self.report_service,
+        # The model fetches further batches itself as the table scrolls
+        self.reports_model.set_filters(
             status=status,
             search_term=search_term,
             date_from=date_from,
             date_to=date_to,
-            created_by=created_by,
-            limit=self.page_size,
-            offset=offset
+            created_by=created_by
         )
-        self.worker.finished.connect(self.on_reports_loaded)
-        self.worker.error.connect(self.on_load_error)
-        self.worker.progress.connect(lambda v, m: self.status_label.setText(m))
-        self.worker.start()
 
-    def on_reports_loaded(self, reports: list, total_count: int):
+    def on_reports_loaded(self, loaded_count: int, total_count: int):
         """
-        Handle reports loaded.
+        Handle a batch of reports loaded.
 
         Args:
-            reports: List of report dictionaries
+            loaded_count: Number of rows loaded so far
             total_count: Total number of reports matching filter
         """
-        self.current_reports = reports
-        self.total_count = total_count
-
-        # Update table
-        self.reports_table.setRowCount(0)
-        self.reports_table.setRowCount(len(reports))
-
-        # Approval status labels and colors for special formatting
-        approval_labels = {
-            'draft': 'Draft',
-            'pending_approval': 'Pending',
-            'approved': 'Approved',
-            'rejected': 'Rejected',
-            'rework': 'Rework'
-        }
-        approval_colors = {
-            'draft': '#6e7681',
-            'pending_approval': '#d29922',
-            'approved': '#2ea043',
-            'rejected': '#f85149',
-            'rework': '#d29922'
-        }
-
-        for row, report in enumerate(reports):
-            # Dynamically populate all columns based on display_columns definition
-            for col_idx, col_def in enumerate(self.display_columns):
-                key = col_def['key']
-                value = report.get(key, '')
-
-                # Format specific columns
-                if key == 'current_version':
-                    # Version formatting
-                    item = QTableWidgetItem(f"v{value}" if value else '')
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                elif key == 'approval_status':
-                    # Approval status with color coding
-                    label = approval_labels.get(value, value) if value else ''
-                    item = QTableWidgetItem(label)
-                    item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                    if value:
-                        color = approval_colors.get(value, '#6e7681')
-                        item.setForeground(QColor(color))
-                elif key in ['created_at', 'updated_at']:
-                    # Timestamp formatting (remove microseconds)
-                    formatted_value = value[:19] if value else ''
-                    item = QTableWidgetItem(formatted_value)
-                else:
-                    # Default: convert to string
-                    item = QTableWidgetItem(str(value) if value is not None else '')
-
-                self.reports_table.setItem(row, col_idx, item)
-
-        # Update stats
-        start_record = (self.current_page - 1) * self.page_size + 1
-        end_record = min(start_record + len(reports) - 1, total_count)
-        self.stats_label.setText(f"Showing {start_record}-{end_record} of {total_count} reports")
+        if loaded_count < total_count:
+            self.stats_label.setText(f"{loaded_count} of {total_count} reports loaded")
+        else:
+            self.stats_label.setText(f"{total_count} reports")
         self.status_label.setText("Reports loaded")
 
-        # Update pagination controls
-        total_pages = (total_count + self.page_size - 1) // self.page_size
-        self.page_label.setText(f"Page {self.current_page} of {total_pages}")
-
-        self.prev_btn.setEnabled(self.current_page > 1)
-        self.next_btn.setEnabled(self.current_page < total_pages)
-
     def on_load_error(self, error_message: str):
         """
         Handle load error.
@@ -518,14 +402,13 @@ class ReportsView(QWidget):
 
     def view_report(self):
         """View selected report."""
-        selected_rows = self.reports_table.selectedIndexes()
-        if not selected_rows:
+        index = self.reports_table.currentIndex()
+        if not index.isValid():
             return
 
-        row = selected_rows[0].row()
-        if row < len(self.current_reports):
-            report = self.current_reports[row]
-
+        report_id = self.reports_model.report_id(index.row())
+        report = self.report_service.get_report(report_id) if report_id is not None else None
+        if report:
             # Import here to avoid circular imports
             from ui.dialogs.report_dialog import ReportDialog
 
@@ -561,7 +444,7 @@ class ReportsView(QWidget):
         """Export filtered reports to Excel."""
         try:
             # Check if there are reports to export
-            if not self.current_reports:
+            if self.reports_model.total_count() == 0:
                 QMessageBox.warning(
                     self,
                     "No Data",
@@ -629,7 +512,7 @@ class ReportsView(QWidget):
                 cell.alignment = header_alignment
                 cell.border = border
 
-            # Fetch ALL matching reports (not just current page)
+            # Fetch ALL matching reports (not just the loaded rows)
             status = None if self.status_combo.currentText() == 'All' else self.status_combo.currentText()
             search_term = self.search_input.text().strip() or None
 
@@ -737,21 +620,13 @@ class ReportsView(QWidget):
     def send_all_to_approval(self):
         """Send all draft reports created by current user to approval."""
         try:
-            # Get all draft reports by current user
-            draft_reports, _ = self.report_service.get_reports(
-                status=None,
-                search_term=None,
-                created_by=self.current_user['username'],
-                limit=None  # Get all
-            )
+            draft_filters = {
+                'created_by': self.current_user['username'],
+                'approval_status': 'draft'
+            }
+            draft_count = self.approval_service.count_submittable_reports(draft_filters)
 
-            # Filter for draft approval status
-            draft_approval_reports = [
-                r for r in draft_reports
-                if r.get('approval_status', 'draft') == 'draft'
-            ]
-
-            if not draft_approval_reports:
+            if not draft_count:
                 QMessageBox.information(
                     self,
                     "No Draft Reports",
@@ -763,7 +638,7 @@ class ReportsView(QWidget):
             reply = QMessageBox.question(
                 self,
                 "Confirm Send All",
-                f"Send {len(draft_approval_reports)} draft report(s) for approval?\n\n"
+                f"Send {draft_count} draft report(s) for approval?\n\n"
                 "This will submit all your draft reports for admin review.",
                 QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
             )
@@ -771,40 +646,26 @@ class ReportsView(QWidget):
             if reply != QMessageBox.StandardButton.Yes:
                 return
 
-            # Send each report for approval
-            success_count = 0
-            failed_reports = []
-
-            for report in draft_approval_reports:
-                success, approval_id, message = self.approval_service.request_approval(
-                    report['report_id'],
-                    comment="Bulk submission via Send All"
-                )
-
-                if success:
-                    success_count += 1
-                else:
-                    failed_reports.append(f"Report {report.get('report_number', report['report_id'])}: {message}")
+            # Submit every draft in one transaction
+            success, message, results = self.approval_service.bulk_request_approval(
+                filters=draft_filters,
+                comment="Bulk submission via Send All"
+            )
 
             # Show results
-            if success_count == len(draft_approval_reports):
+            if not success:
+                QMessageBox.critical(self, "Failed", f"Failed to send reports for approval:\n{message}")
+            elif not results:
                 QMessageBox.information(
                     self,
-                    "Success",
-                    f"Successfully sent {success_count} report(s) for approval!"
-                )
-            elif success_count > 0:
-                QMessageBox.warning(
-                    self,
-                    "Partial Success",
-                    f"Sent {success_count} of {len(draft_approval_reports)} reports for approval.\n\n"
-                    f"Failed reports:\n" + "\n".join(failed_reports[:5])
+                    "No Draft Reports",
+                    "You have no draft reports to send for approval."
                 )
             else:
-                QMessageBox.critical(
+                QMessageBox.information(
                     self,
-                    "Failed",
-                    f"Failed to send reports for approval:\n" + "\n".join(failed_reports[:5])
+                    "Success",
+                    f"Successfully sent {len(results)} report(s) for approval!"
                 )
 
             # Reload reports to show updated approval status
@@ -821,34 +682,76 @@ class ReportsView(QWidget):
 
     def save_table_geometry(self):
         """Save column widths and row heights to settings."""
-        from PyQt6.QtCore import QSettings
-        settings = QSettings('FIU', 'ReportManagement')
+        geometry = {}
 
         # Save column widths
         column_widths = []
-        for i in range(self.reports_table.columnCount()):
+        for i in range(self.reports_model.columnCount()):
             column_widths.append(self.reports_table.columnWidth(i))
-        settings.setValue('reports_view/column_widths', column_widths)
+        geometry['reports_view/column_widths'] = column_widths
 
         # Save default row height (when user resizes any row, apply to all)
-        if self.reports_table.rowCount() > 0:
+        if self.reports_model.rowCount() > 0:
             # Get the height of the first row as the default for all rows
-            default_height = self.reports_table.rowHeight(0)
-            settings.setValue('reports_view/default_row_height', default_height)
+            geometry['reports_view/default_row_height'] = self.reports_table.rowHeight(0)
+
+        # Column drags fire a resize per pixel; the settings service only
+        # updates its cache here and writes once the drag settles
+        if self.settings_service:
+            self.settings_service.save_settings(geometry)
+            return
 
-    def restore_table_geometry(self):
-        """Restore column widths and row heights from settings."""
         from PyQt6.QtCore import QSettings
         settings = QSettings('FIU', 'ReportManagement')
+        for key, value in geometry.items():
+            settings.setValue(key, value)
 
-        # Restore column widths
+    def _migrate_qsettings_geometry(self):
+        """
+        Copy table geometry saved by older versions from QSettings into the settings service.
+
+        Returns:
+            Tuple of (column_widths, default_row_height); None where nothing was saved
+        """
+        from PyQt6.QtCore import QSettings
+        settings = QSettings('FIU', 'ReportManagement')
         column_widths = settings.value('reports_view/column_widths', None)
+        default_height = settings.value('reports_view/default_row_height', None)
+
+        geometry = {}
+        if column_widths:
+            # QSettings may hand back a single value or strings depending on the backend
+            if not isinstance(column_widths, (list, tuple)):
+                column_widths = [column_widths]
+            column_widths = [int(width) for width in column_widths]
+            geometry['reports_view/column_widths'] = column_widths
+        if default_height:
+            default_height = int(default_height)
+            geometry['reports_view/default_row_height'] = default_height
+
+        if geometry:
+            self.settings_service.save_settings(geometry)
+        return column_widths or None, default_height or None
+
+    def restore_table_geometry(self):
+        """Restore column widths and row heights from settings."""
+        if self.settings_service:
+            column_widths = self.settings_service.get_setting('reports_view/column_widths')
+            default_height = self.settings_service.get_setting('reports_view/default_row_height')
+            if column_widths is None and default_height is None:
+                column_widths, default_height = self._migrate_qsettings_geometry()
+        else:
+            from PyQt6.QtCore import QSettings
+            settings = QSettings('FIU', 'ReportManagement')
+            column_widths = settings.value('reports_view/column_widths', None)
+            default_height = settings.value('reports_view/default_row_height', None)
+
+        # Restore column widths
         if column_widths:
             for i, width in enumerate(column_widths):
-                if i < self.reports_table.columnCount():
+                if i < self.reports_model.columnCount():
                     self.reports_table.setColumnWidth(i, int(width))
 
         # Restore default row height
-        default_height = settings.value('reports_view/default_row_height', None)
         if default_height:
             self.reports_table.verticalHeader().setDefaultSectionSize(int(default_height))
@@ -13,7 +13,6 @@ from pathlib import Path
 from services.icon_service import get_icon
 from services.keyboard_shortcuts_service import KeyboardShortcutsService
 from ui.utils.responsive_sizing import ResponsiveSize
-from ui.themes import ModernTheme
 from ui.theme_colors import ThemeColors
 
 
@@ -65,6 +64,12 @@ class MainWindow(QMainWindow):
         self.setup_shortcuts()
         self.load_initial_view()
 
+        # Reload views when another client restores the database
+        if self.db_manager:
+            self.restore_check_timer = QTimer(self)
+            self.restore_check_timer.timeout.connect(self.check_database_restored)
+            self.restore_check_timer.start(30000)
+
     def setup_ui(self):
         """Setup the user interface."""
         self.setWindowTitle("FIU Report Management System")
@@ -104,8 +109,10 @@ class MainWindow(QMainWindow):
 
         main_layout.addWidget(content_frame, stretch=1)
 
-        # Initialize views (will be created by subclasses or imported)
+        # Views are added directly or registered as factories and
+        # built on first navigation
         self.views = {}
+        self.view_factories = {}
 
     def create_sidebar(self):
         """
@@ -131,35 +138,8 @@ class MainWindow(QMainWindow):
 
         sidebar.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Expanding)
 
-        # Dynamic stylesheet with responsive sizing
-        padding_v = ResponsiveSize.get_scaled_size(12)
-        padding_h = ResponsiveSize.get_scaled_size(16)
-        font_size = ResponsiveSize.get_font_size('normal')
-        border_radius = ResponsiveSize.get_scaled_size(4)
-
-        sidebar.setStyleSheet(f"""
-            QFrame#sidebar {{
-                background-color: {ModernTheme.SIDEBAR_BG};
-                border-right: 1px solid {ModernTheme.BORDER};
-            }}
-            QPushButton {{
-                color: {ModernTheme.SIDEBAR_TEXT};
-                background-color: transparent;
-                border: none;
-                text-align: left;
-                padding: {padding_v}px {padding_h}px;
-                font-size: {font_size}pt;
-                border-radius: {border_radius}px;
-            }}
-            QPushButton:hover {{
-                background-color: {ModernTheme.SIDEBAR_HOVER};
-            }}
-            QPushButton:checked {{
-                background-color: {ModernTheme.PRIMARY};
-                color: white;
-                font-weight: 600;
-            }}
-        """)
+        # Sidebar, user panel and header styles are application-level rules
+        # (ui.themes.main_window_stylesheet), parsed once instead of per widget
 
         # Main sidebar layout (no margins here, will be on scroll content)
         main_sidebar_layout = QVBoxLayout(sidebar)
@@ -168,12 +148,7 @@ class MainWindow(QMainWindow):
 
         # App logo/title (fixed at top, not scrollable)
         title_label = QLabel("FIU System")
-        title_label.setStyleSheet("""
-            color: white;
-            font-size: 16pt;
-            font-weight: 600;
-            padding: 12px;
-        """)
+        title_label.setObjectName("sidebarTitle")
         title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         main_sidebar_layout.addWidget(title_label)
 
@@ -183,7 +158,7 @@ class MainWindow(QMainWindow):
         scroll_area.setFrameShape(QFrame.Shape.NoFrame)
         scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        scroll_area.setStyleSheet("QScrollArea { background: transparent; border: none; }")
+        scroll_area.setObjectName("sidebarScroll")
 
         # Content widget for scrollable buttons
         scroll_content = QWidget()
@@ -226,12 +201,7 @@ class MainWindow(QMainWindow):
             layout.addSpacing(20)
 
             admin_label = QLabel("ADMINISTRATION")
-            admin_label.setStyleSheet(f"""
-                color: {ThemeColors.TEXT_SECONDARY};
-                font-size: 9pt;
-                font-weight: 600;
-                padding: 8px 16px;
-            """)
+            admin_label.setObjectName("adminSectionLabel")
             layout.addWidget(admin_label)
 
             self.nav_buttons['approvals'] = self.create_nav_button("Approvals", "approvals", "check-circle")
@@ -250,46 +220,24 @@ class MainWindow(QMainWindow):
 
         # User info at bottom
         user_frame = QFrame()
-        user_frame.setStyleSheet("""
-            QFrame {
-                background-color: #2c3e50;
-                border-radius: 6px;
-                padding: 8px;
-            }
-            QLabel {
-                color: white;
-            }
-        """)
+        user_frame.setObjectName("userFrame")
         user_layout = QVBoxLayout(user_frame)
         user_layout.setContentsMargins(12, 8, 12, 8)
         user_layout.setSpacing(4)
 
         user_name = QLabel(self.current_user['full_name'] if self.current_user else "User")
-        user_name.setStyleSheet("font-weight: 600; font-size: 10pt;")
+        user_name.setObjectName("userNameLabel")
 
         user_role = QLabel(self.current_user['role'].capitalize() if self.current_user else "")
-        user_role.setStyleSheet(f"color: {ThemeColors.TEXT_SECONDARY}; font-size: 9pt;")
+        user_role.setObjectName("userRoleLabel")
 
         user_layout.addWidget(user_name)
         user_layout.addWidget(user_role)
 
         # My Profile button
         profile_btn = QPushButton("My Profile")
+        profile_btn.setObjectName("profileLinkButton")
         profile_btn.setIcon(get_icon('user', color='#ffffff'))
-        profile_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                color: #0d7377;
-                border: 1px solid #0d7377;
-                padding: 6px;
-                border-radius: 4px;
-                margin-top: 8px;
-            }
-            QPushButton:hover {
-                background-color: #0d7377;
-                color: white;
-            }
-        """)
         profile_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         profile_btn.clicked.connect(self.show_profile)
         user_layout.addWidget(profile_btn)
@@ -298,18 +246,8 @@ class MainWindow(QMainWindow):
 
         # Logout button
         logout_btn = QPushButton("Logout")
+        logout_btn.setObjectName("logoutButton")
         logout_btn.setIcon(get_icon('sign-out-alt', color='#ffffff'))
-        logout_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                padding: 10px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-        """)
         logout_btn.clicked.connect(self.handle_logout)
         layout.addWidget(logout_btn)
 
@@ -351,13 +289,8 @@ class MainWindow(QMainWindow):
         """
         header = QFrame()
         header.setMinimumHeight(50)  # Reduced minimum height for smaller screens
+        header.setObjectName("appHeader")
         header.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Preferred)
-        header.setStyleSheet("""
-            QFrame {
-                background-color: #0d1117;
-                border-bottom: 1px solid #30363d;
-            }
-        """)
 
         layout = QHBoxLayout(header)
         layout.setContentsMargins(24, 0, 24, 0)
@@ -401,19 +334,6 @@ class MainWindow(QMainWindow):
         profile_menu.addAction("Logout", self.handle_logout)
         self.profile_btn.setMenu(profile_menu)
 
-        # Style the profile button
-        self.profile_btn.setStyleSheet("""
-            QPushButton {
-                background-color: transparent;
-                border: none;
-                padding: 8px;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border-radius: 4px;
-            }
-        """)
-
         layout.addWidget(self.profile_btn)
 
         return header
@@ -490,6 +410,11 @@ class MainWindow(QMainWindow):
             reservation_mgmt_action.triggered.connect(self.show_reservation_management)
             admin_menu.addAction(reservation_mgmt_action)
 
+            # Query Profiler
+            query_profile_action = QAction(get_icon('chart-bar', color=ThemeColors.ICON_DEFAULT), "Query &Profiler", self)
+            query_profile_action.triggered.connect(self.show_query_profiler)
+            admin_menu.addAction(query_profile_action)
+
         # Help menu
         help_menu = menubar.addMenu("&Help")
 
@@ -619,6 +544,41 @@ class MainWindow(QMainWindow):
         """
         self.views[view_id] = self.stacked_widget.addWidget(widget)
 
+    def register_view(self, view_id: str, factory):
+        """
+        Register a view to be built the first time it is shown.
+
+        Args:
+            view_id: Unique identifier for the view
+            factory: Callable returning the view widget
+        """
+        self.view_factories[view_id] = factory
+
+    def build_view(self, view_id: str) -> bool:
+        """
+        Build a registered view and add it to the stacked widget.
+
+        Args:
+            view_id: View identifier
+
+        Returns:
+            bool: True if the view was built
+        """
+        factory = self.view_factories.pop(view_id)
+        QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
+        try:
+            widget = factory()
+        except Exception as e:
+            self.view_factories[view_id] = factory
+            self.logging_service.error(f"Error building {view_id} view: {str(e)}", exc_info=True)
+            QMessageBox.critical(self, "Error", f"Failed to open {view_id} view:\n{str(e)}")
+            return False
+        finally:
+            QApplication.restoreOverrideCursor()
+
+        self.add_view(view_id, widget)
+        return True
+
     def switch_view(self, view_id: str):
         """
         Switch to a specific view.
@@ -626,6 +586,10 @@ class MainWindow(QMainWindow):
         Args:
             view_id: View identifier
         """
+        if view_id in self.view_factories and view_id not in self.views:
+            if not self.build_view(view_id):
+                return
+
         if view_id in self.views:
             # Update navigation buttons
             for btn_id, button in self.nav_buttons.items():
@@ -665,6 +629,22 @@ class MainWindow(QMainWindow):
             current_widget.refresh()
             self.statusBar().showMessage("View refreshed", 2000)
 
+    def check_database_restored(self):
+        """Refresh every view if the database was restored since the last check."""
+        try:
+            if not self.db_manager.check_restored():
+                return
+        except Exception as e:
+            self.logging_service.error(f"Error checking restore generation: {str(e)}")
+            return
+
+        self.logging_service.info("Database was restored by another client - reloading views")
+        for index in self.views.values():
+            view = self.stacked_widget.widget(index)
+            if hasattr(view, 'refresh'):
+                view.refresh()
+        self.statusBar().showMessage("Database was restored - data reloaded", 10000)
+
     def handle_logout(self):
         """Handle logout request."""
         reply = QMessageBox.question(
@@ -735,7 +715,7 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            if not self.report_service or not self.logging_service:
+            if not self.approval_service or not self.logging_service:
                 QMessageBox.warning(
                     self,
                     "Not Available",
@@ -744,7 +724,7 @@ class MainWindow(QMainWindow):
                 return
 
             dialog = ApprovalsHistoryDialog(
-                self.report_service,
+                self.approval_service,
                 self.logging_service,
                 self
             )
@@ -795,6 +775,38 @@ class MainWindow(QMainWindow):
                 f"Failed to open reservation management: {str(e)}"
             )
 
+    def show_query_profiler(self):
+        """Show query profiler dialog (admin only)."""
+        from ui.dialogs.query_profile_dialog import QueryProfileDialog
+        try:
+            if not self.current_user or self.current_user.get('role') != 'admin':
+                QMessageBox.warning(
+                    self,
+                    "Access Denied",
+                    "Only administrators can access the query profiler."
+                )
+                return
+
+            if not self.db_manager:
+                QMessageBox.warning(
+                    self,
+                    "Not Available",
+                    "The query profiler requires a database connection."
+                )
+                return
+
+            dialog = QueryProfileDialog(self.db_manager, self.logging_service, self)
+            dialog.exec()
+            self.logging_service.info(f"Admin {self.current_user['username']} opened query profiler")
+
+        except Exception as e:
+            self.logging_service.error(f"Error showing query profiler: {str(e)}", exc_info=True)
+            QMessageBox.critical(
+                self,
+                "Error",
+                f"Failed to open query profiler: {str(e)}"
+            )
+
     def handle_notification_clicked(self, notification):
         """
         Handle notification click.
@@ -292,7 +292,7 @@ class BackupWorker(QThread):
 
 class LogExportWorker(QThread):
     """
-    Worker for exporting logs to file.
+    Worker for streaming logs to a JSON Lines, CSV or text file.
 
     Signals:
         finished: Emitted with (file_path, count)
@@ -305,7 +305,8 @@ class LogExportWorker(QThread):
     progress = pyqtSignal(int, str)
 
     def __init__(self, logging_service, file_path: str, level=None,
-                 module=None, start_date=None, end_date=None):
+                 module=None, start_date=None, end_date=None,
+                 export_format=None, compress=None):
         """
         Initialize log export worker.
 
@@ -316,10 +317,14 @@ class LogExportWorker(QThread):
             module: Optional module filter
             start_date: Optional start date
             end_date: Optional end date
+            export_format: 'jsonl', 'csv' or 'txt' (default: from the file extension)
+            compress: Gzip the output (default: when the file ends in .gz)
         """
         super().__init__()
         self.logging_service = logging_service
         self.file_path = file_path
+        self.export_format = export_format
+        self.compress = compress
         self.level = level
         self.module = module
         self.start_date = start_date
@@ -330,21 +335,69 @@ class LogExportWorker(QThread):
         try:
             self.progress.emit(0, "Exporting logs...")
 
-            count = self.logging_service.export_logs_to_file(
+            count = self.logging_service.export_logs(
                 self.file_path,
+                export_format=self.export_format,
+                compress=self.compress,
                 level=self.level,
                 module=self.module,
                 start_date=self.start_date,
-                end_date=self.end_date
+                end_date=self.end_date,
+                progress_callback=self.progress.emit
             )
 
-            self.progress.emit(100, f"Exported {count} logs")
             self.finished.emit(self.file_path, count)
 
         except Exception as e:
             self.error.emit(str(e))
 
 
+class ReportImportWorker(QThread):
+    """
+    Worker for bulk report imports.
+
+    Signals:
+        finished: Emitted with (success, message, stats)
+        error: Emitted with error message
+        progress: Emitted with progress updates (percent, rows/sec message)
+    """
+
+    finished = pyqtSignal(bool, str, dict)
+    error = pyqtSignal(str)
+    progress = pyqtSignal(int, str)
+
+    def __init__(self, import_service, file_path: str, user: dict):
+        """
+        Initialize report import worker.
+
+        Args:
+            import_service: ReportImportService instance
+            file_path: Path to the CSV/XLSX file
+            user: Importing user
+        """
+        super().__init__()
+        self.import_service = import_service
+        self.file_path = file_path
+        self.user = user
+
+    def run(self):
+        """Import reports."""
+        try:
+            self.progress.emit(0, "Starting import...")
+
+            success, message, stats = self.import_service.import_file(
+                self.file_path,
+                self.user,
+                progress_callback=self.progress.emit
+            )
+
+            self.progress.emit(100, message)
+            self.finished.emit(success, message, stats)
+
+        except Exception as e:
+            self.error.emit(str(e))
+
+
 class AuthenticationWorker(QThread):
     """
     Worker for authentication operations.
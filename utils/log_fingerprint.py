@@ -0,0 +1,57 @@
+"""
+Error Fingerprints
+Groups recurring errors by exception type and call stack.
+"""
+
+import hashlib
+import re
+from typing import Optional
+
+# 'File "path/to/module.py", line 42, in function'
+FRAME_PATTERN = re.compile(r'File "([^"]+)", line \d+, in (\S+)')
+QUOTED_PATTERN = re.compile(r"'[^']*'|\"[^\"]*\"")
+NUMBER_PATTERN = re.compile(r'\d+')
+PATH_SEPARATOR = re.compile(r'[\\/]')
+
+ERROR_LEVELS = ('ERROR', 'CRITICAL')
+
+
+def error_fingerprint(log_level: str,
+                      exception_type: Optional[str],
+                      stack_trace: Optional[str],
+                      module: Optional[str],
+                      function_name: Optional[str],
+                      message: Optional[str]) -> Optional[str]:
+    """
+    Fingerprint an error log so repeats of the same failure group together.
+
+    Errors with a stack trace are keyed on the exception type and the
+    file and function of each frame; line numbers are left out so the
+    grouping survives unrelated edits. Errors without one are keyed on
+    where they were logged and the message with quoted values and
+    numbers masked.
+
+    Args:
+        log_level: Log level name
+        exception_type: Exception class name, if any
+        stack_trace: Formatted traceback, if any
+        module: Module that logged the error
+        function_name: Function that logged the error
+        message: Log message
+
+    Returns:
+        16-character hex fingerprint, or None for non-error logs
+    """
+    if log_level not in ERROR_LEVELS and not exception_type:
+        return None
+
+    frames = FRAME_PATTERN.findall(stack_trace or '')
+    if frames:
+        parts = [exception_type or ''] + [
+            f"{PATH_SEPARATOR.split(path)[-1]}:{function}" for path, function in frames
+        ]
+    else:
+        template = NUMBER_PATTERN.sub('#', QUOTED_PATTERN.sub('?', message or ''))
+        parts = [exception_type or '', module or '', function_name or '', template[:200]]
+
+    return hashlib.sha1('\n'.join(parts).encode('utf-8')).hexdigest()[:16]
@@ -0,0 +1,112 @@
+"""
+Startup Profiler
+Import-time and startup-phase timing, enabled with --profile-startup
+"""
+import builtins
+import sys
+import time
+from contextlib import contextmanager
+from typing import List, Tuple
+
+
+class StartupProfiler:
+    """Records first-time module imports and named startup phases"""
+
+    def __init__(self):
+        self.enabled = False
+        self.started = time.perf_counter()
+        self._phases: List[Tuple[str, float, float]] = []  # name, start offset, duration
+        self._imports: List[Tuple[str, float]] = []  # module, inclusive seconds
+        self._original_import = None
+        self._import_depth = 0
+        self._reported = False
+
+    def enable(self):
+        """Start recording and hook the import system"""
+        if self.enabled:
+            return
+        self.enabled = True
+        self._original_import = builtins.__import__
+        builtins.__import__ = self._timed_import
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        """builtins.__import__ replacement that times outermost first-time imports"""
+        if level != 0 or name in sys.modules or self._import_depth > 0:
+            self._import_depth += 1
+            try:
+                return self._original_import(name, globals, locals, fromlist, level)
+            finally:
+                self._import_depth -= 1
+
+        start = time.perf_counter()
+        self._import_depth += 1
+        try:
+            return self._original_import(name, globals, locals, fromlist, level)
+        finally:
+            self._import_depth -= 1
+            self._imports.append((name, time.perf_counter() - start))
+
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time a named startup phase
+
+        Phases finishing after the startup report are printed as they end,
+        so lazily built views still show up in the profile.
+
+        Args:
+            name: Phase label
+        """
+        if not self.enabled:
+            yield
+            return
+
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            self._phases.append((name, start - self.started, duration))
+            if self._reported:
+                print(f"[startup] {name}: {duration * 1000:.0f} ms")
+
+    def note(self, message: str):
+        """
+        Print a one-line measurement (e.g. cache statistics) while profiling
+
+        Args:
+            message: Text to print
+        """
+        if self.enabled:
+            print(f"[startup] {message}")
+
+    def report(self, milestone: str, top: int = 15):
+        """
+        Print the phase and import profile up to a milestone
+
+        Args:
+            milestone: Label for the point reached (e.g. "login window shown")
+            top: Number of slowest imports to list
+        """
+        if not self.enabled or self._reported:
+            return
+        self._reported = True
+        elapsed = time.perf_counter() - self.started
+
+        lines = ["", "=" * 60, f"Startup profile - {milestone} after {elapsed * 1000:.0f} ms", "=" * 60]
+        lines.append("Phases:")
+        for name, offset, duration in self._phases:
+            lines.append(f"  {offset * 1000:8.0f} ms  {duration * 1000:8.0f} ms  {name}")
+
+        total_imports = sum(duration for _, duration in self._imports)
+        lines.append(f"Imports: {len(self._imports)} top-level, {total_imports * 1000:.0f} ms total")
+        slowest = sorted(self._imports, key=lambda item: item[1], reverse=True)[:top]
+        for name, duration in slowest:
+            lines.append(f"  {duration * 1000:8.1f} ms  {name}")
+        lines.append("=" * 60)
+
+        print("\n".join(lines))
+
+
+# Global profiler instance
+startup_profiler = StartupProfiler()
@@ -0,0 +1,369 @@
+"""
+Tracing
+Lightweight nested timing spans for service methods and database calls,
+exportable as Chrome trace-event JSON (chrome://tracing, Perfetto, speedscope)
+"""
+import functools
+import inspect
+import itertools
+import json
+import os
+import threading
+import time
+from collections import deque
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, List, Optional
+
+
+# Span currently open in this thread / async task
+_current_span: ContextVar[Optional['Span']] = ContextVar('current_span', default=None)
+
+
+class Span:
+    """One timed operation, nested under the span that was open when it started"""
+
+    __slots__ = ('span_id', 'name', 'category', 'attributes', 'parent', 'root',
+                 'thread_id', 'start', 'end', 'child_time', '_token', '_tracer')
+
+    def __init__(self, tracer: 'Tracer', span_id: int, name: str, category: str,
+                 attributes: Optional[Dict[str, Any]], parent: Optional['Span']):
+        self._tracer = tracer
+        self.span_id = span_id
+        self.name = name
+        self.category = category
+        self.attributes = attributes or {}
+        self.parent = parent
+        self.root = parent.root if parent is not None else self
+        self.thread_id = threading.get_ident()
+        self.start = time.perf_counter()
+        self.end: Optional[float] = None
+        self.child_time = 0.0
+        self._token = None
+
+    def __bool__(self) -> bool:
+        return True
+
+    def set(self, key: str, value: Any):
+        """Attach an attribute to the span"""
+        self.attributes[key] = value
+
+    @property
+    def duration(self) -> float:
+        """Duration in seconds (up to now while the span is open)"""
+        return (self.end if self.end is not None else time.perf_counter()) - self.start
+
+    def __enter__(self) -> 'Span':
+        self._token = _current_span.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is not None:
+            self.attributes['error'] = exc_type.__name__
+        self.finish()
+        return False
+
+    def finish(self):
+        """Close the span and hand it to the tracer"""
+        if self.end is not None:
+            return
+        self.end = time.perf_counter()
+        if self._token is not None:
+            try:
+                _current_span.reset(self._token)
+            except ValueError:
+                # Closed from a different context (e.g. a generator finalized elsewhere)
+                _current_span.set(self.parent)
+            self._token = None
+        if self.parent is not None:
+            self.parent.child_time += self.end - self.start
+        self._tracer._finished(self)
+
+
+class _NullSpan:
+    """Stand-in returned while tracing is disabled; every operation is a no-op"""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __enter__(self) -> '_NullSpan':
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def set(self, key: str, value: Any):
+        pass
+
+    def finish(self):
+        pass
+
+
+NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """
+    Records spans into a bounded in-memory buffer while enabled
+
+    Nesting follows a ContextVar, so spans opened in worker threads or async
+    tasks start their own tree. Disabled tracing costs one attribute check
+    per instrumented call.
+    """
+
+    # Finished spans kept in memory
+    MAX_SPANS = 100000
+
+    def __init__(self):
+        self.enabled = False
+        self.epoch = time.perf_counter()
+        self._spans = deque(maxlen=self.MAX_SPANS)
+        self._thread_names: Dict[int, str] = {}
+        self._ids = itertools.count(1)
+
+    def enable(self):
+        """Start recording spans"""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording spans (recorded spans are kept until clear())"""
+        self.enabled = False
+
+    def clear(self):
+        """Drop all recorded spans"""
+        self._spans.clear()
+        self._thread_names.clear()
+
+    @property
+    def span_count(self) -> int:
+        """Number of finished spans held in memory"""
+        return len(self._spans)
+
+    def span(self, name: str, category: str = 'app', **attributes):
+        """
+        Open a span, for use as a context manager
+
+        Args:
+            name: Span name (e.g. "ReportService.create_report")
+            category: Span category (service, db, ui, ...)
+            **attributes: Attributes recorded with the span
+
+        Returns:
+            Span, or a falsy no-op span while tracing is disabled
+        """
+        if not self.enabled:
+            return NULL_SPAN
+        span_id = next(self._ids)
+        thread = threading.current_thread()
+        self._thread_names.setdefault(thread.ident, thread.name)
+        return Span(self, span_id, name, category, attributes, _current_span.get())
+
+    def start_span(self, name: str, category: str = 'app', **attributes):
+        """
+        Open a span that is closed explicitly with finish()
+
+        For code that cannot wrap the traced work in a with block.
+        """
+        span = self.span(name, category, **attributes)
+        return span.__enter__()
+
+    def current_span(self):
+        """Get the innermost open span of the current context, if any"""
+        return _current_span.get() if self.enabled else None
+
+    def _finished(self, span: Span):
+        """Store a finished span"""
+        self._spans.append(span)
+
+    # ==================== ANALYSIS ====================
+
+    def spans(self) -> List[Span]:
+        """Snapshot of the finished spans, oldest first"""
+        return list(self._spans)
+
+    def requests(self, limit: int = 10, min_duration_ms: float = 0.0) -> List[Dict]:
+        """
+        Get the slowest top-level spans with a breakdown of where their time went
+
+        Each request lists its descendants grouped by name with call count,
+        total time and self time (time not spent in nested spans).
+
+        Args:
+            limit: Maximum number of requests
+            min_duration_ms: Skip requests faster than this
+
+        Returns:
+            List of request dictionaries, slowest first
+        """
+        spans = self.spans()
+        roots = [
+            span for span in spans
+            if span.parent is None and span.duration * 1000 >= min_duration_ms
+        ]
+        roots.sort(key=lambda span: span.duration, reverse=True)
+        roots = roots[:limit]
+
+        by_root: Dict[int, List[Span]] = {root.span_id: [] for root in roots}
+        for span in spans:
+            members = by_root.get(span.root.span_id)
+            if members is not None:
+                members.append(span)
+
+        result = []
+        for root in roots:
+            groups: Dict[str, Dict] = {}
+            for span in by_root[root.span_id]:
+                group = groups.setdefault(span.name, {
+                    'name': span.name, 'category': span.category,
+                    'calls': 0, 'total_ms': 0.0, 'self_ms': 0.0
+                })
+                group['calls'] += 1
+                group['total_ms'] += span.duration * 1000
+                group['self_ms'] += (span.duration - span.child_time) * 1000
+
+            breakdown = sorted(groups.values(), key=lambda group: group['self_ms'], reverse=True)
+            for group in breakdown:
+                group['total_ms'] = round(group['total_ms'], 3)
+                group['self_ms'] = round(group['self_ms'], 3)
+
+            result.append({
+                'name': root.name,
+                'category': root.category,
+                'duration_ms': round(root.duration * 1000, 3),
+                'started_ms': round((root.start - self.epoch) * 1000, 3),
+                'attributes': dict(root.attributes),
+                'breakdown': breakdown,
+            })
+        return result
+
+    def format_requests(self, limit: int = 5, top: int = 8) -> str:
+        """
+        Format the slowest requests as plain text
+
+        Args:
+            limit: Number of requests
+            top: Breakdown lines per request
+
+        Returns:
+            Multi-line report
+        """
+        requests = self.requests(limit=limit)
+        if not requests:
+            return "No traced requests recorded."
+
+        lines = []
+        for request in requests:
+            lines.append(f"{request['name']}: {request['duration_ms']:.1f} ms")
+            lines.append(f"  {'Self ms':>9} {'Total ms':>9} {'Calls':>6}  Span")
+            for group in request['breakdown'][:top]:
+                lines.append(
+                    f"  {group['self_ms']:9.1f} {group['total_ms']:9.1f} {group['calls']:6d}  {group['name']}"
+                )
+            lines.append("")
+        return "\n".join(lines).rstrip()
+
+    # ==================== EXPORT ====================
+
+    def chrome_trace(self) -> Dict:
+        """
+        Build the recorded spans as a Chrome trace-event document
+
+        Spans become complete ("X") events with microsecond timestamps;
+        the viewer nests them per thread by time.
+
+        Returns:
+            Dictionary ready for json.dump
+        """
+        pid = os.getpid()
+        events = [
+            {'name': 'thread_name', 'ph': 'M', 'pid': pid, 'tid': thread_id, 'args': {'name': name}}
+            for thread_id, name in list(self._thread_names.items())
+        ]
+        for span in self.spans():
+            args = {key: _json_value(value) for key, value in span.attributes.items()}
+            args['span_id'] = span.span_id
+            if span.parent is not None:
+                args['parent_id'] = span.parent.span_id
+            events.append({
+                'name': span.name,
+                'cat': span.category,
+                'ph': 'X',
+                'ts': round((span.start - self.epoch) * 1_000_000, 3),
+                'dur': round(span.duration * 1_000_000, 3),
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export_chrome_trace(self, file_path: str) -> int:
+        """
+        Write the recorded spans as Chrome trace-event JSON
+
+        Args:
+            file_path: Destination .json file
+
+        Returns:
+            Number of spans written
+        """
+        document = self.chrome_trace()
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump(document, f)
+        return sum(1 for event in document['traceEvents'] if event['ph'] == 'X')
+
+
+def _json_value(value: Any) -> Any:
+    """Make an attribute value JSON serializable"""
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def traced(name: Optional[str] = None, category: str = 'app',
+           attributes: Optional[Callable[..., Dict[str, Any]]] = None):
+    """
+    Decorator wrapping a function call in a span
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Span category
+        attributes: Optional callable receiving the call's arguments and
+            returning span attributes; only called while tracing is enabled
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            extra = attributes(*args, **kwargs) if attributes else {}
+            with tracer.span(span_name, category, **extra):
+                return func(*args, **kwargs)
+
+        wrapper.__traced__ = True
+        return wrapper
+    return decorator
+
+
+def trace_service(cls):
+    """
+    Class decorator tracing every public method defined on a service class
+
+    Private methods (leading underscore), static/class methods, properties
+    and generators (which would only time their creation) are left alone.
+    """
+    for attr_name, value in list(vars(cls).items()):
+        if attr_name.startswith('_') or isinstance(value, (staticmethod, classmethod, property, type)):
+            continue
+        if not callable(value) or inspect.isgeneratorfunction(value):
+            continue
+        if getattr(value, '__traced__', False):
+            continue
+        setattr(cls, attr_name, traced(f"{cls.__name__}.{attr_name}", 'service')(value))
+    return cls
+
+
+# Global tracer instance
+tracer = Tracer()